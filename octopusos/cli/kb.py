@@ -581,6 +581,8 @@ def build(batch_size, verbose):
         table.add_row("Total", str(stats["total"]))
         table.add_row("Processed", str(stats["processed"]))
         table.add_row("Skipped", str(stats["skipped"]))
+        table.add_row("Cache hits", f"{stats['cache_hits']} ({stats['cache_hit_rate']:.0%})")
+        table.add_row("Embedding time", f"{stats['embed_seconds']:.2f}s")
         if stats["errors"] > 0:
             table.add_row("[red]Errors[/red]", f"[red]{stats['errors']}[/red]")
 
@@ -627,6 +629,7 @@ def refresh():
         table = Table(show_header=False)
         table.add_row("Processed", str(stats["processed"]))
         table.add_row("Skipped", str(stats["skipped"]))
+        table.add_row("Cache hits", f"{stats['cache_hits']} ({stats['cache_hit_rate']:.0%})")
 
         console.print(table)
 
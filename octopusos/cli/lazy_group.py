@@ -0,0 +1,85 @@
+"""Lazily imported click subcommands.
+
+``LazyGroup`` knows its subcommands by name (plus the one-line help shown in
+``--help``) and imports a subcommand's module only when that subcommand is
+invoked, so ``octopusos --help`` or ``octopusos task list`` do not pay for
+importing every command module (FastAPI, numpy, the chat engine, ...).
+"""
+
+import importlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """A subcommand resolved on first use.
+
+    Attributes:
+        import_path: "package.module:attribute" of the click command
+        short_help: Help line listed by the parent group's ``--help``
+        extras: (name, import_path) commands attached to the loaded group
+    """
+
+    import_path: str
+    short_help: str = ""
+    extras: Tuple[Tuple[str, str], ...] = ()
+
+
+def _import_command(import_path: str) -> click.Command:
+    module_name, _, attribute = import_path.partition(":")
+    command = getattr(importlib.import_module(module_name), attribute)
+    if not isinstance(command, click.Command):
+        raise TypeError(f"{import_path} is not a click command")
+    return command
+
+
+class LazyGroup(click.Group):
+    """click.Group that imports subcommands on demand."""
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, LazySubcommand]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: Dict[str, LazySubcommand] = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(self.commands) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = self.commands.get(cmd_name)
+        if command is not None:
+            return command
+        spec = self.lazy_subcommands.get(cmd_name)
+        if spec is None:
+            return None
+
+        command = _import_command(spec.import_path)
+        if spec.extras:
+            if not isinstance(command, click.Group):
+                raise TypeError(f"{spec.import_path} must be a group to take extra subcommands")
+            for extra_name, extra_path in spec.extras:
+                command.add_command(_import_command(extra_path), name=extra_name)
+        self.add_command(command, name=cmd_name)
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List subcommands with their registered help (without importing them)."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            command = self.commands.get(name)
+            if command is not None:
+                if command.hidden:
+                    continue
+                help_text = command.get_short_help_str(limit)
+            else:
+                help_text = click.utils.make_default_short_help(self.lazy_subcommands[name].short_help, limit)
+            rows.append((name, help_text))
+
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
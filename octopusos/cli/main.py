@@ -4,11 +4,124 @@ import sys
 import click
 
 from octopusos import __version__
-from octopusos.config import load_settings
-from octopusos.i18n import set_language
-
-
-@click.group(invoke_without_command=True)
+from octopusos.cli.lazy_group import LazyGroup, LazySubcommand
+
+
+# Subcommands are imported only when invoked; keep the help lines in sync
+# with the commands' docstrings.
+SUBCOMMANDS = {
+    "init": LazySubcommand("octopusos.cli.init:init_cmd", "Initialize OctopusOS store"),
+    "doctor": LazySubcommand("octopusos.cli.doctor:doctor", "环境健康检查和自动修复"),
+    "project": LazySubcommand("octopusos.cli.project:project_group", "Manage projects"),
+    "scan": LazySubcommand("octopusos.cli.scan:scan_cmd", "Scan project and generate FactPack"),
+    "generate": LazySubcommand("octopusos.cli.generate:generate_group", "Generate artifacts"),
+    "verify": LazySubcommand(
+        "octopusos.cli.verify:verify_cmd",
+        "Verify artifact (FactPack, AgentSpec, or Markdown)",
+    ),
+    "orchestrate": LazySubcommand(
+        "octopusos.cli.orchestrate:orchestrate_cmd",
+        "Run orchestrator to process tasks from queue",
+    ),
+    "migrate": LazySubcommand(
+        "octopusos.cli.migrate:migrate",
+        "Migrate database schema to target version.",
+    ),
+    "memory": LazySubcommand(
+        "octopusos.cli.memory:memory_group",
+        "Manage external memory storage.",
+    ),
+    "content": LazySubcommand(
+        "octopusos.cli.content:content_group",
+        "Manage content registry (agents, workflows, commands, rules, policies, memories).",
+    ),
+    "evaluator": LazySubcommand(
+        "octopusos.cli.evaluator:evaluator",
+        "Intent Evaluator commands (v0.9.3)",
+    ),
+    "builder": LazySubcommand(
+        "octopusos.cli.intent_builder:builder",
+        "Intent Builder CLI - Convert Natural Language to ExecutionIntent",
+    ),
+    "dry-run": LazySubcommand(
+        "octopusos.cli.dry_executor:dry_run_group",
+        "Dry executor: generate execution plans without running anything.",
+    ),
+    "answers": LazySubcommand(
+        "octopusos.cli.answers:answers_group",
+        "Manage AnswerPacks for resolving BLOCKED pipelines.",
+    ),
+    "pipeline": LazySubcommand(
+        "octopusos.cli.pipeline:pipeline_group",
+        "Pipeline management commands.",
+    ),
+    "exec": LazySubcommand(
+        "octopusos.cli.executor:exec_group",
+        "Executor commands for controlled execution.",
+    ),
+    "tool": LazySubcommand(
+        "octopusos.cli.tools:tool_group",
+        "Tool integration commands for external execution.",
+    ),
+    "run": LazySubcommand("octopusos.cli.run:run_cmd", "Run OctopusOS with natural language input"),
+    # v1.3 Inspection Commands (PR-0131-2026-4: CLI Read-only Parity) attach to task/governance
+    "task": LazySubcommand(
+        "octopusos.cli.task:task_group",
+        "Task management and tracing commands",
+        extras=(("inspect", "octopusos.cli.inspect:task_inspect"),),
+    ),
+    "kb": LazySubcommand("octopusos.cli.kb:kb", "ProjectKB - Project Knowledge Base retrieval"),
+    "web": LazySubcommand(
+        "octopusos.cli.web:web_cmd",
+        "WebUI v1 has been removed. Use apps/webui instead.",
+    ),
+    "webui": LazySubcommand(
+        "octopusos.cli.webui_control:webui_group",
+        "Manage OctopusOS WebUI daemon.",
+    ),
+    "logs": LazySubcommand(
+        "octopusos.cli.logs:logs_cmd",
+        "Show daemon logs (same source as `octopusos webui logs`).",
+    ),
+    "auth": LazySubcommand("octopusos.cli.auth:auth_group", "Manage Git authentication profiles"),
+    "imessage-bridge": LazySubcommand(
+        "octopusos.cli.imessage_bridge:imessage_bridge_group",
+        "Run the built-in local iMessage bridge (no third-party bridge required).",
+    ),
+    # v0.4 Project-Aware Task OS commands
+    "project-v31": LazySubcommand(
+        "octopusos.cli.commands.project_v31:project_v31_group",
+        "v0.4 Project management (Project-Aware Task OS)",
+    ),
+    "repo-v31": LazySubcommand(
+        "octopusos.cli.commands.repo_v31:repo_v31_group",
+        "v0.4 Repository management (Project-Aware Task OS)",
+    ),
+    "task-v31": LazySubcommand(
+        "octopusos.cli.commands.task_v31:task_v31_group",
+        "v0.4 Task management extensions (Project-Aware Task OS)",
+    ),
+    # v3 Classifier Version Management
+    "version": LazySubcommand(
+        "octopusos.cli.classifier_version:version_group",
+        "Classifier version management commands",
+    ),
+    "governance": LazySubcommand(
+        "octopusos.cli.inspect:governance_group",
+        "Governance and decision trace commands",
+        extras=(("trace", "octopusos.cli.inspect:governance_trace"),),
+    ),
+    # Skill Management Commands (PR-0201-2026-3: GitHub Importer)
+    "skill": LazySubcommand("octopusos.cli.commands.skill:skill", "Skill management commands."),
+    # NetworkOS Commands (Cloudflare Tunnel Management)
+    "networkos": LazySubcommand(
+        "octopusos.cli.commands.networkos:networkos",
+        "NetworkOS tunnel management",
+    ),
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=SUBCOMMANDS, invoke_without_command=True)
 @click.version_option(version=__version__, prog_name="octopusos")
 @click.option("--web", is_flag=True, help="Deprecated: show WebUI v2 migration guidance")
 @click.pass_context
@@ -28,6 +141,9 @@ def cli(ctx, web):
         click.echo("  npm run dev")
         ctx.exit(0)
     # Initialize language from settings (before any output)
+    from octopusos.config import load_settings
+    from octopusos.i18n import set_language
+
     try:
         settings = load_settings()
         set_language(settings.language)
@@ -56,103 +172,11 @@ def cli(ctx, web):
             ctx.exit(1)
 
 
-# Import subcommands
-from octopusos.cli.init import init_cmd
-from octopusos.cli.doctor import doctor
-from octopusos.cli.project import project_group
-from octopusos.cli.scan import scan_cmd
-from octopusos.cli.generate import generate_group
-from octopusos.cli.verify import verify_cmd
-from octopusos.cli.orchestrate import orchestrate_cmd
-from octopusos.cli.migrate import migrate
-from octopusos.cli.memory import memory_group
-from octopusos.cli.content import content_group
-from octopusos.cli.evaluator import evaluator
-from octopusos.cli.intent_builder import builder
-from octopusos.cli.dry_executor import dry_run_group
-from octopusos.cli.answers import answers_group
-from octopusos.cli.pipeline import pipeline_group
-from octopusos.cli.executor import exec_group
-from octopusos.cli.tools import tool_group
-from octopusos.cli.run import run_cmd
-from octopusos.cli.task import task_group
-from octopusos.cli.kb import kb
-from octopusos.cli.interactive import interactive_main
-from octopusos.cli.web import web_cmd
-from octopusos.cli.webui_control import webui_group
-from octopusos.cli.logs import logs_cmd
-from octopusos.cli.auth import auth_group
-from octopusos.cli.imessage_bridge import imessage_bridge_group
-
-# Import v0.4 Project-Aware Task OS commands
-from octopusos.cli.commands.project_v31 import project_v31_group
-from octopusos.cli.commands.repo_v31 import repo_v31_group
-from octopusos.cli.commands.task_v31 import task_v31_group
-
-# Import v3 Classifier Version Management
-from octopusos.cli.classifier_version import version_group
-
-# Import v1.3 Inspection Commands (PR-0131-2026-4: CLI Read-only Parity)
-from octopusos.cli.inspect import task_group as inspect_task_group, governance_group
-
-# Import Skill Management Commands (PR-0201-2026-3: GitHub Importer)
-from octopusos.cli.commands.skill import skill as skill_group
-
-# Import NetworkOS Commands (Cloudflare Tunnel Management)
-from octopusos.cli.commands.networkos import networkos as networkos_group
-
-cli.add_command(init_cmd, name="init")
-cli.add_command(doctor, name="doctor")
-cli.add_command(project_group, name="project")
-cli.add_command(scan_cmd, name="scan")
-cli.add_command(generate_group, name="generate")
-cli.add_command(verify_cmd, name="verify")
-cli.add_command(orchestrate_cmd, name="orchestrate")
-cli.add_command(migrate, name="migrate")
-cli.add_command(memory_group, name="memory")
-cli.add_command(content_group, name="content")
-cli.add_command(evaluator, name="evaluator")
-cli.add_command(builder, name="builder")
-cli.add_command(dry_run_group, name="dry-run")
-cli.add_command(answers_group, name="answers")
-cli.add_command(pipeline_group, name="pipeline")
-cli.add_command(exec_group, name="exec")
-cli.add_command(tool_group, name="tool")
-cli.add_command(run_cmd, name="run")
-cli.add_command(task_group, name="task")
-cli.add_command(kb, name="kb")
-cli.add_command(web_cmd, name="web")
-cli.add_command(webui_group, name="webui")
-cli.add_command(logs_cmd, name="logs")
-cli.add_command(auth_group, name="auth")
-cli.add_command(imessage_bridge_group, name="imessage-bridge")
-
-# Register v0.4 Project-Aware Task OS commands
-cli.add_command(project_v31_group, name="project-v31")
-cli.add_command(repo_v31_group, name="repo-v31")
-cli.add_command(task_v31_group, name="task-v31")
-
-# Register v3 Classifier Version Management
-cli.add_command(version_group, name="version")
-
-# Register v1.3 Inspection Commands (PR-0131-2026-4: CLI Read-only Parity)
-cli.add_command(governance_group, name="governance")
-
-# Register Skill Management Commands (PR-0201-2026-3: GitHub Importer)
-cli.add_command(skill_group, name="skill")
-
-# Register NetworkOS Commands (Cloudflare Tunnel Management)
-cli.add_command(networkos_group, name="networkos")
-
-# Add inspect commands to existing task_group
-from octopusos.cli.inspect import task_inspect, governance_trace
-task_group.add_command(task_inspect, name="inspect")
-governance_group.add_command(governance_trace, name="trace")
-
-
 @cli.command(name="interactive")
 def interactive_cmd():
     """Enter interactive mode (Task Control Plane)"""
+    from octopusos.cli.interactive import interactive_main
+
     interactive_main()
 
 
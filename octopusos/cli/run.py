@@ -75,9 +75,9 @@ def _format_duration(started_at: str, finished_at: str) -> str:
 )
 def run_cmd(nl_input: str, repo: str, policy: str, output: str, dry_run: bool):
     """Run OctopusOS with natural language input
-    
+
     Automatically selects the appropriate mode pipeline and executes it.
-    
+
     Examples:
     
         # Create a landing page
@@ -0,0 +1,341 @@
+"""
+Graph Snapshot - 导航用的内存图快照
+
+核心思路：
+- 每个图谱版本只构建一次 CSR 邻接结构（只含有证据的边，按无向图展开）
+- 边证据数、节点证据数/覆盖来源/度数、盲区标记与严重度预先计算成数组
+- 路径搜索（Dijkstra / 探索）与路径对象构建完全在内存中完成
+
+版本与失效：
+- 版本令牌 = 最新 build_metadata（id + graph_version）+ 实体/边/证据的 MAX(id) 与数量
+- 每次取快照时用一条轻量查询比对令牌，不一致则重建
+- BrainIndexJob 写完新版本后调用 invalidate_graph_snapshot() 立即失效
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..store import SQLiteStore
+from .models import CognitiveZone, ZoneMetrics
+
+logger = logging.getLogger(__name__)
+
+# 覆盖来源位掩码（与 zone_detector.infer_sources 的前缀规则一致）
+_SOURCE_BITS = (("git", 1), ("doc", 2), ("code", 4))
+
+# 盲区惩罚（与 compute_edge_weight 一致）
+BLIND_SPOT_PENALTY = 5.0
+
+
+def _source_mask(source_type: str) -> int:
+    for prefix, bit in _SOURCE_BITS:
+        if source_type.startswith(prefix):
+            return bit
+    return 0
+
+
+def _mask_to_sources(mask: int) -> List[str]:
+    return sorted(name for name, bit in _SOURCE_BITS if mask & bit)
+
+
+@dataclass
+class EntityInfo:
+    """快照中的实体基本信息"""
+    entity_type: str
+    entity_key: str
+    entity_name: str
+
+
+class GraphSnapshot:
+    """
+    某个图谱版本的只读内存快照
+
+    节点以稠密下标 0..N-1 表示（按 entity_id 升序），邻接关系为 CSR：
+    节点 i 的邻居槽位是 [indptr[i], indptr[i+1])，每个槽位对应
+    neighbors[slot]（邻居下标）和 slot_edges[slot]（边下标）。
+    """
+
+    def __init__(self, conn, version_token: Tuple):
+        self.version_token = version_token
+        self._build(conn)
+
+    # ------------------------------------------------------------------
+    # 构建
+    # ------------------------------------------------------------------
+
+    def _build(self, conn):
+        cursor = conn.cursor()
+
+        entity_rows = cursor.execute(
+            "SELECT id, type, key, name FROM entities ORDER BY id"
+        ).fetchall()
+        edge_rows = cursor.execute(
+            "SELECT id, src_entity_id, dst_entity_id, type FROM edges ORDER BY id"
+        ).fetchall()
+
+        edge_ids = np.array([row[0] for row in edge_rows], dtype=np.int64)
+        src = np.array([row[1] for row in edge_rows], dtype=np.int64)
+        dst = np.array([row[2] for row in edge_rows], dtype=np.int64)
+        self.edge_types: List[str] = [row[3] for row in edge_rows]
+        self.edge_ids = edge_ids
+        edge_index = {int(edge_id): i for i, edge_id in enumerate(edge_ids)}
+
+        # 节点全集：实体表 + 边端点（端点缺失实体时仍可被遍历）
+        self.entity_ids = np.unique(
+            np.concatenate([np.array([row[0] for row in entity_rows], dtype=np.int64), src, dst])
+        )
+        self.index: Dict[int, int] = {int(entity_id): i for i, entity_id in enumerate(self.entity_ids)}
+        self.entities: Dict[int, EntityInfo] = {
+            self.index[row[0]]: EntityInfo(row[1], row[2], row[3]) for row in entity_rows
+        }
+        n_nodes = len(self.entity_ids)
+        src_idx = np.searchsorted(self.entity_ids, src)
+        dst_idx = np.searchsorted(self.entity_ids, dst)
+        self.edge_src = src_idx
+        self.edge_dst = dst_idx
+
+        # 每条边的证据数与来源位掩码
+        edge_evidence = np.zeros(len(edge_ids), dtype=np.int64)
+        for edge_id, count in cursor.execute(
+            "SELECT edge_id, COUNT(*) FROM evidence GROUP BY edge_id"
+        ):
+            i = edge_index.get(edge_id)
+            if i is not None:
+                edge_evidence[i] = count
+        edge_sources = np.zeros(len(edge_ids), dtype=np.int64)
+        for edge_id, source_type in cursor.execute(
+            "SELECT edge_id, source_type FROM evidence GROUP BY edge_id, source_type"
+        ):
+            i = edge_index.get(edge_id)
+            if i is not None:
+                edge_sources[i] |= _source_mask(source_type)
+        self.edge_evidence = edge_evidence
+
+        # 节点证据数（自环只计一次）/ 覆盖来源 / 度数（所有边）
+        self_loop = src_idx == dst_idx
+        node_evidence = np.bincount(src_idx, weights=edge_evidence, minlength=n_nodes)
+        node_evidence += np.bincount(dst_idx, weights=np.where(self_loop, 0, edge_evidence), minlength=n_nodes)
+        self.node_evidence = node_evidence.astype(np.int64)
+
+        node_sources = np.zeros(n_nodes, dtype=np.int64)
+        np.bitwise_or.at(node_sources, src_idx, edge_sources)
+        np.bitwise_or.at(node_sources, dst_idx, edge_sources)
+        self.node_sources = node_sources
+
+        self.out_degree = np.bincount(src_idx, minlength=n_nodes)
+        self.in_degree = np.bincount(dst_idx, minlength=n_nodes)
+
+        # AVG(degree) over per-src and per-dst groups (same as compute_zone_metrics)
+        groups = int(np.count_nonzero(self.out_degree)) + int(np.count_nonzero(self.in_degree))
+        self.avg_degree = (2.0 * len(edge_ids) / groups) if groups else 1.0
+
+        self._compute_blind_spots(dst_idx, n_nodes)
+
+        # CSR：只含有证据的边，双向展开（与原 build_graph 相同的无向语义）
+        evidenced = np.nonzero(edge_evidence > 0)[0]
+        rows = np.concatenate([src_idx[evidenced], dst_idx[evidenced]])
+        cols = np.concatenate([dst_idx[evidenced], src_idx[evidenced]])
+        slots = np.concatenate([evidenced, evidenced])
+        order = np.argsort(rows, kind="stable")
+        self.neighbors = cols[order].tolist()
+        self.slot_edges = slots[order].tolist()
+        self.indptr = np.concatenate(
+            [[0], np.cumsum(np.bincount(rows, minlength=n_nodes))]
+        ).tolist()
+
+        # 预计算每个槽位的边权重（1 / (evidence + 1) + 目标盲区惩罚）
+        base = 1.0 / (edge_evidence[slots[order]] + 1.0)
+        penalty = np.where(self.blind_spot[cols[order]], BLIND_SPOT_PENALTY, 0.0)
+        self.slot_weights = (base + penalty).tolist()
+
+        logger.info(
+            f"Built graph snapshot: {n_nodes} nodes, {len(edge_ids)} edges "
+            f"({len(evidenced)} with evidence)"
+        )
+
+    def _compute_blind_spots(self, dst_idx: np.ndarray, n_nodes: int):
+        """批量计算盲区（规则与 detect_blind_spots_for_entities 一致）"""
+        from ..service.blind_spot import BlindSpotType, calculate_severity
+
+        edge_types = np.array(self.edge_types, dtype=object)
+
+        def fan_in(*types: str) -> np.ndarray:
+            return np.bincount(dst_idx[np.isin(edge_types, types)], minlength=n_nodes)
+
+        depends_on = fan_in("depends_on")
+        references = fan_in("references")
+        implements = fan_in("implements")
+        modifies = fan_in("modifies")
+        doc_mentions = fan_in("references", "mentions")
+
+        self.blind_spot = np.zeros(n_nodes, dtype=bool)
+        self.blind_spot_severity: Dict[int, float] = {}
+
+        for idx, info in self.entities.items():
+            severity = None
+            if info.entity_type == "file" and depends_on[idx] >= 5 and references[idx] == 0:
+                severity = calculate_severity(
+                    BlindSpotType.HIGH_FAN_IN_UNDOCUMENTED, {"fan_in_count": int(depends_on[idx])}
+                )
+            elif info.entity_type == "capability" and implements[idx] == 0:
+                severity = calculate_severity(
+                    BlindSpotType.CAPABILITY_NO_IMPLEMENTATION, {"implementation_count": 0}
+                )
+            elif info.entity_type == "file" and modifies[idx] > 0 and doc_mentions[idx] == 0:
+                severity = calculate_severity(
+                    BlindSpotType.TRACE_DISCONTINUITY, {"commit_count": int(modifies[idx])}
+                )
+
+            if severity is not None:
+                self.blind_spot[idx] = True
+                self.blind_spot_severity[idx] = severity
+
+    # ------------------------------------------------------------------
+    # 查询
+    # ------------------------------------------------------------------
+
+    def node_index(self, entity_id) -> Optional[int]:
+        """实体 ID -> 稠密下标（不存在返回 None）"""
+        try:
+            return self.index.get(int(entity_id))
+        except (TypeError, ValueError):
+            return None
+
+    def iter_neighbors(self, idx: int) -> Iterator[Tuple[int, int, float]]:
+        """遍历邻居：(neighbor_idx, edge_idx, weight)"""
+        for slot in range(self.indptr[idx], self.indptr[idx + 1]):
+            yield self.neighbors[slot], self.slot_edges[slot], self.slot_weights[slot]
+
+    def find_edge(self, a_idx: int, b_idx: int) -> Optional[int]:
+        """两节点之间 ID 最小的有证据边（任意方向）"""
+        best = None
+        for neighbor, edge, _ in self.iter_neighbors(a_idx):
+            if neighbor == b_idx and (best is None or edge < best):
+                best = edge
+        return best
+
+    def edge_data(self, edge: int) -> Dict:
+        """边属性（与原 build_graph 的 edge_data 结构一致）"""
+        return {
+            "edge_id": int(self.edge_ids[edge]),
+            "edge_type": self.edge_types[edge],
+            "evidence_count": int(self.edge_evidence[edge]),
+        }
+
+    def is_blind_spot(self, idx: int) -> bool:
+        return bool(self.blind_spot[idx])
+
+    def coverage_sources(self, idx: int) -> List[str]:
+        return _mask_to_sources(int(self.node_sources[idx]))
+
+    def zone_metrics(self, idx: int) -> ZoneMetrics:
+        """区域指标（与 zone_detector.compute_zone_metrics 相同的公式）"""
+        coverage_sources = self.coverage_sources(idx)
+        evidence_count = int(self.node_evidence[idx])
+        is_blind_spot = self.is_blind_spot(idx)
+        in_degree = int(self.in_degree[idx])
+        out_degree = int(self.out_degree[idx])
+
+        centrality = (in_degree + out_degree) / self.avg_degree
+        coverage_ratio = len(coverage_sources) / 3.0
+        evidence_density = evidence_count / 10.0
+
+        zone_score = (
+            0.4 * coverage_ratio +
+            0.3 * min(evidence_density, 1.0) +
+            0.2 * (1.0 if not is_blind_spot else 0.0) +
+            0.1 * min(centrality, 1.0)
+        )
+
+        return ZoneMetrics(
+            entity_id=int(self.entity_ids[idx]),
+            evidence_count=evidence_count,
+            evidence_density=evidence_density,
+            coverage_sources=coverage_sources,
+            coverage_ratio=coverage_ratio,
+            is_blind_spot=is_blind_spot,
+            blind_spot_severity=self.blind_spot_severity.get(idx),
+            in_degree=in_degree,
+            out_degree=out_degree,
+            centrality=centrality,
+            zone_score=zone_score
+        )
+
+    def zone(self, idx: int) -> CognitiveZone:
+        from .zone_detector import classify_zone
+        return classify_zone(self.zone_metrics(idx))
+
+    def to_adjacency(self) -> Dict[int, List[Tuple[int, Dict]]]:
+        """导出为 {entity_id: [(neighbor_id, edge_data), ...]} 邻接表"""
+        graph: Dict[int, List[Tuple[int, Dict]]] = {}
+        for idx in range(len(self.entity_ids)):
+            entries = [
+                (int(self.entity_ids[neighbor]), self.edge_data(edge))
+                for neighbor, edge, _ in self.iter_neighbors(idx)
+            ]
+            if entries:
+                graph[int(self.entity_ids[idx])] = entries
+        return graph
+
+
+# ----------------------------------------------------------------------
+# 快照缓存（按数据库路径）
+# ----------------------------------------------------------------------
+
+_SNAPSHOTS: Dict[str, GraphSnapshot] = {}
+_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def graph_version_token(conn) -> Tuple:
+    """当前图谱版本令牌（一条轻量查询）"""
+    return tuple(conn.execute("""
+        SELECT
+            (SELECT id || ':' || graph_version FROM build_metadata ORDER BY id DESC LIMIT 1),
+            (SELECT MAX(id) FROM entities),
+            (SELECT MAX(id) FROM edges),
+            (SELECT COUNT(*) FROM edges),
+            (SELECT MAX(id) FROM evidence),
+            (SELECT COUNT(*) FROM evidence)
+    """).fetchone())
+
+
+def get_graph_snapshot(store: SQLiteStore) -> GraphSnapshot:
+    """
+    获取 store 当前图谱版本的快照（版本不变时复用缓存）
+
+    Args:
+        store: BrainOS 数据库
+
+    Returns:
+        GraphSnapshot
+    """
+    conn = store.connect()
+    key = str(store.db_path)
+    token = graph_version_token(conn)
+
+    with _SNAPSHOTS_LOCK:
+        snapshot = _SNAPSHOTS.get(key)
+        if snapshot is not None and snapshot.version_token == token:
+            return snapshot
+
+        snapshot = GraphSnapshot(conn, token)
+        _SNAPSHOTS[key] = snapshot
+        return snapshot
+
+
+def invalidate_graph_snapshot(db_path: Optional[str] = None):
+    """
+    丢弃缓存的快照（BrainIndexJob 生成新版本后调用）
+
+    Args:
+        db_path: 数据库路径（None 表示全部）
+    """
+    with _SNAPSHOTS_LOCK:
+        if db_path is None:
+            _SNAPSHOTS.clear()
+        else:
+            _SNAPSHOTS.pop(str(db_path), None)
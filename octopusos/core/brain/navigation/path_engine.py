@@ -5,14 +5,14 @@ Path Engine - 证据加权路径搜索
 - 使用 Dijkstra 算法
 - 边权重 = 1 / (evidence_count + 1) - 证据越多，权重越小（越"近"）
 - 额外惩罚：盲区节点 +5，零覆盖节点 +10
+- 图结构、证据数、盲区标记来自按图谱版本缓存的内存快照（graph_snapshot）
 """
 
 import logging
 from typing import List, Optional, Dict, Set, Tuple
-from collections import defaultdict
 import heapq
+from .graph_snapshot import GraphSnapshot, get_graph_snapshot
 from .models import Path, PathNode, PathType, RiskLevel, CognitiveZone
-from .zone_detector import detect_zone
 from .risk_model import compute_path_score, compute_path_confidence, compute_path_risk, generate_recommendation_reason
 from ..store import SQLiteStore
 
@@ -88,13 +88,16 @@ def dijkstra_paths(
     返回：
     - 所有从 start 到 goal 的路径（距离 <= max_hops）
     """
-    # 构建图（邻接表）
-    graph = build_graph(store)
-
-    # Dijkstra
-    distances = {start_id: 0}
+    snapshot = get_graph_snapshot(store)
+    start = snapshot.node_index(start_id)
+    goal = snapshot.node_index(goal_id)
+    if start is None:
+        return []
+
+    # Dijkstra（在快照的稠密下标上运行）
+    distances = {start: 0}
     visited = set()
-    pq = [(0, start_id, [])]  # (distance, node_id, path)
+    pq = [(0, start, [])]  # (distance, node_idx, path)
 
     all_paths = []
 
@@ -108,18 +111,17 @@ def dijkstra_paths(
         path = path + [current]
 
         # 找到目标
-        if current == goal_id:
+        if current == goal:
             if len(path) <= max_hops + 1:
-                all_paths.append(path)
+                all_paths.append(_to_entity_ids(snapshot, path))
             continue
 
         # 探索邻居
         if len(path) > max_hops:
             continue
 
-        for neighbor, edge_data in graph.get(current, []):
+        for neighbor, _, weight in snapshot.iter_neighbors(current):
             if neighbor not in visited:
-                weight = compute_edge_weight(store, edge_data, neighbor)
                 new_dist = dist + weight
 
                 if neighbor not in distances or new_dist < distances[neighbor]:
@@ -140,11 +142,14 @@ def explore_paths(
     返回：
     - 到达不同节点的路径（按权重排序，取前 10 条）
     """
-    graph = build_graph(store)
+    snapshot = get_graph_snapshot(store)
+    start = snapshot.node_index(start_id)
+    if start is None:
+        return []
 
     # BFS + 权重排序
     visited = set()
-    pq = [(0, start_id, [])]
+    pq = [(0, start, [])]
 
     all_paths = []
 
@@ -159,24 +164,27 @@ def explore_paths(
 
         # 记录路径（排除起点）
         if len(path) > 1 and len(path) <= max_hops + 1:
-            all_paths.append(path)
+            all_paths.append(_to_entity_ids(snapshot, path))
 
         # 继续探索
         if len(path) > max_hops:
             continue
 
-        for neighbor, edge_data in graph.get(current, []):
+        for neighbor, _, weight in snapshot.iter_neighbors(current):
             if neighbor not in visited:
-                weight = compute_edge_weight(store, edge_data, neighbor)
-                new_dist = dist + weight
-                heapq.heappush(pq, (new_dist, neighbor, path))
+                heapq.heappush(pq, (dist + weight, neighbor, path))
 
     return all_paths
 
 
+def _to_entity_ids(snapshot: GraphSnapshot, path: List[int]) -> List[int]:
+    """快照下标路径 -> 实体 ID 路径"""
+    return [int(snapshot.entity_ids[idx]) for idx in path]
+
+
 def build_graph(store: SQLiteStore) -> Dict[str, List[Tuple[str, Dict]]]:
     """
-    构建图的邻接表
+    构建图的邻接表（来自当前图谱版本的快照）
 
     返回：
     {
@@ -186,38 +194,7 @@ def build_graph(store: SQLiteStore) -> Dict[str, List[Tuple[str, Dict]]]:
         ]
     }
     """
-    cursor = store.conn.cursor()
-
-    # 查询所有有证据的边
-    cursor.execute("""
-        SELECT
-            e.id as edge_id,
-            e.src_entity_id,
-            e.dst_entity_id,
-            e.type as edge_type,
-            COUNT(DISTINCT ev.id) as evidence_count
-        FROM edges e
-        LEFT JOIN evidence ev ON ev.edge_id = e.id
-        GROUP BY e.id
-        HAVING evidence_count > 0
-    """)
-
-    graph = defaultdict(list)
-
-    for row in cursor.fetchall():
-        edge_id, src_id, dst_id, edge_type, evidence_count = row
-
-        edge_data = {
-            "edge_id": edge_id,
-            "edge_type": edge_type,
-            "evidence_count": evidence_count
-        }
-
-        # 无向图（双向边）
-        graph[src_id].append((dst_id, edge_data))
-        graph[dst_id].append((src_id, edge_data))
-
-    return graph
+    return get_graph_snapshot(store).to_adjacency()
 
 
 def compute_edge_weight(store: SQLiteStore, edge_data: Dict, target_entity_id: str) -> float:
@@ -233,11 +210,10 @@ def compute_edge_weight(store: SQLiteStore, edge_data: Dict, target_entity_id: s
 
     base_weight = 1.0 / (evidence_count + 1)
 
-    # 检查目标节点是否为盲区，添加惩罚
-    from ..service.blind_spot import detect_blind_spots_for_entities
-    blind_spots = detect_blind_spots_for_entities(store, entity_ids=[target_entity_id])
-
-    blind_spot_penalty = 5.0 if blind_spots else 0.0
+    # 检查目标节点是否为盲区，添加惩罚（快照中预先计算）
+    snapshot = get_graph_snapshot(store)
+    target = snapshot.node_index(target_entity_id)
+    blind_spot_penalty = 5.0 if target is not None and snapshot.is_blind_spot(target) else 0.0
 
     return base_weight + blind_spot_penalty
 
@@ -263,9 +239,11 @@ def categorize_paths(store: SQLiteStore, all_paths: List[List[str]]) -> Dict[Pat
         PathType.CONSERVATIVE: []
     }
 
+    snapshot = get_graph_snapshot(store) if all_paths else None
+
     for path_node_ids in all_paths:
         # 构建 Path 对象
-        path = build_path_object(store, path_node_ids)
+        path = build_path_object(store, path_node_ids, snapshot)
 
         # 计算评分
         score = compute_path_score(store, path)
@@ -312,11 +290,16 @@ def categorize_paths(store: SQLiteStore, all_paths: List[List[str]]) -> Dict[Pat
     return categorized
 
 
-def build_path_object(store: SQLiteStore, node_ids: List[str]) -> Path:
+def build_path_object(
+    store: SQLiteStore,
+    node_ids: List[str],
+    snapshot: Optional[GraphSnapshot] = None
+) -> Path:
     """
-    从节点 ID 列表构建 Path 对象
+    从节点 ID 列表构建 Path 对象（节点/边属性全部来自内存快照）
     """
-    cursor = store.conn.cursor()
+    if snapshot is None:
+        snapshot = get_graph_snapshot(store)
 
     path_nodes = []
     total_evidence = 0
@@ -325,40 +308,22 @@ def build_path_object(store: SQLiteStore, node_ids: List[str]) -> Path:
 
     for i, node_id in enumerate(node_ids):
         # 查询节点信息
-        cursor.execute("""
-            SELECT type, key, name
-            FROM entities
-            WHERE id = ?
-        """, (node_id,))
-
-        entity = cursor.fetchone()
+        idx = snapshot.node_index(node_id)
+        entity = snapshot.entities.get(idx) if idx is not None else None
         if not entity:
             continue
 
-        entity_type, entity_key, entity_name = entity
-
         # 判断区域
-        zone = detect_zone(store, node_id)
+        zone = snapshot.zone(idx)
 
         # 检查盲区
-        from ..service.blind_spot import detect_blind_spots_for_entities
-        blind_spots = detect_blind_spots_for_entities(store, entity_ids=[node_id])
-        is_blind_spot = len(blind_spots) > 0
+        is_blind_spot = snapshot.is_blind_spot(idx)
 
         if is_blind_spot:
             blind_spot_count += 1
 
         # 获取覆盖来源
-        cursor.execute("""
-            SELECT DISTINCT ev.source_type
-            FROM evidence ev
-            JOIN edges e ON e.id = ev.edge_id
-            WHERE e.src_entity_id = ? OR e.dst_entity_id = ?
-        """, (node_id, node_id))
-
-        evidence_types = [row[0] for row in cursor.fetchall()]
-        from .zone_detector import infer_sources
-        node_sources = infer_sources(evidence_types)
+        node_sources = snapshot.coverage_sources(idx)
         coverage_sources.update(node_sources)
 
         # 获取边信息（如果不是第一个节点）
@@ -367,27 +332,19 @@ def build_path_object(store: SQLiteStore, node_ids: List[str]) -> Path:
         evidence_count = 0
 
         if i > 0:
-            prev_node_id = node_ids[i - 1]
-
-            cursor.execute("""
-                SELECT e.id, e.type, COUNT(DISTINCT ev.id)
-                FROM edges e
-                LEFT JOIN evidence ev ON ev.edge_id = e.id
-                WHERE (e.src_entity_id = ? AND e.dst_entity_id = ?)
-                   OR (e.src_entity_id = ? AND e.dst_entity_id = ?)
-                GROUP BY e.id
-                LIMIT 1
-            """, (prev_node_id, node_id, node_id, prev_node_id))
-
-            edge_row = cursor.fetchone()
-            if edge_row:
-                edge_id, edge_type, evidence_count = edge_row
+            prev_idx = snapshot.node_index(node_ids[i - 1])
+            edge = snapshot.find_edge(prev_idx, idx) if prev_idx is not None else None
+            if edge is not None:
+                edge_data = snapshot.edge_data(edge)
+                edge_id = edge_data["edge_id"]
+                edge_type = edge_data["edge_type"]
+                evidence_count = edge_data["evidence_count"]
                 total_evidence += evidence_count
 
         path_node = PathNode(
             entity_id=node_id,
-            entity_type=entity_type,
-            entity_name=entity_name,
+            entity_type=entity.entity_type,
+            entity_name=entity.entity_name,
             edge_id=edge_id,
             edge_type=edge_type,
             evidence_count=evidence_count,
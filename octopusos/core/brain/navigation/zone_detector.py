@@ -30,6 +30,19 @@ def detect_zone(store: SQLiteStore, entity_id: str) -> CognitiveZone:
     metrics = compute_zone_metrics(store, entity_id)
 
     # 2. 应用规则
+    return classify_zone(metrics)
+
+
+def classify_zone(metrics: ZoneMetrics) -> CognitiveZone:
+    """
+    根据区域指标判断认知区域
+
+    Args:
+        metrics: 区域指标
+
+    Returns:
+        CognitiveZone (CORE/EDGE/NEAR_BLIND)
+    """
     if is_core_zone(metrics):
         return CognitiveZone.CORE
     elif is_near_blind_zone(metrics):
@@ -26,6 +26,7 @@ from ..store import (
     create_graph_version,
     get_iso_timestamp
 )
+from ..navigation.graph_snapshot import invalidate_graph_snapshot
 from ..extractors.git_extractor import GitExtractor
 from ..extractors.doc_extractor import DocExtractor
 from ..extractors.code_extractor import CodeExtractor
@@ -233,6 +234,9 @@ class BrainIndexJob:
             if store.conn:
                 store.conn.commit()
 
+            # New graph version: drop cached navigation snapshot
+            invalidate_graph_snapshot(store.db_path)
+
             # Step 7: Generate manifest
             manifest = BuildManifest(
                 graph_version=graph_version,
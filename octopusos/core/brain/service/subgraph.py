@@ -23,7 +23,6 @@ Reference:
 import json
 import logging
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -603,18 +602,15 @@ def query_subgraph(
 
         # Step 3: Compute node cognitive attributes
         logger.debug("Step 3: Computing node cognitive attributes")
-        nodes_dict = {}
-        for node_id in node_ids:
-            node_attrs = compute_node_attributes(cursor, node_id, seed_node_id, subgraph_data)
-            nodes_dict[node_id] = node_attrs
+        nodes_dict = compute_node_attributes_bulk(cursor, node_ids, subgraph_data)
 
         # Step 4: Compute edge cognitive attributes
         logger.debug("Step 4: Computing edge cognitive attributes")
-        edges_list = []
-        for edge_db_id, src_id, dst_id, edge_type in edge_data:
-            edge_attrs = compute_edge_attributes(cursor, edge_db_id, src_id, dst_id, edge_type)
-            if edge_attrs["evidence_count"] >= min_evidence or include_suspected:
-                edges_list.append(edge_attrs)
+        edges_list = [
+            edge_attrs
+            for edge_attrs in compute_edge_attributes_bulk(cursor, edge_data)
+            if edge_attrs["evidence_count"] >= min_evidence or include_suspected
+        ]
 
         # Step 5: Detect blind spots (enriches nodes_dict)
         logger.debug("Step 5: Detecting blind spots")
@@ -775,21 +771,49 @@ def find_seed_node(cursor, seed: str) -> Optional[int]:
     return None
 
 
+# Max host parameters per IN (...) list (below SQLITE_MAX_VARIABLE_NUMBER on old builds)
+_SQL_IN_CHUNK = 500
+
+
+def _chunked(ids: List[int], size: int = _SQL_IN_CHUNK):
+    """Yield ``ids`` in slices small enough for one IN (...) list"""
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+def _evidence_counts(cursor, edge_ids: List[int]) -> Dict[int, int]:
+    """Evidence count per edge, one grouped query per chunk of edge IDs"""
+    counts: Dict[int, int] = {}
+    for chunk in _chunked(edge_ids):
+        cursor.execute(f"""
+            SELECT edge_id, COUNT(*)
+            FROM evidence
+            WHERE edge_id IN ({",".join("?" * len(chunk))})
+            GROUP BY edge_id
+        """, chunk)
+        counts.update(cursor.fetchall())
+    return counts
+
+
 def bfs_k_hop(cursor, seed_id: int, k: int, min_evidence: int) -> Dict:
     """
     BFS k-hop traversal (only edges with evidence)
 
     RED LINE 1 ENFORCEMENT: Only traverse edges with >= min_evidence
 
-    Algorithm:
-    1. Initialize visited = {seed_id}, queue = [(seed_id, 0)]
-    2. While queue not empty:
-       - Dequeue (node_id, depth)
-       - If depth >= k, skip
-       - Query all adjacent edges with evidence >= min_evidence
-       - For each unvisited neighbor, add to visited and queue
+    Algorithm (frontier-at-a-time):
+    1. Initialize visited = {seed_id}, frontier = [seed_id]
+    2. For each hop < k:
+       - Fetch all edges touching the frontier in one batched query
+       - Fetch evidence counts for the new edges in one grouped query
+       - Keep edges with evidence >= min_evidence
+       - Unvisited endpoints form the next frontier
     3. Return {node_ids, edges}
 
+    Edges are deduplicated by ID and returned in discovery order, so the
+    result matches a node-at-a-time BFS while issuing O(k) queries instead
+    of O(nodes).
+
     Args:
         cursor: SQLite cursor
         seed_id: Seed node entity ID
@@ -799,71 +823,153 @@ def bfs_k_hop(cursor, seed_id: int, k: int, min_evidence: int) -> Dict:
     Returns:
         Dict with {
             "node_ids": Set[int],
-            "edges": List[Tuple[edge_id, src_id, dst_id, type]]
+            "edges": List[Tuple[edge_id, src_id, dst_id, type]],
+            "distance_map": Dict[int, int],
+            "evidence_counts": Dict[int, int]
         }
     """
     visited = {seed_id}
-    queue = deque([(seed_id, 0)])
-    edges = []
     distance_map = {seed_id: 0}  # Track distance from seed
-
-    while queue:
-        node_id, depth = queue.popleft()
-
-        if depth >= k:
-            continue
-
-        # Query outgoing edges with evidence >= min_evidence
-        cursor.execute("""
-            SELECT DISTINCT e.id, e.src_entity_id, e.dst_entity_id, e.type,
-                   COUNT(ev.id) AS evidence_count
-            FROM edges e
-            LEFT JOIN evidence ev ON ev.edge_id = e.id
-            WHERE e.src_entity_id = ?
-            GROUP BY e.id
-            HAVING evidence_count >= ?
-        """, (node_id, min_evidence))
-
-        outgoing_edges = cursor.fetchall()
-
-        for edge_id, src_id, dst_id, edge_type, _ in outgoing_edges:
-            edges.append((edge_id, src_id, dst_id, edge_type))
-
-            if dst_id not in visited:
-                visited.add(dst_id)
-                distance_map[dst_id] = depth + 1
-                queue.append((dst_id, depth + 1))
-
-        # Query incoming edges with evidence >= min_evidence
-        cursor.execute("""
-            SELECT DISTINCT e.id, e.src_entity_id, e.dst_entity_id, e.type,
-                   COUNT(ev.id) AS evidence_count
-            FROM edges e
-            LEFT JOIN evidence ev ON ev.edge_id = e.id
-            WHERE e.dst_entity_id = ?
-            GROUP BY e.id
-            HAVING evidence_count >= ?
-        """, (node_id, min_evidence))
-
-        incoming_edges = cursor.fetchall()
-
-        for edge_id, src_id, dst_id, edge_type, _ in incoming_edges:
-            # Avoid duplicate edges
-            if (edge_id, src_id, dst_id, edge_type) not in edges:
-                edges.append((edge_id, src_id, dst_id, edge_type))
-
-            if src_id not in visited:
-                visited.add(src_id)
-                distance_map[src_id] = depth + 1
-                queue.append((src_id, depth + 1))
+    edges: Dict[int, Tuple[int, int, int, str]] = {}
+    evidence_counts: Dict[int, int] = {}
+    frontier = [seed_id]
+
+    for depth in range(k):
+        if not frontier:
+            break
+
+        # All edges touching the frontier (outgoing first, then incoming)
+        candidates: Dict[int, Tuple[int, int, int, str]] = {}
+        for column in ("src_entity_id", "dst_entity_id"):
+            for chunk in _chunked(frontier):
+                cursor.execute(f"""
+                    SELECT id, src_entity_id, dst_entity_id, type
+                    FROM edges
+                    WHERE {column} IN ({",".join("?" * len(chunk))})
+                """, chunk)
+                for row in cursor.fetchall():
+                    if row[0] not in edges:
+                        candidates.setdefault(row[0], tuple(row))
+
+        evidence_counts.update(_evidence_counts(cursor, list(candidates)))
+
+        next_frontier = []
+        for edge_id, (_, src_id, dst_id, edge_type) in candidates.items():
+            if evidence_counts.get(edge_id, 0) < min_evidence:
+                continue
+            edges[edge_id] = (edge_id, src_id, dst_id, edge_type)
+            for neighbor in (dst_id, src_id):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    distance_map[neighbor] = depth + 1
+                    next_frontier.append(neighbor)
+
+        frontier = next_frontier
 
     return {
         "node_ids": visited,
-        "edges": edges,
-        "distance_map": distance_map
+        "edges": list(edges.values()),
+        "distance_map": distance_map,
+        "evidence_counts": evidence_counts
     }
 
 
+def compute_node_attributes_bulk(cursor, node_ids: Set[int], subgraph_data: Dict) -> Dict[int, Dict]:
+    """
+    Compute cognitive attributes for every node in the subgraph
+
+    Same attributes as compute_node_attributes(), but computed for the whole
+    node set with a handful of batched queries:
+    1. Entity basic info
+    2. evidence_count / coverage_sources over all edges touching each node
+    3. in_degree / out_degree within the subgraph
+
+    Args:
+        cursor: SQLite cursor
+        node_ids: Entity IDs in the subgraph
+        subgraph_data: BFS result with distance_map
+
+    Returns:
+        Dict mapping node_id -> attribute dict (nodes missing from the
+        entities table are omitted)
+    """
+    node_ids = set(node_ids)
+    id_list = sorted(node_ids)
+    distance_map = subgraph_data["distance_map"]
+
+    entities: Dict[int, Tuple[str, str, str]] = {}
+    evidence_count: Dict[int, int] = dict.fromkeys(id_list, 0)
+    sources: Dict[int, List[str]] = {node_id: [] for node_id in id_list}
+    in_degree = dict.fromkeys(id_list, 0)
+    out_degree = dict.fromkeys(id_list, 0)
+
+    for chunk in _chunked(id_list):
+        placeholders = ",".join("?" * len(chunk))
+
+        cursor.execute(f"""
+            SELECT id, type, key, name
+            FROM entities
+            WHERE id IN ({placeholders})
+        """, chunk)
+        for entity_id, entity_type, entity_key, entity_name in cursor.fetchall():
+            entities[entity_id] = (entity_type, entity_key, entity_name)
+
+        # Evidence touching each node (either endpoint; UNION dedups self-loops)
+        cursor.execute(f"""
+            SELECT node_id, COUNT(*), GROUP_CONCAT(DISTINCT source_type)
+            FROM (
+                SELECT e.src_entity_id AS node_id, ev.id AS evidence_id, ev.source_type
+                FROM edges e
+                JOIN evidence ev ON ev.edge_id = e.id
+                WHERE e.src_entity_id IN ({placeholders})
+                UNION
+                SELECT e.dst_entity_id, ev.id, ev.source_type
+                FROM edges e
+                JOIN evidence ev ON ev.edge_id = e.id
+                WHERE e.dst_entity_id IN ({placeholders})
+            )
+            GROUP BY node_id
+        """, chunk + chunk)
+        for node_id, count, source_types in cursor.fetchall():
+            evidence_count[node_id] = count
+            sources[node_id] = sorted(source_types.split(","))
+
+        # Degree within the subgraph (all edges, regardless of evidence)
+        cursor.execute(f"""
+            SELECT src_entity_id, dst_entity_id
+            FROM edges
+            WHERE src_entity_id IN ({placeholders})
+        """, chunk)
+        for src_id, dst_id in cursor.fetchall():
+            if dst_id in node_ids:
+                out_degree[src_id] += 1
+                in_degree[dst_id] += 1
+
+    result = {}
+    for node_id in id_list:
+        if node_id not in entities:
+            continue
+        entity_type, entity_key, entity_name = entities[node_id]
+        result[node_id] = {
+            "entity_type": entity_type,
+            "entity_key": entity_key,
+            "entity_name": entity_name,
+            "evidence_count": evidence_count[node_id],
+            "coverage_sources": sources[node_id],
+            # Simple heuristic: density = min(1.0, evidence_count / 10)
+            "evidence_density": min(1.0, evidence_count[node_id] / 10.0),
+            "is_blind_spot": False,  # Will be enriched later
+            "blind_spot_severity": None,
+            "blind_spot_type": None,
+            "blind_spot_reason": None,
+            "in_degree": in_degree[node_id],
+            "out_degree": out_degree[node_id],
+            "distance_from_seed": distance_map.get(node_id, 999)
+        }
+
+    return result
+
+
 def compute_node_attributes(cursor, node_id: int, seed_id: int, subgraph_data: Dict) -> Dict:
     """
     Compute cognitive attributes for a node
@@ -875,6 +981,8 @@ def compute_node_attributes(cursor, node_id: int, seed_id: int, subgraph_data: D
     4. in_degree / out_degree: Topology within subgraph
     5. distance_from_seed: Hops from seed node
 
+    Prefer compute_node_attributes_bulk() when computing a whole subgraph.
+
     Args:
         cursor: SQLite cursor
         node_id: Entity ID
@@ -884,113 +992,24 @@ def compute_node_attributes(cursor, node_id: int, seed_id: int, subgraph_data: D
     Returns:
         Dict with node attributes
     """
-    # Get entity basic info
-    cursor.execute("""
-        SELECT type, key, name, attrs_json
-        FROM entities
-        WHERE id = ?
-    """, (node_id,))
-
-    row = cursor.fetchone()
-    if not row:
+    # Degrees are counted within the subgraph, so the full node set is needed
+    attrs = compute_node_attributes_bulk(cursor, subgraph_data["node_ids"] | {node_id}, subgraph_data)
+    if node_id not in attrs:
         raise ValueError(f"Node not found: {node_id}")
-
-    entity_type, entity_key, entity_name, attrs_json = row
-
-    # Evidence count and sources
-    cursor.execute("""
-        SELECT DISTINCT ev.source_type
-        FROM evidence ev
-        JOIN edges e ON e.id = ev.edge_id
-        WHERE e.src_entity_id = ? OR e.dst_entity_id = ?
-    """, (node_id, node_id))
-
-    evidence_sources = cursor.fetchall()
-    coverage_sources = [row[0] for row in evidence_sources]
-
-    cursor.execute("""
-        SELECT COUNT(DISTINCT ev.id)
-        FROM evidence ev
-        JOIN edges e ON e.id = ev.edge_id
-        WHERE e.src_entity_id = ? OR e.dst_entity_id = ?
-    """, (node_id, node_id))
-
-    evidence_count = cursor.fetchone()[0]
-
-    # Evidence density (normalized)
-    # Simple heuristic: density = min(1.0, evidence_count / 10)
-    evidence_density = min(1.0, evidence_count / 10.0)
-
-    # In/out degree (within subgraph)
-    node_ids_in_subgraph = subgraph_data["node_ids"]
-
-    cursor.execute("""
-        SELECT COUNT(*)
-        FROM edges
-        WHERE src_entity_id = ? AND dst_entity_id IN ({})
-    """.format(",".join("?" * len(node_ids_in_subgraph))),
-    (node_id, *node_ids_in_subgraph))
-
-    out_degree = cursor.fetchone()[0]
-
-    cursor.execute("""
-        SELECT COUNT(*)
-        FROM edges
-        WHERE dst_entity_id = ? AND src_entity_id IN ({})
-    """.format(",".join("?" * len(node_ids_in_subgraph))),
-    (node_id, *node_ids_in_subgraph))
-
-    in_degree = cursor.fetchone()[0]
-
-    # Distance from seed
-    distance_from_seed = subgraph_data["distance_map"].get(node_id, 999)
-
-    return {
-        "entity_type": entity_type,
-        "entity_key": entity_key,
-        "entity_name": entity_name,
-        "evidence_count": evidence_count,
-        "coverage_sources": coverage_sources,
-        "evidence_density": evidence_density,
-        "is_blind_spot": False,  # Will be enriched later
-        "blind_spot_severity": None,
-        "blind_spot_type": None,
-        "blind_spot_reason": None,
-        "in_degree": in_degree,
-        "out_degree": out_degree,
-        "distance_from_seed": distance_from_seed
-    }
+    return attrs[node_id]
 
 
-def compute_edge_attributes(cursor, edge_db_id: int, src_id: int, dst_id: int, edge_type: str) -> Dict:
-    """
-    Compute cognitive attributes for an edge
-
-    Computes:
-    1. evidence_count: Number of evidence records
-    2. evidence_types: Distinct evidence types (git/doc/code)
-    3. evidence_list: Full evidence records
-    4. confidence: Computed confidence score
-    5. status: "confirmed" or "suspected"
-
-    Args:
-        cursor: SQLite cursor
-        edge_db_id: Edge ID
-        src_id: Source entity ID
-        dst_id: Destination entity ID
-        edge_type: Edge type
+def _loads_json_object(value: Optional[str]) -> Dict:
+    """Decode a JSON object column (most evidence rows store the '{}' default)"""
+    if not value or value == "{}":
+        return {}
+    return json.loads(value)
 
-    Returns:
-        Dict with edge attributes
-    """
-    # Query evidence
-    cursor.execute("""
-        SELECT id, source_type, source_ref, span_json, attrs_json
-        FROM evidence
-        WHERE edge_id = ?
-    """, (edge_db_id,))
 
-    evidence_rows = cursor.fetchall()
+def _edge_attributes_from_evidence(
+    edge_db_id: int, src_id: int, dst_id: int, edge_type: str, evidence_rows: List[Tuple]
+) -> Dict:
+    """Build edge attribute dict from its evidence rows (id, source_type, source_ref, span_json, attrs_json)"""
     evidence_count = len(evidence_rows)
 
     evidence_types = list(set(row[1] for row in evidence_rows))
@@ -999,8 +1018,8 @@ def compute_edge_attributes(cursor, edge_db_id: int, src_id: int, dst_id: int, e
             "id": row[0],
             "source_type": row[1],
             "source_ref": row[2],
-            "span": json.loads(row[3]) if row[3] else {},
-            "attrs": json.loads(row[4]) if row[4] else {}
+            "span": _loads_json_object(row[3]),
+            "attrs": _loads_json_object(row[4])
         }
         for row in evidence_rows
     ]
@@ -1045,6 +1064,60 @@ def compute_edge_attributes(cursor, edge_db_id: int, src_id: int, dst_id: int, e
     }
 
 
+def compute_edge_attributes_bulk(cursor, edge_data: List[Tuple[int, int, int, str]]) -> List[Dict]:
+    """
+    Compute cognitive attributes for a list of edges
+
+    Loads evidence for all edges with one query per chunk of edge IDs.
+
+    Args:
+        cursor: SQLite cursor
+        edge_data: List of (edge_id, src_id, dst_id, edge_type)
+
+    Returns:
+        List of edge attribute dicts, in the order of edge_data
+    """
+    evidence_by_edge: Dict[int, List[Tuple]] = {edge[0]: [] for edge in edge_data}
+    for chunk in _chunked(list(evidence_by_edge)):
+        cursor.execute(f"""
+            SELECT edge_id, id, source_type, source_ref, span_json, attrs_json
+            FROM evidence
+            WHERE edge_id IN ({",".join("?" * len(chunk))})
+            ORDER BY id
+        """, chunk)
+        for row in cursor.fetchall():
+            evidence_by_edge[row[0]].append(tuple(row[1:]))
+
+    return [
+        _edge_attributes_from_evidence(edge_db_id, src_id, dst_id, edge_type, evidence_by_edge[edge_db_id])
+        for edge_db_id, src_id, dst_id, edge_type in edge_data
+    ]
+
+
+def compute_edge_attributes(cursor, edge_db_id: int, src_id: int, dst_id: int, edge_type: str) -> Dict:
+    """
+    Compute cognitive attributes for an edge
+
+    Computes:
+    1. evidence_count: Number of evidence records
+    2. evidence_types: Distinct evidence types (git/doc/code)
+    3. evidence_list: Full evidence records
+    4. confidence: Computed confidence score
+    5. status: "confirmed" or "suspected"
+
+    Args:
+        cursor: SQLite cursor
+        edge_db_id: Edge ID
+        src_id: Source entity ID
+        dst_id: Destination entity ID
+        edge_type: Edge type
+
+    Returns:
+        Dict with edge attributes
+    """
+    return compute_edge_attributes_bulk(cursor, [(edge_db_id, src_id, dst_id, edge_type)])[0]
+
+
 def detect_blind_spots_for_subgraph(store: SQLiteStore, node_ids: List[int]) -> Dict[int, BlindSpot]:
     """
     Detect blind spots for nodes in subgraph
@@ -1068,18 +1141,22 @@ def detect_blind_spots_for_subgraph(store: SQLiteStore, node_ids: List[int]) ->
         conn = store.connect()
         cursor = conn.cursor()
 
+        # Map entity keys -> IDs for subgraph nodes in one pass
+        subgraph_ids = set(node_ids)
+        key_to_id: Dict[str, int] = {}
+        id_list = sorted(subgraph_ids)
+        for chunk in _chunked(id_list):
+            cursor.execute(f"""
+                SELECT key, id FROM entities
+                WHERE id IN ({",".join("?" * len(chunk))})
+            """, chunk)
+            for key, entity_id in cursor.fetchall():
+                key_to_id.setdefault(key, entity_id)
+
         for blind_spot in blind_spot_report.blind_spots:
-            # Find entity ID by key
-            cursor.execute("""
-                SELECT id FROM entities
-                WHERE key = ?
-            """, (blind_spot.entity_key,))
-
-            result = cursor.fetchone()
-            if result:
-                entity_id = result[0]
-                if entity_id in node_ids:
-                    blind_spot_dict[entity_id] = blind_spot
+            entity_id = key_to_id.get(blind_spot.entity_key)
+            if entity_id is not None:
+                blind_spot_dict[entity_id] = blind_spot
 
         return blind_spot_dict
 
@@ -1109,19 +1186,21 @@ def detect_missing_connections(cursor, nodes: List[SubgraphNode], edges: List[Su
     """
     missing = []
 
+    nodes_by_id = {n.id: n for n in nodes}
+
+    # Targets that have at least one doc-backed reference
+    doc_referenced_targets = {
+        e.target_id
+        for e in edges
+        if e.edge_type == "references" and "doc" in e.evidence_types
+    }
+
     # Scenario 1: Code depends_on but no doc references
     depends_on_edges = [e for e in edges if e.edge_type == "depends_on"]
     for edge in depends_on_edges:
         # Check if target has any doc references
-        has_doc_ref = any(
-            e.edge_type == "references" and
-            e.target_id == edge.target_id and
-            "doc" in e.evidence_types
-            for e in edges
-        )
-
-        if not has_doc_ref:
-            target_node = next((n for n in nodes if n.id == edge.target_id), None)
+        if edge.target_id not in doc_referenced_targets:
+            target_node = nodes_by_id.get(edge.target_id)
             if target_node:
                 missing.append({
                     "type": "missing_doc_coverage",
@@ -1272,6 +1351,8 @@ def inject_gap_anchors(
                 gaps_by_node[anchor_to] = []
             gaps_by_node[anchor_to].append(gap)
 
+    nodes_by_id = {n.id: n for n in nodes}
+
     # 2. Create Gap Anchor Node for each node with gaps
     for parent_id, gaps in gaps_by_node.items():
         missing_count = len(gaps)
@@ -1339,7 +1420,7 @@ def inject_gap_anchors(
         gap_edges.append(gap_edge)
 
         # 4. Update parent node with gap metadata
-        parent_node = next((n for n in nodes if n.id == parent_id), None)
+        parent_node = nodes_by_id.get(parent_id)
         if parent_node:
             parent_node.missing_connections_count = missing_count
             parent_node.gap_types = gap_types
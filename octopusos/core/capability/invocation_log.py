@@ -0,0 +1,206 @@
+"""
+Capability Invocation Log - buffered audit writes for permission checks
+
+CapabilityRegistry.check_capability() runs on every tool step of every agent.
+Writing its audit row synchronously (connect, INSERT, COMMIT) made each
+permission check pay an fsync. InvocationLogBuffer keeps the rows in a
+bounded in-memory queue instead; a background writer thread persists them in
+batches (one transaction per batch):
+
+- A batch is written once batch_size rows are pending, or once the oldest
+  pending row is flush_interval seconds old.
+- flush() waits until everything appended so far has been written; close()
+  flushes and stops the writer (also done at interpreter exit).
+- When max_pending rows are queued, append() waits for the writer to make
+  room (backpressure). Only if the writer makes no progress for
+  full_wait_timeout seconds (e.g. the database is locked) is the oldest row
+  dropped and counted in get_stats()["dropped"].
+
+Usage:
+    buffer = InvocationLogBuffer(write_batch=registry._write_invocations)
+    buffer.append((agent_id, capability_id, operation, 1, None, None, timestamp_ms))
+    buffer.flush()
+"""
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (agent_id, capability_id, operation, allowed, reason, context_json, timestamp_ms)
+InvocationRow = Tuple[str, str, str, int, Optional[str], Optional[str], int]
+
+DEFAULT_MAX_PENDING = 10000
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_FULL_WAIT_TIMEOUT_SECONDS = 1.0
+
+_open_buffers: "weakref.WeakSet[InvocationLogBuffer]" = weakref.WeakSet()
+_atexit_registered = False
+
+
+def _close_open_buffers() -> None:
+    for buffer in list(_open_buffers):
+        try:
+            buffer.close(timeout=5.0)
+        except Exception as e:
+            logger.debug(f"Failed to flush capability invocations at exit: {e}")
+
+
+class InvocationLogBuffer:
+    """Bounded queue of invocation rows, written in batches by a background thread"""
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[InvocationRow]], None],
+        max_pending: int = DEFAULT_MAX_PENDING,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        full_wait_timeout: float = DEFAULT_FULL_WAIT_TIMEOUT_SECONDS,
+    ):
+        """
+        Args:
+            write_batch: Persists a list of rows (called on the writer thread)
+            max_pending: Max rows held in memory while the writer is behind
+            batch_size: Pending rows that trigger an immediate write
+            flush_interval: Max seconds a row waits before being written
+            full_wait_timeout: Max seconds append() waits for room in a full queue
+        """
+        self._write_batch = write_batch
+        self._batch_size = max(1, int(batch_size))
+        self._max_pending = max(self._batch_size, int(max_pending))
+        self._flush_interval = max(0.0, float(flush_interval))
+        self._full_wait_timeout = max(0.0, float(full_wait_timeout))
+        self._cond = threading.Condition()
+        self._pending: Deque[InvocationRow] = deque(maxlen=self._max_pending)
+        self._inflight = 0
+        self._first_pending_at: Optional[float] = None
+        self._flush_requested = False
+        self._requested_generation = 0
+        self._flushed_generation = 0
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._batches = 0
+        self._rows_written = 0
+        self._dropped = 0
+        self._failed_batches = 0
+
+    def append(self, row: InvocationRow) -> None:
+        """Queue one row (waits only while the queue is full)"""
+        with self._cond:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                pending = self._pending
+                if len(pending) >= self._max_pending:
+                    self._flush_requested = True
+                    self._cond.notify_all()
+                    if not self._cond.wait_for(
+                        lambda: len(pending) < self._max_pending or self._closed,
+                        self._full_wait_timeout,
+                    ):
+                        self._dropped += 1
+                pending.append(row)
+                if self._first_pending_at is None:
+                    self._first_pending_at = time.monotonic()
+                    self._ensure_writer()
+                    self._cond.notify_all()
+                elif len(pending) >= self._batch_size and not self._flush_requested:
+                    self._flush_requested = True
+                    self._cond.notify_all()
+        if closed:
+            self._write([row])
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Write everything appended so far; False if timeout expired first"""
+        with self._cond:
+            if not self._pending and not self._inflight:
+                return True
+            self._requested_generation += 1
+            target = self._requested_generation
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: self._flushed_generation >= target or (not self._pending and not self._inflight),
+                timeout,
+            )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending rows and stop the writer thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "pending": len(self._pending) + self._inflight,
+                "batches": self._batches,
+                "rows_written": self._rows_written,
+                "dropped": self._dropped,
+                "failed_batches": self._failed_batches,
+            }
+
+    def _ensure_writer(self) -> None:
+        # Caller holds self._cond
+        global _atexit_registered
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run,
+                name="capability-invocation-writer",
+                daemon=True,
+            )
+            self._thread.start()
+            _open_buffers.add(self)
+            if not _atexit_registered:
+                atexit.register(_close_open_buffers)
+                _atexit_registered = True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                deadline = (self._first_pending_at or time.monotonic()) + self._flush_interval
+                while not self._flush_requested and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = list(self._pending)
+                self._pending.clear()
+                self._inflight = len(batch)
+                self._first_pending_at = None
+                self._flush_requested = False
+                generation = self._requested_generation
+                self._cond.notify_all()  # Appenders waiting for room
+
+            self._write(batch)
+
+            with self._cond:
+                self._inflight = 0
+                self._flushed_generation = generation
+                self._cond.notify_all()
+
+    def _write(self, rows: List[InvocationRow]) -> None:
+        try:
+            self._write_batch(rows)
+        except Exception:
+            logger.warning("Failed to persist %d capability invocations", len(rows), exc_info=True)
+            with self._cond:
+                self._failed_batches += 1
+            return
+        with self._cond:
+            self._batches += 1
+            self._rows_written += len(rows)
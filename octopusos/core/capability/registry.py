@@ -10,12 +10,17 @@ This is the core registry that:
 
 Design Philosophy:
 - Singleton pattern for global access
-- LRU cache for permission checks (60s TTL)
+- In-memory grant snapshot for permission checks: indexed by
+  (agent_id, capability_id) -> {scope: expires_at_ms}, updated by
+  grant_capability()/revoke_capability() and reloaded every 60s to pick up
+  grants changed by other processes. Expiry is evaluated on every check.
 - Fail-safe defaults (unknown agent → no permissions)
-- Complete audit trail of all checks
+- Audit trail of checks, written in batches by a background thread
+  (see invocation_log.py). Denials are always logged; allowed decisions are
+  sampled at OCTOPUSOS_CAPABILITY_LOG_SAMPLE_RATE (default 1.0 = all).
 
 Performance Targets:
-- Permission check: < 10ms (cached)
+- Permission check: < 10us (snapshot hit, buffered audit)
 - Grant operation: < 20ms
 - Bulk query: < 100ms for 1000 grants
 """
@@ -24,9 +29,11 @@ import sqlite3
 import json
 import logging
 import os
-from typing import Dict, List, Optional, Set
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
 from functools import lru_cache
-from datetime import datetime, timedelta
 from pathlib import Path
 
 from octopusos.core.capability.models import (
@@ -37,11 +44,24 @@ from octopusos.core.capability.models import (
     get_default_capabilities,
     validate_capability_definition,
 )
+from octopusos.core.capability.invocation_log import InvocationLogBuffer, InvocationRow
 from octopusos.core.time import utc_now_ms
 
 
 logger = logging.getLogger(__name__)
 
+# (agent_id, capability_id) -> {scope: expires_at_ms}; None scope = unscoped grant,
+# None expiry = never expires
+GrantSnapshot = Dict[Tuple[str, str], Dict[Optional[str], Optional[int]]]
+
+
+def _parse_sample_rate(value: Optional[str]) -> float:
+    try:
+        return min(1.0, max(0.0, float(value))) if value not in (None, "") else 1.0
+    except ValueError:
+        logger.warning(f"Invalid OCTOPUSOS_CAPABILITY_LOG_SAMPLE_RATE: {value!r}, using 1.0")
+        return 1.0
+
 
 class PermissionDenied(Exception):
     """
@@ -72,8 +92,8 @@ class CapabilityRegistry:
     This singleton manages:
     - 27 atomic capability definitions
     - Agent capability grants
-    - Permission checks with caching
-    - Complete audit trail
+    - Permission checks against an in-memory grant snapshot
+    - Buffered audit trail of checks
 
     Usage:
         registry = CapabilityRegistry.get_instance()
@@ -85,12 +105,15 @@ class CapabilityRegistry:
     _instance: Optional["CapabilityRegistry"] = None
     _lock = None  # Will be threading.Lock() if needed
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, invocation_sample_rate: Optional[float] = None):
         """
         Initialize registry.
 
         Args:
             db_path: Path to SQLite database (default: store/registry.sqlite)
+            invocation_sample_rate: Fraction of allowed checks written to
+                capability_invocations (default: OCTOPUSOS_CAPABILITY_LOG_SAMPLE_RATE
+                or 1.0). Denials are always written.
         """
         if db_path is None:
             from octopusos.store import get_db_path
@@ -103,6 +126,13 @@ class CapabilityRegistry:
         self._execution_alias_index: Dict[str, str] = {}
         self._cache_enabled = True
         self._cache_ttl_seconds = 60
+        self._grant_snapshot: Optional[GrantSnapshot] = None
+        self._snapshot_loaded_at = 0.0
+        self._snapshot_lock = threading.Lock()
+        if invocation_sample_rate is None:
+            invocation_sample_rate = _parse_sample_rate(os.getenv("OCTOPUSOS_CAPABILITY_LOG_SAMPLE_RATE"))
+        self.invocation_sample_rate = min(1.0, max(0.0, float(invocation_sample_rate)))
+        self._invocation_log = InvocationLogBuffer(write_batch=self._write_invocations)
         self._execution_alias_meta: Dict[str, Dict[str, object]] = {}
         self._execution_alias_source: Dict[str, str] = {}
 
@@ -728,9 +758,9 @@ class CapabilityRegistry:
             f"Granted capability '{capability_id}' to agent '{agent_id}' (grant_id: {grant_id})"
         )
 
-        # Clear cache for this agent
+        # Update grant snapshot
         if self._cache_enabled:
-            self._clear_agent_cache(agent_id)
+            self._refresh_grants(agent_id, capability_id)
 
         return grant_id
 
@@ -798,9 +828,9 @@ class CapabilityRegistry:
             f"Revoked capability '{capability_id}' from agent '{agent_id}' (grant_id: {grant_id})"
         )
 
-        # Clear cache
+        # Update grant snapshot (other grants of the pair may remain)
         if self._cache_enabled:
-            self._clear_agent_cache(agent_id)
+            self._refresh_grants(agent_id, capability_id)
 
         return True
 
@@ -890,13 +920,25 @@ class CapabilityRegistry:
         Returns:
             True if agent has capability, False otherwise
         """
-        # Use cache if enabled
         if self._cache_enabled:
-            cache_key = f"{agent_id}:{capability_id}:{scope or ''}"
-            cached = self._get_from_cache(cache_key)
-            if cached is not None:
-                return cached
+            has_grant = self._snapshot_has_grant(agent_id, capability_id, scope)
+        else:
+            has_grant = self._query_has_grant(agent_id, capability_id, scope)
 
+        if log_invocation:
+            self._log_invocation(
+                agent_id=agent_id,
+                capability_id=capability_id,
+                operation="has_capability",
+                allowed=has_grant,
+                reason=None if has_grant else "No active grant found",
+                context={"scope": scope} if scope else None,
+            )
+
+        return has_grant
+
+    def _query_has_grant(self, agent_id: str, capability_id: str, scope: Optional[str]) -> bool:
+        """Check active grants in the database (used when the snapshot is disabled)"""
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -925,22 +967,6 @@ class CapabilityRegistry:
 
         has_grant = cursor.fetchone() is not None
         conn.close()
-
-        if log_invocation:
-            self._log_invocation(
-                agent_id=agent_id,
-                capability_id=capability_id,
-                operation="has_capability",
-                allowed=has_grant,
-                reason=None if has_grant else "No active grant found",
-                context={"scope": scope} if scope else None,
-            )
-
-        # Cache result
-        if self._cache_enabled:
-            cache_key = f"{agent_id}:{capability_id}:{scope or ''}"
-            self._put_in_cache(cache_key, has_grant)
-
         return has_grant
 
     def check_capability(
@@ -956,7 +982,7 @@ class CapabilityRegistry:
 
         This is the primary permission check method. It:
         1. Checks if agent has capability
-        2. Logs to audit trail
+        2. Logs to audit trail (buffered; allowed checks may be sampled)
         3. Raises PermissionDenied if not allowed
 
         Args:
@@ -998,76 +1024,154 @@ class CapabilityRegistry:
         reason: Optional[str],
         context: Optional[Dict],
     ):
-        """Log capability invocation to audit trail"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        """Queue capability invocation for the audit trail"""
+        if not allowed:
+            logger.warning(
+                f"Capability check DENIED: agent='{agent_id}', capability='{capability_id}', "
+                f"operation='{operation}', reason='{reason}'"
+            )
+        elif self.invocation_sample_rate < 1.0:
+            if random.random() >= self.invocation_sample_rate:
+                return
+            # Lets audit queries scale sampled counts back up
+            context = dict(context or {}, sample_rate=self.invocation_sample_rate)
 
-        timestamp_ms = utc_now_ms()
         context_json = json.dumps(context) if context else None
+        self._invocation_log.append(
+            (agent_id, capability_id, operation, int(allowed), reason, context_json, int(time.time() * 1000))
+        )
 
-        cursor.execute(
-            """
-            INSERT INTO capability_invocations (
-                agent_id, capability_id, operation, allowed, reason, context_json, timestamp_ms
+    def _write_invocations(self, rows: List[InvocationRow]) -> None:
+        """Persist a batch of invocation rows (invocation log writer thread)"""
+        conn = self._get_connection()
+        try:
+            conn.executemany(
+                """
+                INSERT INTO capability_invocations (
+                    agent_id, capability_id, operation, allowed, reason, context_json, timestamp_ms
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (agent_id, capability_id, operation, int(allowed), reason, context_json, timestamp_ms),
-        )
+            conn.commit()
+        finally:
+            conn.close()
 
-        conn.commit()
-        conn.close()
+    def flush_invocations(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Write all queued invocation records to the database.
 
-        if not allowed:
-            logger.warning(
-                f"Capability check DENIED: agent='{agent_id}', capability='{capability_id}', "
-                f"operation='{operation}', reason='{reason}'"
-            )
+        Args:
+            timeout: Max seconds to wait (None = no limit)
+
+        Returns:
+            True if the queue was drained, False on timeout
+        """
+        return self._invocation_log.flush(timeout)
 
     # ===================================================================
-    # Cache Management
+    # Grant Snapshot
     # ===================================================================
 
-    def _get_from_cache(self, key: str) -> Optional[bool]:
-        """Get permission check result from cache"""
-        # Simple dict cache (in production use Redis/memcached)
-        if not hasattr(self, "_cache"):
-            self._cache = {}
+    def _snapshot_has_grant(self, agent_id: str, capability_id: str, scope: Optional[str]) -> bool:
+        """Check active grants in the snapshot (same matching rules as _query_has_grant)"""
+        scopes = self._get_grant_snapshot().get((agent_id, capability_id))
+        if not scopes:
+            return False
+
+        now_ms = int(time.time() * 1000)
+        if scope:
+            candidates = [scopes[key] for key in (None, scope) if key in scopes]
+        else:
+            candidates = scopes.values()
+        for expires_at_ms in candidates:
+            if expires_at_ms is None or expires_at_ms > now_ms:
+                return True
+        return False
+
+    def _get_grant_snapshot(self) -> GrantSnapshot:
+        """Grant snapshot, reloaded after _cache_ttl_seconds (grants changed by other processes)"""
+        snapshot = self._grant_snapshot
+        if snapshot is not None and time.monotonic() - self._snapshot_loaded_at < self._cache_ttl_seconds:
+            return snapshot
+
+        with self._snapshot_lock:
+            if (
+                self._grant_snapshot is not None
+                and time.monotonic() - self._snapshot_loaded_at < self._cache_ttl_seconds
+            ):
+                return self._grant_snapshot
+            conn = self._get_connection()
+            try:
+                rows = conn.execute(
+                    """
+                    SELECT agent_id, capability_id, scope, expires_at_ms FROM capability_grants
+                    WHERE expires_at_ms IS NULL OR expires_at_ms > ?
+                    """,
+                    (utc_now_ms(),),
+                ).fetchall()
+            finally:
+                conn.close()
+
+            snapshot = {}
+            for row in rows:
+                self._add_to_snapshot(snapshot, row)
+            self._grant_snapshot = snapshot
+            self._snapshot_loaded_at = time.monotonic()
+            logger.debug(f"Grant snapshot loaded: {len(rows)} active grants")
+            return snapshot
 
-        if key in self._cache:
-            value, expires_at = self._cache[key]
-            if datetime.now() < expires_at:
-                return value
+    @staticmethod
+    def _add_to_snapshot(snapshot: GrantSnapshot, row: sqlite3.Row) -> None:
+        scopes = snapshot.setdefault((row["agent_id"], row["capability_id"]), {})
+        scope = row["scope"]
+        expires_at_ms = row["expires_at_ms"]
+        if scope in scopes:
+            # Several grants with the same scope: the latest expiry wins
+            current = scopes[scope]
+            if current is None or expires_at_ms is None:
+                expires_at_ms = None
             else:
-                del self._cache[key]
-
-        return None
+                expires_at_ms = max(current, expires_at_ms)
+        scopes[scope] = expires_at_ms
+
+    def _refresh_grants(self, agent_id: str, capability_id: str) -> None:
+        """Reload one (agent_id, capability_id) entry of the snapshot from the database"""
+        with self._snapshot_lock:
+            snapshot = self._grant_snapshot
+            if snapshot is None:
+                return  # Loaded on the next check
+            conn = self._get_connection()
+            try:
+                rows = conn.execute(
+                    """
+                    SELECT agent_id, capability_id, scope, expires_at_ms FROM capability_grants
+                    WHERE agent_id = ? AND capability_id = ?
+                    AND (expires_at_ms IS NULL OR expires_at_ms > ?)
+                    """,
+                    (agent_id, capability_id, utc_now_ms()),
+                ).fetchall()
+            finally:
+                conn.close()
 
-    def _put_in_cache(self, key: str, value: bool):
-        """Put permission check result in cache"""
-        if not hasattr(self, "_cache"):
-            self._cache = {}
+            updated: GrantSnapshot = {}
+            for row in rows:
+                self._add_to_snapshot(updated, row)
+            # Replace the entry in one step; readers see the old or the new set
+            if updated:
+                snapshot[(agent_id, capability_id)] = updated[(agent_id, capability_id)]
+            else:
+                snapshot.pop((agent_id, capability_id), None)
 
-        expires_at = datetime.now() + timedelta(seconds=self._cache_ttl_seconds)
-        self._cache[key] = (value, expires_at)
+        logger.debug(f"Grant snapshot refreshed: {agent_id} / {capability_id}")
 
     def _clear_cache(self):
-        """Clear entire cache"""
-        if hasattr(self, "_cache"):
-            self._cache.clear()
+        """Drop the grant snapshot (reloaded on the next check)"""
+        with self._snapshot_lock:
+            self._grant_snapshot = None
         logger.debug("Cache cleared")
 
-    def _clear_agent_cache(self, agent_id: str):
-        """Clear cache for specific agent"""
-        if not hasattr(self, "_cache"):
-            return
-
-        keys_to_delete = [key for key in self._cache.keys() if key.startswith(f"{agent_id}:")]
-        for key in keys_to_delete:
-            del self._cache[key]
-
-        logger.debug(f"Cache cleared for agent: {agent_id}")
-
     # ===================================================================
     # Statistics
     # ===================================================================
@@ -1082,6 +1186,9 @@ class CapabilityRegistry:
         conn = self._get_connection()
         cursor = conn.cursor()
 
+        # Include queued invocation records in the counts
+        self.flush_invocations()
+
         stats = {}
 
         # Count definitions
@@ -1106,11 +1213,11 @@ class CapabilityRegistry:
         cursor.execute("SELECT COUNT(*) as count FROM capability_invocations WHERE allowed = 0")
         stats["denied_invocations"] = cursor.fetchone()["count"]
 
-        # Cache stats
-        if hasattr(self, "_cache"):
-            stats["cache_size"] = len(self._cache)
-        else:
-            stats["cache_size"] = 0
+        # Snapshot / invocation log stats
+        snapshot = self._grant_snapshot
+        stats["cache_size"] = len(snapshot) if snapshot is not None else 0
+        stats["invocation_log"] = self._invocation_log.get_stats()
+        stats["invocation_sample_rate"] = self.invocation_sample_rate
 
         conn.close()
 
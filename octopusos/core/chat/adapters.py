@@ -10,6 +10,9 @@ logger = logging.getLogger(__name__)
 class ChatModelAdapter:
     """Base class for chat model adapters"""
 
+    # Router instance id (e.g. "llamacpp:qwen3-coder-30b") that live telemetry is recorded under
+    instance_id: Optional[str] = None
+
     def generate(
         self,
         messages: List[Dict[str, Any]],
@@ -61,6 +64,20 @@ class ChatModelAdapter:
         """
         raise NotImplementedError
 
+    def _track_request(self) -> Any:
+        """Context manager recording latency, tokens and errors for router telemetry"""
+        from octopusos.router.telemetry import get_instance_telemetry
+
+        return get_instance_telemetry().track(self.instance_id or type(self).__name__)
+
+    @staticmethod
+    def _record_result(call: Any, metadata: Dict[str, Any]) -> None:
+        """Record a generate() result; adapters return empty metadata on failure"""
+        if not metadata:
+            call.fail()
+        else:
+            call.add_tokens(metadata.get("tokens_used") or 0)
+
     def get_adaptive_max_tokens(
         self,
         messages: List[Dict[str, str]],
@@ -124,16 +141,29 @@ class ChatModelAdapter:
 class OllamaChatAdapter(ChatModelAdapter):
     """Ollama adapter for Chat Mode (also used for llama.cpp and LM Studio)"""
 
-    def __init__(self, model: str = "qwen2.5:14b", base_url: Optional[str] = None):
+    def __init__(
+        self,
+        model: str = "qwen2.5:14b",
+        base_url: Optional[str] = None,
+        instance_id: Optional[str] = None,
+    ):
         """Initialize Ollama adapter
 
         Args:
             model: Model name
             base_url: Base URL (defaults to OLLAMA_HOST env var or http://localhost:11434)
+            instance_id: Provider instance id for router telemetry (defaults to "ollama")
         """
         self.model = model
         self.host = base_url or os.environ.get("OLLAMA_HOST", "http://localhost:11434")
-    
+        self.instance_id = instance_id or "ollama"
+
+    def _http_client(self) -> Any:
+        """Shared keep-alive client for this host (see octopusos.providers.http_pool)"""
+        from octopusos.providers.http_pool import get_sync_client
+
+        return get_sync_client(self.host, timeout="chat", provider="ollama")
+
     def generate(
         self,
         messages: List[Dict[str, Any]],
@@ -143,15 +173,22 @@ class OllamaChatAdapter(ChatModelAdapter):
         **kwargs: Any,
     ) -> tuple[str, Dict[str, Any]]:
         """Generate response using Ollama"""
-        try:
-            import requests
-        except ImportError:
-            logger.error("requests library not installed")
-            return "⚠️ Error: requests library required for Ollama", {}
+        with self._track_request() as call:
+            content, metadata = self._generate(messages, temperature, max_tokens)
+            self._record_result(call, metadata)
+            return content, metadata
+
+    def _generate(
+        self,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str, Dict[str, Any]]:
+        http_client = self._http_client()
 
         try:
             return self._chat_generate(
-                requests=requests,
+                http_client=http_client,
                 model=self.model,
                 messages=messages,
                 temperature=temperature,
@@ -164,7 +201,7 @@ class OllamaChatAdapter(ChatModelAdapter):
             if "404" in str(e):
                 try:
                     fallback_url = f"{self.host}/api/generate"
-                    response = requests.post(
+                    response = http_client.post(
                         fallback_url,
                         json={
                             "model": self.model,
@@ -187,11 +224,11 @@ class OllamaChatAdapter(ChatModelAdapter):
                         "tokens_used": result.get("eval_count"),
                     }
                 except Exception as fallback_error:
-                    auto_model = self._detect_first_available_model(requests)
+                    auto_model = self._detect_first_available_model(http_client)
                     if auto_model and auto_model != self.model:
                         try:
                             return self._chat_generate(
-                                requests=requests,
+                                http_client=http_client,
                                 model=auto_model,
                                 messages=messages,
                                 temperature=temperature,
@@ -222,13 +259,13 @@ class OllamaChatAdapter(ChatModelAdapter):
     def _chat_generate(
         self,
         *,
-        requests: Any,
+        http_client: Any,
         model: str,
         messages: List[Dict[str, Any]],
         temperature: float,
         max_tokens: int,
     ) -> tuple[str, Dict[str, Any]]:
-        response = requests.post(
+        response = http_client.post(
             f"{self.host}/api/chat",
             json={
                 "model": model,
@@ -251,9 +288,9 @@ class OllamaChatAdapter(ChatModelAdapter):
             "tokens_used": result.get("eval_count"),
         }
 
-    def _detect_first_available_model(self, requests: Any) -> Optional[str]:
+    def _detect_first_available_model(self, http_client: Any) -> Optional[str]:
         try:
-            resp = requests.get(f"{self.host}/api/tags", timeout=8)
+            resp = http_client.get(f"{self.host}/api/tags", timeout=8)
             resp.raise_for_status()
             models = resp.json().get("models", [])
             if not isinstance(models, list) or not models:
@@ -272,12 +309,16 @@ class OllamaChatAdapter(ChatModelAdapter):
         max_tokens: int = 2000
     ) -> Iterator[str]:
         """Generate response with streaming"""
-        try:
-            import requests
-        except ImportError:
-            yield "⚠️ Error: requests library required"
-            return
+        with self._track_request() as call:
+            yield from self._stream(call, messages, temperature, max_tokens)
 
+    def _stream(
+        self,
+        call: Any,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        max_tokens: int,
+    ) -> Iterator[str]:
         try:
             url = f"{self.host}/api/chat"
             payload = {
@@ -290,30 +331,31 @@ class OllamaChatAdapter(ChatModelAdapter):
                 }
             }
 
-            response = requests.post(url, json=payload, stream=True, timeout=60)
-            response.raise_for_status()
+            with self._http_client().stream("POST", url, json=payload, timeout=60) as response:
+                response.raise_for_status()
 
-            for line in response.iter_lines():
-                if line:
-                    try:
-                        data = line.decode('utf-8')
-                        import json
-                        chunk = json.loads(data)
-                        content = chunk.get("message", {}).get("content", "")
-                        if content:
-                            yield content
-                    except Exception:
-                        continue
+                for line in response.iter_lines():
+                    if line:
+                        try:
+                            import json
+                            chunk = json.loads(line)
+                            content = chunk.get("message", {}).get("content", "")
+                            if content:
+                                call.first_token()
+                                call.add_tokens(1)
+                                yield content
+                        except Exception:
+                            continue
 
         except Exception as e:
+            call.fail(e)
             logger.error(f"Ollama streaming failed: {e}")
             yield f"⚠️ Ollama error: {str(e)}"
 
     def health_check(self) -> tuple[bool, str]:
         """Check Ollama availability"""
         try:
-            import requests
-            response = requests.get(f"{self.host}/api/tags", timeout=5)
+            response = self._http_client().get(f"{self.host}/api/tags", timeout=5)
 
             if response.status_code == 200:
                 models = response.json().get("models", [])
@@ -353,7 +395,8 @@ class OpenAIChatAdapter(ChatModelAdapter):
         self,
         model: str = "gpt-4o-mini",
         api_key: Optional[str] = None,
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        instance_id: Optional[str] = None,
     ):
         """Initialize OpenAI adapter
         
@@ -361,10 +404,12 @@ class OpenAIChatAdapter(ChatModelAdapter):
             model: OpenAI model name
             api_key: API key (defaults to OPENAI_API_KEY env var)
             base_url: Base URL (for OpenAI-compatible services)
+            instance_id: Provider instance id for router telemetry (defaults to "openai")
         """
         self.model = model
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.base_url = base_url
+        self.instance_id = instance_id or "openai"
     
     def generate(
         self,
@@ -375,8 +420,20 @@ class OpenAIChatAdapter(ChatModelAdapter):
         **kwargs: Any,
     ) -> tuple[str, Dict[str, Any]]:
         """Generate response using OpenAI"""
+        with self._track_request() as call:
+            content, metadata = self._generate(messages, temperature, max_tokens, **kwargs)
+            self._record_result(call, metadata)
+            return content, metadata
+
+    def _generate(
+        self,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> tuple[str, Dict[str, Any]]:
         try:
-            import openai
+            import openai  # noqa: F401
         except ImportError:
             logger.error("openai library not installed")
             return "⚠️ Error: openai library required", {}
@@ -386,13 +443,11 @@ class OpenAIChatAdapter(ChatModelAdapter):
             return "⚠️ Error: OPENAI_API_KEY not configured", {}
 
         try:
-            client_kwargs = {"api_key": self.api_key}
-            if self.base_url:
-                client_kwargs["base_url"] = self.base_url
+            logger.info(f"Using pooled OpenAI client with base_url={self.base_url}, model={self.model}")
 
-            logger.info(f"Creating OpenAI client with base_url={self.base_url}, model={self.model}")
+            from octopusos.providers.http_pool import get_openai_client
 
-            client = openai.OpenAI(**client_kwargs)
+            client = get_openai_client(api_key=self.api_key, base_url=self.base_url)
 
             request_kwargs: Dict[str, Any] = {
                 "model": self.model,
@@ -464,25 +519,35 @@ class OpenAIChatAdapter(ChatModelAdapter):
         max_tokens: int = 2000
     ) -> Iterator[str]:
         """Generate response with streaming"""
+        with self._track_request() as call:
+            yield from self._stream(call, messages, temperature, max_tokens)
+
+    def _stream(
+        self,
+        call: Any,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        max_tokens: int,
+    ) -> Iterator[str]:
         try:
-            import openai
+            import openai  # noqa: F401
         except ImportError:
+            call.fail()
             yield "⚠️ Error: openai library required"
             return
 
         # Only check API key for actual OpenAI (not for local services with custom base_url)
         if not self.api_key and not self.base_url:
+            call.fail()
             yield "⚠️ Error: OPENAI_API_KEY not configured"
             return
         
         try:
-            client_kwargs = {"api_key": self.api_key}
-            if self.base_url:
-                client_kwargs["base_url"] = self.base_url
+            logger.info(f"Using pooled OpenAI client for streaming with base_url={self.base_url}, model={self.model}")
 
-            logger.info(f"Creating OpenAI client for streaming with base_url={self.base_url}, model={self.model}")
+            from octopusos.providers.http_pool import get_openai_client
 
-            client = openai.OpenAI(**client_kwargs)
+            client = get_openai_client(api_key=self.api_key, base_url=self.base_url)
 
             stream = client.chat.completions.create(
                 model=self.model,
@@ -494,9 +559,12 @@ class OpenAIChatAdapter(ChatModelAdapter):
 
             for chunk in stream:
                 if chunk.choices[0].delta.content:
+                    call.first_token()
+                    call.add_tokens(1)
                     yield chunk.choices[0].delta.content
 
         except Exception as e:
+            call.fail(e)
             logger.error(f"OpenAI streaming failed: {e}", exc_info=True)
             yield f"⚠️ OpenAI error: {str(e)}"
     
@@ -560,6 +628,7 @@ def get_adapter(provider: str, model: Optional[str] = None) -> ChatModelAdapter:
     if provider_type == "ollama":
         model = model or "qwen2.5:14b"
         base_url = None
+        resolved_id = "ollama"
 
         # Get actual endpoint from registry
         try:
@@ -571,23 +640,28 @@ def get_adapter(provider: str, model: Optional[str] = None) -> ChatModelAdapter:
                 provider_obj = registry.get(f"ollama:{instance_id}")
                 if provider_obj and hasattr(provider_obj, 'endpoint'):
                     base_url = provider_obj.endpoint
+                    resolved_id = provider_obj.id
                     logger.info(f"Using ollama instance endpoint: {base_url}")
             else:
                 # No instance specified - find any available ollama instance
                 from octopusos.providers.base import ProviderState
                 all_providers = registry.list_all()
                 first_ollama_endpoint = None
+                first_ollama_id = None
                 for p in all_providers:
                     if p.id.startswith("ollama:") or p.id == "ollama":
                         if first_ollama_endpoint is None and hasattr(p, "endpoint"):
                             first_ollama_endpoint = p.endpoint
+                            first_ollama_id = p.id
                         status = p.get_cached_status()
                         if status and status.state == ProviderState.READY:
                             base_url = p.endpoint
+                            resolved_id = p.id
                             logger.info(f"Auto-selected ollama instance: {p.id} at {base_url}")
                             break
                 if not base_url and first_ollama_endpoint:
                     base_url = first_ollama_endpoint
+                    resolved_id = first_ollama_id
                     logger.info(f"Selected ollama instance without cached status: {base_url}")
 
             if not base_url:
@@ -598,12 +672,13 @@ def get_adapter(provider: str, model: Optional[str] = None) -> ChatModelAdapter:
             logger.warning(f"Failed to get ollama endpoint: {e}", exc_info=True)
             base_url = "http://127.0.0.1:11434"
 
-        return OllamaChatAdapter(model=model, base_url=base_url)
+        return OllamaChatAdapter(model=model, base_url=base_url, instance_id=resolved_id)
 
     # Handle llama.cpp (OpenAI-compatible)
     elif provider_type == "llamacpp":
         model = model or "local-model"
         base_url = None
+        resolved_id = provider_type
 
         # Get actual endpoint from registry
         try:
@@ -615,11 +690,12 @@ def get_adapter(provider: str, model: Optional[str] = None) -> ChatModelAdapter:
                 provider_obj = registry.get(f"llamacpp:{instance_id}")
                 if provider_obj and hasattr(provider_obj, 'endpoint'):
                     base_url = provider_obj.endpoint
+                    resolved_id = provider_obj.id
                     logger.info(f"Using llamacpp instance endpoint: {base_url}")
             else:
                 # No instance specified - find instance that has this model
                 from octopusos.providers.base import ProviderState
-                import asyncio
+                from octopusos.core.utils.background_loop import run_coroutine_sync
                 import requests
                 all_providers = registry.list_all()
 
@@ -634,7 +710,7 @@ def get_adapter(provider: str, model: Optional[str] = None) -> ChatModelAdapter:
                         status = p.get_cached_status()
                         if not status:
                             try:
-                                status = asyncio.run(p.probe())
+                                status = run_coroutine_sync(p.probe())
                             except:
                                 continue
 
@@ -651,6 +727,7 @@ def get_adapter(provider: str, model: Optional[str] = None) -> ChatModelAdapter:
 
                                 if model in models:
                                     base_url = p.endpoint
+                                    resolved_id = p.id
                                     logger.info(f"✓ Found model '{model}' in instance: {p.id} at {base_url}")
                                     break
                         except Exception as e:
@@ -664,12 +741,13 @@ def get_adapter(provider: str, model: Optional[str] = None) -> ChatModelAdapter:
                         status = p.get_cached_status()
                         if not status:
                             try:
-                                status = asyncio.run(p.probe())
+                                status = run_coroutine_sync(p.probe())
                             except:
                                 continue
 
                         if status and status.state == ProviderState.READY:
                             base_url = p.endpoint
+                            resolved_id = p.id
                             logger.info(f"Auto-selected llamacpp instance: {p.id} at {base_url}")
                             break
 
@@ -683,12 +761,15 @@ def get_adapter(provider: str, model: Optional[str] = None) -> ChatModelAdapter:
             base_url = "http://127.0.0.1:8080"
 
         # llama.cpp uses OpenAI-compatible API
-        return OpenAIChatAdapter(model=model, base_url=f"{base_url}/v1", api_key="dummy")
+        return OpenAIChatAdapter(
+            model=model, base_url=f"{base_url}/v1", api_key="dummy", instance_id=resolved_id
+        )
 
     # Handle LM Studio (OpenAI-compatible)
     elif provider_type == "lmstudio":
         model = model or "local-model"
         base_url = None
+        resolved_id = provider_type
 
         # Get actual endpoint from registry
         try:
@@ -700,23 +781,25 @@ def get_adapter(provider: str, model: Optional[str] = None) -> ChatModelAdapter:
                 provider_obj = registry.get(f"lmstudio:{instance_id}")
                 if provider_obj and hasattr(provider_obj, 'endpoint'):
                     base_url = provider_obj.endpoint
+                    resolved_id = provider_obj.id
                     logger.info(f"Using lmstudio instance endpoint: {base_url}")
             else:
                 # No instance specified - find any available lmstudio instance
                 from octopusos.providers.base import ProviderState
-                import asyncio
+                from octopusos.core.utils.background_loop import run_coroutine_sync
                 all_providers = registry.list_all()
                 for p in all_providers:
                     if p.id.startswith("lmstudio:") or p.id == "lmstudio":
                         status = p.get_cached_status()
                         if not status:
                             try:
-                                status = asyncio.run(p.probe())
+                                status = run_coroutine_sync(p.probe())
                             except:
                                 continue
 
                         if status and status.state == ProviderState.READY:
                             base_url = p.endpoint
+                            resolved_id = p.id
                             logger.info(f"Auto-selected lmstudio instance: {p.id} at {base_url}")
                             break
 
@@ -728,7 +811,9 @@ def get_adapter(provider: str, model: Optional[str] = None) -> ChatModelAdapter:
             logger.warning(f"Failed to get lmstudio endpoint: {e}", exc_info=True)
             base_url = "http://127.0.0.1:1234"
 
-        return OpenAIChatAdapter(model=model, base_url=f"{base_url}/v1", api_key="dummy")
+        return OpenAIChatAdapter(
+            model=model, base_url=f"{base_url}/v1", api_key="dummy", instance_id=resolved_id
+        )
 
     # Handle OpenAI
     elif provider_type == "openai" or provider_type == "cloud":
@@ -1,17 +1,20 @@
 """Context builder for Chat Mode - assembles context from multiple sources"""
 
-from typing import List, Dict, Any, Optional, Literal
-from dataclasses import dataclass
+from typing import Callable, List, Dict, Any, Optional, Literal
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 import logging
 import hashlib
 import json
+import os
 import sqlite3
 import re
 
 from octopusos.core.chat.models import ChatMessage
 from octopusos.core.chat.service import ChatService
+from octopusos.core.chat.token_counter import TokenCounter, get_token_counter
 from octopusos.core.evidence import normalize_evidence_refs
 from octopusos.core.memory.service import MemoryService
 from octopusos.core.project_kb.service import ProjectKBService
@@ -22,6 +25,13 @@ from octopusos.core.time import utc_now, utc_now_ms
 
 logger = logging.getLogger(__name__)
 
+# Bounded pool for the independent context sources (window, summaries,
+# memory, RAG); each loader uses its own connection or a thread-local one.
+_SOURCE_LOADER_POOL = ThreadPoolExecutor(
+    max_workers=max(1, int(os.getenv("OCTOPUSOS_CONTEXT_LOADER_WORKERS", "8"))),
+    thread_name_prefix="context-loader",
+)
+
 
 class UsageWatermark(Enum):
     """Token usage watermarks for auto-summary trigger"""
@@ -115,6 +125,8 @@ class ContextPack:
     audit: Dict[str, Any]
     usage: ContextUsage  # NEW: Usage statistics
     snapshot_id: Optional[str] = None  # NEW: Snapshot ID if saved
+    # Audit/snapshot writes of a deferred build, run by ContextBuilder.commit()
+    pending_commit: Optional[Callable[[], Optional[str]]] = field(default=None, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -139,7 +151,8 @@ class ContextBuilder:
         budget_resolver: Optional['BudgetResolver'] = None,
         db_path: Optional[str] = None,
         enable_auto_summary: bool = True,
-        enable_snapshots: bool = True
+        enable_snapshots: bool = True,
+        token_counter: Optional[TokenCounter] = None
     ):
         """Initialize ContextBuilder
 
@@ -152,6 +165,7 @@ class ContextBuilder:
             db_path: Database path (for snapshots)
             enable_auto_summary: Whether to auto-trigger summaries
             enable_snapshots: Whether to save context snapshots
+            token_counter: TokenCounter for budgeting (default: process-wide counter)
         """
         self.chat_service = chat_service or ChatService()
         self.memory_service = memory_service or MemoryService()
@@ -190,6 +204,7 @@ class ContextBuilder:
 
         self.enable_auto_summary = enable_auto_summary
         self.enable_snapshots = enable_snapshots
+        self.token_counter = token_counter or get_token_counter()
 
         # Summary artifacts cache (artifact_id -> message range)
         self._summary_cache: Dict[str, tuple[int, int]] = {}
@@ -200,7 +215,8 @@ class ContextBuilder:
         user_input: str,
         rag_enabled: bool = True,
         memory_enabled: bool = True,
-        reason: Literal["send", "dry_run", "audit"] = "send"
+        reason: Literal["send", "dry_run", "audit"] = "send",
+        defer_side_effects: bool = False,
     ) -> ContextPack:
         """Build context for a chat message
 
@@ -210,6 +226,9 @@ class ContextBuilder:
             rag_enabled: Whether to include RAG context
             memory_enabled: Whether to include Memory facts
             reason: Reason for building context (send/dry_run/audit)
+            defer_side_effects: Leave the KB-retrieval and memory-injection
+                audits and the snapshot to commit(), so a speculative build
+                can be dropped
 
         Returns:
             ContextPack with assembled context
@@ -223,12 +242,24 @@ class ContextBuilder:
             f"model_window: {self.budget.model_context_window})"
         )
         
-        # 1. Load session window (recent messages)
-        window_messages = self._load_session_window(session_id)
+        # 1-4. Start the independent source loads concurrently
+        auto_summary = self.enable_auto_summary and reason == "send"
+        window_load = _SOURCE_LOADER_POOL.submit(self._load_session_window, session_id)
+        summary_load = None if auto_summary else _SOURCE_LOADER_POOL.submit(self._load_summary_artifacts, session_id)
+        memory_load = _SOURCE_LOADER_POOL.submit(self._load_memory_facts, session_id) if memory_enabled else None
+        rag_load = (
+            _SOURCE_LOADER_POOL.submit(self._load_rag_context, session_id=session_id, query=user_input)
+            if rag_enabled
+            else None
+        )
+
+        # 1. Session window (recent messages)
+        window_messages = window_load.result()
         
-        # 2. Check if auto-summary should be triggered
+        # 2. Check if auto-summary should be triggered (needs the window;
+        # memory and RAG keep loading meanwhile)
         summary_artifacts = []
-        if self.enable_auto_summary and reason == "send":
+        if auto_summary:
             summary_trigger = self._check_summary_trigger(session_id, window_messages)
             if summary_trigger:
                 logger.info(f"Auto-summary triggered: {summary_trigger['reason']}")
@@ -236,12 +267,12 @@ class ContextBuilder:
                 # For now, load existing summaries
                 summary_artifacts = self._load_summary_artifacts(session_id)
         else:
-            summary_artifacts = self._load_summary_artifacts(session_id)
+            summary_artifacts = summary_load.result()
         
-        # 3. Load pinned facts from Memory
+        # 3. Pinned facts from Memory
         memory_facts = []
-        if memory_enabled:
-            memory_facts = self._load_memory_facts(session_id)
+        if memory_load is not None:
+            memory_facts = memory_load.result()
 
             # Log memory context injection for observability
             if memory_facts:
@@ -257,11 +288,11 @@ class ContextBuilder:
                     f"(preferred_name={'present' if has_preferred_name else 'absent'})"
                 )
 
-        # 4. Load RAG context
+        # 4. RAG context
         rag_chunks = []
         rag_trace = {}
-        if rag_enabled:
-            rag_chunks, rag_trace = self._load_rag_context(session_id=session_id, query=user_input)
+        if rag_load is not None:
+            rag_chunks, rag_trace = rag_load.result()
         
         # 5. Check budget and trim if needed
         context_parts = {
@@ -296,14 +327,6 @@ class ContextBuilder:
             user_input=user_input
         )
 
-        # Log audit event for memory context injection
-        if trimmed_parts["memory"]:
-            self._log_memory_injection_audit(
-                session_id=session_id,
-                memory_facts=trimmed_parts["memory"],
-                usage=usage
-            )
-        
         # 9. Generate audit trail
         audit = self._generate_audit(
             session_id=session_id,
@@ -333,16 +356,25 @@ class ContextBuilder:
             "usage_ratio": usage.usage_ratio,
             "watermark": usage.watermark.value,
             "trimming": trim_debug,
+            "tokenizer": self.token_counter.backend,
             "integrity_budget": {
                 "mcc_recovery_tokens": self.budget.mcc_recovery_tokens,
                 "rag_recovery_tokens": self.budget.rag_recovery_tokens,
             },
         }
         
-        # 11. Save context snapshot (if enabled)
-        snapshot_id = None
-        if self.enable_snapshots:
-            snapshot_id = self._save_snapshot(
+        # 11. Side effects: KB retrieval + memory injection audits, context snapshot (if enabled)
+        def _commit() -> Optional[str]:
+            self._log_kb_retrieval_audit(session_id=session_id, trace=rag_trace)
+            if trimmed_parts["memory"]:
+                self._log_memory_injection_audit(
+                    session_id=session_id,
+                    memory_facts=trimmed_parts["memory"],
+                    usage=usage
+                )
+            if not self.enable_snapshots:
+                return None
+            return self._save_snapshot(
                 session_id=session_id,
                 reason=reason,
                 usage=usage,
@@ -354,14 +386,29 @@ class ContextBuilder:
                 },
                 assembled_hash=audit["context_hash"]
             )
-        
-        return ContextPack(
+
+        pack = ContextPack(
             messages=messages,
             metadata=metadata,
             audit=audit,
             usage=usage,
-            snapshot_id=snapshot_id
+            pending_commit=_commit,
         )
+        return pack if defer_side_effects else self.commit(pack)
+
+    def commit(self, pack: ContextPack) -> ContextPack:
+        """Run the deferred audit/snapshot writes of a build(defer_side_effects=True)
+
+        Args:
+            pack: ContextPack to commit (no-op if already committed)
+
+        Returns:
+            The same pack, with snapshot_id set if a snapshot was saved
+        """
+        commit_fn, pack.pending_commit = pack.pending_commit, None
+        if commit_fn is not None:
+            pack.snapshot_id = commit_fn()
+        return pack
     
     def _load_session_window(self, session_id: str) -> List[ChatMessage]:
         """Load recent messages from session
@@ -469,7 +516,6 @@ class ContextBuilder:
 
             logger.debug(f"Retrieved {len(results)} RAG chunks")
             rag_chunks = [r.to_dict() for r in results]
-            self._log_kb_retrieval_audit(session_id=session_id, trace=trace)
             return rag_chunks, trace
 
         except Exception as e:
@@ -530,7 +576,7 @@ class ContextBuilder:
         """
         original_window_msgs = list(context_parts["window"])
         # Estimate tokens for each part
-        window_tokens = sum(msg.estimate_tokens() for msg in context_parts["window"])
+        window_tokens = sum(self._message_tokens(msg) for msg in context_parts["window"])
         memory_tokens = sum(self._estimate_text_tokens(json.dumps(m)) for m in context_parts["memory"])
         rag_tokens = sum(self._estimate_text_tokens(c.get("content", "")) for c in context_parts["rag"])
         summary_tokens = sum(self._estimate_text_tokens(s.get("content", "")) for s in context_parts.get("summaries", []))
@@ -586,7 +632,7 @@ class ContextBuilder:
             logger.warning(f"Trimmed {trimmed_memory} memory facts (budget: {self.budget.memory_tokens})")
 
         tokens_after = (
-            sum(msg.estimate_tokens() for msg in context_parts["window"])
+            sum(self._message_tokens(msg) for msg in context_parts["window"])
             + sum(self._estimate_text_tokens(json.dumps(m)) for m in context_parts["memory"])
             + sum(self._estimate_text_tokens(c.get("content", "")) for c in context_parts["rag"])
             + sum(self._estimate_text_tokens(s.get("content", "")) for s in context_parts.get("summaries", []))
@@ -664,7 +710,7 @@ class ContextBuilder:
         
         # Iterate from most recent to oldest
         for msg in reversed(messages):
-            msg_tokens = msg.estimate_tokens()
+            msg_tokens = self._message_tokens(msg)
             if tokens + msg_tokens <= max_tokens:
                 trimmed.insert(0, msg)  # Insert at beginning to maintain order
                 tokens += msg_tokens
@@ -927,8 +973,12 @@ class ContextBuilder:
         return audit
     
     def _estimate_text_tokens(self, text: str) -> int:
-        """Estimate token count for text"""
-        return int(len(text) * 1.3)
+        """Estimate token count for text (memoized by content hash)"""
+        return self.token_counter.count_cached(text)
+
+    def _message_tokens(self, msg: ChatMessage) -> int:
+        """Token count of a window message (memoized by message_id + content hash)"""
+        return self.token_counter.count_message(msg)
     
     def _estimate_tokens(self, messages: List[Dict[str, str]]) -> int:
         """Estimate total tokens in messages"""
@@ -980,7 +1030,7 @@ class ContextBuilder:
                 return None
         
         # Check token usage (this is checked after budget application)
-        window_tokens = sum(msg.estimate_tokens() for msg in window_messages)
+        window_tokens = sum(self._message_tokens(msg) for msg in window_messages)
         window_budget = self.budget.window_tokens
         
         if window_tokens > window_budget * 0.8:  # 80% of window budget
@@ -1053,11 +1103,11 @@ class ContextBuilder:
             found_last = False
             for msg in window_messages:
                 if found_last:
-                    age_tokens += msg.estimate_tokens()
+                    age_tokens += self._message_tokens(msg)
                 if getattr(msg, 'message_id', None) == summary_last_message_id:
                     found_last = True
         else:
-            age_tokens = sum(msg.estimate_tokens() for msg in window_messages)
+            age_tokens = sum(self._message_tokens(msg) for msg in window_messages)
 
         # Staleness thresholds
         MESSAGE_THRESHOLD = 15
@@ -1174,7 +1224,7 @@ class ContextBuilder:
             ContextUsage object
         """
         tokens_system = self._estimate_text_tokens(system_prompt)
-        tokens_window = sum(msg.estimate_tokens() for msg in window_messages)
+        tokens_window = sum(self._message_tokens(msg) for msg in window_messages)
         tokens_memory = sum(self._estimate_text_tokens(json.dumps(m)) for m in memory_facts)
         tokens_rag = sum(self._estimate_text_tokens(c.get("content", "")) for c in rag_chunks)
         tokens_summary = sum(self._estimate_text_tokens(s.get("content", "")) for s in summary_artifacts)
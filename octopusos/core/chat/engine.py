@@ -6,9 +6,10 @@ import json
 import re
 import os
 import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from types import SimpleNamespace
 from pathlib import Path
-import asyncio
 
 from octopusos.core.chat.service import ChatService
 from octopusos.core.chat.context_builder import ContextBuilder, ContextBudget
@@ -64,6 +65,8 @@ from octopusos.core.chat.context_integrity import (
     ContextRecoveryService,
     ContextIntegrityGate,
 )
+from octopusos.core.chat.search_fanout import SearchFanout, SearchJob
+from octopusos.core.utils.background_loop import run_coroutine_sync
 from octopusos.core.chat.company_research import (
     apply_mature_company_fallback,
     COMPANY_RESEARCH_INTENT,
@@ -94,8 +97,8 @@ from octopusos.core.capabilities.external_facts import (
 from octopusos.core.capabilities.external_facts.provider_store import ExternalFactsProviderStore
 from octopusos.core.evidence import enforce_evidence, normalize_evidence_refs
 from octopusos.core.executor.audit_logger import AuditLogger
-from octopusos.core.mcp.client import MCPClient
 from octopusos.core.mcp.config import MCPConfigManager, MCPServerConfig
+from octopusos.core.mcp.session_pool import get_mcp_session_pool
 
 # Import and register all slash commands
 from octopusos.core.chat.handlers import (
@@ -112,6 +115,13 @@ from octopusos.core.chat.handlers import (
 
 logger = logging.getLogger(__name__)
 
+# Shared by all engines: speculative context builds for send_message
+_CONTEXT_PREFETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chat-context-prefetch")
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
 
 class ChatEngine:
     """Main engine for Chat Mode"""
@@ -250,6 +260,8 @@ class ChatEngine:
             Response dictionary with message and metadata
         """
         logger.info(f"Processing message for session {session_id}")
+        send_started = time.perf_counter()
+        stage_latency: Dict[str, Any] = {"speculative_context": False}
 
         # 1. Save user message
         user_message = self.chat_service.add_message(
@@ -616,65 +628,97 @@ class ChatEngine:
             "task_id": session.task_id
         }
 
-        if can_use_external:
-            try:
-                import asyncio
-                # Classify the message
-                classification_result = asyncio.run(self.info_need_classifier.classify(effective_user_input))
+        # Speculative mode: assemble context while classification runs. The
+        # pack is built without side effects and dropped if classification
+        # routes the message elsewhere.
+        rag_enabled = session.metadata.get("rag_enabled", True)
+        speculative_context = None
+        if can_use_external and self._speculative_context_enabled(session.metadata):
+            speculative_context = self._start_speculative_context(
+                session_id=session_id,
+                user_input=effective_user_input,
+                rag_enabled=rag_enabled,
+            )
 
-                logger.info(
-                    f"Message classified: type={classification_result.info_need_type.value}, "
-                    f"action={classification_result.decision_action.value}, "
-                    f"confidence={classification_result.confidence_level.value}"
-                )
+        continue_to_model = False
+        try:
+            if can_use_external:
+                try:
+                    import asyncio
+                    # Classify the message
+                    classify_started = time.perf_counter()
+                    try:
+                        classification_result = asyncio.run(self.info_need_classifier.classify(effective_user_input))
+                    finally:
+                        stage_latency["classify_ms"] = _elapsed_ms(classify_started)
 
-                # Route based on classification decision
-                if classification_result.decision_action == DecisionAction.LOCAL_CAPABILITY:
-                    llm_fact_request = self._resolve_external_fact_request(
-                        effective_user_input,
-                        classification_context,
+                    logger.info(
+                        f"Message classified: type={classification_result.info_need_type.value}, "
+                        f"action={classification_result.decision_action.value}, "
+                        f"confidence={classification_result.confidence_level.value}"
                     )
-                    if llm_fact_request:
-                        rerouted_context = dict(classification_context)
-                        rerouted_context["external_fact_request"] = llm_fact_request
-                        logger.info(
-                            "Re-routing LOCAL_CAPABILITY to external facts via LLM intent resolution",
-                            extra={"session_id": session_id, "kind": llm_fact_request.get("kind")},
-                        )
-                        return self._handle_external_info_need(
-                            session_id,
+
+                    # Route based on classification decision
+                    if classification_result.decision_action == DecisionAction.LOCAL_CAPABILITY:
+                        llm_fact_request = self._resolve_external_fact_request(
                             effective_user_input,
-                            classification_result,
-                            rerouted_context,
-                            stream,
+                            classification_context,
                         )
-                    # Handle ambient state queries or local deterministic operations
-                    return self._handle_ambient_state(session_id, effective_user_input, classification_result, classification_context, stream)
+                        if llm_fact_request:
+                            rerouted_context = dict(classification_context)
+                            rerouted_context["external_fact_request"] = llm_fact_request
+                            logger.info(
+                                "Re-routing LOCAL_CAPABILITY to external facts via LLM intent resolution",
+                                extra={"session_id": session_id, "kind": llm_fact_request.get("kind")},
+                            )
+                            return self._handle_external_info_need(
+                                session_id,
+                                effective_user_input,
+                                classification_result,
+                                rerouted_context,
+                                stream,
+                            )
+                        # Handle ambient state queries or local deterministic operations
+                        return self._handle_ambient_state(session_id, effective_user_input, classification_result, classification_context, stream)
 
-                elif classification_result.decision_action == DecisionAction.REQUIRE_COMM:
-                    # Requires external information
-                    return self._handle_external_info_need(session_id, effective_user_input, classification_result, classification_context, stream)
+                    elif classification_result.decision_action == DecisionAction.REQUIRE_COMM:
+                        # Requires external information
+                        return self._handle_external_info_need(session_id, effective_user_input, classification_result, classification_context, stream)
 
-                elif classification_result.decision_action == DecisionAction.SUGGEST_COMM:
-                    # Can answer but suggest verification
-                    return self._handle_with_comm_suggestion(session_id, effective_user_input, classification_result, classification_context, stream)
+                    elif classification_result.decision_action == DecisionAction.SUGGEST_COMM:
+                        # Can answer but suggest verification
+                        return self._handle_with_comm_suggestion(session_id, effective_user_input, classification_result, classification_context, stream)
 
-                # DecisionAction.DIRECT_ANSWER - continue to normal flow
-                logger.info("Direct answer mode - proceeding with normal message flow")
+                    # DecisionAction.DIRECT_ANSWER - continue to normal flow
+                    logger.info("Direct answer mode - proceeding with normal message flow")
 
+                except Exception as e:
+                    # Classification failed - fallback to normal flow
+                    logger.warning(f"Classification failed, falling back to direct answer: {e}", exc_info=True)
+            continue_to_model = True
+        finally:
+            if speculative_context is not None and not continue_to_model:
+                speculative_context.cancel()
+                logger.info("Discarded speculative context: classification routed elsewhere")
+
+        # 5. Normal message - build context (or adopt the speculative one)
+        context_started = time.perf_counter()
+        context_pack = None
+        if speculative_context is not None:
+            try:
+                context_pack = self.context_builder.commit(speculative_context.result())
+                stage_latency["speculative_context"] = True
             except Exception as e:
-                # Classification failed - fallback to normal flow
-                logger.warning(f"Classification failed, falling back to direct answer: {e}", exc_info=True)
-
-        # 5. Normal message - build context
-        rag_enabled = session.metadata.get("rag_enabled", True)
-        
-        context_pack = self.context_builder.build(
-            session_id=session_id,
-            user_input=effective_user_input,
-            rag_enabled=rag_enabled,
-            memory_enabled=True
-        )
+                logger.warning(f"Speculative context build failed, rebuilding: {e}")
+        if context_pack is None:
+            context_pack = self.context_builder.build(
+                session_id=session_id,
+                user_input=effective_user_input,
+                rag_enabled=rag_enabled,
+                memory_enabled=True
+            )
+        # Time spent waiting for context after classification (critical path)
+        stage_latency["context_ms"] = _elapsed_ms(context_started)
         context_pack = self._apply_context_integrity_gate(
             context_pack=context_pack,
             session=session,
@@ -688,7 +732,12 @@ class ChatEngine:
         unlock_degraded_reason = ""
         if stream:
             # Return a stream generator
-            return self._stream_response(session_id, context_pack, model_route)
+            return self._stream_response(
+                session_id,
+                context_pack,
+                model_route,
+                latency={**stage_latency, "started": send_started},
+            )
         else:
             session_mode = str(session.metadata.get("conversation_mode") or "chat").lower()
             model_tools: List[Dict[str, Any]] = []
@@ -705,12 +754,16 @@ class ChatEngine:
             if model_tools:
                 generate_kwargs["tools"] = model_tools
                 generate_kwargs["tool_choice"] = "auto"
+            model_started = time.perf_counter()
             response_content, response_metadata = self._invoke_model(
                 context_pack,
                 model_route,
                 session_id,
                 extra_generate_kwargs=generate_kwargs or None,
             )
+            # Non-streaming: the first token reaches the caller with the full reply
+            stage_latency["model_ms"] = _elapsed_ms(model_started)
+            stage_latency["first_token_ms"] = _elapsed_ms(send_started)
             tool_loop_result = None
             if can_use_mcp:
                 tool_loop_result = self._run_native_tool_loop(
@@ -804,6 +857,7 @@ class ChatEngine:
             if unlock_degraded_reason:
                 message_metadata["unlock_fallback_reason"] = unlock_degraded_reason
                 message_metadata["unlock_fallback_offline"] = True
+            message_metadata["latency"] = {**stage_latency, "total_ms": _elapsed_ms(send_started)}
 
             assistant_message = self.chat_service.add_message(
                 session_id=session_id,
@@ -844,7 +898,8 @@ class ChatEngine:
         self,
         session_id: str,
         context_pack: Any,
-        model_route: str = "local"
+        model_route: str = "local",
+        latency: Optional[Dict[str, Any]] = None,
     ):
         """Stream response from model
 
@@ -852,6 +907,7 @@ class ChatEngine:
             session_id: Session ID
             context_pack: ContextPack with assembled messages
             model_route: "local" or "cloud"
+            latency: Stage latencies of send_message plus its "started" perf_counter
 
         Yields:
             Text chunks
@@ -1115,11 +1171,17 @@ class ChatEngine:
             user_input = str((context_pack.messages or [{}])[-1].get("content") or "")
 
             # Stream response
+            stage_latency = dict(latency or {})
+            request_started = stage_latency.pop("started", None)
+            model_started = time.perf_counter()
             for chunk in adapter.generate_stream(
                 messages=context_pack.messages,
                 temperature=0.7,
                 max_tokens=2000
             ):
+                if not full_response and request_started is not None:
+                    stage_latency["model_first_chunk_ms"] = _elapsed_ms(model_started)
+                    stage_latency["first_token_ms"] = _elapsed_ms(request_started)
                 full_response.append(chunk)
                 yield chunk
             
@@ -1166,6 +1228,8 @@ class ChatEngine:
                 "context_tokens": context_pack.metadata.get("total_tokens"),
                 "streamed": True
             }
+            if request_started is not None:
+                message_metadata["latency"] = {**stage_latency, "total_ms": _elapsed_ms(request_started)}
 
             # Add guardian metadata if response was modified
             if guardian_metadata:
@@ -2262,49 +2326,48 @@ class ChatEngine:
         self._ensure_company_research_provider_defaults()
         queries = self._build_company_research_queries(company_name=company_name, region=region)
 
+        # All (query, engine) pairs run concurrently; bing hedges slow or empty
+        # duckduckgo answers for core queries, news queries go to google only.
+        jobs = [
+            SearchJob(bucket="core", query=query, engines=("duckduckgo", "bing"), max_results=6)
+            for query in queries["core"]
+        ] + [
+            SearchJob(bucket="news", query=query, engines=("google",), max_results=5)
+            for query in queries["news"]
+        ]
+
+        def _env_float(name: str, default: float) -> float:
+            try:
+                return float(os.getenv(name, str(default)))
+            except Exception:
+                return default
+
         async def _search_all() -> Dict[str, List[Dict[str, Any]]]:
             from octopusos.core.chat.communication_adapter import CommunicationAdapter
 
-            core_adapters = [
-                CommunicationAdapter(web_search_engine="duckduckgo"),
-                CommunicationAdapter(web_search_engine="bing"),
-            ]
-            news_adapter = CommunicationAdapter(web_search_engine="google", google_mode="auto")
-            bucket: Dict[str, List[Dict[str, Any]]] = {"core": [], "news": []}
-            seen_urls: set[str] = set()
-            for key in ("core", "news"):
-                for query in queries[key]:
-                    adapters = core_adapters if key == "core" else [news_adapter]
-                    collected = False
-                    for adapter in adapters:
-                        try:
-                            response = await adapter.search(
-                                query=query,
-                                session_id=session_id,
-                                task_id=task_id,
-                                max_results=6 if key == "core" else 5,
-                            )
-                        except Exception:
-                            continue
-                        rows = response.get("results") if isinstance(response, dict) else []
-                        if not isinstance(rows, list):
-                            continue
-                        local_count = 0
-                        for row in rows:
-                            if not isinstance(row, dict):
-                                continue
-                            url = str(row.get("url") or "").strip()
-                            if url and url in seen_urls:
-                                continue
-                            if url:
-                                seen_urls.add(url)
-                            bucket[key].append(row)
-                            local_count += 1
-                        if local_count > 0:
-                            collected = True
-                        if collected:
-                            break
-            return bucket
+            adapters = {
+                "duckduckgo": CommunicationAdapter(web_search_engine="duckduckgo"),
+                "bing": CommunicationAdapter(web_search_engine="bing"),
+                "google": CommunicationAdapter(web_search_engine="google", google_mode="auto"),
+            }
+
+            async def _search(engine: str, query: str, max_results: int) -> Dict[str, Any]:
+                return await adapters[engine].search(
+                    query=query,
+                    session_id=session_id,
+                    task_id=task_id,
+                    max_results=max_results,
+                )
+
+            fanout = SearchFanout(
+                _search,
+                per_engine_concurrency=int(_env_float("OCTOPUSOS_RESEARCH_SEARCH_PER_ENGINE", 3)),
+                hedge_delay=_env_float("OCTOPUSOS_RESEARCH_SEARCH_HEDGE_S", 2.0),
+                deadline=_env_float("OCTOPUSOS_RESEARCH_SEARCH_DEADLINE_S", 20.0),
+            )
+            outcome = await fanout.run(jobs)
+            logger.info("Company research search fan-out", extra={"company": company_name, **outcome.stats()})
+            return outcome.buckets
 
         return self._run_async_in_sync(_search_all())
 
@@ -2737,7 +2800,7 @@ class ChatEngine:
         seen_names: set[str] = set()
         for server in servers:
             try:
-                tools = asyncio.run(self._probe_server_tools(server))
+                tools = self._probe_server_tools(server)
             except Exception:
                 continue
             for tool in tools:
@@ -2781,10 +2844,8 @@ class ChatEngine:
         timeout_budget = max(0.2, float(probe_timeout_s))
         for server in servers:
             try:
-                tools = asyncio.run(
-                    asyncio.wait_for(self._probe_server_tools(server), timeout=timeout_budget)
-                )
-            except asyncio.TimeoutError:
+                tools = self._probe_server_tools(server, timeout=timeout_budget)
+            except TimeoutError:
                 timeout_count += 1
                 continue
             except Exception:
@@ -2815,16 +2876,11 @@ class ChatEngine:
             degraded_reason = "mcp_probe_timeout" if timeout_count > 0 else "mcp_probe_error"
         return tools_out, degraded_reason
 
-    async def _probe_server_tools(self, server: MCPServerConfig) -> List[Dict[str, Any]]:
-        client = MCPClient(server)
-        try:
-            await client.connect()
-            return await client.list_tools()
-        finally:
-            try:
-                await client.disconnect()
-            except Exception:
-                pass
+    def _probe_server_tools(self, server: MCPServerConfig, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        # Warm pooled session; the schema list is cached until the server
+        # restarts or reports tools/list_changed. A timed-out probe leaves
+        # the server starting, so the next probe finds it ready.
+        return get_mcp_session_pool().list_tools_sync(server, timeout=timeout)
 
     def _find_tool_and_server(
         self,
@@ -2843,7 +2899,7 @@ class ChatEngine:
         candidates = package_filtered if package_filtered else servers
         for server in candidates:
             try:
-                tools = asyncio.run(self._probe_server_tools(server))
+                tools = self._probe_server_tools(server)
             except Exception:
                 continue
             for tool in tools:
@@ -2878,21 +2934,11 @@ class ChatEngine:
         params: Dict[str, Any],
     ) -> Dict[str, Any]:
         _ = tool_schema
-        async def _call() -> Dict[str, Any]:
-            client = MCPClient(server)
-            try:
-                await client.connect()
-                result = await client.call_tool(tool_name, params)
-                return {"ok": True, "result": result}
-            except Exception as exc:
-                return {"ok": False, "error": str(exc)}
-            finally:
-                try:
-                    await client.disconnect()
-                except Exception:
-                    pass
-
-        return asyncio.run(_call())
+        try:
+            result = get_mcp_session_pool().call_tool_sync(server, tool_name, params)
+            return {"ok": True, "result": result}
+        except Exception as exc:
+            return {"ok": False, "error": str(exc)}
 
     def _execute_tool_intent_once(
         self,
@@ -3911,35 +3957,26 @@ class ChatEngine:
             "context": {},
         }
 
-    def _run_async_in_sync(self, coro: Any) -> Any:
-        """Run an async coroutine from sync context."""
-        import asyncio
-        import threading
-
-        try:
-            return asyncio.run(coro)
-        except RuntimeError:
-            result_holder: Dict[str, Any] = {}
-            exception_holder: Dict[str, Exception] = {}
-
-            def _runner() -> None:
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        result_holder["result"] = loop.run_until_complete(coro)
-                    finally:
-                        loop.close()
-                except Exception as exc:  # pragma: no cover - defensive
-                    exception_holder["error"] = exc
+    def _speculative_context_enabled(self, session_metadata: Dict[str, Any]) -> bool:
+        """Speculative context assembly: per session, else OCTOPUSOS_CHAT_SPECULATIVE_CONTEXT."""
+        if "speculative_context" in session_metadata:
+            return self._truthy(session_metadata.get("speculative_context"))
+        return self._truthy(os.getenv("OCTOPUSOS_CHAT_SPECULATIVE_CONTEXT", "0"))
 
-            thread = threading.Thread(target=_runner, daemon=True)
-            thread.start()
-            thread.join()
+    def _start_speculative_context(self, *, session_id: str, user_input: str, rag_enabled: bool) -> Future:
+        """Start building the context pack in the background, without side effects."""
+        return _CONTEXT_PREFETCH_POOL.submit(
+            self.context_builder.build,
+            session_id=session_id,
+            user_input=user_input,
+            rag_enabled=rag_enabled,
+            memory_enabled=True,
+            defer_side_effects=True,
+        )
 
-            if "error" in exception_holder:
-                raise exception_holder["error"]
-            return result_holder.get("result")
+    def _run_async_in_sync(self, coro: Any) -> Any:
+        """Run an async coroutine from sync context (on the shared background loop)."""
+        return run_coroutine_sync(coro)
 
     def _handle_chat_mode_external_fallback(
         self,
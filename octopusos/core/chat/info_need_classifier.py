@@ -17,11 +17,13 @@ Key constraint: This is a JUDGMENT-ONLY module.
 - ONLY classifies and recommends actions
 """
 
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 import logging
 import json
 import re
+import threading
 import time
 import uuid
 
@@ -38,6 +40,33 @@ from octopusos.core.chat.models.info_need import (
 logger = logging.getLogger(__name__)
 
 
+def _trie_pattern(words: List[str]) -> str:
+    """
+    Regex alternation for literal words, factored into a prefix trie.
+
+    Python's re tries every branch of a flat alternation at each position;
+    the trie form branches on one character at a time. Optional suffixes
+    are greedy, so the longest word at a position wins.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def _build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + _build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if "" in node else group
+
+    return _build(trie)
+
+
 class RuleBasedFilter:
     """
     Rule-based filter for fast classification signals.
@@ -101,6 +130,56 @@ class RuleBasedFilter:
         "推荐", "建议", "应该", "最好", "认为", "觉得"
     ]
 
+    # Signal categories in matched_keywords order: (label prefix, list attribute)
+    SIGNAL_CATEGORIES = (
+        ("time", "TIME_SENSITIVE_KEYWORDS"),
+        ("auth", "AUTHORITATIVE_KEYWORDS"),
+        ("state", "AMBIENT_STATE_KEYWORDS"),
+        ("implicit_time", "IMPLICIT_TIME_KEYWORDS"),
+        ("code", "CODE_STRUCTURE_PATTERNS"),
+        ("opinion", "OPINION_INDICATORS"),
+    )
+
+    def __init__(self):
+        """Compile all keyword lists and code patterns once."""
+        # Every (category, keyword/pattern) gets its position in matched_keywords order
+        self._labels: List[str] = []
+        self._categories: List[str] = []
+        keyword_entries: Dict[str, List[int]] = {}
+        code_patterns: List[str] = []
+        for category, attr in self.SIGNAL_CATEGORIES:
+            for item in getattr(self, attr):
+                index = len(self._labels)
+                self._labels.append(f"{category}:{item}")
+                self._categories.append(category)
+                if category == "code":
+                    code_patterns.append(item)
+                else:
+                    keyword_entries.setdefault(item.lower(), []).append(index)
+
+        # Keywords: one trie regex inside a lookahead, so every start position
+        # is reported, overlapping matches included. The longest keyword at a
+        # position implies all keywords that are its prefixes.
+        self._keyword_re = re.compile(
+            "(?=(" + _trie_pattern(list(keyword_entries)) + "))" if keyword_entries else "(?!)"
+        )
+        self._keyword_hits: Dict[str, List[int]] = {
+            keyword: sorted(
+                index
+                for other, indexes in keyword_entries.items()
+                if keyword.startswith(other)
+                for index in indexes
+            )
+            for keyword in keyword_entries
+        }
+
+        # Code patterns: compiled once (each keeps re's literal-prefix scan,
+        # which a combined alternation would lose)
+        code_start = self._categories.index("code") if code_patterns else 0
+        self._code_patterns = [
+            (code_start + i, re.compile(pattern, re.IGNORECASE)) for i, pattern in enumerate(code_patterns)
+        ]
+
     def filter(self, message: str) -> ClassificationSignal:
         """
         Fast rule-based filtering to generate classification signals.
@@ -111,50 +190,24 @@ class RuleBasedFilter:
         Returns:
             ClassificationSignal with matched patterns and signal strength
         """
-        message_lower = message.lower()
-        matched_keywords = []
-
-        # Check time-sensitive keywords
-        has_time_sensitive = False
-        for keyword in self.TIME_SENSITIVE_KEYWORDS:
-            if keyword.lower() in message_lower:
-                has_time_sensitive = True
-                matched_keywords.append(f"time:{keyword}")
-
-        # Check authoritative keywords
-        has_authoritative = False
-        for keyword in self.AUTHORITATIVE_KEYWORDS:
-            if keyword.lower() in message_lower:
-                has_authoritative = True
-                matched_keywords.append(f"auth:{keyword}")
-
-        # Check ambient state keywords
-        has_ambient_state = False
-        for keyword in self.AMBIENT_STATE_KEYWORDS:
-            if keyword.lower() in message_lower:
-                has_ambient_state = True
-                matched_keywords.append(f"state:{keyword}")
-
-        # Check implicit time-sensitive keywords
-        has_implicit_time = False
-        for keyword in self.IMPLICIT_TIME_KEYWORDS:
-            if keyword.lower() in message_lower:
-                has_implicit_time = True
-                matched_keywords.append(f"implicit_time:{keyword}")
-
-        # Check code structure patterns
-        has_code_structure = False
-        for pattern in self.CODE_STRUCTURE_PATTERNS:
-            if re.search(pattern, message, re.IGNORECASE):
-                has_code_structure = True
-                matched_keywords.append(f"code:{pattern}")
-
-        # Check opinion indicators
-        has_opinion = False
-        for indicator in self.OPINION_INDICATORS:
-            if indicator.lower() in message_lower:
-                has_opinion = True
-                matched_keywords.append(f"opinion:{indicator}")
+        hits = set()
+
+        # All keyword categories in one pass over the lowercased message
+        for match in self._keyword_re.finditer(message.lower()):
+            hits.update(self._keyword_hits[match.group(1)])
+
+        # Code structure patterns
+        hits.update(index for index, pattern in self._code_patterns if pattern.search(message))
+
+        ordered = sorted(hits)
+        matched_keywords = [self._labels[index] for index in ordered]
+        categories = {self._categories[index] for index in ordered}
+        has_time_sensitive = "time" in categories
+        has_authoritative = "auth" in categories
+        has_ambient_state = "state" in categories
+        has_implicit_time = "implicit_time" in categories
+        has_code_structure = "code" in categories
+        has_opinion = "opinion" in categories
 
         # Calculate signal strength (0.0 - 1.0)
         signal_strength = self._calculate_signal_strength(
@@ -501,7 +554,8 @@ class InfoNeedClassifier:
         Initialize InfoNeedClassifier.
 
         Args:
-            config: Optional configuration dictionary
+            config: Optional configuration dictionary (enable_llm_evaluation,
+                llm_threshold, result_cache_size, result_cache_ttl_s)
             llm_callable: Optional callable for LLM invocation (for testing/mocking)
         """
         self.config = config or {}
@@ -513,6 +567,15 @@ class InfoNeedClassifier:
         self.enable_llm_evaluation = self.config.get("enable_llm_evaluation", True)
         self.llm_threshold = self.config.get("llm_threshold", 0.5)
 
+        # Result cache: normalized message text -> (expires_at, result).
+        # Repeated prompts skip the rule filter and the LLM confidence call.
+        self.result_cache_size = self.config.get("result_cache_size", 512)
+        self.result_cache_ttl_s = self.config.get("result_cache_ttl_s", 3600)
+        self._result_cache: "OrderedDict[str, Tuple[float, ClassificationResult]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     async def classify(
         self,
         message: str,
@@ -522,6 +585,7 @@ class InfoNeedClassifier:
         Complete classification pipeline for user message.
 
         This is the main entry point for classification. It performs:
+        0. Result cache lookup (a repeated message skips steps 1-5)
         1. Rule-based filtering for fast signals
         2. Preliminary type determination
         3. LLM self-assessment (if needed)
@@ -544,6 +608,48 @@ class InfoNeedClassifier:
         # Generate unique message ID for this classification
         message_id = str(uuid.uuid4())
 
+        # Steps 1-7: cached result for the same (normalized) message, or classify
+        cache_key = self._normalize_message(message)
+        result = self._get_cached_result(cache_key)
+        if result is not None:
+            logger.debug("Classification cache hit")
+        else:
+            result, cacheable = await self._classify_uncached(message)
+            if cacheable:
+                self._cache_result(cache_key, result)
+
+        logger.info(f"Classification complete: {result.info_need_type.value} -> {result.decision_action.value}")
+
+        # Step 8: Log to audit trail (non-blocking, fire-and-forget)
+        latency_ms = (time.time() - start_time) * 1000
+        try:
+            await self._log_classification_audit(
+                message_id=message_id,
+                message=message,
+                result=result,
+                session_id=session_id,
+                latency_ms=latency_ms,
+            )
+        except Exception as e:
+            # Audit logging failure should never break classification
+            logger.warning(f"Failed to log classification to audit trail: {e}")
+
+        # Store message_id in result metadata for correlation with outcomes
+        result.message_id = message_id  # type: ignore
+
+        return result
+
+    async def _classify_uncached(self, message: str) -> Tuple[ClassificationResult, bool]:
+        """
+        Run rules, LLM self-assessment and the decision matrix.
+
+        Args:
+            message: User's message to classify
+
+        Returns:
+            Tuple of (result, cacheable); results where a needed LLM
+            evaluation failed are not cacheable
+        """
         # Step 1: Rule-based filtering
         signals = self.rule_filter.filter(message)
         logger.debug(
@@ -557,6 +663,7 @@ class InfoNeedClassifier:
 
         # Step 3: LLM self-assessment (if needed)
         llm_result = None
+        llm_failed = False
         if self._needs_llm_evaluation(preliminary_type, signals):
             logger.debug("LLM evaluation needed")
             if self.enable_llm_evaluation:
@@ -564,6 +671,7 @@ class InfoNeedClassifier:
                     llm_result = await self.llm_evaluator.evaluate(message)
                 except Exception as e:
                     logger.warning(f"LLM evaluation failed, continuing without it: {e}")
+                    llm_failed = True
             else:
                 logger.debug("LLM evaluation disabled by config")
 
@@ -594,26 +702,44 @@ class InfoNeedClassifier:
             timestamp=utc_now(),
         )
 
-        logger.info(f"Classification complete: {result.info_need_type.value} -> {result.decision_action.value}")
-
-        # Step 8: Log to audit trail (non-blocking, fire-and-forget)
-        latency_ms = (time.time() - start_time) * 1000
-        try:
-            await self._log_classification_audit(
-                message_id=message_id,
-                message=message,
-                result=result,
-                session_id=session_id,
-                latency_ms=latency_ms,
-            )
-        except Exception as e:
-            # Audit logging failure should never break classification
-            logger.warning(f"Failed to log classification to audit trail: {e}")
-
-        # Store message_id in result metadata for correlation with outcomes
-        result.message_id = message_id  # type: ignore
-
-        return result
+        return result, not llm_failed
+
+    @staticmethod
+    def _normalize_message(message: str) -> str:
+        """Cache key: case-folded message with whitespace collapsed."""
+        return " ".join(message.split()).lower()
+
+    def _get_cached_result(self, key: str) -> Optional[ClassificationResult]:
+        """Fresh copy of a cached, unexpired result (None on miss)."""
+        if self.result_cache_size <= 0:
+            return None
+        with self._result_cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._result_cache[key]
+                self.cache_misses += 1
+                return None
+            self._result_cache.move_to_end(key)
+            self.cache_hits += 1
+            cached = entry[1]
+        return cached.model_copy(deep=True, update={"timestamp": utc_now()})
+
+    def _cache_result(self, key: str, result: ClassificationResult) -> None:
+        """Store a copy of result, evicting the least recently used entries."""
+        if self.result_cache_size <= 0:
+            return
+        expires_at = time.monotonic() + self.result_cache_ttl_s
+        with self._result_cache_lock:
+            self._result_cache[key] = (expires_at, result.model_copy(deep=True))
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.result_cache_size:
+                self._result_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached classification results."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
 
     def _determine_type(self, signals: ClassificationSignal) -> InfoNeedType:
         """
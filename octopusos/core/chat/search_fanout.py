@@ -0,0 +1,173 @@
+"""Concurrent search fan-out across queries and web search engines.
+
+Company research (and any other multi-query lookup) issues several queries,
+each with an ordered list of engines to try. ``SearchFanout`` runs every
+query at once instead of one after another:
+
+- Per query, the first engine is asked first. If it has not answered within
+  ``hedge_delay`` seconds, or answered without new results, the next engine
+  is asked too (hedged request); the first useful answer wins and the other
+  attempts are cancelled.
+- Each engine has its own concurrency cap so one provider is never hit with
+  every query at once.
+- The whole fan-out has a deadline; whatever has arrived by then is returned.
+- Results are deduplicated by URL as they arrive (first arrival keeps the
+  URL) and returned grouped by bucket in query order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# search_fn(engine, query, max_results) -> adapter-style response {"results": [...]}
+SearchFn = Callable[[str, str, int], Awaitable[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class SearchJob:
+    """One query with the engines to try, in preference order."""
+
+    bucket: str
+    query: str
+    engines: Tuple[str, ...]
+    max_results: int = 10
+
+
+@dataclass
+class SearchFanoutResult:
+    """Merged results plus what the fan-out did to get them."""
+
+    buckets: Dict[str, List[Dict[str, Any]]]
+    winners: Dict[str, Optional[str]] = field(default_factory=dict)  # query -> engine
+    requests: int = 0
+    hedges: int = 0
+    failures: int = 0
+    deadline_hit: bool = False
+    elapsed_ms: float = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Summary for logs and message metadata."""
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "failures": self.failures,
+            "deadline_hit": self.deadline_hit,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+            "winners": dict(self.winners),
+        }
+
+
+class SearchFanout:
+    """Run search jobs concurrently with hedging, per-engine caps and a deadline."""
+
+    def __init__(
+        self,
+        search_fn: SearchFn,
+        *,
+        per_engine_concurrency: int = 3,
+        hedge_delay: float = 2.0,
+        deadline: float = 20.0,
+    ):
+        """
+        Args:
+            search_fn: Coroutine function (engine, query, max_results) -> response
+            per_engine_concurrency: Max in-flight requests per engine
+            hedge_delay: Seconds before a slow engine is hedged with the next one
+            deadline: Seconds for the whole fan-out
+        """
+        self._search_fn = search_fn
+        self._per_engine_concurrency = max(1, per_engine_concurrency)
+        self._hedge_delay = max(0.0, hedge_delay)
+        self._deadline = deadline
+
+    async def run(self, jobs: Sequence[SearchJob]) -> SearchFanoutResult:
+        """Run all jobs; returns partial results if the deadline passes."""
+        started = time.perf_counter()
+        semaphores: Dict[str, asyncio.Semaphore] = {}
+        seen_urls: Set[str] = set()
+        per_job: List[List[Dict[str, Any]]] = [[] for _ in jobs]
+        result = SearchFanoutResult(buckets={job.bucket: [] for job in jobs})
+
+        def _merge(index: int, response: Any) -> int:
+            """Dedup and keep rows of one response; returns the number of new rows."""
+            rows = response.get("results") if isinstance(response, dict) else None
+            if not isinstance(rows, list):
+                return 0
+            added = 0
+            for row in rows:
+                if not isinstance(row, dict):
+                    continue
+                url = str(row.get("url") or "").strip()
+                if url and url in seen_urls:
+                    continue
+                if url:
+                    seen_urls.add(url)
+                per_job[index].append(row)
+                added += 1
+            return added
+
+        async def _attempt(job: SearchJob, engine: str) -> Any:
+            semaphore = semaphores.setdefault(engine, asyncio.Semaphore(self._per_engine_concurrency))
+            async with semaphore:
+                result.requests += 1
+                return await self._search_fn(engine, job.query, job.max_results)
+
+        async def _run_job(index: int, job: SearchJob) -> None:
+            pending: Dict[asyncio.Task, str] = {}
+            remaining = list(job.engines)
+            result.winners[job.query] = None
+
+            def _launch_next() -> None:
+                engine = remaining.pop(0)
+                pending[asyncio.create_task(_attempt(job, engine))] = engine
+
+            _launch_next()
+            try:
+                while pending:
+                    done, _ = await asyncio.wait(
+                        pending,
+                        timeout=self._hedge_delay if remaining else None,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    if not done:
+                        result.hedges += 1
+                        _launch_next()
+                        continue
+                    for task in done:
+                        engine = pending.pop(task)
+                        try:
+                            response = task.result()
+                        except Exception as exc:
+                            logger.debug("Search %s on %s failed: %s", job.query, engine, exc)
+                            response = None
+                        if not isinstance(response, dict) or not isinstance(response.get("results"), list):
+                            result.failures += 1
+                        if _merge(index, response) > 0:
+                            result.winners[job.query] = engine
+                            return
+                    # Only failures / nothing new so far: fall through to the next engine
+                    if remaining and not pending:
+                        _launch_next()
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        job_tasks = [asyncio.create_task(_run_job(i, job)) for i, job in enumerate(jobs)]
+        if job_tasks:
+            _, still_running = await asyncio.wait(job_tasks, timeout=self._deadline)
+            if still_running:
+                result.deadline_hit = True
+                for task in still_running:
+                    task.cancel()
+                await asyncio.gather(*still_running, return_exceptions=True)
+
+        for job, rows in zip(jobs, per_job):
+            result.buckets[job.bucket].extend(rows)
+        result.elapsed_ms = (time.perf_counter() - started) * 1000
+        return result
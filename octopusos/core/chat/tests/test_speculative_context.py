@@ -0,0 +1,113 @@
+import time
+from types import SimpleNamespace
+
+from octopusos.core.chat import context_builder
+from octopusos.core.chat.context_builder import ContextBudget, ContextBuilder
+from octopusos.core.chat.engine import ChatEngine
+
+
+class _FakeChatService:
+    def get_session(self, session_id):
+        return SimpleNamespace(metadata={"conversation_mode": "chat"})
+
+    def get_recent_messages(self, session_id, count=60):
+        return []
+
+
+class _FakeKBService:
+    def search_with_trace(self, query, scope, top_k, explain):
+        return [], {"retrieval_run_id": "run-1", "query_hash": "q", "evidence_count": 0}
+
+
+def _builder(monkeypatch, calls: list, build_delay: float = 0.0) -> ContextBuilder:
+    builder = ContextBuilder(
+        chat_service=_FakeChatService(),
+        memory_service=object(),
+        kb_service=_FakeKBService(),
+        budget=ContextBudget(),
+        db_path=":memory:",
+        enable_auto_summary=False,
+    )
+
+    def _memory(session_id):
+        time.sleep(build_delay)
+        return [{"id": "mem-1", "type": "fact", "content": {"summary": "likes tea"}}]
+
+    monkeypatch.setattr(
+        context_builder,
+        "log_audit_event",
+        lambda event_type, **kwargs: calls.append(event_type),
+    )
+    monkeypatch.setattr(builder, "_load_summary_artifacts", lambda session_id: [])
+    monkeypatch.setattr(builder, "_load_memory_facts", _memory)
+    monkeypatch.setattr(
+        builder, "_log_memory_injection_audit", lambda **kwargs: calls.append("audit")
+    )
+    monkeypatch.setattr(
+        builder, "_save_snapshot", lambda **kwargs: calls.append("snapshot") or "snap-1"
+    )
+    return builder
+
+
+def test_deferred_build_has_no_side_effects_until_commit(monkeypatch) -> None:
+    calls: list = []
+    builder = _builder(monkeypatch, calls)
+
+    pack = builder.build("s1", "hello", rag_enabled=False, defer_side_effects=True)
+    assert calls == []
+    assert pack.snapshot_id is None
+    assert pack.messages[-1]["content"] == "hello"
+
+    assert builder.commit(pack) is pack
+    assert calls == ["audit", "snapshot"]
+    assert pack.snapshot_id == "snap-1"
+
+    # Commit is idempotent; a regular build commits immediately
+    builder.commit(pack)
+    assert calls == ["audit", "snapshot"]
+    assert builder.build("s1", "again", rag_enabled=False).snapshot_id == "snap-1"
+    assert calls == ["audit", "snapshot", "audit", "snapshot"]
+
+
+def test_speculative_context_overlaps_classification(monkeypatch) -> None:
+    calls: list = []
+    engine = ChatEngine.__new__(ChatEngine)
+    engine.context_builder = _builder(monkeypatch, calls, build_delay=0.2)
+
+    monkeypatch.delenv("OCTOPUSOS_CHAT_SPECULATIVE_CONTEXT", raising=False)
+    assert not engine._speculative_context_enabled({})
+    assert engine._speculative_context_enabled({"speculative_context": True})
+    monkeypatch.setenv("OCTOPUSOS_CHAT_SPECULATIVE_CONTEXT", "1")
+    assert engine._speculative_context_enabled({})
+    assert not engine._speculative_context_enabled({"speculative_context": "false"})
+
+    started = time.perf_counter()
+    future = engine._start_speculative_context(
+        session_id="s1", user_input="hello", rag_enabled=False
+    )
+    time.sleep(0.2)  # classification
+    pack = engine.context_builder.commit(future.result())
+    assert time.perf_counter() - started < 0.35
+    assert pack.snapshot_id == "snap-1"
+
+    # Routed elsewhere: the speculative pack is dropped without writes
+    calls.clear()
+    engine._start_speculative_context(
+        session_id="s1", user_input="weather?", rag_enabled=False
+    ).result()
+    assert calls == []
+
+
+def test_discarded_rag_pack_writes_no_retrieval_audit(monkeypatch) -> None:
+    calls: list = []
+    builder = _builder(monkeypatch, calls)
+
+    # Speculation discarded, then rebuilt and committed: one audit of each kind
+    builder.build("s1", "hello", rag_enabled=True, defer_side_effects=True)
+    assert calls == []
+    pack = builder.build("s1", "hello", rag_enabled=True, defer_side_effects=True)
+    assert calls == []
+    assert pack.metadata["retrieval_run_id"] == "run-1"
+
+    builder.commit(pack)
+    assert calls == ["KB_RETRIEVAL", "audit", "snapshot"]
@@ -0,0 +1,156 @@
+"""Token counting for context budgeting.
+
+``ContextBuilder`` sizes every window message, memory fact, RAG chunk and
+summary against the budget on every turn. ``TokenCounter`` counts with a
+tiktoken encoding when one can be loaded and memoizes the result:
+
+- Chat messages are keyed by ``(message_id, content hash)``, so a growing
+  session window only tokenizes the messages that are new since the last
+  turn (an edited message gets a new hash and is counted again).
+- Other text (memory facts, RAG chunks, the system prompt) is keyed by its
+  content hash alone.
+
+When tiktoken is not installed or its encoding cannot be loaded (the BPE
+files are downloaded on first use, which fails offline), the counter falls
+back to a script-aware estimate: one token per CJK character and about four
+characters per token for everything else. The encoding is loaded once; a
+failure is remembered rather than retried on every call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "o200k_base"
+DEFAULT_MAX_ENTRIES = 8192
+
+# CJK punctuation, kana, Han, hangul and full-width forms: roughly one token per character
+_CJK_RE = re.compile(
+    "[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]"
+)
+
+
+def estimate_tokens_heuristic(text: str) -> int:
+    """Estimate tokens without a tokenizer (CJK aware)"""
+    if not text:
+        return 0
+    cjk = len(_CJK_RE.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+class TokenCounter:
+    """Memoized token counter backed by tiktoken, with a heuristic fallback"""
+
+    def __init__(self, encoding_name: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            encoding_name: tiktoken encoding (default: OCTOPUSOS_TOKEN_ENCODING or o200k_base)
+            max_entries: Max memoized counts kept (least recently used are evicted)
+        """
+        self.encoding_name = encoding_name or os.getenv("OCTOPUSOS_TOKEN_ENCODING", DEFAULT_ENCODING)
+        self.max_entries = max(1, max_entries)
+        self._encoding: Any = None
+        self._encoding_loaded = False
+        self._lock = threading.Lock()
+        self._memo: "OrderedDict[Tuple[Optional[Hashable], bytes], int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_encoding(self) -> Any:
+        if self._encoding_loaded:
+            return self._encoding
+        with self._lock:
+            if not self._encoding_loaded:
+                try:
+                    import tiktoken
+
+                    self._encoding = tiktoken.get_encoding(self.encoding_name)
+                except Exception as e:
+                    logger.info(
+                        f"tiktoken encoding {self.encoding_name} unavailable ({e}); "
+                        "using heuristic token estimates"
+                    )
+                    self._encoding = None
+                self._encoding_loaded = True
+        return self._encoding
+
+    @property
+    def backend(self) -> str:
+        """``tiktoken:<encoding>`` or ``heuristic``"""
+        return f"tiktoken:{self.encoding_name}" if self._get_encoding() is not None else "heuristic"
+
+    def count(self, text: str) -> int:
+        """Count tokens in text (not memoized)"""
+        if not text:
+            return 0
+        encoding = self._get_encoding()
+        if encoding is None:
+            return estimate_tokens_heuristic(text)
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def count_cached(self, text: str, key: Optional[Hashable] = None) -> int:
+        """Count tokens in text, memoized by (key, content hash)
+
+        Args:
+            text: Text to count
+            key: Optional identity of the text's owner (e.g. a message_id)
+
+        Returns:
+            Token count
+        """
+        if not text:
+            return 0
+        digest = hashlib.blake2b(text.encode("utf-8", errors="replace"), digest_size=16).digest()
+        memo_key = (key, digest)
+        with self._lock:
+            cached = self._memo.get(memo_key)
+            if cached is not None:
+                self._memo.move_to_end(memo_key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        tokens = self.count(text)
+        with self._lock:
+            self._memo[memo_key] = tokens
+            if len(self._memo) > self.max_entries:
+                self._memo.popitem(last=False)
+        return tokens
+
+    def count_message(self, message: Any) -> int:
+        """Count tokens in a ChatMessage, memoized by message_id + content hash"""
+        return self.count_cached(message.content or "", key=getattr(message, "message_id", None))
+
+    def stats(self) -> Dict[str, Any]:
+        """Memo statistics for logs and metadata"""
+        with self._lock:
+            entries = len(self._memo)
+        return {"backend": self.backend, "entries": entries, "hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """Drop memoized counts"""
+        with self._lock:
+            self._memo.clear()
+            self.hits = self.misses = 0
+
+
+_default_counter: Optional[TokenCounter] = None
+_default_counter_lock = threading.Lock()
+
+
+def get_token_counter() -> TokenCounter:
+    """Process-wide token counter (shared memo across ContextBuilders)"""
+    global _default_counter
+    if _default_counter is None:
+        with _default_counter_lock:
+            if _default_counter is None:
+                _default_counter = TokenCounter()
+    return _default_counter
@@ -40,9 +40,21 @@ Error Handling:
     - Transient errors (locked/busy) trigger automatic retry with exponential backoff
     - Non-transient errors are propagated to the caller
     - Timeout errors raise TimeoutError after the specified duration
+
+Group Commit:
+    By default every job runs in its own transaction and is committed before the
+    next job is dequeued. Setting batch_max_jobs > 1 (or OCTOPUSOS_WRITER_BATCH_MAX_JOBS)
+    enables group-commit mode: the writer drains up to batch_max_jobs queued jobs,
+    waiting at most batch_max_wait_ms for more to arrive, runs them inside a single
+    BEGIN IMMEDIATE transaction with one SAVEPOINT per job, and commits once. A job
+    that raises only rolls back its own savepoint; callers are resolved after the
+    shared COMMIT succeeds, so a successful submit() is always durable. If a job
+    ends the shared transaction itself with a rollback (or SQLite rolls it back),
+    the earlier jobs of the batch are run again one by one.
 """
 
 import logging
+import os
 import queue
 import sqlite3
 import threading
@@ -66,6 +78,35 @@ class WriteJob:
     result_q: queue.Queue[Tuple[bool, Any]]
 
 
+# Connection-local table telling a committed batch from a rolled back one
+_BATCH_MARKER_TABLE = "temp.octopusos_writer_batch"
+
+# Upper bounds of the batch-size histogram buckets reported by get_stats()
+_BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={raw!r}, using {default}")
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={raw!r}, using {default}")
+        return default
+
+
 class SQLiteWriter:
     """Single-threaded SQLite write serializer.
 
@@ -78,6 +119,7 @@ class SQLiteWriter:
     - BEGIN IMMEDIATE for early write lock acquisition
     - Exponential backoff retry for transient lock errors
     - Graceful timeout handling with error propagation
+    - Optional group commit (one COMMIT for a batch of jobs)
 
     Parameters:
         db_path: Path to the SQLite database file
@@ -85,6 +127,10 @@ class SQLiteWriter:
         max_retry: Maximum retry attempts for locked operations (default: 8)
         initial_delay: Initial retry delay in seconds (default: 0.02)
         max_delay: Maximum retry delay in seconds (default: 0.5)
+        batch_max_jobs: Maximum jobs per group commit; 1 disables batching
+            (default: OCTOPUSOS_WRITER_BATCH_MAX_JOBS or 1)
+        batch_max_wait_ms: Maximum time to wait for more jobs once a batch has
+            started (default: OCTOPUSOS_WRITER_BATCH_MAX_WAIT_MS or 0)
     """
 
     # Class-level registry for singleton pattern
@@ -108,6 +154,8 @@ class SQLiteWriter:
         max_retry: int = 8,
         initial_delay: float = 0.02,
         max_delay: float = 0.5,
+        batch_max_jobs: Optional[int] = None,
+        batch_max_wait_ms: Optional[float] = None,
     ):
         """Initialize the SQLiteWriter.
 
@@ -120,6 +168,8 @@ class SQLiteWriter:
             max_retry: Maximum retry attempts
             initial_delay: Initial retry delay in seconds
             max_delay: Maximum retry delay in seconds
+            batch_max_jobs: Maximum jobs committed together (1 = no batching)
+            batch_max_wait_ms: Maximum wait for additional jobs per batch
         """
         # Avoid re-initialization for singleton; also protect against concurrent
         # initialization racing on the same singleton instance.
@@ -132,6 +182,12 @@ class SQLiteWriter:
             self.max_retry = max_retry
             self.initial_delay = initial_delay
             self.max_delay = max_delay
+            if batch_max_jobs is None:
+                batch_max_jobs = _env_int("OCTOPUSOS_WRITER_BATCH_MAX_JOBS", 1)
+            if batch_max_wait_ms is None:
+                batch_max_wait_ms = _env_float("OCTOPUSOS_WRITER_BATCH_MAX_WAIT_MS", 0.0)
+            self.batch_max_jobs = max(1, int(batch_max_jobs))
+            self.batch_max_wait_ms = max(0.0, float(batch_max_wait_ms))
 
             self._queue: queue.Queue[Optional[WriteJob]] = queue.Queue()
             self._thread: Optional[threading.Thread] = None
@@ -145,6 +201,10 @@ class SQLiteWriter:
             self._total_write_time = 0.0
             self._high_water_mark = 0  # Historical max queue length
             self._start_time = time.time()
+            self._total_batches = 0
+            self._batch_size_histogram = {bound: 0 for bound in _BATCH_SIZE_BUCKETS}
+            self._batch_size_overflow = 0  # Batches larger than the last bucket
+            self._batch_generation = 0  # Marker of the open batch transaction
 
             # Start background thread
             self._start()
@@ -152,7 +212,9 @@ class SQLiteWriter:
 
         logger.info(
             f"SQLiteWriter initialized: db_path={db_path}, "
-            f"busy_timeout={busy_timeout}ms, max_retry={max_retry}"
+            f"busy_timeout={busy_timeout}ms, max_retry={max_retry}, "
+            f"batch_max_jobs={self.batch_max_jobs}, "
+            f"batch_max_wait_ms={self.batch_max_wait_ms}"
         )
 
     def _open(self) -> Connection:
@@ -231,10 +293,18 @@ class SQLiteWriter:
                     if job is None:  # Sentinel for shutdown
                         break
 
+                    if self.batch_max_jobs > 1:
+                        batch, stop_requested = self._collect_batch(job)
+                        self._exec_batch(self._conn, batch)
+                        if stop_requested:
+                            break
+                        continue
+
                     # Execute with retry logic
                     success, result = self._exec_with_retry(
                         self._conn, job.fn, self.max_retry
                     )
+                    self._record_batch(1)
 
                     # Send result back to caller
                     job.result_q.put((success, result))
@@ -249,6 +319,208 @@ class SQLiteWriter:
                 self._conn.close()
                 logger.debug("Database connection closed")
 
+    def _collect_batch(self, first: WriteJob) -> Tuple[list[WriteJob], bool]:
+        """Drain up to batch_max_jobs jobs, waiting at most batch_max_wait_ms.
+
+        Args:
+            first: Job already taken off the queue
+
+        Returns:
+            Tuple of (jobs, stop_requested) where stop_requested is True if the
+            shutdown sentinel was dequeued while collecting.
+        """
+        batch = [first]
+        deadline = time.monotonic() + self.batch_max_wait_ms / 1000.0
+
+        while len(batch) < self.batch_max_jobs:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    job = self._queue.get(timeout=remaining)
+                else:
+                    job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is None:
+                return batch, True
+            batch.append(job)
+
+        return batch, False
+
+    def _exec_batch(self, conn: Connection, batch: list[WriteJob]) -> None:
+        """Execute a batch of jobs in one transaction and resolve every caller.
+
+        Each job runs inside its own SAVEPOINT so a failing job only rolls back
+        its own changes. Results are delivered once the shared COMMIT succeeds;
+        if the transaction cannot be started, continued or committed, every job
+        without a result yet falls back to running individually through
+        _exec_with_retry().
+
+        Args:
+            conn: Database connection
+            batch: Jobs to execute, in submission order
+        """
+        if len(batch) == 1:
+            job = batch[0]
+            job.result_q.put(self._exec_with_retry(conn, job.fn, self.max_retry))
+            self._record_batch(1)
+            return
+
+        start_time = time.time()
+        # Jobs whose outcome is not durable yet, in submission order
+        pending: list[Tuple[WriteJob, bool, Any]] = []
+        deferred: list[WriteJob] = []  # Jobs that hit a transient lock error
+        resolved: set[int] = set()  # id() of jobs whose caller has its result
+
+        def _resolve(job: WriteJob, success: bool, result: Any) -> None:
+            if success:
+                self._total_writes += 1
+            else:
+                self._failed_writes += 1
+            self._total_write_time += time.time() - start_time
+            resolved.add(id(job))
+            job.result_q.put((success, result))
+
+        def _run_alone(job: WriteJob) -> None:
+            resolved.add(id(job))
+            job.result_q.put(self._exec_with_retry(conn, job.fn, self.max_retry))
+            self._record_batch(1)
+
+        def _resolve_pending() -> None:
+            for job, success, result in pending:
+                _resolve(job, success, result)
+            if pending:
+                self._record_batch(len(pending))
+            pending.clear()
+
+        def _settle_ended_transaction() -> None:
+            # A job ended the shared transaction itself: conn.commit(),
+            # conn.rollback() or an SQLite auto-rollback. The earlier jobs are
+            # durable only if it was a commit; otherwise run them again alone.
+            if self._batch_marker_committed(conn):
+                _resolve_pending()
+            else:
+                lost = list(pending)
+                pending.clear()
+                for job, success, result in lost:
+                    if success:
+                        _run_alone(job)
+                    else:
+                        pending.append((job, success, result))
+                _resolve_pending()
+            self._begin_batch(conn)
+
+        try:
+            if getattr(conn, "in_transaction", False):
+                conn.rollback()
+            self._begin_batch(conn)
+
+            for index, job in enumerate(batch):
+                savepoint = f"writer_job_{index}"
+                conn.execute(f"SAVEPOINT {savepoint}")
+                try:
+                    result = job.fn(conn)
+                except Exception as e:
+                    if isinstance(e, sqlite3.OperationalError) and self._is_transient(e):
+                        deferred.append(job)
+                    else:
+                        logger.error(f"Write operation failed: {e}", exc_info=True)
+                        pending.append((job, False, e))
+                    if conn.in_transaction:
+                        conn.execute(f"ROLLBACK TO {savepoint}")
+                        conn.execute(f"RELEASE {savepoint}")
+                    else:
+                        _settle_ended_transaction()
+                    continue
+
+                if conn.in_transaction:
+                    conn.execute(f"RELEASE {savepoint}")
+                    pending.append((job, True, result))
+                else:
+                    # This job's own outcome stands either way; it ended the transaction itself
+                    _resolve(job, True, result)
+                    self._record_batch(1)
+                    _settle_ended_transaction()
+
+            conn.commit()
+        except Exception as e:
+            logger.warning(
+                f"Group commit of {len(batch)} jobs failed, "
+                f"falling back to per-job transactions: {e}"
+            )
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            # A job that raised keeps its error; every other unresolved job (the
+            # uncommitted ones, the one interrupted and those not reached yet)
+            # runs again on its own, in submission order
+            failures = {id(job): result for job, success, result in pending if not success}
+            pending.clear()
+            for job in batch:
+                if id(job) in resolved:
+                    continue
+                if id(job) in failures:
+                    _resolve(job, False, failures[id(job)])
+                    self._record_batch(1)
+                else:
+                    _run_alone(job)
+            return
+
+        _resolve_pending()
+
+        # Retry lock-conflicted jobs outside the batch with the usual backoff
+        for job in deferred:
+            _run_alone(job)
+
+    def _begin_batch(self, conn: Connection) -> None:
+        """Start a batch transaction and tag it with a new marker row.
+
+        The marker lives in a connection-local TEMP table, which is
+        transactional like the main database: if a job ends the transaction,
+        the marker is still there after a COMMIT and gone after a ROLLBACK.
+        """
+        conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS {_BATCH_MARKER_TABLE} (generation INTEGER)")
+        self._begin_immediate(conn)
+        self._batch_generation += 1
+        conn.execute(f"DELETE FROM {_BATCH_MARKER_TABLE}")
+        conn.execute(f"INSERT INTO {_BATCH_MARKER_TABLE} VALUES (?)", (self._batch_generation,))
+
+    def _batch_marker_committed(self, conn: Connection) -> bool:
+        """True if the current batch transaction was committed, False if rolled back."""
+        row = conn.execute(
+            f"SELECT 1 FROM {_BATCH_MARKER_TABLE} WHERE generation = ?", (self._batch_generation,)
+        ).fetchone()
+        return row is not None
+
+    def _begin_immediate(self, conn: Connection) -> None:
+        """Start a write transaction, retrying transient lock errors."""
+        delay = self.initial_delay
+        for attempt in range(self.max_retry):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                return
+            except sqlite3.OperationalError as e:
+                if not self._is_transient(e) or attempt == self.max_retry - 1:
+                    raise
+                self._total_retries += 1
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_delay)
+
+    @staticmethod
+    def _is_transient(error: sqlite3.OperationalError) -> bool:
+        error_msg = str(error).lower()
+        return "locked" in error_msg or "busy" in error_msg
+
+    def _record_batch(self, size: int) -> None:
+        """Record one committed batch in the batch-size histogram."""
+        self._total_batches += 1
+        for bound in _BATCH_SIZE_BUCKETS:
+            if size <= bound:
+                self._batch_size_histogram[bound] += 1
+                return
+        self._batch_size_overflow += 1
+
     def _exec_with_retry(
         self,
         conn: Connection,
@@ -500,6 +772,26 @@ class SQLiteWriter:
         uptime = time.time() - self._start_time
         return self._total_writes / uptime if uptime > 0 else 0.0
 
+    @property
+    def total_batches(self) -> int:
+        """Number of transactions committed (a batch of 1 without group commit)."""
+        return self._total_batches
+
+    @property
+    def avg_batch_size(self) -> float:
+        """Average number of jobs per committed transaction."""
+        if self._total_batches == 0:
+            return 0.0
+        jobs = self._total_writes + self._failed_writes
+        return jobs / self._total_batches
+
+    @property
+    def batch_size_histogram(self) -> dict[str, int]:
+        """Batch-size histogram keyed by bucket label ("<=1", "<=2", ..., ">256")."""
+        histogram = {f"<={bound}": count for bound, count in self._batch_size_histogram.items()}
+        histogram[f">{_BATCH_SIZE_BUCKETS[-1]}"] = self._batch_size_overflow
+        return histogram
+
     def get_stats(self) -> dict:
         """Get all monitoring statistics.
 
@@ -513,6 +805,10 @@ class SQLiteWriter:
             - avg_write_latency_ms: Average latency in milliseconds
             - throughput_per_second: Operations per second
             - uptime_seconds: Time since writer started
+            - batch_max_jobs / batch_max_wait_ms: Group-commit configuration
+            - total_batches: Committed transactions
+            - avg_batch_size: Average jobs per committed transaction
+            - batch_size_histogram: Count of batches per size bucket
 
         Example:
             stats = writer.get_stats()
@@ -528,4 +824,9 @@ class SQLiteWriter:
             "avg_write_latency_ms": self.avg_write_latency_ms,
             "throughput_per_second": self.throughput_per_second,
             "uptime_seconds": time.time() - self._start_time,
+            "batch_max_jobs": self.batch_max_jobs,
+            "batch_max_wait_ms": self.batch_max_wait_ms,
+            "total_batches": self.total_batches,
+            "avg_batch_size": self.avg_batch_size,
+            "batch_size_histogram": self.batch_size_histogram,
         }
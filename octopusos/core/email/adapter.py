@@ -34,7 +34,7 @@ class EmailAdapter:
         except Exception:
             cfg = {}
         if provider_type == "imap_smtp":
-            return ImapSmtpEmailProvider(config=cfg, secret_ref=inst.secret_ref), inst.config_json
+            return ImapSmtpEmailProvider(config=cfg, secret_ref=inst.secret_ref, instance_id=inst.instance_id), inst.config_json
         if provider_type == "gmail_oauth":
             return GmailOAuthEmailProvider(config=cfg, token_secret_ref=inst.secret_ref), inst.config_json
         if provider_type == "outlook_oauth":
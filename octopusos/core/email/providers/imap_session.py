@@ -0,0 +1,324 @@
+"""IMAP session cache for the IMAP/SMTP email provider.
+
+Every list_unread / get_message / mark_read call used to open a connection,
+log in and SELECT INBOX. ImapSessionCache keeps one logged-in connection per
+email instance, together with that instance's incremental sync state
+(UIDVALIDITY, highest known UID and the cached unread headers):
+
+- A session is reused while its connection fingerprint (host, port, TLS,
+  user, password) is unchanged. A changed config reconnects and restarts the
+  sync.
+- Commands on one session are serialized; imaplib connections are not
+  thread-safe.
+- A dropped connection (server idle timeout, network error) is reopened and
+  the operation retried once.
+- Sessions idle for longer than OCTOPUSOS_IMAP_IDLE_TIMEOUT_S (default 600s,
+  below the usual 30 minute server autologout) are logged out.
+
+The module also parses FETCH responses (including literals) and builds
+compact UID sets for ranged commands.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import imaplib
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_IDLE_TIMEOUT_S = 600.0
+# A connection unused for this long is checked with NOOP before reuse
+NOOP_AFTER_S = 30.0
+
+_RECORD_START = re.compile(rb"\d+ \(")
+
+
+def connection_fingerprint(*parts: Any) -> str:
+    """Hash of the connection settings (the password is not kept in plain text)"""
+    return hashlib.sha256("\x00".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+def uid_set(uids: Iterable[int]) -> str:
+    """Compact IMAP UID set: [1, 2, 3, 7] -> "1:3,7" """
+    ranges: List[str] = []
+    start = prev = None
+    for uid in sorted(set(int(u) for u in uids)):
+        if prev is not None and uid == prev + 1:
+            prev = uid
+            continue
+        if start is not None:
+            ranges.append(f"{start}:{prev}" if prev != start else str(start))
+        start = prev = uid
+    if start is not None:
+        ranges.append(f"{start}:{prev}" if prev != start else str(start))
+    return ",".join(ranges)
+
+
+def _parse_value(data: bytes, pos: int) -> Tuple[Any, int]:
+    """Parse one IMAP value at data[pos:]: list, quoted string, literal, NIL or atom"""
+    length = len(data)
+    while pos < length and data[pos] == 0x20:
+        pos += 1
+    if pos >= length:
+        return None, pos
+    char = data[pos]
+    if char == 0x28:  # (
+        items = []
+        pos += 1
+        while True:
+            while pos < length and data[pos] == 0x20:
+                pos += 1
+            if pos >= length or data[pos] == 0x29:  # )
+                return items, pos + 1
+            value, pos = _parse_value(data, pos)
+            items.append(value)
+    if char == 0x22:  # "
+        out = bytearray()
+        pos += 1
+        while pos < length and data[pos] != 0x22:
+            if data[pos] == 0x5C and pos + 1 < length:  # backslash escape
+                pos += 1
+            out.append(data[pos])
+            pos += 1
+        return bytes(out), pos + 1
+    if char == 0x7B:  # {n} followed by n raw bytes
+        end = data.index(b"}", pos)
+        size = int(data[pos + 1 : end])
+        start = end + 1
+        return data[start : start + size], start + size
+    # Atom, e.g. UID, 42, \Seen, NIL or BODY[HEADER.FIELDS (DATE)]
+    start = pos
+    depth = 0
+    while pos < length:
+        char = data[pos]
+        if char == 0x5B:  # [
+            depth += 1
+        elif char == 0x5D:  # ]
+            depth -= 1
+        elif depth == 0 and char in (0x20, 0x28, 0x29):
+            break
+        pos += 1
+    atom = data[start:pos]
+    return (None if atom.upper() == b"NIL" else atom), pos
+
+
+def parse_fetch_response(data: List[Any]) -> List[Dict[bytes, Any]]:
+    """Parse imaplib FETCH data into one {ITEM: value} dict per message
+
+    imaplib returns each message as bytes, or as (prefix, literal) tuples
+    followed by the bytes that continue the line when the response contains
+    literals. Unsolicited FETCH responses are parsed too; callers filter on
+    the items they asked for (e.g. UID).
+    """
+    records: List[bytes] = []
+    for item in data or []:
+        if item is None:
+            continue
+        if isinstance(item, tuple):
+            head, piece = item[0], item[0] + item[1]
+        else:
+            head = piece = item
+        if _RECORD_START.match(head) or not records:
+            records.append(piece)
+        else:
+            records[-1] += piece
+
+    parsed = []
+    for record in records:
+        match = _RECORD_START.match(record)
+        if not match:
+            continue
+        values, _ = _parse_value(record, match.end() - 1)
+        if not isinstance(values, list):
+            continue
+        parsed.append(
+            {
+                (key.upper() if isinstance(key, bytes) else key): value
+                for key, value in zip(values[0::2], values[1::2])
+            }
+        )
+    return parsed
+
+
+@dataclass
+class ImapSession:
+    """Cached connection and incremental sync state of one email instance"""
+
+    key: str
+    fingerprint: str
+    conn: Optional[imaplib.IMAP4] = None
+    lock: threading.RLock = field(default_factory=threading.RLock)
+    last_used: float = field(default_factory=time.monotonic)
+    exists: int = 0
+    # Sync state (reset when UIDVALIDITY changes)
+    uidvalidity: Optional[int] = None
+    last_uid: int = 0  # Highest known UID: UIDNEXT - 1 at SELECT, or a newer unread UID
+    unread: Dict[int, Any] = field(default_factory=dict)
+    unread_truncated: bool = False  # More unread messages than are cached
+
+    def reset_sync(self) -> None:
+        self.last_uid = 0
+        self.unread = {}
+        self.unread_truncated = False
+
+    def close(self) -> None:
+        conn, self.conn = self.conn, None
+        if conn is None:
+            return
+        try:
+            conn.logout()
+        except Exception:
+            pass
+
+
+class ImapSessionCache:
+    """One warm IMAP session per email instance"""
+
+    def __init__(self, idle_timeout_s: Optional[float] = None):
+        if idle_timeout_s is None:
+            idle_timeout_s = float(os.getenv("OCTOPUSOS_IMAP_IDLE_TIMEOUT_S", DEFAULT_IDLE_TIMEOUT_S))
+        self.idle_timeout_s = idle_timeout_s
+        self._sessions: Dict[str, ImapSession] = {}
+        self._lock = threading.Lock()
+        self.connects = 0
+
+    def run(
+        self,
+        key: str,
+        fingerprint: str,
+        connect: Callable[[], imaplib.IMAP4],
+        fn: Callable[[ImapSession], T],
+    ) -> T:
+        """Run fn with the instance's session, connected and with INBOX selected
+
+        Args:
+            key: Session key (email instance)
+            fingerprint: Connection settings hash; a change reconnects
+            connect: Opens and logs in a new connection
+            fn: Operation; retried once on a fresh connection if the old one dropped
+        """
+        session = self._session(key, fingerprint)
+        with session.lock:
+            for attempt in (0, 1):
+                try:
+                    if session.conn is None:
+                        self._open(session, connect)
+                    elif time.monotonic() - session.last_used > NOOP_AFTER_S:
+                        self.noop(session)
+                    result = fn(session)
+                    session.last_used = time.monotonic()
+                    return result
+                except (imaplib.IMAP4.abort, OSError) as exc:
+                    logger.info(f"IMAP connection lost for {key} ({exc}); reconnecting")
+                    session.close()
+                    if attempt:
+                        raise
+
+        raise AssertionError("unreachable")
+
+    @staticmethod
+    def noop(session: ImapSession) -> None:
+        """NOOP; also consumes unsolicited EXISTS / EXPUNGE / FETCH updates"""
+        session.conn.noop()
+        exists = session.conn.untagged_responses.get("EXISTS")
+        if exists:
+            session.exists = int(exists[-1])
+        for name in ("EXISTS", "EXPUNGE", "FETCH", "RECENT"):
+            session.conn.untagged_responses.pop(name, None)
+
+    def close(self, key: Optional[str] = None) -> None:
+        """Log out one session, or all sessions when key is None"""
+        with self._lock:
+            keys = [key] if key is not None else list(self._sessions)
+            sessions = [self._sessions.pop(k) for k in keys if k in self._sessions]
+        for session in sessions:
+            with session.lock:
+                session.close()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            sessions = list(self._sessions.values())
+        return [
+            {
+                "key": s.key,
+                "connected": s.conn is not None,
+                "uidvalidity": s.uidvalidity,
+                "last_uid": s.last_uid,
+                "unread_cached": len(s.unread),
+                "idle_s": round(time.monotonic() - s.last_used, 1),
+            }
+            for s in sessions
+        ]
+
+    def _session(self, key: str, fingerprint: str) -> ImapSession:
+        now = time.monotonic()
+        stale: List[ImapSession] = []
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None and session.fingerprint != fingerprint:
+                stale.append(self._sessions.pop(key))
+                session = None
+            if session is None:
+                session = self._sessions[key] = ImapSession(key=key, fingerprint=fingerprint)
+            for other_key, other in list(self._sessions.items()):
+                if other is not session and now - other.last_used > self.idle_timeout_s:
+                    stale.append(self._sessions.pop(other_key))
+        for old in stale:
+            # Skip sessions still in use; they are dropped from the cache either way
+            if old.lock.acquire(blocking=False):
+                try:
+                    old.close()
+                finally:
+                    old.lock.release()
+        return session
+
+    def _open(self, session: ImapSession, connect: Callable[[], imaplib.IMAP4]) -> None:
+        conn = connect()
+        self.connects += 1
+        try:
+            typ, data = conn.select("INBOX")
+            if typ != "OK":
+                raise imaplib.IMAP4.error(f"SELECT INBOX failed: {data}")
+            session.exists = int((data or [b"0"])[0] or 0)
+            _, validity = conn.response("UIDVALIDITY")
+            uidvalidity = int(validity[0]) if validity and validity[0] else None
+            # EXISTS can be stale or 0 on some servers; UIDNEXT is what bounds the UIDs
+            _, uidnext = conn.response("UIDNEXT")
+            last_uid = int(uidnext[0]) - 1 if uidnext and uidnext[0] else 0
+        except Exception:
+            try:
+                conn.logout()
+            except Exception:
+                pass
+            raise
+        if uidvalidity is None or uidvalidity != session.uidvalidity:
+            # UIDs from a previous UIDVALIDITY refer to other messages now
+            session.reset_sync()
+        session.uidvalidity = uidvalidity
+        session.last_uid = max(session.last_uid, last_uid)
+        session.conn = conn
+
+
+_default_cache: Optional[ImapSessionCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_imap_session_cache() -> ImapSessionCache:
+    """Process-wide IMAP session cache"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = ImapSessionCache()
+                atexit.register(_default_cache.close)
+    return _default_cache
@@ -8,10 +8,18 @@ import ssl
 from email.header import decode_header, make_header
 from email.message import Message
 from email.utils import parseaddr, parsedate_to_datetime
-from typing import Optional
+from typing import Any, Optional
 
 from octopusos.core.email.models import EmailHeader, EmailMessage, SendResult
 from octopusos.core.email.providers.base import EmailProvider
+from octopusos.core.email.providers.imap_session import (
+    ImapSession,
+    ImapSessionCache,
+    connection_fingerprint,
+    get_imap_session_cache,
+    parse_fetch_response,
+    uid_set,
+)
 from octopusos.webui.secret_resolver import resolve_secret_ref
 from octopusos.store.timestamp_utils import now_ms
 
@@ -23,8 +31,12 @@ def _decode_mime(value: str) -> str:
         return value or ""
 
 
-def _msg_date_ms(msg: Message) -> int:
-    raw = msg.get("Date")
+# Most recent unread messages kept per instance (list_unread returns at most this many)
+MAX_UNREAD = 200
+IMAP_TIMEOUT_S = 30
+
+
+def _date_ms(raw: Any) -> int:
     if not raw:
         return now_ms()
     try:
@@ -34,6 +46,48 @@ def _msg_date_ms(msg: Message) -> int:
         return now_ms()
 
 
+def _msg_date_ms(msg: Message) -> int:
+    return _date_ms(msg.get("Date"))
+
+
+def _imap_text(value: Any) -> str:
+    """Decode an ENVELOPE string (raw header bytes, possibly MIME encoded-words)"""
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        try:
+            value = value.decode("utf-8")
+        except UnicodeDecodeError:
+            value = value.decode("latin-1")
+    return _decode_mime(str(value))
+
+
+def _header_from_envelope(uid: int, envelope: list) -> EmailHeader:
+    """EmailHeader from an IMAP ENVELOPE: (date subject from sender reply-to to cc bcc in-reply-to message-id)"""
+    date_raw = _imap_text(envelope[0]) if len(envelope) > 0 else ""
+    subject = _imap_text(envelope[1]) if len(envelope) > 1 else ""
+    from_name, from_addr = "", ""
+    senders = envelope[2] if len(envelope) > 2 else None
+    if isinstance(senders, list) and senders and isinstance(senders[0], list):
+        name, _adl, mailbox, host = (list(senders[0]) + [None] * 4)[:4]
+        from_name = _imap_text(name)
+        mailbox, host = _imap_text(mailbox), _imap_text(host)
+        from_addr = f"{mailbox}@{host}" if mailbox and host else mailbox
+    return EmailHeader(
+        message_id=str(uid),
+        from_email=from_addr,
+        from_name=from_name or None,
+        subject=subject,
+        date_ms=_date_ms(date_raw),
+        snippet="",
+        importance="normal",
+    )
+
+
+def _is_seen(flags: Any) -> bool:
+    return isinstance(flags, list) and any(isinstance(f, bytes) and f.lower() == b"\\seen" for f in flags)
+
+
 def _extract_text_body(msg: Message) -> str:
     if msg.is_multipart():
         # Prefer text/plain, fall back to first part.
@@ -80,9 +134,30 @@ def _extract_text_body(msg: Message) -> str:
 
 
 class ImapSmtpEmailProvider(EmailProvider):
-    def __init__(self, *, config: dict, secret_ref: str):
+    """IMAP (read) + SMTP (send) provider.
+
+    Reads go through a cached IMAP session per email instance (see
+    imap_session.py). list_unread syncs incrementally by UID: every poll runs
+    one UID SEARCH UNSEEN, which also catches messages read, expunged or
+    marked unread again in other clients, and one ranged UID FETCH of
+    ENVELOPE and FLAGS for the unread UIDs not cached yet (none on a quiet
+    poll). Message ids are IMAP UIDs, which stay valid while the mailbox's
+    UIDVALIDITY is unchanged. Ids stored when they were sequence numbers are
+    invalidated by schema v104.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: dict,
+        secret_ref: str,
+        instance_id: str = "",
+        session_cache: Optional[ImapSessionCache] = None,
+    ):
         self._config = config or {}
         self._secret_ref = secret_ref or ""
+        self._instance_id = instance_id or ""
+        self._sessions = session_cache or get_imap_session_cache()
 
     def _password(self) -> str:
         if not self._secret_ref:
@@ -94,8 +169,57 @@ class ImapSmtpEmailProvider(EmailProvider):
         port = int(self._config.get("imap_port") or 993)
         tls = bool(self._config.get("imap_tls", True))
         if tls:
-            return imaplib.IMAP4_SSL(host, port)
-        return imaplib.IMAP4(host, port)
+            return imaplib.IMAP4_SSL(host, port, timeout=IMAP_TIMEOUT_S)
+        return imaplib.IMAP4(host, port, timeout=IMAP_TIMEOUT_S)
+
+    def _with_session(self, user: str, pw: str, fn):
+        """Run fn(session) on this instance's cached, logged-in IMAP session"""
+        host = str(self._config.get("imap_host") or "")
+        port = int(self._config.get("imap_port") or 993)
+        tls = bool(self._config.get("imap_tls", True))
+        key = self._instance_id or f"{user}@{host}:{port}"
+        fingerprint = connection_fingerprint(host, port, tls, user, pw)
+
+        def _connect() -> imaplib.IMAP4:
+            im = self._imap()
+            try:
+                im.login(user, pw)
+            except Exception:
+                try:
+                    im.logout()
+                except Exception:
+                    pass
+                raise
+            return im
+
+        return self._sessions.run(key, fingerprint, _connect, fn)
+
+    def _sync_unread(self, session: ImapSession) -> None:
+        """Bring session.unread up to date (called with the session lock held)"""
+        typ, data = session.conn.uid("SEARCH", "UNSEEN")
+        if typ != "OK":
+            return
+        unseen = sorted(int(x) for x in (data[0] or b"").split() if x)
+        # Newest MAX_UNREAD unread messages; drop the rest, fetch the uncached ones
+        window = unseen[-MAX_UNREAD:]
+        session.unread = {uid: session.unread[uid] for uid in window if uid in session.unread}
+        session.unread_truncated = len(unseen) > MAX_UNREAD
+        self._fetch_headers(session, uid_set(uid for uid in window if uid not in session.unread))
+        session.last_uid = max([session.last_uid] + window)
+
+    def _fetch_headers(self, session: ImapSession, uids: str) -> None:
+        if not uids:
+            return
+        typ, data = session.conn.uid("FETCH", uids, "(UID FLAGS ENVELOPE)")
+        if typ != "OK":
+            return
+        for item in parse_fetch_response(data):
+            if b"UID" not in item or not isinstance(item.get(b"ENVELOPE"), list):
+                continue  # Unsolicited update
+            uid = int(item[b"UID"])
+            # Read elsewhere between the SEARCH and this FETCH
+            if not _is_seen(item.get(b"FLAGS")):
+                session.unread[uid] = _header_from_envelope(uid, item[b"ENVELOPE"])
 
     def _smtp(self) -> smtplib.SMTP:
         host = str(self._config.get("smtp_host") or "")
@@ -142,87 +266,55 @@ class ImapSmtpEmailProvider(EmailProvider):
         pw = self._password()
         if not user or not pw:
             return []
-        im = self._imap()
-        try:
-            im.login(user, pw)
-            im.select("INBOX")
-            # Search unread.
-            typ, data = im.search(None, "UNSEEN")
-            if typ != "OK":
-                return []
-            ids = [x for x in (data[0] or b"").split() if x]
-            ids = ids[-max(1, min(int(limit), 200)) :]
-            out: list[EmailHeader] = []
-            for mid in reversed(ids):
-                typ2, msg_data = im.fetch(mid, "(BODY.PEEK[HEADER])")
-                if typ2 != "OK" or not msg_data:
-                    continue
-                raw = msg_data[0][1] if isinstance(msg_data[0], tuple) else None
-                if not raw:
-                    continue
-                msg = email.message_from_bytes(raw)
-                date_ms = _msg_date_ms(msg)
-                if since_ms is not None and date_ms < int(since_ms):
-                    continue
-                subj = _decode_mime(str(msg.get("Subject") or ""))
-                from_raw = _decode_mime(str(msg.get("From") or ""))
-                from_name, from_addr = parseaddr(from_raw)
-                out.append(
-                    EmailHeader(
-                        message_id=str(mid.decode("utf-8", errors="replace")),
-                        from_email=from_addr or from_raw,
-                        from_name=from_name or None,
-                        subject=subj,
-                        date_ms=date_ms,
-                        snippet="",
-                        importance="normal",
-                    )
-                )
-            return out
-        finally:
-            try:
-                im.logout()
-            except Exception:
-                pass
+
+        def _poll(session: ImapSession) -> list[EmailHeader]:
+            self._sync_unread(session)
+            return [session.unread[uid] for uid in sorted(session.unread, reverse=True)]
+
+        headers = self._with_session(user, pw, _poll)
+        out: list[EmailHeader] = []
+        for header in headers[: max(1, min(int(limit), MAX_UNREAD))]:
+            if since_ms is not None and header.date_ms < int(since_ms):
+                continue
+            out.append(header)
+        return out
 
     def get_message(self, *, message_id: str) -> EmailMessage:
         user = str(self._config.get("username") or "")
         pw = self._password()
         if not user or not pw:
             raise ValueError("missing_credentials")
-        im = self._imap()
-        try:
-            im.login(user, pw)
-            im.select("INBOX")
-            typ, data = im.fetch(message_id.encode("utf-8"), "(RFC822)")
+
+        def _fetch(session: ImapSession) -> Optional[bytes]:
+            typ, data = session.conn.uid("FETCH", str(message_id), "(RFC822)")
             if typ != "OK" or not data:
-                raise ValueError("MESSAGE_NOT_FOUND")
-            raw = data[0][1] if isinstance(data[0], tuple) else None
-            if not raw:
-                raise ValueError("MESSAGE_NOT_FOUND")
-            msg = email.message_from_bytes(raw)
-            subject = _decode_mime(str(msg.get("Subject") or ""))
-            from_raw = _decode_mime(str(msg.get("From") or ""))
-            from_name, from_addr = parseaddr(from_raw)
-            body_text = _extract_text_body(msg)
-            md_from = f"{from_name} <{from_addr}>" if from_addr else from_raw
-            md = f"**From:** {md_from}\n\n**Subject:** {subject}\n\n---\n\n{body_text}\n"
-            return EmailMessage(
-                message_id=str(message_id),
-                from_email=from_addr or from_raw,
-                from_name=from_name or None,
-                to=[],
-                cc=[],
-                subject=subject,
-                date_ms=_msg_date_ms(msg),
-                body_text=body_text,
-                body_md=md,
-            )
-        finally:
-            try:
-                im.logout()
-            except Exception:
-                pass
+                return None
+            for item in data:
+                if isinstance(item, tuple) and b"RFC822" in item[0].upper():
+                    return item[1]
+            return None
+
+        raw = self._with_session(user, pw, _fetch)
+        if not raw:
+            raise ValueError("MESSAGE_NOT_FOUND")
+        msg = email.message_from_bytes(raw)
+        subject = _decode_mime(str(msg.get("Subject") or ""))
+        from_raw = _decode_mime(str(msg.get("From") or ""))
+        from_name, from_addr = parseaddr(from_raw)
+        body_text = _extract_text_body(msg)
+        md_from = f"{from_name} <{from_addr}>" if from_addr else from_raw
+        md = f"**From:** {md_from}\n\n**Subject:** {subject}\n\n---\n\n{body_text}\n"
+        return EmailMessage(
+            message_id=str(message_id),
+            from_email=from_addr or from_raw,
+            from_name=from_name or None,
+            to=[],
+            cc=[],
+            subject=subject,
+            date_ms=_msg_date_ms(msg),
+            body_text=body_text,
+            body_md=md,
+        )
 
     def create_draft_reply(self, *, message_id: str, user_text: str) -> tuple[str, str, str]:
         msg = self.get_message(message_id=message_id)
@@ -273,14 +365,11 @@ class ImapSmtpEmailProvider(EmailProvider):
         pw = self._password()
         if not user or not pw:
             raise ValueError("missing_credentials")
-        im = self._imap()
-        try:
-            im.login(user, pw)
-            im.select("INBOX")
-            # message_id is an IMAP message sequence as used by list_unread (MVP).
-            im.store(str(message_id), "+FLAGS", "\\Seen")
-        finally:
-            try:
-                im.logout()
-            except Exception:
-                pass
+
+        def _store(session: ImapSession) -> None:
+            # message_id is an IMAP UID as returned by list_unread.
+            session.conn.uid("STORE", str(message_id), "+FLAGS", "(\\Seen)")
+            if str(message_id).isdigit():
+                session.unread.pop(int(message_id), None)
+
+        self._with_session(user, pw, _store)
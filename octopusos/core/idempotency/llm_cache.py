@@ -9,6 +9,9 @@ Key Features:
 - Configurable cache expiration
 - Token savings tracking
 - Support for both plan and work_item outputs
+- In-process LRU tier (bounded by entries and bytes, with TTL) in front of
+  the SQLite store
+- Single-flight: concurrent identical requests share one generation
 
 Example:
     cache = LLMOutputCache()
@@ -33,13 +36,105 @@ Example:
     )
 """
 
+import json
 import logging
-from typing import Any, Callable, Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from octopusos.core.idempotency.store import IdempotencyStore
+from octopusos.core.idempotency.store import IdempotencyConflictError, IdempotencyStore
 
 logger = logging.getLogger(__name__)
 
+# In-process tier defaults
+MEMORY_MAX_ENTRIES = 512
+MEMORY_MAX_BYTES = 32 * 1024 * 1024
+MEMORY_TTL_SECONDS = 3600
+
+
+def _output_tokens(result: Any) -> int:
+    """Best-effort token count of an LLM output dict (0 if unknown)."""
+    if not isinstance(result, dict):
+        return 0
+    for field in ("tokens", "tokens_used", "total_tokens"):
+        value = result.get(field)
+        if isinstance(value, (int, float)):
+            return int(value)
+    usage = result.get("usage")
+    if isinstance(usage, dict):
+        value = usage.get("total_tokens")
+        if isinstance(value, (int, float)):
+            return int(value)
+    return 0
+
+
+class _MemoryTier:
+    """LRU of serialized outputs bounded by entry count and total bytes.
+
+    Entries hold the JSON text rather than the dict so every hit returns a
+    fresh copy (same as reading from the store) and the byte size is exact.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # key -> (request_hash, payload, expires_at, tokens)
+        self._entries: "OrderedDict[str, Tuple[str, str, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[Tuple[str, str, int]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        request_hash, payload, expires_at, tokens = entry
+        if expires_at <= time.monotonic():
+            self.pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return request_hash, payload, tokens
+
+    def put(self, key: str, request_hash: str, payload: str, ttl_seconds: float, tokens: int) -> None:
+        self.pop(key)
+        size = len(payload)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        expires_at = time.monotonic() + min(ttl_seconds, self.ttl_seconds)
+        self._entries[key] = (request_hash, payload, expires_at, tokens)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted, _, _) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+
+class _InFlight:
+    """One running generation that concurrent identical callers wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.payload: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
 
 class LLMOutputCache:
     """Cache for LLM outputs to reduce token consumption.
@@ -52,17 +147,39 @@ class LLMOutputCache:
 
     This ensures that identical LLM requests return cached results,
     avoiding redundant API calls and token consumption.
+
+    Lookups go through a bounded in-process LRU first and only fall back to
+    the store on a local miss. Concurrent callers with the same cache key are
+    coalesced: one runs ``generate_fn`` and the others wait for its result
+    (or its exception).
     """
 
-    def __init__(self, store: Optional[IdempotencyStore] = None):
+    def __init__(
+        self,
+        store: Optional[IdempotencyStore] = None,
+        memory_max_entries: int = MEMORY_MAX_ENTRIES,
+        memory_max_bytes: int = MEMORY_MAX_BYTES,
+        memory_ttl_seconds: float = MEMORY_TTL_SECONDS,
+    ):
         """Initialize LLM output cache.
 
         Args:
             store: Optional IdempotencyStore instance. If None, creates new one.
+            memory_max_entries: Max outputs kept in the in-process tier (0 disables it)
+            memory_max_bytes: Max total serialized size of the in-process tier
+            memory_ttl_seconds: Max lifetime of an in-process entry
+                (never longer than the store expiration)
         """
         self.store = store or IdempotencyStore()
+        self._memory = _MemoryTier(memory_max_entries, memory_max_bytes, memory_ttl_seconds)
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, _InFlight] = {}
         self._cache_hits = 0
         self._cache_misses = 0
+        self._memory_hits = 0
+        self._store_hits = 0
+        self._coalesced_calls = 0
+        self._tokens_saved = 0
 
     def get_or_generate(
         self,
@@ -111,9 +228,86 @@ class LLMOutputCache:
             "work_item_id": work_item_id,
         }
         request_hash = IdempotencyStore.compute_hash(request_data)
+        expires_in = expires_in_seconds or (7 * 24 * 3600)  # Default 7 days
+
+        # In-process tier, or join a generation already running for this key
+        with self._lock:
+            cached = self._memory.get(cache_key)
+            if cached is not None:
+                cached_hash, payload, tokens = cached
+                if cached_hash != request_hash:
+                    raise IdempotencyConflictError(
+                        f"Same idempotency key used with different request: {cache_key}"
+                    )
+                self._cache_hits += 1
+                self._memory_hits += 1
+                self._tokens_saved += tokens
+                return json.loads(payload)
+
+            flight = self._inflight.get(cache_key)
+            leader = flight is None
+            if leader:
+                flight = _InFlight()
+                self._inflight[cache_key] = flight
+            else:
+                flight.waiters += 1
+
+        if not leader:
+            return self._wait_for(flight, cache_key, operation_type, model, task_id)
 
+        try:
+            result = self._load_or_generate(
+                cache_key, request_hash, operation_type, model, generate_fn,
+                task_id, work_item_id, expires_in,
+            )
+            flight.payload = json.dumps(result)
+            with self._lock:
+                self._memory.put(cache_key, request_hash, flight.payload, expires_in, _output_tokens(result))
+            return result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(cache_key, None)
+            flight.done.set()
+
+    def _wait_for(
+        self,
+        flight: _InFlight,
+        cache_key: str,
+        operation_type: str,
+        model: str,
+        task_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Wait for the leader's generation and share its outcome."""
+        logger.info(
+            f"LLM cache COALESCED: operation={operation_type}, "
+            f"model={model}, task_id={task_id}"
+        )
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        result = json.loads(flight.payload)
+        with self._lock:
+            self._cache_hits += 1
+            self._coalesced_calls += 1
+            self._tokens_saved += _output_tokens(result)
+        return result
+
+    def _load_or_generate(
+        self,
+        cache_key: str,
+        request_hash: str,
+        operation_type: str,
+        model: str,
+        generate_fn: Callable[[], Dict[str, Any]],
+        task_id: Optional[str],
+        work_item_id: Optional[str],
+        expires_in: int,
+    ) -> Dict[str, Any]:
+        """Store lookup, then generation on a miss (single caller per key)."""
         # Check cache or create entry
-        expires_in = expires_in_seconds or (7 * 24 * 3600)  # Default 7 days
         is_cached, cached_result = self.store.check_or_create(
             key=cache_key,
             request_hash=request_hash,
@@ -124,7 +318,10 @@ class LLMOutputCache:
 
         if is_cached:
             # Cache hit
-            self._cache_hits += 1
+            with self._lock:
+                self._cache_hits += 1
+                self._store_hits += 1
+                self._tokens_saved += _output_tokens(cached_result)
             logger.info(
                 f"LLM cache HIT: operation={operation_type}, "
                 f"model={model}, task_id={task_id}"
@@ -132,7 +329,8 @@ class LLMOutputCache:
             return cached_result
 
         # Cache miss - generate new output
-        self._cache_misses += 1
+        with self._lock:
+            self._cache_misses += 1
         logger.info(
             f"LLM cache MISS: operation={operation_type}, "
             f"model={model}, task_id={task_id}"
@@ -174,6 +372,8 @@ class LLMOutputCache:
         cache_key = self._build_cache_key(
             operation_type, prompt, model, task_id, work_item_id
         )
+        with self._lock:
+            self._memory.pop(cache_key)
         self.store.mark_failed(cache_key, "Manually invalidated")
         logger.info(f"Invalidated LLM cache entry: key={cache_key}")
 
@@ -222,25 +422,57 @@ class LLMOutputCache:
 
         Returns:
             Dictionary with:
-            - cache_hits: Number of cache hits
-            - cache_misses: Number of cache misses
+            - cache_hits: Number of cache hits (memory + store + coalesced)
+            - cache_misses: Number of cache misses (generate_fn calls)
             - hit_rate: Cache hit rate (0-1)
             - total_requests: Total requests
+            - memory_hits: Hits served by the in-process tier
+            - store_hits: Hits served by the IdempotencyStore
+            - coalesced_calls: Callers that waited on an in-flight generation
+            - tokens_saved: Tokens of outputs served without calling the model
+            - memory: In-process tier occupancy (entries, bytes, evictions)
             - store_stats: Statistics from underlying IdempotencyStore
         """
-        total = self._cache_hits + self._cache_misses
-        hit_rate = self._cache_hits / total if total > 0 else 0.0
+        with self._lock:
+            hits = self._cache_hits
+            misses = self._cache_misses
+            stats = {
+                "memory_hits": self._memory_hits,
+                "store_hits": self._store_hits,
+                "coalesced_calls": self._coalesced_calls,
+                "tokens_saved": self._tokens_saved,
+                "memory": {
+                    "entries": len(self._memory),
+                    "bytes": self._memory.bytes,
+                    "max_entries": self._memory.max_entries,
+                    "max_bytes": self._memory.max_bytes,
+                    "evictions": self._memory.evictions,
+                },
+            }
+        total = hits + misses
+        hit_rate = hits / total if total > 0 else 0.0
 
         return {
-            "cache_hits": self._cache_hits,
-            "cache_misses": self._cache_misses,
+            "cache_hits": hits,
+            "cache_misses": misses,
             "hit_rate": hit_rate,
             "total_requests": total,
+            **stats,
             "store_stats": self.store.get_stats(),
         }
 
     def reset_stats(self) -> None:
         """Reset cache statistics counters."""
-        self._cache_hits = 0
-        self._cache_misses = 0
+        with self._lock:
+            self._cache_hits = 0
+            self._cache_misses = 0
+            self._memory_hits = 0
+            self._store_hits = 0
+            self._coalesced_calls = 0
+            self._tokens_saved = 0
         logger.info("Reset LLM cache statistics")
+
+    def clear_memory(self) -> None:
+        """Drop the in-process tier (the store is left untouched)."""
+        with self._lock:
+            self._memory.clear()
@@ -2,19 +2,55 @@
 LLM Token Tracking Wrapper - Universal injection point for token usage tracking
 
 This module provides a decorator and wrapper for all LLM calls to automatically
-inject token usage tracking and budget enforcement.
+inject token usage tracking and budget enforcement. Calls made for a known
+provider instance (instance_id) also feed the router's live telemetry:
+latency, completion tokens and failures (octopusos.router.telemetry).
 
 PR-0131-2026-1 Wave A: Real Token Tracking Integration
 """
 
 import logging
 import functools
+import time
 from typing import Any, Callable, Optional, Dict
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
+def _completion_tokens(response: Any) -> int:
+    """Completion token count from an OpenAI/Anthropic-style response (0 if absent)"""
+    usage = getattr(response, "usage", None)
+    if usage is None and isinstance(response, dict):
+        usage = response.get("usage")
+    if usage is None:
+        return 0
+    if isinstance(usage, dict):
+        return int(usage.get("completion_tokens") or usage.get("output_tokens") or 0)
+    return int(
+        getattr(usage, "completion_tokens", None) or getattr(usage, "output_tokens", None) or 0
+    )
+
+
+def _record_instance_telemetry(
+    instance_id: Optional[str], ok: bool, started: float, response: Any = None
+) -> None:
+    """Report one call to the router's per-instance telemetry"""
+    if not instance_id:
+        return
+    try:
+        from octopusos.router.telemetry import get_instance_telemetry
+
+        get_instance_telemetry().record(
+            instance_id,
+            ok=ok,
+            latency_ms=(time.perf_counter() - started) * 1000,
+            tokens=_completion_tokens(response) if ok else 0,
+        )
+    except Exception as e:
+        logger.debug(f"Instance telemetry skipped: {e}")
+
+
 @dataclass
 class LLMCallContext:
     """Context for LLM call tracking"""
@@ -22,6 +58,7 @@ class LLMCallContext:
     provider: str = "unknown"
     model: str = "unknown"
     operation: str = "generate"
+    instance_id: Optional[str] = None  # Provider instance for router telemetry
 
 
 def track_llm_call(context: Optional[LLMCallContext] = None):
@@ -40,7 +77,14 @@ def track_llm_call(context: Optional[LLMCallContext] = None):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Execute LLM call
-            response = func(*args, **kwargs)
+            instance_id = context.instance_id if context else None
+            started = time.perf_counter()
+            try:
+                response = func(*args, **kwargs)
+            except Exception:
+                _record_instance_telemetry(instance_id, False, started)
+                raise
+            _record_instance_telemetry(instance_id, True, started, response)
 
             # Extract token usage from response
             try:
@@ -93,16 +137,18 @@ class LLMCallWrapper:
     consistent token tracking across providers.
     """
 
-    def __init__(self, provider: str, model: str):
+    def __init__(self, provider: str, model: str, instance_id: Optional[str] = None):
         """
         Initialize wrapper
 
         Args:
             provider: Provider name (anthropic/openai/local)
             model: Model name
+            instance_id: Provider instance id for router telemetry (e.g. "llamacpp:qwen3-coder-30b")
         """
         self.provider = provider
         self.model = model
+        self.instance_id = instance_id
 
     def wrap_call(
         self,
@@ -122,7 +168,13 @@ class LLMCallWrapper:
             LLM response (with tracking side-effect)
         """
         # Execute call
-        response = llm_call(**kwargs)
+        started = time.perf_counter()
+        try:
+            response = llm_call(**kwargs)
+        except Exception:
+            _record_instance_telemetry(self.instance_id, False, started)
+            raise
+        _record_instance_telemetry(self.instance_id, True, started, response)
 
         # Track tokens
         try:
@@ -9,6 +9,7 @@ Components:
 - MCPClient: Stdio-based MCP protocol client
 - MCPAdapter: Converts MCP tools to ToolDescriptor format
 - MCPHealthChecker: Health monitoring for MCP servers
+- MCPSessionPool: Long-lived server sessions with a tool-schema cache
 
 Example:
     from octopusos.core.mcp import MCPConfigManager, MCPClient, MCPAdapter
@@ -36,6 +37,7 @@ from octopusos.core.mcp.config import MCPConfigManager, MCPServerConfig
 from octopusos.core.mcp.client import MCPClient, MCPClientError
 from octopusos.core.mcp.adapter import MCPAdapter
 from octopusos.core.mcp.health import MCPHealthChecker, HealthStatus
+from octopusos.core.mcp.session_pool import MCPSessionPool, get_mcp_session_pool
 
 __all__ = [
     "MCPConfigManager",
@@ -45,4 +47,6 @@ __all__ = [
     "MCPAdapter",
     "MCPHealthChecker",
     "HealthStatus",
+    "MCPSessionPool",
+    "get_mcp_session_pool",
 ]
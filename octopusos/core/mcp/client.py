@@ -19,7 +19,7 @@ import json
 import logging
 import shutil
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from octopusos.core.mcp.config import MCPServerConfig
 
@@ -78,6 +78,17 @@ class MCPClient:
         self._pending_requests: Dict[int, asyncio.Future] = {}
         self._reader_task: Optional[asyncio.Task] = None
         self._connected = False
+        self._notification_handlers: List[Callable[[Dict[str, Any]], None]] = []
+
+    def add_notification_handler(self, handler: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Register a callback for server notifications
+
+        Args:
+            handler: Called with each notification message, e.g.
+                {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"}
+        """
+        self._notification_handlers.append(handler)
 
     async def connect(self) -> bool:
         """
@@ -183,9 +194,10 @@ class MCPClient:
         """
         Disconnect from MCP server
 
-        Gracefully shuts down the connection and terminates the process.
+        Gracefully shuts down the connection and terminates the process
+        (also a process whose handshake failed).
         """
-        if not self._connected:
+        if not self._connected and self.process is None:
             return
 
         logger.info(f"Disconnecting from MCP server: {self.config.id}")
@@ -302,6 +314,10 @@ class MCPClient:
         if not self.process or self.process.returncode is not None:
             return False
 
+        # stdout closed: no response can arrive any more
+        if self._reader_task is not None and self._reader_task.done():
+            return False
+
         return True
 
     async def _send_request(
@@ -436,6 +452,10 @@ class MCPClient:
             logger.error(f"Error in read loop: {e}", exc_info=True)
 
         finally:
+            # Fail in-flight requests now instead of letting them time out
+            for future in self._pending_requests.values():
+                if not future.done():
+                    future.set_exception(MCPConnectionError(f"MCP server connection closed: {self.config.id}"))
             logger.debug(f"Read loop ended for MCP server: {self.config.id}")
 
     def _handle_response(self, response: Dict[str, Any]):
@@ -448,6 +468,11 @@ class MCPClient:
         # Check if this is a notification (no id)
         if "id" not in response:
             logger.debug(f"Received notification: {response.get('method', 'unknown')}")
+            for handler in self._notification_handlers:
+                try:
+                    handler(response)
+                except Exception as e:
+                    logger.warning(f"MCP notification handler failed: {e}")
             return
 
         request_id = response["id"]
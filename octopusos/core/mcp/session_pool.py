@@ -0,0 +1,347 @@
+"""
+MCP Session Pool - long-lived MCP server sessions
+
+Connecting an MCPClient spawns the server process and runs the MCP
+handshake, which takes hundreds of milliseconds for node-based servers.
+MCPSessionPool keeps one warm client per server and reuses it:
+
+- All sessions live on the shared background event loop
+  (octopusos.core.utils.background_loop), so sync callers and callers on
+  other event loops can share them. Concurrent requests are multiplexed over
+  the client's JSON-RPC request ids.
+- Tool schemas are cached per session. The cache is dropped when the server
+  restarts or sends notifications/tools/list_changed.
+- A crashed server is restarted on the next request, with exponential
+  backoff between restarts. A health task restarts crashed servers that were
+  recently used and closes sessions that have been idle too long.
+- A changed server config (command, env, timeout) restarts the session.
+
+Usage:
+    from octopusos.core.mcp.session_pool import get_mcp_session_pool
+
+    pool = get_mcp_session_pool()
+    tools = pool.list_tools_sync(server_config, timeout=5)
+    result = pool.call_tool_sync(server_config, "echo", {"message": "hi"})
+"""
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar
+
+from octopusos.core.mcp.client import MCPClient, MCPConnectionError
+from octopusos.core.mcp.config import MCPServerConfig
+from octopusos.core.utils.background_loop import BackgroundLoop, get_background_loop
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TOOLS_LIST_CHANGED = "notifications/tools/list_changed"
+
+
+def _config_fingerprint(config: MCPServerConfig) -> str:
+    """Fields that require a new process when they change"""
+    return config.model_dump_json(include={"transport", "command", "env", "timeout_ms"})
+
+
+@dataclass
+class MCPSession:
+    """One warm MCP client for a server"""
+
+    config: MCPServerConfig
+    fingerprint: str
+    client: Optional[MCPClient] = None
+    start_task: Optional[asyncio.Task] = None
+    tools: Optional[List[Dict[str, Any]]] = None
+    generation: int = 0  # Incremented on every (re)start
+    restarts: int = 0
+    consecutive_failures: int = 0
+    next_start_at: float = 0.0  # Backoff: no start attempt before this time
+    last_used: float = field(default_factory=time.monotonic)
+    last_error: Optional[str] = None
+
+    def is_alive(self) -> bool:
+        return self.client is not None and self.client.is_alive()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "server_id": self.config.id,
+            "alive": self.is_alive(),
+            "generation": self.generation,
+            "restarts": self.restarts,
+            "tools_cached": self.tools is not None,
+            "idle_s": round(time.monotonic() - self.last_used, 1),
+            "last_error": self.last_error,
+        }
+
+
+class MCPSessionPool:
+    """
+    Pool of long-lived MCP sessions, one per server id
+
+    The async methods can be awaited from any event loop; the *_sync
+    methods block the calling thread (not the background loop's own thread).
+    """
+
+    def __init__(
+        self,
+        loop: Optional[BackgroundLoop] = None,
+        idle_timeout_s: Optional[float] = None,
+        health_interval_s: float = 30.0,
+        restart_backoff_s: float = 1.0,
+        max_restart_backoff_s: float = 30.0,
+    ):
+        """
+        Args:
+            loop: Background loop the sessions run on (default: shared loop)
+            idle_timeout_s: Close sessions unused for this long
+                (default: OCTOPUSOS_MCP_IDLE_TIMEOUT_S or 600)
+            health_interval_s: Seconds between health checks
+            restart_backoff_s: Initial delay between restarts of a failing server
+            max_restart_backoff_s: Maximum delay between restarts
+        """
+        self._loop = loop or get_background_loop()
+        if idle_timeout_s is None:
+            idle_timeout_s = float(os.getenv("OCTOPUSOS_MCP_IDLE_TIMEOUT_S", "600"))
+        self.idle_timeout_s = idle_timeout_s
+        self.health_interval_s = health_interval_s
+        self.restart_backoff_s = restart_backoff_s
+        self.max_restart_backoff_s = max_restart_backoff_s
+        # Only touched on the background loop
+        self._sessions: Dict[str, MCPSession] = {}
+        self._health_task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def list_tools(self, server: MCPServerConfig, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Tool schemas of a server (cached until restart / tools/list_changed)"""
+        return await self._on_loop(self._list_tools(server, refresh))
+
+    async def call_tool(self, server: MCPServerConfig, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool on the server's warm session"""
+        return await self._on_loop(self._call_tool(server, tool_name, arguments))
+
+    async def close(self, server_id: Optional[str] = None) -> None:
+        """Close one session, or all sessions when server_id is None"""
+        await self._on_loop(self._close(server_id))
+
+    def list_tools_sync(
+        self,
+        server: MCPServerConfig,
+        timeout: Optional[float] = None,
+        refresh: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Blocking list_tools(); raises TimeoutError after timeout seconds"""
+        return self._loop.run(self._list_tools(server, refresh), timeout)
+
+    def call_tool_sync(
+        self,
+        server: MCPServerConfig,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Blocking call_tool(); raises TimeoutError after timeout seconds"""
+        return self._loop.run(self._call_tool(server, tool_name, arguments), timeout)
+
+    def close_sync(self, timeout: Optional[float] = 10.0) -> None:
+        """Blocking close of all sessions"""
+        self._loop.run(self._close(None), timeout)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-session status (snapshot)"""
+        return [session.stats() for session in list(self._sessions.values())]
+
+    # ------------------------------------------------------------------
+    # Implementation (runs on the background loop)
+    # ------------------------------------------------------------------
+
+    async def _on_loop(self, coro: Awaitable[T]) -> T:
+        if self._loop.in_loop_thread():
+            return await coro
+        return await asyncio.wrap_future(self._loop.submit(coro))
+
+    async def _list_tools(self, server: MCPServerConfig, refresh: bool) -> List[Dict[str, Any]]:
+        session = self._session_for(server)
+        if session.tools is not None and not refresh and session.is_alive():
+            return list(session.tools)
+
+        client = await self._ensure_started(session)
+        generation = session.generation
+        try:
+            tools = await client.list_tools()
+        except Exception:
+            if session.is_alive():
+                raise
+            # Server died mid-request; listing is safe to retry once
+            client = await self._ensure_started(session)
+            generation = session.generation
+            tools = await client.list_tools()
+
+        # Keep the result unless the session restarted meanwhile
+        if session.generation == generation:
+            session.tools = list(tools)
+        return tools
+
+    async def _call_tool(self, server: MCPServerConfig, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        session = self._session_for(server)
+        client = await self._ensure_started(session)
+        # Not retried: a tool call may have side effects
+        return await client.call_tool(tool_name, arguments)
+
+    def _session_for(self, server: MCPServerConfig) -> MCPSession:
+        fingerprint = _config_fingerprint(server)
+        session = self._sessions.get(server.id)
+        if session is not None and session.fingerprint != fingerprint:
+            logger.info(f"MCP server config changed, restarting session: {server.id}")
+            self._discard_client(session)
+            session = None
+        if session is None:
+            session = MCPSession(config=server, fingerprint=fingerprint)
+            self._sessions[server.id] = session
+        session.last_used = time.monotonic()
+        self._ensure_health_task()
+        return session
+
+    async def _ensure_started(self, session: MCPSession) -> MCPClient:
+        """Warm client for the session, (re)starting the server if needed"""
+        if session.is_alive():
+            return session.client
+        if session.start_task is None or session.start_task.done():
+            if session.client is not None:
+                logger.warning(f"MCP server not alive, restarting: {session.config.id}")
+                self._discard_client(session)
+            if time.monotonic() < session.next_start_at:
+                raise MCPConnectionError(
+                    f"MCP server {session.config.id} is restarting after failures "
+                    f"(last error: {session.last_error})"
+                )
+            # The start runs as its own task: a caller timing out or being
+            # cancelled must not abort the handshake and orphan the process
+            session.start_task = asyncio.create_task(self._start(session))
+            # Retrieve the outcome even if every waiting caller gave up
+            session.start_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return await asyncio.shield(session.start_task)
+
+    async def _start(self, session: MCPSession) -> MCPClient:
+        client = MCPClient(session.config)
+        generation = session.generation + 1
+
+        def _on_notification(message: Dict[str, Any]) -> None:
+            if message.get("method") == TOOLS_LIST_CHANGED and session.generation == generation:
+                logger.info(f"MCP tool list changed: {session.config.id}")
+                session.tools = None
+
+        client.add_notification_handler(_on_notification)
+        try:
+            await client.connect()
+        except asyncio.CancelledError:
+            # Session closed / reconfigured mid-handshake: stop the process
+            asyncio.create_task(self._disconnect(client))
+            raise
+        except Exception as e:
+            session.consecutive_failures += 1
+            session.last_error = str(e)
+            backoff = min(
+                self.max_restart_backoff_s,
+                self.restart_backoff_s * (2 ** (session.consecutive_failures - 1)),
+            )
+            session.next_start_at = time.monotonic() + backoff
+            raise
+
+        if session.generation > 0:
+            session.restarts += 1
+        session.generation = generation
+        session.client = client
+        session.tools = None
+        session.consecutive_failures = 0
+        session.next_start_at = 0.0
+        logger.info(f"MCP session ready: {session.config.id} (generation {generation})")
+        return client
+
+    def _discard_client(self, session: MCPSession) -> None:
+        """Drop the session's client and its cached tools; stop the process in the background"""
+        client, session.client, session.tools = session.client, None, None
+        if session.start_task is not None and not session.start_task.done():
+            session.start_task.cancel()
+        session.start_task = None
+        if client is not None:
+            asyncio.create_task(self._disconnect(client))
+
+    @staticmethod
+    async def _disconnect(client: MCPClient) -> None:
+        try:
+            await client.disconnect()
+        except Exception as e:
+            logger.debug(f"MCP disconnect failed for {client.config.id}: {e}")
+
+    async def _close(self, server_id: Optional[str]) -> None:
+        ids = [server_id] if server_id is not None else list(self._sessions)
+        for sid in ids:
+            session = self._sessions.pop(sid, None)
+            if session is None:
+                continue
+            if session.start_task is not None and not session.start_task.done():
+                session.start_task.cancel()
+            if session.client is not None:
+                await self._disconnect(session.client)
+        if not self._sessions and self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+
+    def _ensure_health_task(self) -> None:
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_loop())
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval_s)
+            await self._check_health()
+
+    async def _check_health(self) -> None:
+        """Close idle sessions; restart crashed ones that are still in use"""
+        now = time.monotonic()
+        for session in list(self._sessions.values()):
+            if now - session.last_used > self.idle_timeout_s:
+                logger.info(f"Closing idle MCP session: {session.config.id}")
+                await self._close(session.config.id)
+                continue
+            starting = session.start_task is not None and not session.start_task.done()
+            if session.client is not None and not session.is_alive() and not starting:
+                logger.warning(f"MCP server exited, restarting: {session.config.id}")
+                self._discard_client(session)
+                try:
+                    await self._ensure_started(session)
+                except Exception as e:
+                    logger.warning(f"MCP restart failed for {session.config.id}: {e}")
+
+
+_default_pool: Optional[MCPSessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """Process-wide MCP session pool"""
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = MCPSessionPool()
+                atexit.register(_close_default_pool)
+    return _default_pool
+
+
+def _close_default_pool() -> None:
+    if _default_pool is None:
+        return
+    try:
+        _default_pool.close_sync(timeout=5.0)
+    except Exception as e:
+        logger.debug(f"Failed to close MCP sessions at exit: {e}")
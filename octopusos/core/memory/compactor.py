@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
 from octopusos.core.memory import MemoryService
+from octopusos.core.memory.deduplicator import MemoryDeduplicator
+from octopusos.core.memory.lsh import candidate_positions, memory_summary, summary_tokens
+
+logger = logging.getLogger(__name__)
+
+# Below this many memories a plain pairwise scan is cheaper than building an LSH index
+LSH_MIN_MEMORIES = 200
+
+# Clustering queries LSH buckets instead of comparing every pair, so a
+# compaction run can cover far more than the old 1000-memory window.
+COMPACT_MAX_MEMORIES = 100000
 
 
 class SummaryStrategy(ABC):
@@ -162,7 +174,7 @@ class MemoryCompactor:
         memories = self.memory_service.list(
             scope=scope,
             project_id=project_id,
-            limit=1000  # Process up to 1000 memories
+            limit=COMPACT_MAX_MEMORIES
         )
         
         if not memories:
@@ -213,15 +225,20 @@ class MemoryCompactor:
     def _cluster_memories(self, memories: list[dict]) -> list[CompactionCluster]:
         """Cluster similar memories using Jaccard similarity.
         
+        Each unclustered memory seeds a cluster and absorbs every other
+        unclustered memory at or above the threshold. Candidates come from the
+        service's MinHash/LSH index, so only memories sharing a bucket are compared.
+        
         Args:
             memories: List of memory items
             
         Returns:
             List of clusters
         """
-        from octopusos.core.memory.deduplicator import MemoryDeduplicator
-        
-        deduplicator = MemoryDeduplicator(None)  # We only need similarity calculation
+        tokens = [summary_tokens(memory_summary(mem)) for mem in memories]
+        candidates = None
+        if len(memories) >= LSH_MIN_MEMORIES:
+            candidates = candidate_positions(memories, self._similarity_index())
         clusters = []
         processed = set()
         
@@ -234,15 +251,14 @@ class MemoryCompactor:
             processed.add(mem1["id"])
             
             # Find similar memories
-            for j, mem2 in enumerate(memories):
+            others = candidates[i] if candidates is not None else range(len(memories))
+            for j in others:
+                mem2 = memories[j]
                 if i == j or mem2["id"] in processed:
                     continue
                 
                 # Calculate similarity
-                similarity = deduplicator._jaccard_similarity(
-                    mem1["content"]["summary"],
-                    mem2["content"]["summary"]
-                )
+                similarity = MemoryDeduplicator._jaccard(tokens[i], tokens[j])
                 
                 if similarity >= self.similarity_threshold:
                     cluster_memories.append(mem2)
@@ -259,6 +275,17 @@ class MemoryCompactor:
                 )
         
         return clusters
+
+    def _similarity_index(self):
+        """Shared LSH index of the memory service (None for services without one)."""
+        get_index = getattr(self.memory_service, "get_similarity_index", None)
+        if get_index is None:
+            return None
+        try:
+            return get_index()
+        except Exception as e:
+            logger.warning(f"Memory similarity index unavailable, using a local one: {e}")
+            return None
     
     def _create_summary(
         self,
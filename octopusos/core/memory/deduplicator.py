@@ -4,8 +4,13 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from typing import Optional
+
+from octopusos.core.memory.lsh import MemoryLSHIndex, memory_summary, summary_tokens
+from octopusos.core.memory.overlap import overlap_matches
 from octopusos.core.time import utc_now_iso
 
+# Below this many memories a plain pairwise scan is cheaper than building a token index
+OVERLAP_INDEX_MIN_MEMORIES = 200
 
 
 class MemoryDeduplicator:
@@ -44,9 +49,10 @@ class MemoryDeduplicator:
             return 0.0
         
         # Normalize
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
+        return self._overlap(summary_tokens(text1), summary_tokens(text2))
+
+    @staticmethod
+    def _overlap(words1: frozenset[str], words2: frozenset[str]) -> float:
         if not words1 or not words2:
             return 0.0
         
@@ -54,22 +60,48 @@ class MemoryDeduplicator:
         min_size = min(len(words1), len(words2))
 
         return intersection / min_size if min_size > 0 else 0.0
+
+    def jaccard_similarity(self, text1: str, text2: str) -> float:
+        """
+        Calculate Jaccard similarity (intersection / union) of two texts' word sets.
+        
+        Args:
+            text1: First text
+            text2: Second text
+        
+        Returns:
+            Similarity score (0.0-1.0)
+        """
+        return self._jaccard(summary_tokens(text1), summary_tokens(text2))
+
+    @staticmethod
+    def _jaccard(words1: frozenset[str], words2: frozenset[str]) -> float:
+        if not words1 or not words2:
+            return 0.0
+        intersection = len(words1 & words2)
+        return intersection / (len(words1) + len(words2) - intersection)
     
     def find_duplicates(
         self,
         memory_item: dict,
         existing_memories: list[dict],
         check_same_type: bool = True,
-        check_same_scope: bool = False
+        check_same_scope: bool = False,
+        index: Optional[MemoryLSHIndex] = None,
     ) -> list[dict]:
         """
         Find duplicate memories.
         
+        With an index, only the candidates it returns for the summary are
+        compared (plus memories the index does not hold); without one every
+        existing memory is.
+        
         Args:
             memory_item: Memory to check
             existing_memories: List of existing memories
             check_same_type: Only consider duplicates of same type
             check_same_scope: Only consider duplicates of same scope
+            index: Index over the existing summaries (e.g. MemoryService.get_similarity_index())
         
         Returns:
             List of duplicate MemoryItem dicts
@@ -80,10 +112,19 @@ class MemoryDeduplicator:
         mem_type = memory_item.get("type")
         mem_scope = memory_item.get("scope")
         mem_id = memory_item.get("id")
+
+        candidates = None
+        if index is not None and self.similarity_threshold > 0:
+            candidates = index.query_overlap(mem_summary, self.similarity_threshold)
         
         for existing in existing_memories:
+            existing_id = existing.get("id")
             # Skip self
-            if existing.get("id") == mem_id:
+            if existing_id == mem_id:
+                continue
+
+            # Indexed but not a candidate: cannot reach the threshold
+            if candidates is not None and existing_id not in candidates and existing_id in index:
                 continue
             
             # Check type constraint
@@ -202,11 +243,15 @@ class MemoryDeduplicator:
     def get_duplicate_groups(
         self,
         memories: list[dict],
-        check_same_type: bool = True
+        check_same_type: bool = True,
     ) -> list[list[dict]]:
         """
         Find all groups of duplicate memories.
         
+        Large lists only compare memories found through a prefix-filtered
+        token index (see overlap.py) instead of every remaining memory;
+        groups are the same as the pairwise scan.
+        
         Args:
             memories: List of MemoryItem dicts
             check_same_type: Only consider duplicates of same type
@@ -216,6 +261,11 @@ class MemoryDeduplicator:
         """
         processed = set()
         groups = []
+
+        matches = None
+        if len(memories) >= OVERLAP_INDEX_MIN_MEMORIES and self.similarity_threshold > 0:
+            tokens = [summary_tokens(memory_summary(mem)) for mem in memories]
+            matches = overlap_matches(tokens, self.similarity_threshold)
         
         for i, mem in enumerate(memories):
             mem_id = mem.get("id")
@@ -225,11 +275,18 @@ class MemoryDeduplicator:
                 continue
             
             # Find duplicates for this memory
-            duplicates = self.find_duplicates(
-                mem,
-                memories[i+1:],  # Only check remaining memories
-                check_same_type=check_same_type
-            )
+            if matches is None:
+                duplicates = self.find_duplicates(
+                    mem,
+                    memories[i+1:],  # Only check remaining memories
+                    check_same_type=check_same_type
+                )
+            else:
+                duplicates = [
+                    memories[j]
+                    for j in matches[i]
+                    if j > i and (not check_same_type or memories[j].get("type") == mem.get("type"))
+                ]
             
             if duplicates:
                 # Create group
@@ -0,0 +1,128 @@
+"""Token inverted index for overlap-coefficient duplicate lookup.
+
+``MemoryDeduplicator`` treats two summaries as duplicates when the overlap
+coefficient of their word sets (|A ∩ B| / min(|A|, |B|)) reaches a threshold.
+A summary that is a subset or prefix of a longer one scores 1.0 even though
+their Jaccard similarity can be low, so a MinHash/LSH index (which estimates
+Jaccard) misses those pairs.
+
+This module finds the pairs with a prefix filter instead, which is exact
+for the overlap coefficient. Order tokens globally, rarest first. If
+|A ∩ B| >= t * |S| for the smaller set S, then S shares at least one token of
+its first ``|S| - ceil(t * |S|) + 1`` tokens (its prefix) with the other set,
+and at least two of its first prefix + 1 tokens. So every set probes an
+inverted index with those tokens, keeping only sets at least as large as
+itself with enough hits, and only the survivors are verified. Rare-first
+ordering keeps common words out of the probes; the probes are expanded and
+counted with numpy in batches.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from typing import Sequence
+
+import numpy as np
+
+# Slack for float rounding in t * |S| (e.g. 0.85 * 20 = 16.999999999999996)
+_EPSILON = 1e-9
+
+# Probe hits (set, candidate) expanded per vectorized batch
+_PROBE_CHUNK = 1 << 22
+
+
+def prefix_length(size: int, threshold: float) -> int:
+    """Number of leading (rarest) tokens a set must probe for the overlap threshold."""
+    required = max(1, math.ceil(threshold * size - _EPSILON))
+    return max(0, min(size, size - required + 1))
+
+
+def overlap_matches(
+    token_sets: Sequence[frozenset[str]],
+    threshold: float,
+) -> list[list[int]]:
+    """
+    All pairs whose overlap coefficient reaches the threshold.
+
+    Args:
+        token_sets: Word set per position
+        threshold: Overlap coefficient threshold (must be > 0)
+
+    Returns:
+        For each position, the ascending positions of the sets it overlaps
+        with at or above the threshold (itself excluded). Same result as
+        checking every pair.
+    """
+    if threshold <= 0:
+        raise ValueError("threshold must be > 0")
+
+    count = len(token_sets)
+    matches: list[list[int]] = [[] for _ in range(count)]
+    frequency = Counter(token for tokens in token_sets for token in tokens)
+    if not frequency:
+        return matches
+    # Token IDs in rarest-first order (ties broken by token, so the order is deterministic)
+    rarest_first = sorted(frequency, key=lambda token: (frequency[token], token))
+    token_id = {token: i for i, token in enumerate(rarest_first)}
+    ordered = [sorted(token_id[token] for token in tokens) for tokens in token_sets]
+    sizes = np.fromiter((len(tokens) for tokens in ordered), dtype=np.int64, count=count)
+
+    # Inverted index in CSR form: positions of token t are postings[starts[t]:starts[t + 1]]
+    flat_tokens = np.fromiter(
+        (t for tokens in ordered for t in tokens), dtype=np.int64, count=int(sizes.sum())
+    )
+    flat_positions = np.repeat(np.arange(count, dtype=np.int64), sizes)
+    by_token = np.argsort(flat_tokens, kind="stable")
+    postings = flat_positions[by_token]
+    starts = np.searchsorted(flat_tokens[by_token], np.arange(len(token_id) + 1))
+
+    # Probe with the prefix plus one token where the set has one: at least
+    # probe - prefix + 1 of the probed tokens are shared with any match
+    probe: list[int] = []
+    probe_positions: list[int] = []
+    min_hits = np.zeros(count, dtype=np.int64)
+    for position, tokens in enumerate(ordered):
+        size = len(tokens)
+        if not size:
+            continue
+        prefix = prefix_length(size, threshold)
+        length = min(size, prefix + 1)
+        min_hits[position] = length - prefix + 1
+        probe.extend(tokens[:length])
+        probe_positions.extend([position] * length)
+    probe_tokens = np.array(probe, dtype=np.int64)
+    probe_sources = np.array(probe_positions, dtype=np.int64)
+    hits_per_probe = starts[probe_tokens + 1] - starts[probe_tokens]
+
+    # Expand probes to (set, other) hits in batches; a pair is found from its
+    # smaller set (the lower position on a tie), where the prefix lemma applies
+    candidates = []
+    ends = np.cumsum(hits_per_probe)
+    batch_start = 0
+    while batch_start < len(probe_tokens):
+        limit = (ends[batch_start - 1] if batch_start else 0) + _PROBE_CHUNK
+        batch_end = max(batch_start + 1, int(np.searchsorted(ends, limit, side="right")))
+        # Keep all probes of a set in one batch so its hits are counted together
+        batch_end = int(np.searchsorted(probe_sources, probe_sources[batch_end - 1], side="right"))
+        batch_tokens = probe_tokens[batch_start:batch_end]
+        lengths = hits_per_probe[batch_start:batch_end]
+        sources = np.repeat(probe_sources[batch_start:batch_end], lengths)
+        offsets = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        others = postings[np.repeat(starts[batch_tokens], lengths) + offsets]
+        own_sizes, other_sizes = sizes[sources], sizes[others]
+        keep = (other_sizes > own_sizes) | ((other_sizes == own_sizes) & (others > sources))
+        keys, hits = np.unique(sources[keep] * count + others[keep], return_counts=True)
+        candidates.append(keys[hits >= min_hits[keys // count]])
+        batch_start = batch_end
+
+    for key in np.concatenate(candidates).tolist() if candidates else []:
+        source, other = divmod(key, count)
+        words = token_sets[source]
+        # Same arithmetic as MemoryDeduplicator._overlap
+        if len(words & token_sets[other]) / len(words) >= threshold:
+            matches[source].append(other)
+            matches[other].append(source)
+    for found in matches:
+        found.sort()
+    return matches
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+import threading
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -13,6 +14,7 @@ from typing import Optional
 from rich.console import Console
 
 from octopusos.core.memory.budgeter import ContextBudget, ContextBudgeter
+from octopusos.core.memory.lsh import MemoryLSHIndex, memory_summary
 from octopusos.core.memory.permission import MemoryPermissionService
 from octopusos.core.storage.paths import component_db_path
 from octopusos.core.time import utc_now_iso
@@ -38,6 +40,9 @@ class MemoryService:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         # Use the same db_path for permission service
         self.permission_service = MemoryPermissionService(db_path=self.db_path)
+        # Near-duplicate index over active summaries (built on first use)
+        self._similarity_index: Optional[MemoryLSHIndex] = None
+        self._similarity_index_lock = threading.Lock()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
@@ -45,6 +50,48 @@ class MemoryService:
         conn.row_factory = sqlite3.Row
         return conn
 
+    def get_similarity_index(self) -> MemoryLSHIndex:
+        """
+        MinHash/LSH index over the summaries of active memories.
+
+        Built from the database on first use, then kept up to date by
+        upsert() and delete(). Used by compaction (Jaccard clustering) and
+        MemoryDeduplicator.find_duplicates (overlap coefficient) to look up
+        near-duplicate candidates instead of scanning every memory.
+
+        Returns:
+            MemoryLSHIndex keyed by memory ID
+        """
+        with self._similarity_index_lock:
+            if self._similarity_index is None:
+                conn = self._get_connection()
+                try:
+                    cursor = conn.cursor()
+                    query = "SELECT id, content FROM memory_items"
+                    if "is_active" in self._get_memory_columns(cursor):
+                        query += " WHERE (is_active IS NULL OR is_active = 1)"
+                    index = MemoryLSHIndex()
+                    for row in cursor.execute(query):
+                        try:
+                            content = json.loads(row["content"])
+                        except (TypeError, ValueError):
+                            continue
+                        index.add(row["id"], memory_summary({"content": content}))
+                finally:
+                    conn.close()
+                self._similarity_index = index
+            return self._similarity_index
+
+    def _index_memory(self, memory_item: dict) -> None:
+        """Reflect a committed write in the similarity index (if built)."""
+        index = self._similarity_index
+        if index is None:
+            return
+        if memory_item.get("is_active", 1):
+            index.add(memory_item["id"], memory_summary(memory_item))
+        else:
+            index.remove(memory_item["id"])
+
     def _get_memory_columns(self, cursor: sqlite3.Cursor) -> set[str]:
         rows = cursor.execute("PRAGMA table_info(memory_items)").fetchall()
         columns: set[str] = set()
@@ -252,6 +299,7 @@ class MemoryService:
             )
             raise
         conn.close()
+        self._index_memory(memory_item)
 
         return memory_id
 
@@ -604,6 +652,8 @@ class MemoryService:
 
         conn.commit()
         conn.close()
+        if self._similarity_index is not None:
+            self._similarity_index.remove(memory_id)
 
         return deleted
 
@@ -929,6 +979,10 @@ class MemoryService:
                 )
                 raise
 
+            if self._similarity_index is not None:
+                self._similarity_index.remove(old_id)
+            self._index_memory(new_item)
+
             logger.info(
                 f"Conflict resolved: new value wins "
                 f"(old: {old_id}, new: {new_id}, version: {new_item['version']})"
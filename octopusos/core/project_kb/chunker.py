@@ -63,6 +63,18 @@ class MarkdownChunker:
         with open(file_path, "r", encoding="utf-8") as f:
             lines = f.readlines()
 
+        yield from self.chunk_lines(source_id, lines)
+
+    def chunk_lines(self, source_id: str, lines: list[str]) -> Iterator[Chunk]:
+        """切片已读取的文本行 (供已读入内存的文件复用, 避免二次读盘)
+
+        Args:
+            source_id: 文档 source_id
+            lines: 文件内容行 (保留换行符, 同 readlines())
+
+        Yields:
+            Chunk 对象
+        """
         # 按 heading 分割成 sections
         sections = self._split_into_sections(lines)
 
@@ -5,6 +5,7 @@
 - exclude_patterns: 排除模式
 - chunk_size: 切片大小限制
 - index_weights: 文档类型权重
+- refresh_workers: 刷新时哈希/切片的进程数
 """
 
 import json
@@ -23,6 +24,11 @@ class VectorRerankConfig:
     candidate_k: int = 50  # 候选集大小
     final_k: int = 10  # 最终返回结果数
     alpha: float = 0.7  # 融合权重 (0-1, 越大越偏向向量分数)
+    fusion: str = "alpha"  # alpha|rrf (Reciprocal Rank Fusion)
+    rrf_k: int = 60  # RRF 平滑常数
+    semantic_retrieval: bool = True  # 是否用向量索引召回关键词未命中的 chunks
+    ivf_min_vectors: int = 50000  # 向量数达到该值启用 IVF 分区 (0 = 禁用)
+    ivf_nprobe: int = 8  # IVF 查询扫描的分区数
 
 
 @dataclass
@@ -58,6 +64,9 @@ class ProjectKBConfig:
     # 向量重排序配置 (P2)
     vector_rerank: VectorRerankConfig = field(default_factory=VectorRerankConfig)
 
+    # 刷新时哈希/切片的进程数 (0 = CPU 核数, 1 = 串行)
+    refresh_workers: int = 0
+
     @classmethod
     def from_file(cls, config_path: Path) -> "ProjectKBConfig":
         """从 JSON 文件加载配置
@@ -83,6 +92,11 @@ class ProjectKBConfig:
             candidate_k=vector_rerank_data.get("candidate_k", 50),
             final_k=vector_rerank_data.get("final_k", 10),
             alpha=vector_rerank_data.get("alpha", 0.7),
+            fusion=vector_rerank_data.get("fusion", "alpha"),
+            rrf_k=vector_rerank_data.get("rrf_k", 60),
+            semantic_retrieval=vector_rerank_data.get("semantic_retrieval", True),
+            ivf_min_vectors=vector_rerank_data.get("ivf_min_vectors", 50000),
+            ivf_nprobe=vector_rerank_data.get("ivf_nprobe", 8),
         )
         
         return cls(
@@ -93,6 +107,7 @@ class ProjectKBConfig:
             index_weights=data.get("index_weights", cls().index_weights),
             doc_type_weights=data.get("doc_type_weights", {}),
             vector_rerank=vector_rerank,
+            refresh_workers=data.get("refresh_workers", 0),
         )
 
     def to_file(self, config_path: Path):
@@ -111,6 +126,7 @@ class ProjectKBConfig:
                 "max": self.chunk_size_max,
             },
             "index_weights": self.index_weights,
+            "refresh_workers": self.refresh_workers,
         }
 
         if self.doc_type_weights:
@@ -124,6 +140,11 @@ class ProjectKBConfig:
             "candidate_k": self.vector_rerank.candidate_k,
             "final_k": self.vector_rerank.final_k,
             "alpha": self.vector_rerank.alpha,
+            "fusion": self.vector_rerank.fusion,
+            "rrf_k": self.vector_rerank.rrf_k,
+            "semantic_retrieval": self.vector_rerank.semantic_retrieval,
+            "ivf_min_vectors": self.vector_rerank.ivf_min_vectors,
+            "ivf_nprobe": self.vector_rerank.ivf_nprobe,
         }
 
         with open(config_path, "w", encoding="utf-8") as f:
@@ -138,6 +159,7 @@ class ProjectKBConfig:
             "chunk_size_max": self.chunk_size_max,
             "index_weights": self.index_weights,
             "doc_type_weights": self.doc_type_weights,
+            "refresh_workers": self.refresh_workers,
         }
 
 
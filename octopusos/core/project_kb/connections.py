@@ -0,0 +1,115 @@
+"""ProjectKB 只读连接池 - 查询路径复用连接和预编译语句
+
+与 registry_db 相同的线程本地 (thread-local) 策略, 但按 db_path 区分,
+因为 ProjectKB 允许指定任意数据库路径。
+
+- 每个线程、每个数据库一个长连接 (避免每次查询 connect/close)
+- sqlite3 按连接缓存预编译语句, 相同 SQL 文本直接复用
+- autocommit + query_only, 不会持有事务阻塞 WAL checkpoint
+"""
+
+import atexit
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+
+# 预编译语句缓存大小 (过滤条件组合会产生不同 SQL 文本)
+STATEMENT_CACHE_SIZE = 256
+
+
+def _close_connections(connections: dict[str, sqlite3.Connection]):
+    for conn in list(connections.values()):
+        try:
+            conn.close()
+        except Exception:
+            pass
+    connections.clear()
+
+
+class _ThreadConnections:
+    """单个线程的连接表
+
+    线程结束时 threading.local 释放本对象, finalizer 随即关闭其中的连接。
+    sqlite3.Connection 不支持弱引用, 所以全局登记的是本对象而不是连接。
+    """
+
+    __slots__ = ("connections", "__weakref__")
+
+    def __init__(self):
+        self.connections: dict[str, sqlite3.Connection] = {}
+        weakref.finalize(self, _close_connections, self.connections)
+
+
+_thread_local = threading.local()
+# 弱引用: 已结束线程的连接表不会被这里留住
+_ALL_THREADS: "weakref.WeakSet[_ThreadConnections]" = weakref.WeakSet()
+_ALL_THREADS_LOCK = threading.Lock()
+
+
+def _thread_connections() -> _ThreadConnections:
+    holder = getattr(_thread_local, "holder", None)
+    if holder is None:
+        holder = _ThreadConnections()
+        _thread_local.holder = holder
+        with _ALL_THREADS_LOCK:
+            _ALL_THREADS.add(holder)
+    return holder
+
+
+def get_read_connection(db_path: Path) -> sqlite3.Connection:
+    """获取当前线程对指定数据库的只读连接
+
+    Args:
+        db_path: 数据库路径
+
+    Returns:
+        sqlite3.Connection (row_factory=sqlite3.Row), 调用方不要 close()
+    """
+    key = str(Path(db_path).resolve())
+    connections = _thread_connections().connections
+
+    conn = connections.get(key)
+    if conn is not None:
+        return conn
+
+    conn = sqlite3.connect(
+        key,
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only=ON")
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+    connections[key] = conn
+    return conn
+
+
+def reset_read_connection(db_path: Path):
+    """关闭并丢弃当前线程的连接 (出错后调用, 下次重新建立)
+
+    Args:
+        db_path: 数据库路径
+    """
+    key = str(Path(db_path).resolve())
+    holder = getattr(_thread_local, "holder", None)
+    conn = holder.connections.pop(key, None) if holder is not None else None
+    if conn is None:
+        return
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def close_all_read_connections():
+    """关闭所有线程的只读连接 (进程退出或测试清理时使用)"""
+    with _ALL_THREADS_LOCK:
+        holders = list(_ALL_THREADS)
+    for holder in holders:
+        _close_connections(holder.connections)
+
+
+atexit.register(close_all_read_connections)
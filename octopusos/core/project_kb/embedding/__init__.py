@@ -8,9 +8,11 @@
 from octopusos.core.project_kb.embedding.provider import IEmbeddingProvider
 from octopusos.core.project_kb.embedding.factory import create_provider
 from octopusos.core.project_kb.embedding.manager import EmbeddingManager
+from octopusos.core.project_kb.embedding.vector_index import VectorIndex
 
 __all__ = [
     "IEmbeddingProvider",
     "create_provider",
     "EmbeddingManager",
+    "VectorIndex",
 ]
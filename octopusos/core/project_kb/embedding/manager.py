@@ -3,32 +3,56 @@
 负责:
 - 批量生成 embeddings
 - 增量更新 (基于 content_hash)
-- 持久化到 SQLite
+- 按 (model, content_hash) 去重, 相同内容只调用一次 provider
+- 批量持久化到 SQLite (每批一个事务)
 - 检索 embeddings
+- 维护内存向量索引 (VectorIndex), 支持语义召回
 """
 
 import sqlite3
+import threading
 import time
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
 
+from octopusos.core.project_kb.connections import get_read_connection, reset_read_connection
 from octopusos.core.project_kb.embedding.provider import IEmbeddingProvider
+from octopusos.core.project_kb.embedding.vector_index import VectorIndex
 from octopusos.core.project_kb.types import Chunk
 
 
 class EmbeddingManager:
     """Embedding 管理器"""
 
-    def __init__(self, db_path: Path, provider: IEmbeddingProvider):
+    # 检查其他进程是否修改了 kb_embeddings 的最小间隔 (秒)
+    INDEX_STALE_CHECK_SECONDS = 30.0
+
+    def __init__(
+        self,
+        db_path: Path,
+        provider: IEmbeddingProvider,
+        ivf_min_vectors: int = 50000,
+        ivf_nprobe: int = 8,
+    ):
         """初始化 manager
 
         Args:
             db_path: 数据库路径
             provider: Embedding provider
+            ivf_min_vectors: 向量数达到该值时索引启用 IVF 分区 (0 = 始终全量扫描)
+            ivf_nprobe: IVF 查询扫描的分区数
         """
         self.db_path = Path(db_path)
         self.provider = provider
+        self.ivf_min_vectors = ivf_min_vectors
+        self.ivf_nprobe = ivf_nprobe
+
+        # 内存向量索引 (首次语义检索时加载)
+        self._index: Optional[VectorIndex] = None
+        self._index_lock = threading.Lock()
+        self._index_checked_at = 0.0
 
         # 确保 embedding 表存在
         self._ensure_schema()
@@ -63,59 +87,84 @@ class EmbeddingManager:
     ) -> dict:
         """批量生成 embeddings
 
+        每个批次: 一次查询判断哪些 chunk 需要更新, 按 (model, content_hash) 去重
+        (已存在相同内容的向量直接复用, 不再调用 provider), 一个事务写入整批向量。
+
         Args:
             chunks: Chunk 列表
             batch_size: 批量大小
             show_progress: 是否显示进度
 
         Returns:
-            统计信息 dict
+            统计信息 dict (含 cache_hits / cache_hit_rate / embed_seconds)
         """
+        stats = {
+            "total": len(chunks),
+            "processed": 0,
+            "skipped": 0,
+            "errors": 0,
+            "embedded": 0,  # 实际发送给 provider 的文本数
+            "cache_hits": 0,  # 复用已有向量的 chunk 数
+            "cache_hit_rate": 0.0,
+            "embed_seconds": 0.0,
+        }
         if not chunks:
-            return {"total": 0, "processed": 0, "skipped": 0, "errors": 0}
+            return stats
 
         total = len(chunks)
-        processed = 0
-        skipped = 0
-        errors = 0
-
         for i in range(0, total, batch_size):
             batch = chunks[i : i + batch_size]
 
             if show_progress:
                 print(f"Processing batch {i//batch_size + 1}/{(total + batch_size - 1)//batch_size}...")
 
+            chunks_to_process: list[Chunk] = []
             try:
-                # 检查哪些 chunk 需要生成 embedding
-                chunks_to_process = []
+                # 检查哪些 chunk 需要生成 embedding (一次查询)
+                existing = self._get_existing_hashes([c.chunk_id for c in batch])
                 for chunk in batch:
-                    if not self._has_embedding(chunk.chunk_id, chunk.content_hash):
-                        chunks_to_process.append(chunk)
+                    if existing.get(chunk.chunk_id) == chunk.content_hash:
+                        stats["skipped"] += 1
                     else:
-                        skipped += 1
+                        chunks_to_process.append(chunk)
 
                 if not chunks_to_process:
                     continue
 
-                # 批量生成 embeddings
-                texts = [c.content for c in chunks_to_process]
-                vectors = self.provider.embed_texts(texts)
-
-                # 保存到数据库
-                for chunk, vector in zip(chunks_to_process, vectors):
-                    self._save_embedding(chunk.chunk_id, chunk.content_hash, vector)
-                    processed += 1
+                # 内容去重: 复用库中相同 (model, content_hash) 的向量
+                vectors_by_hash = self._get_cached_vectors(
+                    {c.content_hash for c in chunks_to_process}
+                )
+                texts_by_hash: dict[str, str] = {}
+                for chunk in chunks_to_process:
+                    if chunk.content_hash not in vectors_by_hash:
+                        texts_by_hash.setdefault(chunk.content_hash, chunk.content)
+
+                # 只为未命中的内容生成 embeddings
+                if texts_by_hash:
+                    started = time.perf_counter()
+                    vectors = self.provider.embed_texts(list(texts_by_hash.values()))
+                    stats["embed_seconds"] += time.perf_counter() - started
+                    vectors_by_hash.update(zip(texts_by_hash, vectors))
+
+                # 一个事务写入整批
+                self._save_embeddings(
+                    [(c.chunk_id, c.content_hash, vectors_by_hash[c.content_hash]) for c in chunks_to_process]
+                )
+                stats["processed"] += len(chunks_to_process)
+                stats["embedded"] += len(texts_by_hash)
+                stats["cache_hits"] += len(chunks_to_process) - len(texts_by_hash)
 
             except Exception as e:
                 print(f"Error processing batch: {e}")
-                errors += len(batch)
+                stats["errors"] += len(chunks_to_process) or len(batch)
 
-        return {
-            "total": total,
-            "processed": processed,
-            "skipped": skipped,
-            "errors": errors,
-        }
+        if stats["processed"]:
+            stats["cache_hit_rate"] = stats["cache_hits"] / stats["processed"]
+            self._sync_index()
+        stats["embed_seconds"] = round(stats["embed_seconds"], 3)
+
+        return stats
 
     def refresh_embeddings(self, chunks: list[Chunk], batch_size: int = 32) -> dict:
         """增量刷新 embeddings (只处理变更的 chunks)
@@ -141,10 +190,7 @@ class EmbeddingManager:
         if not chunk_ids:
             return []
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # 构建 IN 查询
+        # 构建 IN 查询 (查询路径复用线程本地只读连接)
         placeholders = ",".join(["?"] * len(chunk_ids))
         query = f"""
             SELECT chunk_id, vector, dims
@@ -152,9 +198,11 @@ class EmbeddingManager:
             WHERE chunk_id IN ({placeholders})
         """
 
-        cursor.execute(query, chunk_ids)
-        rows = cursor.fetchall()
-        conn.close()
+        try:
+            rows = get_read_connection(self.db_path).execute(query, chunk_ids).fetchall()
+        except sqlite3.ProgrammingError:
+            reset_read_connection(self.db_path)
+            rows = get_read_connection(self.db_path).execute(query, chunk_ids).fetchall()
 
         # 构建结果映射
         embedding_map = {}
@@ -170,6 +218,74 @@ class EmbeddingManager:
         # 按原始顺序返回 (缺失的为 None)
         return [embedding_map.get(chunk_id) for chunk_id in chunk_ids]
 
+    def get_index(self) -> VectorIndex:
+        """获取内存向量索引 (懒加载; 定期检查其他进程的写入, 过期则重建)
+
+        Returns:
+            当前 provider 模型的 VectorIndex
+        """
+        with self._index_lock:
+            now = time.monotonic()
+            if self._index is None:
+                index = VectorIndex(
+                    self.db_path,
+                    model=self.provider.model_name,
+                    dims=self.provider.dims,
+                    ivf_min_vectors=self.ivf_min_vectors,
+                    ivf_nprobe=self.ivf_nprobe,
+                )
+                index.load(self._read_connection())
+                self._index = index
+                self._index_checked_at = now
+            elif now - self._index_checked_at >= self.INDEX_STALE_CHECK_SECONDS:
+                self._index_checked_at = now
+                conn = self._read_connection()
+                if self._index.is_stale(conn):
+                    self._index.load(conn)
+            return self._index
+
+    def search_similar(self, query_vec: np.ndarray, k: int) -> list[tuple[str, float]]:
+        """语义召回: 在内存索引中查找与 query 最相似的 chunks
+
+        Args:
+            query_vec: Query embedding
+            k: 返回数量
+
+        Returns:
+            [(chunk_id, cosine_similarity)] 按相似度降序
+        """
+        return self.get_index().search(query_vec, k)
+
+    def get_normalized_embeddings(self, chunk_ids: list[str]) -> list[np.ndarray | None]:
+        """从内存索引批量获取归一化 embeddings (缺失的为 None)
+
+        Args:
+            chunk_ids: Chunk ID 列表
+
+        Returns:
+            单位长度向量列表, 与 chunk_ids 顺序一致
+        """
+        if not chunk_ids:
+            return []
+        return self.get_index().get(chunk_ids)
+
+    def _read_connection(self) -> sqlite3.Connection:
+        """线程本地只读连接 (失效时重建)"""
+        conn = get_read_connection(self.db_path)
+        try:
+            conn.execute("SELECT 1")
+        except sqlite3.ProgrammingError:
+            reset_read_connection(self.db_path)
+            conn = get_read_connection(self.db_path)
+        return conn
+
+    def _sync_index(self):
+        """写库后更新索引的数据库指纹并持久化 sidecar"""
+        if self._index is None:
+            return
+        with self._index_lock:
+            self._index.mark_synced(self._read_connection())
+
     def delete_embeddings(self, chunk_ids: list[str]):
         """删除 embeddings
 
@@ -188,6 +304,10 @@ class EmbeddingManager:
         conn.commit()
         conn.close()
 
+        if self._index is not None:
+            self._index.delete(chunk_ids)
+            self._sync_index()
+
     def get_stats(self) -> dict:
         """获取 embedding 统计信息
 
@@ -233,66 +353,96 @@ class EmbeddingManager:
         conn.commit()
         conn.close()
 
-    def _has_embedding(self, chunk_id: str, content_hash: str) -> bool:
-        """检查是否已有 embedding (且 content_hash 匹配)
+        if self._index is not None:
+            self._index.clear()
+            self._sync_index()
+
+    def _get_existing_hashes(self, chunk_ids: list[str]) -> dict[str, str]:
+        """批量查询已有 embedding 的 content_hash (仅限当前模型)
 
         Args:
-            chunk_id: Chunk ID
-            content_hash: Content hash
+            chunk_ids: Chunk ID 列表
 
         Returns:
-            是否已有有效的 embedding
+            {chunk_id: content_hash}
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        if not chunk_ids:
+            return {}
 
-        cursor.execute(
-            """
-            SELECT content_hash
+        placeholders = ",".join(["?"] * len(chunk_ids))
+        rows = self._read_connection().execute(
+            f"""
+            SELECT chunk_id, content_hash
             FROM kb_embeddings
-            WHERE chunk_id = ?
+            WHERE chunk_id IN ({placeholders}) AND model = ? AND dims = ?
             """,
-            (chunk_id,),
-        )
+            [*chunk_ids, self.provider.model_name, self.provider.dims],
+        ).fetchall()
+        return {row["chunk_id"]: row["content_hash"] for row in rows}
 
-        row = cursor.fetchone()
-        conn.close()
+    def _get_cached_vectors(self, content_hashes: set[str]) -> dict[str, np.ndarray]:
+        """按 (model, content_hash) 查找可复用的向量
 
-        if not row:
-            return False
+        Args:
+            content_hashes: Content hash 集合
 
-        # 检查 content_hash 是否匹配
-        return row["content_hash"] == content_hash
+        Returns:
+            {content_hash: vector}
+        """
+        if not content_hashes:
+            return {}
+
+        hashes = list(content_hashes)
+        placeholders = ",".join(["?"] * len(hashes))
+        rows = self._read_connection().execute(
+            f"""
+            SELECT content_hash, vector
+            FROM kb_embeddings
+            WHERE content_hash IN ({placeholders}) AND model = ? AND dims = ?
+            """,
+            [*hashes, self.provider.model_name, self.provider.dims],
+        ).fetchall()
+        return {row["content_hash"]: np.frombuffer(row["vector"], dtype=np.float32) for row in rows}
 
-    def _save_embedding(self, chunk_id: str, content_hash: str, vector: np.ndarray):
-        """保存 embedding 到数据库
+    def _save_embeddings(self, items: list[tuple[str, str, np.ndarray]]):
+        """在一个事务中批量保存 embeddings
 
         Args:
-            chunk_id: Chunk ID
-            content_hash: Content hash
-            vector: Embedding vector (numpy array)
+            items: [(chunk_id, content_hash, vector)]
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        if not items:
+            return
 
-        # 序列化 vector
-        vector_bytes = vector.astype(np.float32).tobytes()
+        model = self.provider.model_name
+        dims = self.provider.dims
+        built_at = int(time.time())
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO kb_embeddings 
-            (chunk_id, model, dims, vector, content_hash, built_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                chunk_id,
-                self.provider.model_name,
-                self.provider.dims,
-                vector_bytes,
-                content_hash,
-                int(time.time()),
-            ),
-        )
+        conn = self._get_connection()
+        try:
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO kb_embeddings 
+                    (chunk_id, model, dims, vector, content_hash, built_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            chunk_id,
+                            model,
+                            dims,
+                            np.asarray(vector, dtype=np.float32).tobytes(),
+                            content_hash,
+                            built_at,
+                        )
+                        for chunk_id, content_hash, vector in items
+                    ],
+                )
+        finally:
+            conn.close()
 
-        conn.commit()
-        conn.close()
+        if self._index is not None:
+            self._index.upsert(
+                [chunk_id for chunk_id, _, _ in items],
+                np.stack([np.asarray(vector, dtype=np.float32) for _, _, vector in items]),
+            )
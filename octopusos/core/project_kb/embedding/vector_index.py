@@ -0,0 +1,522 @@
+"""Vector Index - 内存向量索引 (语义召回)
+
+负责:
+- 启动时把 kb_embeddings 中某个模型的全部向量装入一个连续的 float32 矩阵
+- 批量点积打分 (向量已归一化, 点积即 cosine)
+- 大语料可选 IVF 分区 (球面 k-means, 只扫描最近的 nprobe 个分区)
+- 随 EmbeddingManager 写入/删除增量更新
+- 持久化到 sidecar 目录, 冷启动 mmap 加载, 无需逐行反序列化 BLOB
+
+Sidecar 布局 (<db_path>.kbvec/<model>/):
+- vectors.npy: 归一化向量矩阵 (capacity x dims, 只有前 count 行有效)
+- ids.json: 行号 -> chunk_id (null 为已删除行)
+- ivf_centroids.npy / ivf_assign.npy: IVF 分区 (可选)
+- meta.json: 模型、维度、行数、数据库指纹 (最后写入, 用于校验 sidecar 是否过期)
+
+vectors.npy 预留容量, 增量保存只通过 memmap 写回变更行和新增行;
+只有结构变化 (重建、清空、IVF 重训、容量不足、删除行过多) 才整体重写。
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_FORMAT_VERSION = 2
+
+
+class VectorIndex:
+    """单模型内存向量索引"""
+
+    # k-means 训练参数
+    IVF_TRAIN_ITERATIONS = 10
+    IVF_SAMPLES_PER_LIST = 64
+
+    # sidecar 整体重写时预留的容量倍数, 之后的新增行原地追加
+    SIDECAR_GROWTH = 1.25
+    # 删除行超过该比例时保存前先压缩
+    COMPACT_TOMBSTONE_RATIO = 0.25
+
+    def __init__(
+        self,
+        db_path: Path,
+        model: str,
+        dims: int,
+        ivf_min_vectors: int = 50000,
+        ivf_nprobe: int = 8,
+    ):
+        """初始化索引 (不加载数据, 见 load())
+
+        Args:
+            db_path: 数据库路径 (sidecar 放在同目录)
+            model: 模型名称 (只索引该模型的向量)
+            dims: 向量维度
+            ivf_min_vectors: 向量数达到该值才启用 IVF 分区 (0 表示禁用)
+            ivf_nprobe: 查询时扫描的分区数
+        """
+        self.db_path = Path(db_path)
+        self.model = model
+        self.dims = dims
+        self.ivf_min_vectors = ivf_min_vectors
+        self.ivf_nprobe = ivf_nprobe
+
+        model_slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model)
+        self.sidecar_dir = self.db_path.parent / f"{self.db_path.name}.kbvec" / model_slug
+
+        self._lock = threading.RLock()
+        self._matrix = np.zeros((0, dims), dtype=np.float32)
+        self._writable = True
+        self._ids: list[Optional[str]] = []  # None = 已删除 (tombstone)
+        self._rows: dict[str, int] = {}
+        self._size = 0
+        self._centroids: Optional[np.ndarray] = None
+        self._assign: Optional[np.ndarray] = None
+        self._trained_count = 0
+        self._fingerprint: Optional[tuple[int, int]] = None
+        self._dirty = False
+        self.loaded = False
+
+        # sidecar 当前覆盖的行数 / 预留容量; 以及自上次保存以来的变化
+        self._persisted_rows = 0
+        self._persisted_capacity = 0
+        self._changed_rows: set[int] = set()
+        self._ids_dirty = False
+        self._needs_rewrite = True
+
+    # ------------------------------------------------------------------
+    # 加载 / 持久化
+    # ------------------------------------------------------------------
+
+    def db_fingerprint(self, conn: sqlite3.Connection) -> tuple[int, int]:
+        """数据库侧指纹: (该模型向量数, 最大 rowid)"""
+        row = conn.execute(
+            "SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM kb_embeddings WHERE model = ?",
+            (self.model,),
+        ).fetchone()
+        return int(row[0]), int(row[1])
+
+    def load(self, conn: sqlite3.Connection):
+        """加载索引: sidecar 有效则 mmap 加载, 否则从数据库重建并写 sidecar
+
+        Args:
+            conn: 数据库连接
+        """
+        with self._lock:
+            fingerprint = self.db_fingerprint(conn)
+            if not self._load_sidecar(fingerprint):
+                self._load_from_db(conn)
+                self._fingerprint = fingerprint
+                self._dirty = True
+                self.save()
+            self.loaded = True
+
+    def is_stale(self, conn: sqlite3.Connection) -> bool:
+        """数据库是否被其他进程修改过 (指纹不一致)"""
+        return self.db_fingerprint(conn) != self._fingerprint
+
+    def mark_synced(self, conn: sqlite3.Connection):
+        """本进程写库后记录新的数据库指纹, 并持久化 sidecar"""
+        with self._lock:
+            self._fingerprint = self.db_fingerprint(conn)
+            self._dirty = True
+            self.save()
+
+    def _load_sidecar(self, fingerprint: tuple[int, int]) -> bool:
+        meta_path = self.sidecar_dir / "meta.json"
+        if not meta_path.exists():
+            return False
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if (
+                meta.get("format") != SIDECAR_FORMAT_VERSION
+                or meta.get("model") != self.model
+                or meta.get("dims") != self.dims
+                or tuple(meta.get("fingerprint", ())) != fingerprint
+            ):
+                return False
+
+            matrix = np.load(self.sidecar_dir / "vectors.npy", mmap_mode="r")
+            ids = json.loads((self.sidecar_dir / "ids.json").read_text(encoding="utf-8"))
+            if (
+                matrix.ndim != 2
+                or matrix.shape[1] != self.dims
+                or matrix.shape[0] < len(ids)
+                or len(ids) != meta.get("count")
+            ):
+                return False
+
+            centroids = assign = None
+            if meta.get("ivf"):
+                centroids = np.load(self.sidecar_dir / "ivf_centroids.npy")
+                assign = np.load(self.sidecar_dir / "ivf_assign.npy")
+                if assign.shape != (matrix.shape[0],):
+                    centroids = assign = None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable vector index sidecar {self.sidecar_dir}: {e}")
+            return False
+
+        self._matrix = matrix
+        self._writable = False
+        self._ids = list(ids)
+        self._rows = {chunk_id: row for row, chunk_id in enumerate(ids) if chunk_id is not None}
+        self._size = len(ids)
+        self._centroids = centroids
+        self._assign = assign
+        self._trained_count = len(self._rows) if centroids is not None else 0
+        self._fingerprint = fingerprint
+        self._dirty = False
+        self._persisted_rows = len(ids)
+        self._persisted_capacity = matrix.shape[0]
+        self._changed_rows = set()
+        self._ids_dirty = False
+        self._needs_rewrite = False
+        return True
+
+    def _load_from_db(self, conn: sqlite3.Connection):
+        rows = conn.execute(
+            "SELECT chunk_id, vector FROM kb_embeddings "
+            "WHERE model = ? AND dims = ? ORDER BY rowid",
+            (self.model, self.dims),
+        ).fetchall()
+
+        row_bytes = self.dims * 4
+        valid = [(row[0], row[1]) for row in rows if len(row[1]) == row_bytes]
+        ids = [chunk_id for chunk_id, _ in valid]
+
+        if valid:
+            # 一次性拼接所有 BLOB, 得到连续矩阵
+            matrix = np.frombuffer(b"".join(blob for _, blob in valid), dtype=np.float32)
+            matrix = matrix.reshape(len(valid), self.dims).copy()
+            self._normalize_rows(matrix)
+        else:
+            matrix = np.zeros((0, self.dims), dtype=np.float32)
+
+        self._matrix = matrix
+        self._writable = True
+        self._ids = ids
+        self._rows = {chunk_id: row for row, chunk_id in enumerate(ids)}
+        self._size = len(ids)
+        self._centroids = None
+        self._assign = None
+        self._trained_count = 0
+        self._needs_rewrite = True
+        self._maybe_train_ivf()
+
+    def save(self):
+        """把当前索引写入 sidecar; meta.json 最后写入
+
+        只有行内容变化时, 通过 memmap 原地写回变更行和新增行;
+        结构变化时压缩删除行并整体重写 (预留 SIDECAR_GROWTH 倍容量)。
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            tombstones = self._size - len(self._rows)
+            if tombstones and (
+                self._needs_rewrite or tombstones > self._size * self.COMPACT_TOMBSTONE_RATIO
+            ):
+                self._compact()
+            has_ivf = self._centroids is not None and self._assign is not None
+            try:
+                self.sidecar_dir.mkdir(parents=True, exist_ok=True)
+                if (
+                    self._needs_rewrite
+                    or self._size > self._persisted_capacity
+                    or not (self.sidecar_dir / "vectors.npy").exists()
+                ):
+                    self._rewrite_sidecar(has_ivf)
+                else:
+                    self._write_changed_rows(has_ivf)
+                if self._ids_dirty:
+                    self._atomic_write_text("ids.json", json.dumps(self._ids[: self._size]))
+                meta = {
+                    "format": SIDECAR_FORMAT_VERSION,
+                    "model": self.model,
+                    "dims": self.dims,
+                    "count": self._size,
+                    "fingerprint": list(self._fingerprint or (0, 0)),
+                    "ivf": has_ivf,
+                }
+                self._atomic_write_text("meta.json", json.dumps(meta))
+                self._persisted_rows = self._size
+                self._changed_rows = set()
+                self._ids_dirty = False
+                self._needs_rewrite = False
+                self._dirty = False
+            except OSError as e:
+                # sidecar 只是加速冷启动, 写失败不影响检索; 下次保存整体重写
+                self._needs_rewrite = True
+                logger.warning(f"Failed to persist vector index sidecar {self.sidecar_dir}: {e}")
+
+    def _rewrite_sidecar(self, has_ivf: bool):
+        capacity = max(64, math.ceil(self._size * self.SIDECAR_GROWTH))
+        self._atomic_write_rows("vectors.npy", self._matrix[: self._size], (capacity, self.dims))
+        if has_ivf:
+            self._atomic_write_npy("ivf_centroids.npy", self._centroids)
+            self._atomic_write_rows("ivf_assign.npy", self._assign[: self._size], (capacity,))
+        self._persisted_capacity = capacity
+        self._ids_dirty = True
+
+    def _write_changed_rows(self, has_ivf: bool):
+        """通过 memmap 原地写回变更行和新增行"""
+        rows = sorted(self._changed_rows | set(range(self._persisted_rows, self._size)))
+        if not rows:
+            return
+        rows = np.asarray(rows, dtype=np.int64)
+        names = [("vectors.npy", self._matrix)]
+        if has_ivf:
+            names.append(("ivf_assign.npy", self._assign))
+        for name, source in names:
+            target = np.lib.format.open_memmap(self.sidecar_dir / name, mode="r+")
+            try:
+                target[rows] = source[rows]
+                target.flush()
+            finally:
+                del target
+
+    def _atomic_write_rows(self, name: str, rows: np.ndarray, shape: tuple):
+        """写入预留容量的 .npy (超出 rows 的部分填 0)"""
+        tmp_path = self.sidecar_dir / f"{name}.tmp"
+        target = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=rows.dtype, shape=shape)
+        try:
+            target[: len(rows)] = rows
+            target.flush()
+        finally:
+            del target
+        os.replace(tmp_path, self.sidecar_dir / name)
+
+    def _atomic_write_npy(self, name: str, array: np.ndarray):
+        tmp_path = self.sidecar_dir / f"{name}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp_path, self.sidecar_dir / name)
+
+    def _atomic_write_text(self, name: str, text: str):
+        tmp_path = self.sidecar_dir / f"{name}.tmp"
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, self.sidecar_dir / name)
+
+    # ------------------------------------------------------------------
+    # 增量更新
+    # ------------------------------------------------------------------
+
+    def upsert(self, chunk_ids: list[str], vectors: np.ndarray):
+        """插入或覆盖向量
+
+        Args:
+            chunk_ids: Chunk ID 列表
+            vectors: shape (len(chunk_ids), dims) 的原始向量
+        """
+        if not chunk_ids:
+            return
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(chunk_ids), self.dims).copy()
+        self._normalize_rows(vectors)
+
+        with self._lock:
+            self._ensure_writable(self._size + len(chunk_ids))
+            for chunk_id, vector in zip(chunk_ids, vectors):
+                row = self._rows.get(chunk_id)
+                if row is None:
+                    row = self._size
+                    self._size += 1
+                    self._ids.append(chunk_id)
+                    self._rows[chunk_id] = row
+                    self._ids_dirty = True
+                elif row < self._persisted_rows:
+                    self._changed_rows.add(row)
+                self._matrix[row] = vector
+                if self._assign is not None:
+                    self._assign[row] = int(np.argmax(self._centroids @ vector))
+            self._dirty = True
+            self._maybe_train_ivf()
+
+    def delete(self, chunk_ids: list[str]):
+        """删除向量 (标记 tombstone, 保存时压缩)
+
+        Args:
+            chunk_ids: Chunk ID 列表
+        """
+        with self._lock:
+            for chunk_id in chunk_ids:
+                row = self._rows.pop(chunk_id, None)
+                if row is not None:
+                    self._ids[row] = None
+                    self._ids_dirty = True
+                    self._dirty = True
+
+    def clear(self):
+        """清空索引"""
+        with self._lock:
+            self._matrix = np.zeros((0, self.dims), dtype=np.float32)
+            self._writable = True
+            self._ids = []
+            self._rows = {}
+            self._size = 0
+            self._centroids = None
+            self._assign = None
+            self._trained_count = 0
+            self._needs_rewrite = True
+            self._dirty = True
+
+    def _ensure_writable(self, min_rows: int):
+        """mmap 只读矩阵在首次写入时复制到内存; 容量按 2 倍增长"""
+        capacity = self._matrix.shape[0]
+        if self._writable and capacity >= min_rows:
+            return
+        new_capacity = max(min_rows, capacity * 2 if self._writable else capacity, 64)
+        matrix = np.empty((new_capacity, self.dims), dtype=np.float32)
+        matrix[: self._size] = self._matrix[: self._size]
+        self._matrix = matrix
+        if self._assign is not None:
+            assign = np.full(new_capacity, -1, dtype=np.int32)
+            assign[: self._size] = self._assign[: self._size]
+            self._assign = assign
+        self._writable = True
+
+    def _compact(self):
+        """去掉 tombstone 行 (行号改变, 下次保存整体重写 sidecar)"""
+        live_rows = [row for row, chunk_id in enumerate(self._ids) if chunk_id is not None]
+        if len(live_rows) == self._size:
+            return
+        self._matrix = np.ascontiguousarray(self._matrix[live_rows])
+        if self._assign is not None:
+            self._assign = self._assign[live_rows]
+        self._ids = [self._ids[row] for row in live_rows]
+        self._rows = {chunk_id: row for row, chunk_id in enumerate(self._ids)}
+        self._size = len(self._ids)
+        self._writable = True
+        self._needs_rewrite = True
+
+    # ------------------------------------------------------------------
+    # IVF 分区
+    # ------------------------------------------------------------------
+
+    def _maybe_train_ivf(self):
+        """向量数达到阈值 (或比上次训练翻倍) 时训练 IVF 分区"""
+        live = len(self._rows)
+        if not self.ivf_min_vectors or live < self.ivf_min_vectors:
+            return
+        if self._centroids is not None and live < 2 * self._trained_count:
+            return
+        self._train_ivf()
+
+    def _train_ivf(self):
+        live_rows = np.array(
+            [row for row, chunk_id in enumerate(self._ids) if chunk_id is not None], dtype=np.int64
+        )
+        n_lists = max(1, int(math.sqrt(len(live_rows))))
+        rng = np.random.default_rng(0)
+        sample_size = min(len(live_rows), n_lists * self.IVF_SAMPLES_PER_LIST)
+        sample = self._matrix[rng.choice(live_rows, size=sample_size, replace=False)]
+
+        # 球面 k-means (向量已归一化, 用点积做相似度)
+        centroids = sample[rng.choice(sample_size, size=n_lists, replace=False)].copy()
+        for _ in range(self.IVF_TRAIN_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for list_id in range(n_lists):
+                members = sample[labels == list_id]
+                if len(members):
+                    centroids[list_id] = members.mean(axis=0)
+            self._normalize_rows(centroids)
+
+        assign = np.full(self._matrix.shape[0], -1, dtype=np.int32)
+        for start in range(0, self._size, 65536):
+            block = self._matrix[start : min(start + 65536, self._size)]
+            assign[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+
+        self._centroids = centroids
+        self._assign = assign
+        self._trained_count = len(live_rows)
+        self._needs_rewrite = True
+        self._dirty = True
+        logger.info(
+            f"Trained IVF index for {self.model}: {n_lists} lists over {len(live_rows)} vectors"
+        )
+
+    # ------------------------------------------------------------------
+    # 查询
+    # ------------------------------------------------------------------
+
+    def search(self, query_vec: np.ndarray, k: int) -> list[tuple[str, float]]:
+        """语义召回 top-k
+
+        Args:
+            query_vec: 查询向量 (shape: (dims,))
+            k: 返回数量
+
+        Returns:
+            [(chunk_id, cosine_similarity)] 按相似度降序
+        """
+        query = np.asarray(query_vec, dtype=np.float32).reshape(-1)
+        norm = np.linalg.norm(query)
+        if norm == 0 or k <= 0:
+            return []
+        query = query / norm
+
+        with self._lock:
+            if self._size == 0:
+                return []
+
+            rows = None
+            if self._centroids is not None and self._assign is not None:
+                nprobe = min(self.ivf_nprobe, len(self._centroids))
+                probes = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+                rows = np.nonzero(np.isin(self._assign[: self._size], probes))[0]
+                if len(rows) < k:
+                    rows = None  # 分区太小, 退回全量扫描
+
+            matrix = self._matrix[: self._size] if rows is None else self._matrix[rows]
+            scores = matrix @ query
+
+            # tombstone 行不参与排序
+            ids = self._ids if rows is None else [self._ids[row] for row in rows]
+            live = np.fromiter(
+                (chunk_id is not None for chunk_id in ids), dtype=bool, count=len(ids)
+            )
+            scores = np.where(live, scores, -np.inf)
+
+            top_n = min(k, int(live.sum()))
+            if top_n == 0:
+                return []
+            top = np.argpartition(-scores, top_n - 1)[:top_n]
+            top = top[np.argsort(-scores[top])]
+            return [(ids[i], float(scores[i])) for i in top]
+
+    def get(self, chunk_ids: list[str]) -> list[Optional[np.ndarray]]:
+        """按 chunk_id 取归一化向量 (缺失为 None)"""
+        with self._lock:
+            result = []
+            for chunk_id in chunk_ids:
+                row = self._rows.get(chunk_id)
+                result.append(None if row is None else np.array(self._matrix[row]))
+            return result
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_stats(self) -> dict:
+        """索引统计"""
+        with self._lock:
+            return {
+                "vectors": len(self._rows),
+                "dims": self.dims,
+                "model": self.model,
+                "ivf_lists": 0 if self._centroids is None else len(self._centroids),
+                "memory_mapped": not self._writable,
+                "sidecar": str(self.sidecar_dir),
+            }
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray):
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
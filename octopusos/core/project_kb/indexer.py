@@ -5,6 +5,7 @@
 - 管理 sources 和 chunks 表
 - 增量更新 (只处理变更文件)
 - 清理已删除文档
+- 批量索引会话 (BulkIndexSession: 单连接 + executemany + 延迟 FTS 维护)
 
 Gate 要求:
 - #1: FTS5 Available性检测
@@ -15,7 +16,7 @@ Gate 要求:
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from octopusos.core.project_kb.types import Chunk, Source
 from octopusos.core.time import utc_now_iso
@@ -30,6 +31,9 @@ class FTS5NotAvailableError(RuntimeError):
 class ProjectKBIndexer:
     """ProjectKB 索引构建器"""
 
+    # FTS5 默认 automerge 级别 (批量会话结束后恢复)
+    FTS_DEFAULT_AUTOMERGE = 4
+
     def __init__(self, db_path: Path):
         """初始化索引器
 
@@ -46,6 +50,18 @@ class ProjectKBIndexer:
         conn.execute("PRAGMA journal_mode=WAL")
         return conn
 
+    def bulk_session(self, batch_size: int = 200, rebuild_fts: bool = False) -> "BulkIndexSession":
+        """打开批量索引会话
+
+        Args:
+            batch_size: 每个事务包含的文件数
+            rebuild_fts: 关闭会话时是否全量 rebuild_fts (否则只做 optimize)
+
+        Returns:
+            BulkIndexSession (支持 with 语句)
+        """
+        return BulkIndexSession(self, batch_size=batch_size, rebuild_fts=rebuild_fts)
+
     def check_fts5_available(self) -> bool:
         """检查 FTS5 是否Available (Gate #1)
         
@@ -91,9 +107,20 @@ class ProjectKBIndexer:
             # Gate #2: 迁移是幂等的（IF NOT EXISTS）
             conn.executescript(migration_sql)
             conn.commit()
-        
+
+        self._ensure_source_stat_columns(conn)
         conn.close()
 
+    def _ensure_source_stat_columns(self, conn: sqlite3.Connection):
+        """确保 kb_sources 有 stat 快速路径列 (schema v101, 兼容未迁移的库)"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(kb_sources)").fetchall()}
+        if not columns:
+            return
+        for column in ("size_bytes", "mtime_ns"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE kb_sources ADD COLUMN {column} INTEGER")
+        conn.commit()
+
     def get_existing_sources(self, repo_id: str) -> dict[str, Source]:
         """获取已存在的 sources
 
@@ -108,7 +135,8 @@ class ProjectKBIndexer:
 
         cursor.execute(
             """
-            SELECT source_id, repo_id, path, file_hash, mtime, doc_type, language, tags
+            SELECT source_id, repo_id, path, file_hash, mtime, doc_type, language, tags,
+                   size_bytes, mtime_ns
             FROM kb_sources
             WHERE repo_id = ?
             """,
@@ -126,6 +154,8 @@ class ProjectKBIndexer:
                 doc_type=row["doc_type"],
                 language=row["language"],
                 tags=eval(row["tags"]) if row["tags"] else [],
+                size=row["size_bytes"],
+                mtime_ns=row["mtime_ns"],
             )
 
         conn.close()
@@ -153,8 +183,9 @@ class ProjectKBIndexer:
         cursor.execute(
             """
             INSERT OR REPLACE INTO kb_sources 
-            (source_id, repo_id, path, file_hash, mtime, doc_type, language, tags, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            (source_id, repo_id, path, file_hash, mtime, doc_type, language, tags,
+             size_bytes, mtime_ns, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 source.source_id,
@@ -165,6 +196,8 @@ class ProjectKBIndexer:
                 source.doc_type,
                 source.language,
                 str(source.tags),
+                source.size,
+                source.mtime_ns,
                 created_at,
                 now,
             ),
@@ -613,3 +646,279 @@ class ProjectKBIndexer:
         finally:
             conn.close()
 
+
+
+class BulkIndexSession:
+    """批量索引会话 - 用于 refresh 的大批量写入
+
+    与逐条 insert_chunk/upsert_source 相比:
+    - 整个会话复用一个连接
+    - 每 batch_size 个文件一个事务, 使用 executemany 写入
+    - 会话期间关闭 FTS5 automerge, 结束时统一 optimize (或 rebuild_fts)
+
+    单个文件写入失败不会影响同一批次的其他文件: 批量事务失败时回滚,
+    再逐文件重试, 失败的文件记录在 errors 中。
+
+    Example:
+        >>> with indexer.bulk_session(batch_size=200) as session:
+        ...     session.add_file(source, chunks, replace=True)
+        ...     session.delete_sources(deleted_ids)
+        >>> print(session.stats)
+    """
+
+    def __init__(self, indexer: ProjectKBIndexer, batch_size: int = 200, rebuild_fts: bool = False):
+        self.indexer = indexer
+        self.batch_size = max(1, batch_size)
+        self.rebuild_fts = rebuild_fts
+        self.errors: list[str] = []
+        self.stats = {
+            "files": 0,
+            "chunks": 0,
+            "batches": 0,
+            "deleted_sources": 0,
+            "deleted_chunks": 0,
+        }
+        self._pending: list[tuple[Source, list[Chunk], bool]] = []
+        self._touched: list[Source] = []
+        self._conn: Optional[sqlite3.Connection] = None
+        self._closed = False
+
+    def __enter__(self) -> "BulkIndexSession":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            # 异常退出: 丢弃未提交批次, 但仍恢复 automerge 并关闭连接
+            self._pending.clear()
+        self.close()
+
+    def open(self):
+        """打开连接并暂停 FTS5 自动合并"""
+        if self._conn is not None:
+            return
+        conn = self.indexer._get_connection()
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("INSERT INTO kb_chunks_fts(kb_chunks_fts, rank) VALUES('automerge', 0)")
+        conn.commit()
+        self._conn = conn
+
+    def add_file(self, source: Source, chunks: Iterable[Chunk], replace: bool = True):
+        """登记一个文件的 source 与 chunks, 满 batch_size 时自动 flush
+
+        Args:
+            source: Source 对象
+            chunks: 该文件的全部 chunks
+            replace: 是否先删除该 source 的旧 chunks
+        """
+        self._pending.append((source, list(chunks), replace))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def touch_source(self, source: Source):
+        """登记内容未变、仅 stat 变化的 source (只更新 mtime/size, 不动 chunks)
+
+        Args:
+            source: Source 对象 (file_hash 与已索引一致)
+        """
+        self._touched.append(source)
+        if len(self._touched) >= self.batch_size:
+            self.flush()
+
+    def delete_sources(self, source_ids: list[str]) -> int:
+        """删除 sources 及其 chunks (单事务)
+
+        Args:
+            source_ids: Source ID 列表
+
+        Returns:
+            删除的 chunk 数量
+        """
+        if not source_ids:
+            return 0
+        self.flush()
+        conn = self._require_conn()
+        params = [(source_id,) for source_id in source_ids]
+        try:
+            deleted_chunks = 0
+            for start in range(0, len(source_ids), 500):
+                batch = source_ids[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                deleted_chunks += conn.execute(
+                    f"SELECT COUNT(*) FROM kb_chunks WHERE source_id IN ({placeholders})",
+                    batch,
+                ).fetchone()[0]
+            # 不依赖外键 CASCADE (连接未开启 foreign_keys)
+            conn.executemany("DELETE FROM kb_chunks WHERE source_id = ?", params)
+            conn.executemany("DELETE FROM kb_sources WHERE source_id = ?", params)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        self.stats["deleted_sources"] += len(source_ids)
+        self.stats["deleted_chunks"] += deleted_chunks
+        return deleted_chunks
+
+    def flush(self):
+        """将已登记的文件写入一个事务"""
+        if self._touched:
+            self._flush_touched()
+        if not self._pending:
+            return
+        conn = self._require_conn()
+        pending, self._pending = self._pending, []
+        try:
+            chunks = self._write(conn, pending)
+            conn.commit()
+            self._count_written(len(pending), chunks)
+        except Exception:
+            conn.rollback()
+            # 逐文件重试, 隔离出错的文件
+            for item in pending:
+                try:
+                    chunks = self._write(conn, [item])
+                    conn.commit()
+                except Exception as e:
+                    conn.rollback()
+                    self.errors.append(f"{item[0].path}: {str(e)}")
+                    continue
+                self._count_written(1, chunks)
+            return
+        finally:
+            self.stats["batches"] += 1
+
+    def _count_written(self, files: int, chunks: int):
+        """只统计已提交的写入 (回滚的批次在逐文件重试时再计)"""
+        self.stats["files"] += files
+        self.stats["chunks"] += chunks
+
+    def _flush_touched(self):
+        conn = self._require_conn()
+        touched, self._touched = self._touched, []
+        now = utc_now_iso()
+        try:
+            conn.executemany(
+                """
+                UPDATE kb_sources
+                SET mtime = ?, size_bytes = ?, mtime_ns = ?, updated_at = ?
+                WHERE source_id = ?
+                """,
+                [
+                    (source.mtime, source.size, source.mtime_ns, now, source.source_id)
+                    for source in touched
+                ],
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            # 仅影响下次的 stat 快速路径, 不影响索引内容
+            self.errors.append(f"stat update failed for {len(touched)} sources: {e}")
+
+    def close(self):
+        """提交剩余批次, 恢复 automerge 并执行一次 FTS 维护"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._conn is None:
+            return
+        try:
+            self.flush()
+        finally:
+            conn = self._conn
+            try:
+                conn.execute(
+                    "INSERT INTO kb_chunks_fts(kb_chunks_fts, rank) VALUES('automerge', ?)",
+                    (ProjectKBIndexer.FTS_DEFAULT_AUTOMERGE,),
+                )
+                if not self.rebuild_fts:
+                    conn.execute("INSERT INTO kb_chunks_fts(kb_chunks_fts) VALUES('optimize')")
+                conn.commit()
+            finally:
+                conn.close()
+                self._conn = None
+        if self.rebuild_fts:
+            self.indexer.rebuild_fts()
+
+    def _require_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self._closed:
+                raise RuntimeError("BulkIndexSession is closed")
+            self.open()
+        return self._conn
+
+    def _write(self, conn: sqlite3.Connection, items: list[tuple[Source, list[Chunk], bool]]) -> int:
+        """在当前事务中写入 sources/chunks (顺序: source -> 删除旧 chunks -> 插入)
+
+        Returns:
+            写入的 chunk 数量 (未提交)
+        """
+        now = utc_now_iso()
+
+        # upsert 保留 created_at, 且不会像 INSERT OR REPLACE 那样先删除旧行
+        conn.executemany(
+            """
+            INSERT INTO kb_sources
+            (source_id, repo_id, path, file_hash, mtime, doc_type, language, tags,
+             size_bytes, mtime_ns, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(source_id) DO UPDATE SET
+                repo_id = excluded.repo_id,
+                path = excluded.path,
+                file_hash = excluded.file_hash,
+                mtime = excluded.mtime,
+                doc_type = excluded.doc_type,
+                language = excluded.language,
+                tags = excluded.tags,
+                size_bytes = excluded.size_bytes,
+                mtime_ns = excluded.mtime_ns,
+                updated_at = excluded.updated_at
+            """,
+            [
+                (
+                    source.source_id,
+                    source.repo_id,
+                    source.path,
+                    source.file_hash,
+                    source.mtime,
+                    source.doc_type,
+                    source.language,
+                    str(source.tags),
+                    source.size,
+                    source.mtime_ns,
+                    now,
+                    now,
+                )
+                for source, _, _ in items
+            ],
+        )
+
+        conn.executemany(
+            "DELETE FROM kb_chunks WHERE source_id = ?",
+            [(source.source_id,) for source, _, replace in items if replace],
+        )
+
+        rows = [
+            (
+                chunk.chunk_id,
+                chunk.source_id,
+                chunk.heading,
+                chunk.start_line,
+                chunk.end_line,
+                chunk.content,
+                chunk.content_hash,
+                chunk.token_count,
+                now,
+            )
+            for _, chunks, _ in items
+            for chunk in chunks
+        ]
+        conn.executemany(
+            """
+            INSERT INTO kb_chunks
+            (chunk_id, source_id, heading, start_line, end_line, content, content_hash, token_count, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        return len(rows)
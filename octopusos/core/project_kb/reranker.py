@@ -2,107 +2,142 @@
 
 负责:
 - 基于向量相似度对候选结果重新排序
-- 融合关键词分数和向量分数
+- 基于内存向量索引做语义召回 (补充关键词未命中的 chunks)
+- 融合关键词分数和向量分数 (alpha 线性融合 / RRF)
 - 更新 explanation (审计)
 """
 
+from typing import Optional
+
 import numpy as np
 
 from octopusos.core.project_kb.config import VectorRerankConfig
 from octopusos.core.project_kb.embedding.manager import EmbeddingManager
 from octopusos.core.project_kb.embedding.provider import IEmbeddingProvider
-from octopusos.core.project_kb.types import ChunkResult
+from octopusos.core.project_kb.searcher import ProjectKBSearcher
+from octopusos.core.project_kb.types import ChunkResult, SearchFilters
 
 
 class VectorReranker:
     """向量重排序器"""
 
-    def __init__(self, embedding_manager: EmbeddingManager, provider: IEmbeddingProvider):
+    def __init__(
+        self,
+        embedding_manager: EmbeddingManager,
+        provider: IEmbeddingProvider,
+        searcher: Optional[ProjectKBSearcher] = None,
+    ):
         """初始化 reranker
 
         Args:
             embedding_manager: Embedding 管理器
             provider: Embedding provider
+            searcher: 检索器 (用于补全语义召回的 chunks; None 则只重排关键词候选)
         """
         self.embedding_manager = embedding_manager
         self.provider = provider
+        self.searcher = searcher
 
     def rerank(
         self,
         query: str,
         candidates: list[ChunkResult],
         config: VectorRerankConfig,
+        filters: Optional[SearchFilters] = None,
     ) -> list[ChunkResult]:
         """向量重排序
 
         流程:
         1. 生成 query embedding
-        2. 获取候选 embeddings
-        3. 计算 cosine 相似度
-        4. 融合 keyword + vector 分数
+        2. 语义召回: 从内存向量索引取 top candidate_k, 补入关键词未命中的 chunks
+        3. 获取候选 embeddings (内存索引, 已归一化)
+        4. 融合 keyword + vector 分数 (alpha 线性融合 或 RRF)
         5. 重新排序
         6. 更新 explanation
 
         Args:
             query: 查询字符串
-            candidates: 候选结果列表
+            candidates: 关键词候选结果列表
             config: VectorRerankConfig
+            filters: 检索过滤器 (语义召回的结果同样需要满足)
 
         Returns:
             重排序后的结果列表
         """
-        if not candidates:
+        if not candidates and not (config.semantic_retrieval and self.searcher):
             return []
 
         # 1. 生成 query embedding
         try:
-            query_vec = self.provider.embed_query(query)
+            query_vec = np.asarray(self.provider.embed_query(query), dtype=np.float32)
         except Exception as e:
             print(f"⚠️  Failed to generate query embedding: {e}")
             return candidates[: config.final_k]
 
-        # 2. 获取候选 embeddings
-        chunk_ids = [c.chunk_id for c in candidates]
-        embeddings = self.embedding_manager.get_embeddings(chunk_ids)
-
-        # 3-5. 计算相似度、融合分数、更新结果
-        updated_candidates = []
-        for candidate, emb in zip(candidates, embeddings):
-            if emb is None:
-                # 缺失 embedding，保持原分数
-                candidate.explanation.keyword_score = candidate.score
-                candidate.explanation.vector_score = None
-                candidate.explanation.alpha = config.alpha
-                candidate.explanation.final_score = candidate.score
-                updated_candidates.append(candidate)
-                continue
-
-            # 计算向量相似度
-            vector_score = self._cosine_similarity(query_vec, emb)
+        keyword_ranks = {c.chunk_id: rank for rank, c in enumerate(candidates, 1)}
+        keyword_scores = [c.score for c in candidates]
 
-            # 归一化关键词分数 (0-1)
-            keyword_norm = self._normalize_keyword_score(candidate.score, candidates)
+        # 2. 语义召回
+        pool = list(candidates)
+        if config.semantic_retrieval and self.searcher:
+            hits = self.embedding_manager.search_similar(query_vec, config.candidate_k)
+            missing = [chunk_id for chunk_id, _ in hits if chunk_id not in keyword_ranks]
+            pool.extend(self.searcher.get_results_by_ids(missing, filters))
 
-            # 融合分数
-            final_score = (1 - config.alpha) * keyword_norm + config.alpha * vector_score
-
-            # 更新 explanation
-            candidate.explanation.keyword_score = candidate.score
-            candidate.explanation.vector_score = float(vector_score)
-            candidate.explanation.alpha = config.alpha
-            candidate.explanation.final_score = float(final_score)
-
-            # 更新候选分数
-            candidate.score = final_score
-            updated_candidates.append(candidate)
-
-        # 6. 重新排序
-        sorted_results = sorted(updated_candidates, key=lambda x: x.score, reverse=True)
+        if not pool:
+            return []
 
-        # 7. 更新 rerank_delta 和 final_rank
+        # 3. 向量相似度 (索引中的向量已归一化)
+        query_norm = query_vec / (np.linalg.norm(query_vec) + 1e-8)
+        embeddings = self.embedding_manager.get_normalized_embeddings([c.chunk_id for c in pool])
+        similarities = {
+            c.chunk_id: float(np.dot(query_norm, emb))
+            for c, emb in zip(pool, embeddings)
+            if emb is not None
+        }
+        vector_ranks = {
+            chunk_id: rank
+            for rank, chunk_id in enumerate(
+                sorted(similarities, key=similarities.get, reverse=True), 1
+            )
+        }
+
+        # 4. 融合分数、更新 explanation
+        for candidate in pool:
+            keyword_score = candidate.score
+            similarity = similarities.get(candidate.chunk_id)
+            explanation = candidate.explanation
+            explanation.keyword_score = keyword_score
+            explanation.alpha = config.alpha
+            explanation.vector_score = None if similarity is None else (similarity + 1) / 2
+
+            if config.fusion == "rrf":
+                final_score = 0.0
+                if candidate.chunk_id in keyword_ranks:
+                    final_score += 1.0 / (config.rrf_k + keyword_ranks[candidate.chunk_id])
+                if candidate.chunk_id in vector_ranks:
+                    final_score += 1.0 / (config.rrf_k + vector_ranks[candidate.chunk_id])
+            elif similarity is None:
+                # 缺失 embedding，保持原分数
+                final_score = keyword_score
+            else:
+                keyword_norm = (
+                    self._normalize_score(keyword_score, keyword_scores)
+                    if candidate.chunk_id in keyword_ranks
+                    else 0.0
+                )
+                final_score = (1 - config.alpha) * keyword_norm + config.alpha * explanation.vector_score
+
+            explanation.final_score = float(final_score)
+            candidate.score = float(final_score)
+
+        # 5. 重新排序
+        sorted_results = sorted(pool, key=lambda x: x.score, reverse=True)
+
+        # 6. 更新 rerank_delta 和 final_rank (语义召回的结果没有原排名)
         for new_rank, result in enumerate(sorted_results, 1):
-            old_rank = candidates.index(result) + 1
-            result.explanation.rerank_delta = old_rank - new_rank
+            old_rank = keyword_ranks.get(result.chunk_id)
+            result.explanation.rerank_delta = None if old_rank is None else old_rank - new_rank
             result.explanation.final_rank = new_rank
 
         return sorted_results[: config.final_k]
@@ -127,6 +162,27 @@ class VectorReranker:
         # 映射到 0-1 范围
         return (similarity + 1) / 2
 
+    def _normalize_score(self, score: float, scores: list[float]) -> float:
+        """min-max 归一化到 0-1 范围
+
+        Args:
+            score: 原始分数
+            scores: 同一批次的所有分数
+
+        Returns:
+            归一化分数 (0-1)
+        """
+        if not scores:
+            return 0.0
+
+        min_score = min(scores)
+        max_score = max(scores)
+
+        if max_score == min_score:
+            return 1.0
+
+        return (score - min_score) / (max_score - min_score)
+
     def _normalize_keyword_score(
         self, score: float, all_candidates: list[ChunkResult]
     ) -> float:
@@ -144,11 +200,4 @@ class VectorReranker:
         if not all_candidates:
             return 0.0
 
-        scores = [c.score for c in all_candidates]
-        min_score = min(scores)
-        max_score = max(scores)
-
-        if max_score == min_score:
-            return 1.0
-
-        return (score - min_score) / (max_score - min_score)
+        return self._normalize_score(score, [c.score for c in all_candidates])
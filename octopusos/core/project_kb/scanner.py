@@ -5,14 +5,56 @@
 - 计算文件哈希检测变更
 - 推断文档类型 (adr/runbook/spec/guide)
 - 支持增量扫描 (只处理变更文件)
+- stat 快速路径: (size, mtime_ns) 未变化时跳过哈希
+- 单次目录遍历 (排除目录剪枝), find_deleted 复用遍历结果
 """
 
 import hashlib
+import io
+import os
 import re
+import stat
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from octopusos.core.project_kb.types import Source
+from octopusos.core.project_kb.types import Chunk, Source
+
+if TYPE_CHECKING:
+    from octopusos.core.project_kb.chunker import MarkdownChunker
+
+
+def compute_file_hash(data: bytes) -> str:
+    """计算文件内容 SHA256 哈希"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_and_chunk(
+    file_path: Path,
+    source_id: str,
+    previous_hash: Optional[str],
+    chunker: "MarkdownChunker",
+) -> tuple[str, Optional[list[Chunk]]]:
+    """读取一次文件, 计算哈希并切片 (进程池 worker, 须保持模块级可 pickle)
+
+    Args:
+        file_path: 文件绝对路径
+        source_id: 文档 source_id
+        previous_hash: 已索引的文件哈希 (无则为 None)
+        chunker: 切片器
+
+    Returns:
+        (file_hash, chunks) - 内容未变化时 chunks 为 None
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+
+    file_hash = compute_file_hash(data)
+    if previous_hash == file_hash:
+        return file_hash, None
+
+    # 与 open(..., "r").readlines() 相同的通用换行处理
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8").readlines()
+    return file_hash, list(chunker.chunk_lines(source_id, lines))
 
 
 class DocumentScanner:
@@ -92,6 +134,14 @@ class DocumentScanner:
         self.exclude_patterns = exclude_patterns or self.DEFAULT_EXCLUDE_PATTERNS
         self.repo_id = repo_id or self._compute_repo_id()
 
+        # 预编译匹配规则
+        self._scan_matchers = [self._glob_to_regex(p) for p in self.scan_paths]
+        self._exclude_regexes = [
+            re.compile(self._exclude_to_regex(p)) for p in self.exclude_patterns
+        ]
+        # 最近一次遍历到的相对路径 (供 find_deleted 复用)
+        self._last_seen_paths: Optional[set[str]] = None
+
     def _compute_repo_id(self) -> str:
         """计算项目 ID (基于路径哈希)"""
         return hashlib.sha256(str(self.root_dir).encode()).hexdigest()[:12]
@@ -109,58 +159,87 @@ class DocumentScanner:
             - is_changed: 是否变更 (新增或内容变化)
         """
         existing_sources = existing_sources or {}
-        seen_paths = set()
 
-        for pattern in self.scan_paths:
-            for file_path in self._glob_files(pattern):
-                if self._should_exclude(file_path):
-                    continue
+        for file_path, source, stat_unchanged in self.iter_candidates(existing_sources):
+            if stat_unchanged:
+                yield file_path, source, False
+                continue
 
-                rel_path = str(file_path.relative_to(self.root_dir))
-                seen_paths.add(rel_path)
+            # 计算文件哈希
+            source.file_hash = self._compute_file_hash(file_path)
 
-                # 计算文件哈希
-                file_hash = self._compute_file_hash(file_path)
-                mtime = int(file_path.stat().st_mtime)
+            # 检查是否变更
+            is_changed = True
+            if source.source_id in existing_sources:
+                existing = existing_sources[source.source_id]
+                is_changed = existing.file_hash != source.file_hash
 
-                # 推断文档类型
-                doc_type = self._infer_doc_type(rel_path)
+            yield file_path, source, is_changed
 
-                # 生成 source_id
-                source_id = self._generate_source_id(rel_path)
+    def iter_candidates(
+        self, existing_sources: Optional[dict[str, Source]] = None
+    ) -> Iterator[tuple[Path, Source, bool]]:
+        """单次遍历匹配文件, 不计算哈希
 
-                # 检查是否变更
-                is_changed = True
-                if source_id in existing_sources:
-                    existing = existing_sources[source_id]
-                    is_changed = existing.file_hash != file_hash
+        (size, mtime_ns) 与已索引记录一致的文件视为未变化, 沿用已存储的
+        file_hash; 其余文件的 file_hash 为空串, 由调用方计算
+        (scan() 串行计算, refresh 使用进程池 hash_and_chunk)。
 
-                source = Source(
-                    source_id=source_id,
-                    repo_id=self.repo_id,
-                    path=rel_path,
-                    file_hash=file_hash,
-                    mtime=mtime,
-                    doc_type=doc_type,
-                )
+        Args:
+            existing_sources: 已存在的 source_id -> Source 映射
 
-                yield file_path, source, is_changed
+        Yields:
+            (file_path, source, stat_unchanged) 元组
+        """
+        existing_sources = existing_sources or {}
+        self._last_seen_paths = set()
+
+        for file_path, rel_path, st in self._iter_files():
+            self._last_seen_paths.add(rel_path)
+
+            # 生成 source_id
+            source_id = self._generate_source_id(rel_path)
+
+            stat_unchanged = False
+            file_hash = ""
+            existing = existing_sources.get(source_id)
+            if (
+                existing is not None
+                and existing.size is not None
+                and existing.mtime_ns is not None
+                and existing.size == st.st_size
+                and existing.mtime_ns == st.st_mtime_ns
+            ):
+                stat_unchanged = True
+                file_hash = existing.file_hash
+
+            source = Source(
+                source_id=source_id,
+                repo_id=self.repo_id,
+                path=rel_path,
+                file_hash=file_hash,
+                mtime=int(st.st_mtime),
+                doc_type=self._infer_doc_type(rel_path),
+                size=st.st_size,
+                mtime_ns=st.st_mtime_ns,
+            )
+
+            yield file_path, source, stat_unchanged
 
     def find_deleted(self, existing_sources: dict[str, Source]) -> list[str]:
         """查找已删除的文档
 
+        复用最近一次 scan()/iter_candidates() 遍历到的路径, 未遍历过时重新遍历。
+
         Args:
             existing_sources: 已存在的 source_id -> Source 映射
 
         Returns:
             已删除文档的 source_id 列表
         """
-        current_paths = set()
-        for pattern in self.scan_paths:
-            for file_path in self._glob_files(pattern):
-                if not self._should_exclude(file_path):
-                    rel_path = str(file_path.relative_to(self.root_dir))
-                    current_paths.add(rel_path)
+        current_paths = self._last_seen_paths
+        if current_paths is None:
+            current_paths = {rel_path for _, rel_path, _ in self._iter_files()}
 
         deleted = []
         for source_id, source in existing_sources.items():
@@ -169,36 +248,116 @@ class DocumentScanner:
 
         return deleted
 
-    def _glob_files(self, pattern: str) -> Iterator[Path]:
-        """Glob 匹配文件"""
-        try:
-            yield from self.root_dir.glob(pattern)
-        except Exception:
-            # 忽略无效模式
-            pass
+    def _iter_files(self) -> Iterator[tuple[Path, str, os.stat_result]]:
+        """遍历所有匹配 scan_paths 且未被排除的文件 (去重, 剪枝排除目录)
+
+        Yields:
+            (file_path, rel_path, stat_result) 元组
+        """
+        seen: set[str] = set()
+
+        for base in self._walk_roots():
+            base_path = self.root_dir / base if base else self.root_dir
+
+            if base_path.is_file():
+                entries = [(str(base_path.parent), [], [base_path.name])]
+            elif base_path.is_dir():
+                entries = os.walk(base_path)
+            else:
+                continue
+
+            for dirpath, dirnames, filenames in entries:
+                rel_dir = os.path.relpath(dirpath, self.root_dir)
+                rel_dir = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+
+                # 剪枝: 不进入被排除的目录 (如 node_modules/)
+                dirnames[:] = [
+                    d for d in dirnames
+                    if not self._should_exclude_rel(f"{rel_dir}{d}/")
+                ]
+
+                for name in filenames:
+                    rel_posix = f"{rel_dir}{name}"
+                    if rel_posix in seen:
+                        continue
+                    if not any(m.fullmatch(rel_posix) for m in self._scan_matchers):
+                        continue
+                    if self._should_exclude_rel(rel_posix):
+                        continue
+
+                    file_path = Path(dirpath) / name
+                    try:
+                        st = file_path.stat()
+                    except OSError:
+                        continue
+                    if not stat.S_ISREG(st.st_mode):
+                        continue
+
+                    seen.add(rel_posix)
+                    yield file_path, str(file_path.relative_to(self.root_dir)), st
+
+    def _walk_roots(self) -> list[str]:
+        """计算需要遍历的最小目录集合 (各模式中通配符之前的字面前缀)"""
+        roots = set()
+        for pattern in self.scan_paths:
+            literal = []
+            for part in pattern.split("/"):
+                if any(ch in part for ch in "*?["):
+                    break
+                literal.append(part)
+            roots.add("/".join(literal))
+
+        # 去掉已被祖先目录覆盖的根
+        result: list[str] = []
+        for root in sorted(roots, key=len):
+            if any(not r or root == r or root.startswith(r + "/") for r in result):
+                continue
+            result.append(root)
+        return result
+
+    @staticmethod
+    def _glob_to_regex(pattern: str) -> "re.Pattern[str]":
+        """将 glob 模式转换为正则 (** 匹配零或多级目录, * 不跨目录)"""
+        parts = pattern.split("/")
+        regex = ""
+        for i, part in enumerate(parts):
+            last = i == len(parts) - 1
+            if part == "**":
+                regex += ".*" if last else "(?:.*/)?"
+                continue
+            for ch in part:
+                if ch == "*":
+                    regex += "[^/]*"
+                elif ch == "?":
+                    regex += "[^/]"
+                else:
+                    regex += re.escape(ch)
+            if not last:
+                regex += "/"
+        return re.compile(regex)
 
     def _should_exclude(self, file_path: Path) -> bool:
         """检查是否应排除该文件"""
-        rel_path = str(file_path.relative_to(self.root_dir))
-        for pattern in self.exclude_patterns:
-            # 简单匹配 (支持 ** 和 *)
-            if self._match_pattern(rel_path, pattern):
-                return True
-        return False
+        return self._should_exclude_rel(str(file_path.relative_to(self.root_dir)))
+
+    def _should_exclude_rel(self, rel_path: str) -> bool:
+        """检查相对路径是否命中排除模式"""
+        # 简单匹配 (支持 ** 和 *)
+        return any(regex.search(rel_path) for regex in self._exclude_regexes)
 
     def _match_pattern(self, path: str, pattern: str) -> bool:
         """简单的路径模式匹配"""
         # 将 glob 模式转换为正则
-        regex = pattern.replace("**", ".*").replace("*", "[^/]*")
-        return re.search(regex, path) is not None
+        return re.search(self._exclude_to_regex(pattern), path) is not None
+
+    @staticmethod
+    def _exclude_to_regex(pattern: str) -> str:
+        return pattern.replace("**", ".*").replace("*", "[^/]*")
 
     def _compute_file_hash(self, file_path: Path) -> str:
         """计算文件 SHA256 哈希"""
-        sha256 = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            return compute_file_hash(f.read())
 
     def _infer_doc_type(self, path: str) -> str:
         """推断文档类型"""
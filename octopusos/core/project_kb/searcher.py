@@ -5,6 +5,7 @@
 - BM25 相关性评分
 - 支持路径/类型过滤
 - 生成详细的评分解释 (审计关键)
+- 复用线程本地只读连接, 匹配词/偏移由 FTS5 highlight() 计算
 """
 
 import re
@@ -12,6 +13,7 @@ import sqlite3
 from pathlib import Path
 from typing import Any, Optional
 
+from octopusos.core.project_kb.connections import get_read_connection, reset_read_connection
 from octopusos.core.project_kb.types import (
     DOCUMENT_TYPE_WEIGHTS,
     ChunkResult,
@@ -19,6 +21,14 @@ from octopusos.core.project_kb.types import (
     SearchFilters,
 )
 
+# highlight() 标记 (控制字符, 不会出现在正常文档里)
+HIGHLIGHT_OPEN = "\x01"
+HIGHLIGHT_CLOSE = "\x02"
+_HIGHLIGHT_RE = re.compile(f"{HIGHLIGHT_OPEN}(.*?){HIGHLIGHT_CLOSE}", re.DOTALL)
+
+# kb_chunks_fts 列序号: chunk_id, path, heading, content
+_FTS_CONTENT_COLUMN = 3
+
 
 class ProjectKBSearcher:
     """ProjectKB 检索引擎 - 基于 FTS5 的关键词搜索"""
@@ -32,10 +42,17 @@ class ProjectKBSearcher:
         self.db_path = Path(db_path)
 
     def _get_connection(self) -> sqlite3.Connection:
-        """获取数据库连接"""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+        """获取数据库连接 (线程本地只读连接, 不要 close)"""
+        return get_read_connection(self.db_path)
+
+    def _fetchall(self, sql: str, params: list[Any] | tuple[Any, ...]) -> list[sqlite3.Row]:
+        """在复用连接上执行查询; 连接失效时重建并重试一次"""
+        try:
+            return self._get_connection().execute(sql, params).fetchall()
+        except sqlite3.ProgrammingError:
+            # 连接已被关闭 (例如 close_all_read_connections)
+            reset_read_connection(self.db_path)
+            return self._get_connection().execute(sql, params).fetchall()
 
     def search(
         self,
@@ -62,11 +79,7 @@ class ProjectKBSearcher:
         sql, params = self._build_search_query(fts_query, filters, top_k)
 
         # 执行查询
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(sql, params)
-        rows = cursor.fetchall()
-        conn.close()
+        rows = self._fetchall(sql, params)
 
         # 转换为 ChunkResult
         results = []
@@ -117,7 +130,8 @@ class ProjectKBSearcher:
             s.path,
             s.doc_type,
             s.mtime,
-            fts.rank as fts_rank
+            fts.rank as fts_rank,
+            highlight(kb_chunks_fts, 3, char(1), char(2)) as highlighted
         FROM kb_chunks_fts fts
         JOIN kb_chunks c ON fts.rowid = c.rowid
         JOIN kb_sources s ON c.source_id = s.source_id
@@ -127,6 +141,28 @@ class ProjectKBSearcher:
         params: list[Any] = [fts_query]
 
         # 应用过滤器
+        filter_sql, filter_params = self._build_filter_clause(filters)
+        sql += filter_sql
+        params.extend(filter_params)
+
+        # 排序和限制
+        sql += " ORDER BY fts.rank LIMIT ?"
+        params.append(top_k)
+
+        return sql, params
+
+    def _build_filter_clause(self, filters: SearchFilters) -> tuple[str, list[Any]]:
+        """构建过滤条件 (追加在 WHERE 之后, s = kb_sources)
+
+        Args:
+            filters: 过滤器
+
+        Returns:
+            (sql 片段, params) 元组
+        """
+        sql = ""
+        params: list[Any] = []
+
         if filters.scope:
             sql += " AND s.path LIKE ?"
             params.append(f"{filters.scope}%")
@@ -143,12 +179,79 @@ class ProjectKBSearcher:
             sql += " AND s.mtime <= ?"
             params.append(filters.mtime_before)
 
-        # 排序和限制
-        sql += " ORDER BY fts.rank LIMIT ?"
-        params.append(top_k)
-
         return sql, params
 
+    def get_results_by_ids(
+        self,
+        chunk_ids: list[str],
+        filters: Optional[SearchFilters] = None,
+    ) -> list[ChunkResult]:
+        """按 ID 批量构建 ChunkResult (用于语义召回的、关键词未命中的 chunks)
+
+        结果的关键词分数为 0, 不含匹配词; 同样应用过滤器。
+
+        Args:
+            chunk_ids: Chunk ID 列表
+            filters: 过滤器
+
+        Returns:
+            ChunkResult 列表 (按 chunk_ids 顺序, 不存在或被过滤的跳过)
+        """
+        if not chunk_ids:
+            return []
+        filters = filters or SearchFilters()
+
+        placeholders = ",".join(["?"] * len(chunk_ids))
+        sql = f"""
+        SELECT 
+            c.chunk_id,
+            c.heading,
+            c.start_line,
+            c.end_line,
+            c.content,
+            s.path,
+            s.doc_type,
+            s.mtime
+        FROM kb_chunks c
+        JOIN kb_sources s ON c.source_id = s.source_id
+        WHERE c.chunk_id IN ({placeholders})
+        """
+        params: list[Any] = list(chunk_ids)
+        filter_sql, filter_params = self._build_filter_clause(filters)
+        sql += filter_sql
+        params.extend(filter_params)
+
+        rows = {row["chunk_id"]: row for row in self._fetchall(sql, params)}
+
+        results = []
+        for chunk_id in chunk_ids:
+            row = rows.get(chunk_id)
+            if row is None:
+                continue
+            doc_type = row["doc_type"] or "default"
+            lines = f"L{row['start_line']}-L{row['end_line']}"
+            explanation = Explanation(
+                matched_terms=[],
+                term_frequencies={},
+                document_boost=DOCUMENT_TYPE_WEIGHTS.get(doc_type, 1.0),
+                recency_boost=self._calculate_recency_boost(row["mtime"]),
+                path=row["path"],
+                heading=row["heading"],
+                lines=lines,
+            )
+            results.append(
+                ChunkResult(
+                    chunk_id=row["chunk_id"],
+                    content=row["content"],
+                    heading=row["heading"],
+                    path=row["path"],
+                    lines=lines,
+                    score=0.0,
+                    explanation=explanation,
+                )
+            )
+        return results
+
     def _row_to_result(self, row: sqlite3.Row, query: str, rank: int) -> ChunkResult:
         """将数据库行转换为 ChunkResult
 
@@ -160,14 +263,10 @@ class ProjectKBSearcher:
         Returns:
             ChunkResult 对象
         """
-        # 提取匹配词
-        matched_terms = self._extract_matched_terms(row["content"], query)
-
-        # 计算词频
-        term_frequencies = {}
-        content_lower = row["content"].lower()
-        for term in matched_terms:
-            term_frequencies[term] = content_lower.count(term.lower())
+        # 匹配词 / 词频 / 偏移 (来自 FTS5 highlight, 与 MATCH 使用同一分词器)
+        matched_terms, term_frequencies, match_offsets = self._parse_highlights(
+            row["highlighted"], query
+        )
 
         # 计算文档权重
         doc_type = row["doc_type"] or "default"
@@ -189,6 +288,7 @@ class ProjectKBSearcher:
             path=row["path"],
             heading=row["heading"],
             lines=f"L{row['start_line']}-L{row['end_line']}",
+            match_offsets=match_offsets,
         )
 
         return ChunkResult(
@@ -224,25 +324,44 @@ class ProjectKBSearcher:
         boost = 1.0 + 0.5 * math.exp(-days_old / 30)
         return boost
 
-    def _extract_matched_terms(self, content: str, query: str) -> list[str]:
-        """提取匹配的词
+    def _parse_highlights(
+        self, highlighted: Optional[str], query: str
+    ) -> tuple[list[str], dict[str, int], list[list[int]]]:
+        """解析 highlight() 输出
 
         Args:
-            content: 文档内容
-            query: 查询字符串
+            highlighted: 带标记的 content (命中 token 被 \\x01...\\x02 包裹)
+            query: 原始查询
 
         Returns:
-            匹配词列表
+            (matched_terms, term_frequencies, match_offsets)
+            - match_offsets: 命中 token 在原 content 中的 [start, end) 字符偏移
         """
-        query_terms = set(query.lower().split())
-        content_lower = content.lower()
-
-        matched = []
-        for term in query_terms:
-            if term in content_lower:
-                matched.append(term)
-
-        return matched
+        if not highlighted:
+            return [], {}, []
+
+        query_terms = {term.lower() for term in query.split()}
+        frequencies: dict[str, int] = {}
+        offsets: list[list[int]] = []
+        marker_chars = 0
+
+        for match in _HIGHLIGHT_RE.finditer(highlighted):
+            token = match.group(1)
+            start = match.start() - marker_chars
+            offsets.append([start, start + len(token)])
+            marker_chars += len(HIGHLIGHT_OPEN) + len(HIGHLIGHT_CLOSE)
+
+            token_lower = token.lower()
+            term = token_lower if token_lower in query_terms else None
+            if term is None:
+                # 查询词带标点等情况: 按去标点后的形式归并
+                term = next(
+                    (t for t in query_terms if re.sub(r"\W+", "", t) == token_lower),
+                    token_lower,
+                )
+            frequencies[term] = frequencies.get(term, 0) + 1
+
+        return list(frequencies), frequencies, offsets
 
     def get_chunk_by_id(self, chunk_id: str) -> Optional[dict]:
         """按 ID 获取 chunk (含 source 信息)
@@ -253,10 +372,7 @@ class ProjectKBSearcher:
         Returns:
             Chunk 字典，不存在返回 None
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
+        rows = self._fetchall(
             """
             SELECT 
                 c.chunk_id,
@@ -276,9 +392,7 @@ class ProjectKBSearcher:
             """,
             (chunk_id,),
         )
-
-        row = cursor.fetchone()
-        conn.close()
+        row = rows[0] if rows else None
 
         if not row:
             return None
@@ -15,15 +15,17 @@ import json
 import os
 import time
 import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from octopusos.core.executor.audit_logger import AuditLogger
 from octopusos.core.project_kb.chunker import MarkdownChunker
 from octopusos.core.project_kb.config import ProjectKBConfig, load_config
 from octopusos.core.project_kb.explainer import ResultExplainer
 from octopusos.core.project_kb.indexer import ProjectKBIndexer, FTS5NotAvailableError
-from octopusos.core.project_kb.scanner import DocumentScanner
+from octopusos.core.project_kb.scanner import DocumentScanner, hash_and_chunk
 from octopusos.core.project_kb.searcher import ProjectKBSearcher
 from octopusos.core.project_kb.policy import resolve_retrieval_policy
 from octopusos.core.project_kb.types import (
@@ -31,6 +33,7 @@ from octopusos.core.project_kb.types import (
     ChunkResult,
     RefreshReport,
     SearchFilters,
+    Source,
 )
 from octopusos.store import get_db_path
 
@@ -38,6 +41,12 @@ from octopusos.store import get_db_path
 class ProjectKBService:
     """项目知识库服务 - 可审计的文档检索"""
 
+    # refresh 时每个事务包含的文件数
+    REFRESH_BATCH_SIZE = 200
+
+    # 待处理文件数达到该值才启用进程池
+    PARALLEL_MIN_FILES = 64
+
     def __init__(
         self,
         root_dir: Optional[Path] = None,
@@ -92,8 +101,13 @@ class ProjectKBService:
                 from octopusos.core.project_kb.reranker import VectorReranker
 
                 provider = create_provider(config.vector_rerank)
-                self.embedding_manager = EmbeddingManager(self.db_path, provider)
-                self.reranker = VectorReranker(self.embedding_manager, provider)
+                self.embedding_manager = EmbeddingManager(
+                    self.db_path,
+                    provider,
+                    ivf_min_vectors=config.vector_rerank.ivf_min_vectors,
+                    ivf_nprobe=config.vector_rerank.ivf_nprobe,
+                )
+                self.reranker = VectorReranker(self.embedding_manager, provider, self.searcher)
             except ImportError as e:
                 if not fail_safe:
                     raise
@@ -226,7 +240,9 @@ class ProjectKBService:
             
             # 向量 rerank (如果启用)
             if should_rerank and self.reranker:
-                results = self.reranker.rerank(query, results, self.config.vector_rerank)
+                results = self.reranker.rerank(
+                    query, results, self.config.vector_rerank, filters=search_filters
+                )
 
             final_results = results[:top_k]
             top_sources = self._top_sources(final_results)
@@ -388,43 +404,47 @@ class ProjectKBService:
         # 扫描文档
         total_files = 0
         changed_files = 0
-        new_chunks = 0
         errors = []
 
-        for file_path, source, is_changed in self.scanner.scan(existing_sources):
-            total_files += 1
-
-            if not is_changed and changed_only:
-                continue
-
-            changed_files += 1
-
-            try:
-                # 更新 source
-                self.indexer.upsert_source(source)
-
-                # 删除旧 chunks
-                if is_changed:
-                    self.indexer.delete_chunks_by_source(source.source_id)
-
-                # 切片并索引
-                for chunk in self.chunker.chunk_file(source.source_id, file_path):
-                    self.indexer.insert_chunk(chunk)
-                    new_chunks += 1
-
-            except Exception as e:
-                errors.append(f"{source.path}: {str(e)}")
-
-        # 查找已删除文档
-        deleted_sources = []
-        deleted_chunks = 0
-        if changed_only:
-            deleted_sources = self.scanner.find_deleted(existing_sources)
-            for source_id in deleted_sources:
-                # 统计 chunks 数量 (删除前)
-                chunk_count = self.indexer.count_chunks_by_source(source_id)
-                deleted_chunks += chunk_count
-                self.indexer.delete_source(source_id)
+        # 批量索引会话: 单连接 + 每批文件一个事务, 结束时统一 FTS optimize
+        with self.indexer.bulk_session(batch_size=self.REFRESH_BATCH_SIZE) as session:
+            # 单次遍历: stat 未变化的文件直接跳过 (不读盘、不哈希)
+            pending = []
+            for file_path, source, stat_unchanged in self.scanner.iter_candidates(existing_sources):
+                total_files += 1
+                if stat_unchanged and changed_only:
+                    continue
+                existing = existing_sources.get(source.source_id)
+                pending.append((file_path, source, existing.file_hash if existing else None))
+
+            # 哈希 + 切片 (大批量时走进程池), 结果按顺序流式写入索引
+            for (file_path, source, _), outcome in zip(pending, self._hash_and_chunk_all(pending)):
+                if isinstance(outcome, Exception):
+                    errors.append(f"{source.path}: {str(outcome)}")
+                    continue
+
+                file_hash, chunks = outcome
+                source.file_hash = file_hash
+                if chunks is None:
+                    # 内容未变, 只是 mtime 变化: 刷新 stat 供下次快速路径
+                    session.touch_source(source)
+                    continue
+
+                changed_files += 1
+                session.add_file(source, chunks, replace=True)
+
+            session.flush()
+
+            # 查找已删除文档 (复用本次遍历结果)
+            deleted_sources = []
+            deleted_chunks = 0
+            if changed_only:
+                deleted_sources = self.scanner.find_deleted(existing_sources)
+                deleted_chunks = session.delete_sources(deleted_sources)
+
+        # 批次写入失败的文件 (已逐文件隔离重试)
+        errors.extend(session.errors)
+        new_chunks = session.stats["chunks"]
 
         # 更新元数据
         self.indexer.update_meta("last_refresh", str(int(time.time())))
@@ -442,7 +462,8 @@ class ProjectKBService:
                 embed_stats = self.embedding_manager.refresh_embeddings(chunks_to_embed)
                 print(
                     f"  Embeddings: {embed_stats['processed']} processed, "
-                    f"{embed_stats['skipped']} skipped"
+                    f"{embed_stats['skipped']} skipped, "
+                    f"{embed_stats['cache_hits']} reused from cache"
                 )
 
         return RefreshReport(
@@ -456,6 +477,59 @@ class ProjectKBService:
             errors=errors,
         )
 
+    def _refresh_workers(self, file_count: int) -> int:
+        """计算刷新使用的进程数 (文件较少时串行, 避免进程池启动开销)"""
+        if file_count < self.PARALLEL_MIN_FILES:
+            return 1
+        workers = self.config.refresh_workers or os.cpu_count() or 1
+        return max(1, min(workers, file_count))
+
+    def _hash_and_chunk_all(self, pending: list[tuple[Path, Source, Optional[str]]]) -> Iterator:
+        """按输入顺序产出每个文件的 (file_hash, chunks) 或异常
+
+        进程池中同时在途的任务数有上限, 结果流式交给调用方写入,
+        不会把整个仓库的 chunks 堆在内存里。
+        """
+        workers = self._refresh_workers(len(pending))
+
+        if workers > 1:
+            try:
+                executor = ProcessPoolExecutor(max_workers=workers)
+            except (OSError, NotImplementedError) as e:
+                print(f"⚠️  Parallel refresh unavailable, falling back to serial: {e}")
+                workers = 1
+
+        if workers == 1:
+            for file_path, source, previous_hash in pending:
+                try:
+                    yield hash_and_chunk(file_path, source.source_id, previous_hash, self.chunker)
+                except Exception as e:
+                    yield e
+            return
+
+        window = workers * 8
+        with executor:
+            in_flight: deque = deque()
+            items = iter(pending)
+            for file_path, source, previous_hash in items:
+                in_flight.append(
+                    executor.submit(hash_and_chunk, file_path, source.source_id, previous_hash, self.chunker)
+                )
+                if len(in_flight) >= window:
+                    break
+            while in_flight:
+                future = in_flight.popleft()
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield e
+                next_item = next(items, None)
+                if next_item is not None:
+                    file_path, source, previous_hash = next_item
+                    in_flight.append(
+                        executor.submit(hash_and_chunk, file_path, source.source_id, previous_hash, self.chunker)
+                    )
+
     def explain(self, result: ChunkResult) -> str:
         """生成人类可读的结果解释 (审计)
 
@@ -23,6 +23,8 @@ class Source:
     doc_type: Optional[str] = None  # adr/runbook/spec/guide/index
     language: str = "markdown"
     tags: list[str] = field(default_factory=list)
+    size: Optional[int] = None  # 文件大小 (stat 快速路径)
+    mtime_ns: Optional[int] = None  # 纳秒级修改时间 (stat 快速路径)
 
 
 @dataclass
@@ -55,6 +57,7 @@ class Explanation:
     path: Optional[str] = None
     heading: Optional[str] = None
     lines: Optional[str] = None
+    match_offsets: Optional[list[list[int]]] = None  # 命中词在 content 中的 [start, end) 偏移
 
     # [P2] 向量评分 (可选)
     keyword_score: Optional[float] = None
@@ -78,6 +81,8 @@ class Explanation:
             result["heading"] = self.heading
         if self.lines:
             result["lines"] = self.lines
+        if self.match_offsets is not None:
+            result["match_offsets"] = self.match_offsets
         if self.keyword_score is not None:
             result["keyword_score"] = self.keyword_score
         if self.vector_score is not None:
@@ -1,6 +1,6 @@
 """Task-Driven Architecture: Task as the root aggregate for full traceability"""
 
-from octopusos.core.task.models import Task, TaskContext, TaskTrace, TaskLineageEntry
+from octopusos.core.task.models import Task, TaskContext, TaskPage, TaskTrace, TaskLineageEntry
 from octopusos.core.task.manager import TaskManager
 from octopusos.core.task.trace_builder import TraceBuilder
 from octopusos.core.task.run_mode import RunMode, ModelPolicy, TaskMetadata
@@ -25,6 +25,7 @@ __all__ = [
     # Models
     "Task",
     "TaskContext",
+    "TaskPage",
     "TaskTrace",
     "TaskLineageEntry",
     # Managers
@@ -9,6 +9,7 @@ Key Features:
 3. Cycle detection and prevention
 4. Topological sort for execution ordering
 5. Export to GraphViz DOT format
+6. Incremental cycle checks against a cached in-memory dependency graph
 
 Created for Phase 5.3: Cross-repository dependency auto-generation
 
@@ -30,6 +31,12 @@ Usage Example:
     deps = dep_service.get_dependencies(task.task_id)
     reverse_deps = dep_service.get_reverse_dependencies(task.task_id)
 
+    # Bulk insert (validated for cycles in one pass, one transaction)
+    dep_service.create_dependencies([
+        (work_item_id, prerequisite_id, "blocks", "Planned order"),
+        ...
+    ])
+
     # Build and query DAG
     graph = dep_service.build_dependency_graph()
     ancestors = graph.get_ancestors(task.task_id)
@@ -39,12 +46,13 @@ Usage Example:
 import json
 import logging
 import sqlite3
+import threading
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from octopusos.core.task.models import Task, DependencyType, TaskDependency
 from octopusos.core.task.repo_context import ExecutionEnv
@@ -322,6 +330,198 @@ class DependencyGraph:
         return "\n".join(lines)
 
 
+class IncrementalDependencyGraph:
+    """In-memory dependency adjacency kept in sync with task_dependency
+
+    Built once per database and then updated by TaskDependencyService on
+    create/delete, so cycle checks no longer reload every row and run a full
+    DFS. A version token (row count + AUTOINCREMENT sequence) detects writes made
+    elsewhere (other processes, cascading task deletes) and triggers a rebuild.
+
+    Edges are counted per (task_id, depends_on_task_id) pair because the same
+    pair may exist once per dependency type.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[str, str]], version_token: Tuple[int, int]):
+        """Initialize graph
+
+        Args:
+            rows: (task_id, depends_on_task_id) pairs, one per dependency row
+            version_token: (row count, sequence) the rows correspond to
+        """
+        self.version_token = version_token
+        self.lock = threading.RLock()
+        # task -> {dependency: edge count}
+        self._forward: Dict[str, Dict[str, int]] = defaultdict(dict)
+        # dependency -> {dependent: edge count}
+        self._reverse: Dict[str, Dict[str, int]] = defaultdict(dict)
+        for task_id, depends_on_task_id in rows:
+            self.add_edge(task_id, depends_on_task_id)
+
+    def add_edge(self, task_id: str, depends_on_task_id: str) -> None:
+        """Record one dependency row"""
+        forward = self._forward[task_id]
+        forward[depends_on_task_id] = forward.get(depends_on_task_id, 0) + 1
+        reverse = self._reverse[depends_on_task_id]
+        reverse[task_id] = reverse.get(task_id, 0) + 1
+
+    def remove_edge(self, task_id: str, depends_on_task_id: str, count: int = 1) -> None:
+        """Forget `count` dependency rows of a pair"""
+        for graph, a, b in (
+            (self._forward, task_id, depends_on_task_id),
+            (self._reverse, depends_on_task_id, task_id),
+        ):
+            neighbors = graph.get(a)
+            if not neighbors or b not in neighbors:
+                continue
+            remaining = neighbors[b] - count
+            if remaining > 0:
+                neighbors[b] = remaining
+            else:
+                del neighbors[b]
+                if not neighbors:
+                    del graph[a]
+
+    def edge_count(self) -> int:
+        """Number of dependency rows represented"""
+        return sum(sum(neighbors.values()) for neighbors in self._forward.values())
+
+    def find_path(self, start: str, goal: str) -> Optional[List[str]]:
+        """Find a dependency path start -> ... -> goal
+
+        Bidirectional BFS (forward from start, backward from goal), always
+        expanding the smaller frontier, so the search only touches the part of
+        the graph between the two tasks rather than every dependency row.
+
+        Args:
+            start: Task ID the path starts at
+            goal: Task ID the path must reach
+
+        Returns:
+            Task IDs along the path (inclusive), or None if unreachable
+        """
+        if start == goal:
+            return [start]
+        if not self._forward.get(start) or not self._reverse.get(goal):
+            return None
+
+        forward_parent: Dict[str, Optional[str]] = {start: None}
+        backward_parent: Dict[str, Optional[str]] = {goal: None}
+        forward_frontier = [start]
+        backward_frontier = [goal]
+
+        while forward_frontier and backward_frontier:
+            if len(forward_frontier) <= len(backward_frontier):
+                next_frontier = []
+                for node in forward_frontier:
+                    for neighbor in self._forward.get(node, ()):
+                        if neighbor in forward_parent:
+                            continue
+                        forward_parent[neighbor] = node
+                        if neighbor in backward_parent:
+                            return self._join(neighbor, forward_parent, backward_parent)
+                        next_frontier.append(neighbor)
+                forward_frontier = next_frontier
+            else:
+                next_frontier = []
+                for node in backward_frontier:
+                    for neighbor in self._reverse.get(node, ()):
+                        if neighbor in backward_parent:
+                            continue
+                        backward_parent[neighbor] = node
+                        if neighbor in forward_parent:
+                            return self._join(neighbor, forward_parent, backward_parent)
+                        next_frontier.append(neighbor)
+                backward_frontier = next_frontier
+
+        return None
+
+    @staticmethod
+    def _join(
+        meeting: str,
+        forward_parent: Dict[str, Optional[str]],
+        backward_parent: Dict[str, Optional[str]],
+    ) -> List[str]:
+        head = []
+        node: Optional[str] = meeting
+        while node is not None:
+            head.append(node)
+            node = forward_parent[node]
+        head.reverse()
+        node = backward_parent[meeting]
+        while node is not None:
+            head.append(node)
+            node = backward_parent[node]
+        return head
+
+    def cycle_if_added(self, task_id: str, depends_on_task_id: str) -> Optional[List[str]]:
+        """Cycle that adding task_id -> depends_on_task_id would close
+
+        The new edge closes a cycle iff task_id is already reachable from
+        depends_on_task_id.
+
+        Returns:
+            Cycle as [task_id, depends_on_task_id, ..., task_id], or None
+        """
+        path = self.find_path(depends_on_task_id, task_id)
+        if path is None:
+            return None
+        return [task_id] + path
+
+
+# Cached graphs (by database file)
+_DEPENDENCY_GRAPHS: Dict[str, IncrementalDependencyGraph] = {}
+_DEPENDENCY_GRAPHS_LOCK = threading.Lock()
+
+
+def _database_key(db) -> str:
+    """Cache key of a connection: database file path (connection id for in-memory)"""
+    try:
+        for row in db.execute("PRAGMA database_list").fetchall():
+            if row[1] == "main" and row[2]:
+                return row[2]
+    except sqlite3.Error:
+        pass
+    return f"conn:{id(db)}"
+
+
+def dependency_version_token(db) -> Tuple[int, int]:
+    """(row count, AUTOINCREMENT sequence) of task_dependency
+
+    The sequence never goes down, so any insert raises it and any delete
+    lowers the count.
+    """
+    row = db.execute(
+        """
+        SELECT
+            (SELECT COUNT(*) FROM task_dependency),
+            COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'task_dependency'), 0)
+        """
+    ).fetchone()
+    return (row[0], row[1])
+
+
+def invalidate_dependency_graph(db=None) -> None:
+    """Drop cached dependency graphs
+
+    Args:
+        db: Connection whose graph to drop (None = all)
+    """
+    with _DEPENDENCY_GRAPHS_LOCK:
+        if db is None:
+            _DEPENDENCY_GRAPHS.clear()
+        else:
+            _DEPENDENCY_GRAPHS.pop(_database_key(db), None)
+
+
+DependencySpec = Union[
+    TaskDependency,
+    Tuple[str, str, Union[str, DependencyType], str],
+    Tuple[str, str, Union[str, DependencyType], str, str],
+    Tuple[str, str, Union[str, DependencyType], str, str, Optional[Dict[str, Any]]],
+]
+
+
 class TaskDependencyService:
     """Service for managing task dependencies and auto-detection
 
@@ -515,9 +715,11 @@ class TaskDependencyService:
             if audit.operation == "read" and audit.files_changed:
                 files_read.update(audit.files_changed)
 
-        # For each file read, find who last modified it
-        for file_path in files_read:
-            modifier_task_id = self._find_last_modifier(file_path, task.task_id)
+        # Resolve the last modifier of every file read in one indexed query
+        last_modifiers = self._find_last_modifiers(files_read, task.task_id)
+
+        for file_path in sorted(files_read):
+            modifier_task_id = last_modifiers.get(file_path)
 
             if modifier_task_id and modifier_task_id != task.task_id:
                 reason = f"Reads file {file_path} modified by task {modifier_task_id}"
@@ -536,39 +738,65 @@ class TaskDependencyService:
 
         return dependencies
 
-    def _find_last_modifier(self, file_path: str, before_task_id: str) -> Optional[str]:
-        """Find the last task that modified a file
+    def _find_last_modifiers(
+        self,
+        file_paths: Iterable[str],
+        before_task_id: str
+    ) -> Dict[str, str]:
+        """Find the last task that modified each file
+
+        Uses the task_file_writes ledger (filled from write audits, indexed by
+        path) instead of scanning task_audits payloads.
 
         Args:
-            file_path: File path
-            before_task_id: Only consider tasks created before this one
+            file_paths: File paths
+            before_task_id: Task to exclude (the reader itself)
 
         Returns:
-            Task ID of last modifier, or None
+            Dict mapping file path -> task ID of its last modifier
         """
+        paths = sorted(set(file_paths))
+        if not paths:
+            return {}
+
         try:
-            # Query based on payload JSON structure (operation is embedded in payload)
             cursor = self.db.execute(
                 """
-                SELECT DISTINCT ta.task_id
-                FROM task_audits ta
-                WHERE ta.event_type LIKE '%write%'
-                  AND ta.payload LIKE ?
-                  AND ta.task_id != ?
-                ORDER BY ta.created_at DESC
-                LIMIT 1
+                SELECT path, task_id
+                FROM (
+                    SELECT
+                        fw.path,
+                        fw.task_id,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY fw.path
+                            ORDER BY fw.created_at DESC, fw.write_id DESC
+                        ) AS rn
+                    FROM task_file_writes fw
+                    WHERE fw.path IN (SELECT value FROM json_each(?))
+                      AND fw.task_id != ?
+                )
+                WHERE rn = 1
                 """,
-                (f'%{file_path}%', before_task_id)
+                (json.dumps(paths), before_task_id)
             )
-
-            row = cursor.fetchone()
-            if row:
-                return row[0]
+            return {row[0]: row[1] for row in cursor.fetchall()}
 
         except Exception as e:
-            logger.warning(f"Error finding last modifier for {file_path}: {e}")
+            logger.warning(f"Error finding last modifiers for {len(paths)} files: {e}")
 
-        return None
+        return {}
+
+    def _find_last_modifier(self, file_path: str, before_task_id: str) -> Optional[str]:
+        """Find the last task that modified a file
+
+        Args:
+            file_path: File path
+            before_task_id: Only consider tasks created before this one
+
+        Returns:
+            Task ID of last modifier, or None
+        """
+        return self._find_last_modifiers([file_path], before_task_id).get(file_path)
 
     def _deduplicate_dependencies(
         self,
@@ -674,6 +902,13 @@ class TaskDependencyService:
         dependency.dependency_id = cursor.lastrowid
         self.db.commit()
 
+        graph = self._cached_graph()
+        if graph is not None:
+            with graph.lock:
+                graph.add_edge(task_id, depends_on_task_id)
+                count, max_id = graph.version_token
+                graph.version_token = (count + 1, max(max_id, dependency.dependency_id or 0))
+
         logger.info(
             f"Created dependency: {task_id} -> {depends_on_task_id} "
             f"(type={dependency_type.value}, by={created_by})"
@@ -706,30 +941,142 @@ class TaskDependencyService:
         Raises:
             CircularDependencyError: If adding dependency would create cycle
         """
-        # Build temporary graph with new edge
-        existing_deps = self.get_all_dependencies()
+        graph = self.get_incremental_graph()
+        with graph.lock:
+            cycle = graph.cycle_if_added(task_id, depends_on_task_id)
+            if cycle:
+                raise CircularDependencyError(
+                    f"Adding this dependency would create cycle: {cycle}"
+                )
+
+            # Safe to create
+            return self.create_dependency(
+                task_id, depends_on_task_id, dependency_type, reason, created_by, metadata
+            )
 
-        # Simulate adding the new dependency
-        temp_deps = existing_deps + [TaskDependency(
-            task_id=task_id,
-            depends_on_task_id=depends_on_task_id,
-            dependency_type=dependency_type if isinstance(dependency_type, DependencyType) else DependencyType(dependency_type),
-            reason=reason,
-        )]
+    def create_dependencies(
+        self,
+        dependencies: Iterable[DependencySpec],
+        created_by: str = "manual",
+    ) -> List[TaskDependency]:
+        """Create a batch of dependencies with cycle detection
 
-        temp_graph = DependencyGraph(temp_deps)
+        All edges are validated against the cached graph (and each other) in
+        one pass, then inserted in a single transaction. Nothing is written if
+        any edge would close a cycle or an insert fails.
 
-        # Check for cycles
-        cycles = temp_graph.find_cycles()
-        if cycles:
-            raise CircularDependencyError(
-                f"Adding this dependency would create cycle: {cycles[0]}"
-            )
+        Args:
+            dependencies: TaskDependency objects or tuples of
+                (task_id, depends_on_task_id, dependency_type, reason[, created_by[, metadata]])
+            created_by: Default creator identifier for tuple entries
 
-        # Safe to create
-        return self.create_dependency(
-            task_id, depends_on_task_id, dependency_type, reason, created_by, metadata
-        )
+        Returns:
+            Created TaskDependency objects (with dependency_id set), in input order
+
+        Raises:
+            CircularDependencyError: If any edge would create a cycle
+            sqlite3.IntegrityError: If a dependency already exists
+        """
+        now = utc_now_iso()
+        batch: List[TaskDependency] = []
+        for spec in dependencies:
+            if isinstance(spec, TaskDependency):
+                dependency = spec
+                if not isinstance(dependency.dependency_type, DependencyType):
+                    dependency.dependency_type = DependencyType(dependency.dependency_type)
+                dependency.created_by = dependency.created_by or created_by
+                dependency.created_at = dependency.created_at or now
+            else:
+                task_id, depends_on_task_id, dependency_type, reason, *rest = spec
+                dependency = TaskDependency(
+                    task_id=task_id,
+                    depends_on_task_id=depends_on_task_id,
+                    dependency_type=dependency_type if isinstance(dependency_type, DependencyType) else DependencyType(dependency_type),
+                    reason=reason,
+                    created_by=rest[0] if rest else created_by,
+                    created_at=now,
+                    metadata=(rest[1] if len(rest) > 1 else None) or {},
+                )
+            batch.append(dependency)
+
+        if not batch:
+            return []
+
+        graph = self.get_incremental_graph()
+        with graph.lock:
+            # Tentatively add edges so later entries are checked against earlier ones
+            added = 0
+            try:
+                for dependency in batch:
+                    cycle = graph.cycle_if_added(dependency.task_id, dependency.depends_on_task_id)
+                    if cycle:
+                        raise CircularDependencyError(
+                            f"Adding this dependency would create cycle: {cycle}"
+                        )
+                    graph.add_edge(dependency.task_id, dependency.depends_on_task_id)
+                    added += 1
+
+                rows = [dependency.to_dict() for dependency in batch]
+                try:
+                    for dependency, db_dict in zip(batch, rows):
+                        cursor = self.db.execute(
+                            """
+                            INSERT INTO task_dependency (
+                                task_id, depends_on_task_id, dependency_type, reason,
+                                created_at, created_by, metadata
+                            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                            """,
+                            (
+                                db_dict["task_id"],
+                                db_dict["depends_on_task_id"],
+                                db_dict["dependency_type"],
+                                db_dict["reason"],
+                                db_dict["created_at"],
+                                db_dict["created_by"],
+                                db_dict["metadata"],
+                            )
+                        )
+                        dependency.dependency_id = cursor.lastrowid
+                    self.db.commit()
+                except Exception:
+                    self.db.rollback()
+                    raise
+            except Exception:
+                for dependency in batch[:added]:
+                    graph.remove_edge(dependency.task_id, dependency.depends_on_task_id)
+                raise
+
+            count, max_id = graph.version_token
+            graph.version_token = (count + len(batch), max(max_id, batch[-1].dependency_id or 0))
+
+        logger.info(f"Created {len(batch)} dependencies (by={created_by})")
+        return batch
+
+    def get_incremental_graph(self) -> IncrementalDependencyGraph:
+        """Cached dependency graph for this database (rebuilt if stale)
+
+        Returns:
+            IncrementalDependencyGraph matching the current task_dependency rows
+        """
+        key = _database_key(self.db)
+        token = dependency_version_token(self.db)
+
+        with _DEPENDENCY_GRAPHS_LOCK:
+            graph = _DEPENDENCY_GRAPHS.get(key)
+            if graph is not None and graph.version_token == token:
+                return graph
+
+            rows = self.db.execute(
+                "SELECT task_id, depends_on_task_id FROM task_dependency"
+            ).fetchall()
+            graph = IncrementalDependencyGraph(((row[0], row[1]) for row in rows), token)
+            _DEPENDENCY_GRAPHS[key] = graph
+            logger.debug(f"Built dependency graph: {len(rows)} edges")
+            return graph
+
+    def _cached_graph(self) -> Optional[IncrementalDependencyGraph]:
+        with _DEPENDENCY_GRAPHS_LOCK:
+            return _DEPENDENCY_GRAPHS.get(_database_key(self.db))
 
     def get_dependencies(self, task_id: str) -> List[TaskDependency]:
         """Get all dependencies of a task
@@ -862,6 +1209,13 @@ class TaskDependencyService:
         self.db.commit()
         deleted = cursor.rowcount > 0
 
+        graph = self._cached_graph()
+        if deleted and graph is not None:
+            with graph.lock:
+                graph.remove_edge(task_id, depends_on_task_id, cursor.rowcount)
+                count, max_id = graph.version_token
+                graph.version_token = (count - cursor.rowcount, max_id)
+
         if deleted:
             logger.info(f"Deleted dependency: {task_id} -> {depends_on_task_id}")
 
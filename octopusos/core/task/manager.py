@@ -1,9 +1,10 @@
 """Task Manager: CRUD and aggregation for tasks"""
 
+import base64
 import json
 import sqlite3
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
 import logging
 from octopusos.core.time import utc_now, utc_now_iso
@@ -19,12 +20,91 @@ except ImportError:
         def from_datetime(dt):
             return str(uuid.uuid4())
 
-from octopusos.core.task.models import Task, TaskLineageEntry, TaskTrace
+from octopusos.core.task.models import Task, TaskLineageEntry, TaskPage, TaskTrace
 from octopusos.core.task.trace_builder import TraceBuilder
 from octopusos.store import get_db
 
 logger = logging.getLogger(__name__)
 
+# Columns read by task listings; the detail columns hold JSON blobs that list
+# views never render and are skipped by the summary projection.
+_TASK_DETAIL_COLUMNS = ("metadata", "route_plan_json", "requirements_json")
+_TASK_LIST_COLUMNS = (
+    "task_id", "title", "status", "session_id", "project_id", "created_at", "updated_at",
+    "created_by", "exit_reason", "selected_instance_id", "router_version", "spec_frozen",
+    "repo_id", "workdir",
+) + _TASK_DETAIL_COLUMNS
+
+
+def encode_task_cursor(created_at: Optional[str], task_id: str) -> str:
+    """Encode the (created_at, task_id) position of a task as an opaque cursor.
+
+    A NULL created_at is kept as null so the next page resumes inside the
+    NULL tail rather than skipping it.
+    """
+    raw = json.dumps([created_at, task_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_task_cursor(cursor: str) -> Tuple[Optional[str], str]:
+    """Decode a cursor from encode_task_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, task_id = json.loads(raw)
+    except Exception as e:
+        raise ValueError(f"Invalid task cursor: {cursor!r}") from e
+    if not isinstance(created_at, (str, type(None))) or not isinstance(task_id, str):
+        raise ValueError(f"Invalid task cursor: {cursor!r}")
+    return created_at, task_id
+
+
+def task_cursor_condition(cursor: str, id_col: str = "task_id") -> Tuple[str, List[Any]]:
+    """Build the WHERE condition for rows after a cursor in created_at DESC, id DESC order.
+
+    SQLite sorts NULL created_at last in that order, and a row-value comparison
+    against NULL is never true, so the NULL tail is matched explicitly. The
+    columns stay bare so the (created_at, task_id) indexes still serve the scan.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    created_at, task_id = decode_task_cursor(cursor)
+    if created_at is None:
+        return f"(created_at IS NULL AND {id_col} < ?)", [task_id]
+    return (
+        f"((created_at, {id_col}) < (?, ?) OR created_at IS NULL)",
+        [created_at, task_id],
+    )
+
+
+def _row_to_task(row: sqlite3.Row) -> Task:
+    """Build a Task from a (possibly projected) tasks row."""
+    values = dict(zip(row.keys(), row))
+    metadata = values.get("metadata")
+    return Task(
+        task_id=values["task_id"],
+        title=values["title"],
+        status=values["status"],
+        session_id=values.get("session_id"),
+        project_id=values.get("project_id"),
+        created_at=values.get("created_at"),
+        updated_at=values.get("updated_at"),
+        created_by=values.get("created_by"),
+        metadata=json.loads(metadata) if metadata else {},
+        exit_reason=values.get("exit_reason"),
+        route_plan_json=values.get("route_plan_json"),
+        requirements_json=values.get("requirements_json"),
+        selected_instance_id=values.get("selected_instance_id"),
+        router_version=values.get("router_version"),
+        spec_frozen=values.get("spec_frozen") or 0,  # Task #4
+        repo_id=values.get("repo_id"),  # v0.4
+        workdir=values.get("workdir"),  # v0.4
+    )
+
 
 class TaskManager:
     """Task Manager: CRUD + aggregation queries"""
@@ -339,113 +419,122 @@ class TaskManager:
         offset: int = 0,
         status_filter: Optional[str] = None,
         orphan_only: bool = False,
+        cursor: Optional[str] = None,
+        summary: bool = False,
     ) -> List[Task]:
         """
-        List tasks
+        List tasks (newest first)
         
         Args:
             limit: Maximum number of tasks
-            offset: Offset for pagination
+            offset: Offset for pagination (prefer cursor for deep pages)
             status_filter: Filter by status
             orphan_only: Show only orphan tasks
+            cursor: Keyset cursor from a previous TaskPage.next_cursor
+            summary: Skip metadata/route_plan_json/requirements_json
             
         Returns:
             List of tasks
         """
         conn, should_close = self._get_conn()
         try:
-            cursor = conn.cursor()
-            
-            query = "SELECT * FROM tasks WHERE 1=1"
-            params = []
-            
-            if status_filter:
-                query += " AND status = ?"
-                params.append(status_filter)
-            
-            if orphan_only:
-                query += " AND (status = 'orphan' OR json_extract(metadata, '$.orphan') = 1)"
-            
-            query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
-            
-            rows = cursor.execute(query, params).fetchall()
-            
-            tasks = []
-            for row in rows:
-                metadata = json.loads(row["metadata"]) if row["metadata"] else {}
+            return self._select_tasks(
+                conn,
+                limit=limit,
+                offset=offset,
+                status_filter=status_filter,
+                orphan_only=orphan_only,
+                cursor=cursor,
+                summary=summary,
+            )
+        finally:
+            if should_close:
+                conn.close()
 
-                # Safe access for optional router fields
-                try:
-                    route_plan_json = row["route_plan_json"]
-                except (KeyError, IndexError):
-                    route_plan_json = None
+    def list_tasks_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        status_filter: Optional[str] = None,
+        orphan_only: bool = False,
+        summary: bool = True,
+    ) -> TaskPage:
+        """
+        List one page of tasks with keyset pagination on (created_at, task_id)
 
-                try:
-                    requirements_json = row["requirements_json"]
-                except (KeyError, IndexError):
-                    requirements_json = None
+        Each page costs the same whatever its depth, unlike LIMIT/OFFSET.
 
-                try:
-                    selected_instance_id = row["selected_instance_id"]
-                except (KeyError, IndexError):
-                    selected_instance_id = None
+        Args:
+            limit: Page size
+            cursor: next_cursor of the previous page (None for the first page)
+            status_filter: Filter by status
+            orphan_only: Show only orphan tasks
+            summary: Skip metadata/route_plan_json/requirements_json (default)
 
-                try:
-                    router_version = row["router_version"]
-                except (KeyError, IndexError):
-                    router_version = None
+        Returns:
+            TaskPage with next_cursor=None on the last page
 
-                # Task #4: Safe access for v0.4 fields
-                try:
-                    project_id = row["project_id"]
-                except (KeyError, IndexError):
-                    project_id = None
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        conn, should_close = self._get_conn()
+        try:
+            tasks = self._select_tasks(
+                conn,
+                limit=limit + 1,
+                status_filter=status_filter,
+                orphan_only=orphan_only,
+                cursor=cursor,
+                summary=summary,
+            )
+        finally:
+            if should_close:
+                conn.close()
 
-                try:
-                    exit_reason = row["exit_reason"]
-                except (KeyError, IndexError):
-                    exit_reason = None
+        if len(tasks) <= limit:
+            return TaskPage(tasks=tasks)
+        tasks = tasks[:limit]
+        last = tasks[-1]
+        return TaskPage(tasks=tasks, next_cursor=encode_task_cursor(last.created_at, last.task_id))
 
-                try:
-                    spec_frozen = row["spec_frozen"]
-                except (KeyError, IndexError):
-                    spec_frozen = 0
+    def _select_tasks(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        limit: int,
+        offset: int = 0,
+        status_filter: Optional[str] = None,
+        orphan_only: bool = False,
+        cursor: Optional[str] = None,
+        summary: bool = False,
+    ) -> List[Task]:
+        """Run a task listing query with an explicit column projection."""
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(tasks)")}
+        columns = [
+            column for column in _TASK_LIST_COLUMNS
+            if column in existing and not (summary and column in _TASK_DETAIL_COLUMNS)
+        ]
 
-                try:
-                    repo_id = row["repo_id"]
-                except (KeyError, IndexError):
-                    repo_id = None
+        query = f"SELECT {', '.join(columns)} FROM tasks WHERE 1=1"
+        params: List[Any] = []
 
-                try:
-                    workdir = row["workdir"]
-                except (KeyError, IndexError):
-                    workdir = None
+        if status_filter:
+            query += " AND status = ?"
+            params.append(status_filter)
 
-                tasks.append(Task(
-                    task_id=row["task_id"],
-                    title=row["title"],
-                    status=row["status"],
-                    session_id=row["session_id"],
-                    project_id=project_id,
-                    created_at=row["created_at"],
-                    updated_at=row["updated_at"],
-                    created_by=row["created_by"],
-                    metadata=metadata,
-                    exit_reason=exit_reason,
-                    route_plan_json=route_plan_json,
-                    requirements_json=requirements_json,
-                    selected_instance_id=selected_instance_id,
-                    router_version=router_version,
-                    spec_frozen=spec_frozen,  # Task #4
-                    repo_id=repo_id,  # v0.4
-                    workdir=workdir,  # v0.4
-                ))
+        if orphan_only:
+            query += " AND (status = 'orphan' OR json_extract(metadata, '$.orphan') = 1)"
 
-            return tasks
-        finally:
-            if should_close:
-                conn.close()
+        if cursor:
+            condition, cursor_params = task_cursor_condition(cursor)
+            query += f" AND {condition}"
+            params.extend(cursor_params)
+
+        # task_id breaks created_at ties so keyset pages never skip or repeat rows
+        query += " ORDER BY created_at DESC, task_id DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        return [_row_to_task(row) for row in conn.execute(query, params).fetchall()]
     
     def update_task_status(self, task_id: str, status: str) -> None:
         """
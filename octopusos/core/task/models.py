@@ -235,6 +235,21 @@ class TaskTrace:
         }
 
 
+@dataclass
+class TaskPage:
+    """One page of a keyset-paginated task listing"""
+
+    tasks: List[Task]
+    next_cursor: Optional[str] = None  # None on the last page
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "tasks": [task.to_dict() for task in self.tasks],
+            "next_cursor": self.next_cursor,
+        }
+
+
 # ============================================
 # Multi-Repo Task Models (v18)
 # ============================================
@@ -859,6 +859,8 @@ class TaskService:
         offset: int = 0,
         status_filter: Optional[str] = None,
         orphan_only: bool = False,
+        cursor: Optional[str] = None,
+        summary: bool = False,
     ) -> List[Task]:
         """
         List tasks
@@ -868,6 +870,8 @@ class TaskService:
             offset: Offset for pagination
             status_filter: Filter by status
             orphan_only: Show only orphan tasks
+            cursor: Keyset cursor from TaskManager.list_tasks_page()
+            summary: Skip metadata/route_plan_json/requirements_json
 
         Returns:
             List of tasks
@@ -876,7 +880,9 @@ class TaskService:
             limit=limit,
             offset=offset,
             status_filter=status_filter,
-            orphan_only=orphan_only
+            orphan_only=orphan_only,
+            cursor=cursor,
+            summary=summary,
         )
 
     def get_valid_transitions(self, task_id: str) -> List[str]:
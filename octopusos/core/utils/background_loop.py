@@ -0,0 +1,121 @@
+"""
+Persistent background event loop for running coroutines from sync code.
+
+``asyncio.run`` (or a fresh thread + loop when the caller already runs a
+loop) pays for loop setup on every call and throws away anything bound to
+the loop, such as the pooled async HTTP clients of
+``octopusos.providers.http_pool``. ``BackgroundLoop`` keeps one loop alive
+in a daemon thread and submits coroutines to it.
+
+Usage:
+    from octopusos.core.utils.background_loop import run_coroutine_sync
+
+    result = run_coroutine_sync(adapter.search(query="..."), timeout=30)
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Awaitable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BackgroundLoop:
+    """An asyncio event loop running forever in a daemon thread"""
+
+    def __init__(self, name: str = "octopusos-background-loop"):
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running loop (started on first use)"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed() or not self._thread.is_alive():
+                self._start()
+            return self._loop
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def _serve() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        thread = threading.Thread(target=_serve, name=self._name, daemon=True)
+        thread.start()
+        ready.wait()
+        self._loop, self._thread = loop, thread
+        logger.debug("Background event loop started: %s", self._name)
+
+    def in_loop_thread(self) -> bool:
+        """True when called from the loop's own thread"""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the loop and return a concurrent future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the loop and wait for its result
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait; the coroutine is cancelled on timeout
+
+        Raises:
+            TimeoutError: If the timeout expires
+            RuntimeError: If called from the loop's own thread (would deadlock)
+        """
+        if self.in_loop_thread():
+            raise RuntimeError("BackgroundLoop.run() called from its own loop thread")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Coroutine did not finish within {timeout}s")
+
+    def stop(self) -> None:
+        """Stop the loop and join its thread (a later call restarts it)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+            loop.close()
+
+
+_default_loop = BackgroundLoop()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """Process-wide background loop"""
+    return _default_loop
+
+
+def run_coroutine_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine from sync code on the shared background loop
+
+    Safe to call from a thread that is itself running an event loop (the
+    caller blocks, the coroutine runs elsewhere). From the background loop's
+    own thread the coroutine runs on a one-off loop in a helper thread.
+    """
+    if not _default_loop.in_loop_thread():
+        return _default_loop.run(coro, timeout)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result(timeout)
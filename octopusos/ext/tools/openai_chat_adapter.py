@@ -77,7 +77,7 @@ class OpenAIChatAdapter(CloudChatAdapter):
         try:
             # 检查是否安装了 openai
             try:
-                import openai
+                import openai  # noqa: F401
             except ImportError:
                 return (
                     "",
@@ -90,12 +90,10 @@ class OpenAIChatAdapter(CloudChatAdapter):
             if not api_key:
                 return "", "OPENAI_API_KEY not configured", 1
             
-            # 创建 client（支持自定义 base_url）
-            client_kwargs = {"api_key": api_key, "timeout": timeout}
-            if self.base_url:
-                client_kwargs["base_url"] = self.base_url
-            
-            client = openai.OpenAI(**client_kwargs)
+            # 复用共享连接池中的 client（支持自定义 base_url），按调用设置超时
+            from octopusos.providers.http_pool import get_openai_client
+
+            client = get_openai_client(api_key=api_key, base_url=self.base_url).with_options(timeout=timeout)
             
             # 构建系统提示词
             system_prompt = f"""You are a code modification assistant for OctopusOS.
@@ -167,8 +167,8 @@ class Provider(ABC):
 
         # Layer 3: Check API responding
         try:
-            import httpx
-            async with httpx.AsyncClient(timeout=1.0) as client:
+            from octopusos.providers.http_pool import pooled_async_client
+            async with pooled_async_client(self.id, getattr(self, "endpoint", None) or "", timeout=1.0) as client:
                 # Try common health endpoints
                 endpoints_to_try = []
                 if hasattr(self, 'endpoint') and self.endpoint:
@@ -247,8 +247,8 @@ class Provider(ABC):
 
         # Layer 2: Check API responding
         try:
-            import httpx
-            async with httpx.AsyncClient(timeout=1.0) as client:
+            from octopusos.providers.http_pool import pooled_async_client
+            async with pooled_async_client(self.id, self.endpoint, timeout=1.0) as client:
                 # Try common health endpoints
                 endpoints_to_try = [
                     f"{self.endpoint}/health",
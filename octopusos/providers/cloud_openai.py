@@ -18,6 +18,7 @@ from octopusos.providers.base import (
     ModelInfo,
 )
 from octopusos.common.reasons import ReasonCode, get_hint
+from octopusos.providers.http_pool import pooled_async_client
 
 logger = logging.getLogger(__name__)
 
@@ -101,7 +102,7 @@ class OpenAIProvider(Provider):
         start_time = asyncio.get_event_loop().time()
 
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
+            async with pooled_async_client(self.id, endpoint, api_key=api_key, timeout="catalog") as client:
                 response = await client.get(
                     f"{endpoint}/models",
                     headers={"Authorization": f"Bearer {api_key}"},
@@ -215,7 +216,7 @@ class OpenAIProvider(Provider):
             return []
 
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
+            async with pooled_async_client(self.id, endpoint, api_key=api_key, timeout="catalog") as client:
                 response = await client.get(
                     f"{endpoint}/models",
                     headers={"Authorization": f"Bearer {api_key}"},
@@ -20,6 +20,7 @@ import httpx
 
 from octopusos.common.reasons import ReasonCode, get_hint
 from octopusos.providers.base import Provider, ProviderType, ProviderStatus, ProviderState, ModelInfo
+from octopusos.providers.http_pool import pooled_async_client
 
 logger = logging.getLogger(__name__)
 
@@ -94,7 +95,7 @@ class OpenAICompatibleCloudProvider(Provider):
 
         start_time = asyncio.get_event_loop().time()
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
+            async with pooled_async_client(self.id, endpoint, api_key=api_key, timeout="catalog") as client:
                 response = await client.get(
                     f"{endpoint}/models",
                     headers={"Authorization": f"Bearer {api_key}"},
@@ -192,7 +193,7 @@ class OpenAICompatibleCloudProvider(Provider):
         if not api_key or not endpoint:
             return []
         try:
-            async with httpx.AsyncClient(timeout=4.0) as client:
+            async with pooled_async_client(self.id, endpoint, api_key=api_key, timeout=4.0) as client:
                 response = await client.get(
                     f"{endpoint}/models",
                     headers={"Authorization": f"Bearer {api_key}"},
@@ -8,6 +8,8 @@ import httpx
 from typing import Dict, Any, List
 from dataclasses import dataclass
 
+from octopusos.providers.http_pool import pooled_async_client
+
 
 @dataclass
 class DetectionResult:
@@ -41,7 +43,7 @@ class LocalProviderDetector:
         hint = None
 
         try:
-            async with httpx.AsyncClient(timeout=1.5) as client:
+            async with pooled_async_client("ollama", endpoint, timeout="probe") as client:
                 # Check tags endpoint
                 response = await client.get(f"{endpoint}/api/tags")
                 if response.status_code == 200:
@@ -95,7 +97,7 @@ class LocalProviderDetector:
         hint = None
 
         try:
-            async with httpx.AsyncClient(timeout=1.5) as client:
+            async with pooled_async_client("lmstudio", endpoint, timeout="probe") as client:
                 # Check OpenAI-compatible models endpoint
                 response = await client.get(f"{endpoint}/v1/models")
                 if response.status_code == 200:
@@ -137,7 +139,7 @@ class LocalProviderDetector:
         hint = None
 
         try:
-            async with httpx.AsyncClient(timeout=1.5) as client:
+            async with pooled_async_client("llamacpp", endpoint, timeout="probe") as client:
                 # Try OpenAI-compatible endpoint first
                 try:
                     response = await client.get(f"{endpoint}/v1/models")
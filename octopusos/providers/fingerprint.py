@@ -17,6 +17,8 @@ from enum import Enum
 
 import httpx
 
+from octopusos.providers.http_pool import pooled_async_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,7 +40,7 @@ async def probe_port(endpoint: str, timeout: float = 1.0) -> bool:
     Fast TCP/HTTP connectivity check
     """
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with pooled_async_client("fingerprint", endpoint, timeout=timeout) as client:
             # Try HEAD request first (fastest)
             response = await client.head(endpoint, follow_redirects=False)
             return True
@@ -63,7 +65,7 @@ async def fingerprint_ollama(endpoint: str, timeout: float = 1.5) -> tuple[bool,
     - /health endpoint exists
     """
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with pooled_async_client("fingerprint", endpoint, timeout=timeout) as client:
             response = await client.get(f"{endpoint}/api/tags")
 
             if response.status_code == 200:
@@ -107,7 +109,7 @@ async def fingerprint_openai_compatible(endpoint: str, timeout: float = 1.5) ->
     Fingerprint: GET /v1/models returns JSON with 'data' array (OpenAI schema)
     """
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with pooled_async_client("fingerprint", endpoint, timeout=timeout) as client:
             response = await client.get(f"{endpoint}/v1/models")
 
             if response.status_code == 200:
@@ -135,7 +137,7 @@ async def fingerprint_llamacpp_native(endpoint: str, timeout: float = 1.5) -> tu
     - Check Server header
     """
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with pooled_async_client("fingerprint", endpoint, timeout=timeout) as client:
             # Try /health endpoint
             try:
                 response = await client.get(f"{endpoint}/health")
@@ -0,0 +1,460 @@
+"""
+Shared HTTP client pool for chat adapters and providers.
+
+Chat turns and provider probes used to build a fresh HTTP client per call, so
+every request paid for TCP (and TLS) setup and no connection was reused. This
+module keeps long-lived clients in a process-wide registry keyed by
+(base_url, api_key, timeout profile):
+
+- sync ``httpx.Client`` (and the ``openai.OpenAI`` wrappers built on them)
+- async ``httpx.AsyncClient``, one set per running event loop, because an
+  async connection pool cannot be shared across loops (``asyncio.run`` in the
+  provider registry creates short-lived loops). A loop's clients are closed
+  and forgotten when the loop shuts down; their open connections would
+  otherwise keep the dead loop and its sockets alive.
+
+Clients use keep-alive with tuned pool limits, and HTTP/2 when the optional
+``h2`` package is installed (``pip install httpx[http2]``).
+
+Instrumentation: every pooled request records time-to-first-byte (response
+headers received) under its provider label; ``get_pool_stats()`` reports those
+together with pool occupancy.
+
+Usage:
+    async with pooled_async_client(self.id, endpoint, timeout=1.5) as client:
+        response = await client.get(f"{endpoint}/api/tags")
+
+    client = get_openai_client(api_key=..., base_url=..., provider="openai")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextlib
+import importlib.util
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Named timeout profiles; plain numbers are accepted as ad-hoc profiles too
+TIMEOUT_PROFILES: Dict[str, httpx.Timeout] = {
+    "probe": httpx.Timeout(1.5),
+    "catalog": httpx.Timeout(3.0),
+    # Same as the openai SDK default (long generations, fast connect failure)
+    "chat": httpx.Timeout(600.0, connect=5.0),
+}
+
+POOL_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=16,
+    keepalive_expiry=60.0,
+)
+
+TTFB_SAMPLE_SIZE = 256
+
+TimeoutSpec = Union[str, float, int, httpx.Timeout]
+ClientKey = Tuple[str, str, str]
+
+_REQUEST_STARTED = "octopusos_request_started"
+
+
+def _resolve_timeout(timeout: TimeoutSpec) -> Tuple[str, httpx.Timeout]:
+    if isinstance(timeout, httpx.Timeout):
+        return repr(timeout), timeout
+    if isinstance(timeout, str):
+        if timeout not in TIMEOUT_PROFILES:
+            raise ValueError(f"Unknown timeout profile: {timeout}")
+        return timeout, TIMEOUT_PROFILES[timeout]
+    return f"{float(timeout):g}s", httpx.Timeout(float(timeout))
+
+
+def _provider_label(provider: Optional[str], base_url: str) -> str:
+    if provider:
+        return provider
+    parsed = urlparse(base_url or "")
+    return parsed.netloc or "default"
+
+
+class _ProviderMetrics:
+    """Time-to-first-byte samples for one provider."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.ttfb_total = 0.0
+        self.ttfb_samples: deque[float] = deque(maxlen=TTFB_SAMPLE_SIZE)
+
+    def snapshot(self) -> Dict[str, Any]:
+        samples = sorted(self.ttfb_samples)
+        count = len(samples)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "ttfb_avg_ms": round(self.ttfb_total / self.requests * 1000, 2) if self.requests else None,
+            "ttfb_p50_ms": round(samples[count // 2] * 1000, 2) if count else None,
+            "ttfb_p95_ms": round(samples[min(count - 1, int(count * 0.95))] * 1000, 2) if count else None,
+        }
+
+
+class _LoopClients:
+    """
+    Async clients of one event loop, closed when the loop shuts down.
+
+    ``asyncio.run`` (and ``loop.shutdown_asyncgens()`` in general) closes
+    every async generator first iterated on the loop before closing it. The
+    guard generator started here is one of them: its ``finally`` closes the
+    loop's clients while the loop can still run their ``aclose()``.
+    """
+
+    def __init__(self, pool: "HTTPClientPool", loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.clients: Dict[ClientKey, httpx.AsyncClient] = {}
+        self._guard = self._close_on_shutdown(pool)
+        try:
+            # Runs to the first yield without suspending; registers with the running loop
+            self._guard.asend(None).send(None)
+        except StopIteration:
+            pass
+
+    async def _close_on_shutdown(self, pool: "HTTPClientPool") -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            pool._forget_loop_clients(self)
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        for client in list(self.clients.values()):
+            try:
+                await client.aclose()
+            except Exception:
+                logger.debug("Failed to close pooled async HTTP client", exc_info=True)
+
+    def close_soon(self) -> None:
+        """Schedule closing the clients on their loop (no-op once it is closed)."""
+        try:
+            self.loop.call_soon_threadsafe(lambda: self.loop.create_task(self.aclose()))
+        except RuntimeError:  # Loop already closed
+            pass
+
+
+class HTTPClientPool:
+    """
+    Process-wide registry of long-lived HTTP clients.
+
+    Use the module-level helpers (``get_sync_client``, ``pooled_async_client``,
+    ``get_openai_client``) rather than instantiating this class.
+    """
+
+    def __init__(self, limits: httpx.Limits = POOL_LIMITS, http2: bool = HTTP2_AVAILABLE):
+        self.limits = limits
+        self.http2 = http2
+        self._lock = threading.Lock()
+        self._sync_clients: Dict[ClientKey, httpx.Client] = {}
+        self._openai_clients: Dict[ClientKey, Tuple[Any, httpx.Client]] = {}
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._labels: Dict[ClientKey, str] = {}
+        self._metrics: Dict[str, _ProviderMetrics] = {}
+
+    # ------------------------------------------------------------------
+    # Instrumentation
+    # ------------------------------------------------------------------
+
+    def _metrics_for(self, label: str) -> _ProviderMetrics:
+        metrics = self._metrics.get(label)
+        if metrics is None:
+            metrics = self._metrics.setdefault(label, _ProviderMetrics())
+        return metrics
+
+    def _record_ttfb(self, label: str, response: httpx.Response) -> None:
+        started = response.request.extensions.get(_REQUEST_STARTED)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            metrics = self._metrics_for(label)
+            metrics.requests += 1
+            metrics.ttfb_total += elapsed
+            metrics.ttfb_samples.append(elapsed)
+            if response.status_code >= 500:
+                metrics.errors += 1
+
+    def _sync_hooks(self, label: str) -> Dict[str, list]:
+        def on_request(request: httpx.Request) -> None:
+            request.extensions[_REQUEST_STARTED] = time.perf_counter()
+
+        def on_response(response: httpx.Response) -> None:
+            self._record_ttfb(label, response)
+
+        return {"request": [on_request], "response": [on_response]}
+
+    def _async_hooks(self, label: str) -> Dict[str, list]:
+        async def on_request(request: httpx.Request) -> None:
+            request.extensions[_REQUEST_STARTED] = time.perf_counter()
+
+        async def on_response(response: httpx.Response) -> None:
+            self._record_ttfb(label, response)
+
+        return {"request": [on_request], "response": [on_response]}
+
+    # ------------------------------------------------------------------
+    # Clients
+    # ------------------------------------------------------------------
+
+    def _client_kwargs(self, base_url: str, timeout: httpx.Timeout) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {
+            "timeout": timeout,
+            "limits": self.limits,
+            "http2": self.http2,
+        }
+        if base_url:
+            kwargs["base_url"] = base_url
+        return kwargs
+
+    def _sync_client_for(
+        self,
+        key: ClientKey,
+        provider: Optional[str],
+        timeout: httpx.Timeout,
+        **extra: Any,
+    ) -> httpx.Client:
+        with self._lock:
+            client = self._sync_clients.get(key)
+            if client is None or client.is_closed:
+                label = _provider_label(provider, key[0])
+                client = httpx.Client(
+                    event_hooks=self._sync_hooks(label),
+                    **self._client_kwargs(key[0], timeout),
+                    **extra,
+                )
+                self._sync_clients[key] = client
+                self._labels[key] = label
+            return client
+
+    def get_sync_client(
+        self,
+        base_url: str = "",
+        *,
+        api_key: Optional[str] = None,
+        timeout: TimeoutSpec = "chat",
+        provider: Optional[str] = None,
+    ) -> httpx.Client:
+        """Shared ``httpx.Client`` for (base_url, api_key, timeout profile)."""
+        profile, timeout_value = _resolve_timeout(timeout)
+        return self._sync_client_for((base_url or "", api_key or "", profile), provider, timeout_value)
+
+    def get_async_client(
+        self,
+        base_url: str = "",
+        *,
+        api_key: Optional[str] = None,
+        timeout: TimeoutSpec = "probe",
+        provider: Optional[str] = None,
+    ) -> httpx.AsyncClient:
+        """Shared ``httpx.AsyncClient`` for the running event loop."""
+        loop = asyncio.get_running_loop()
+        profile, timeout_value = _resolve_timeout(timeout)
+        key = (base_url or "", api_key or "", profile)
+        with self._lock:
+            loop_clients = self._async_clients.get(loop)
+            if loop_clients is None:
+                self._forget_closed_loops()
+                loop_clients = self._async_clients[loop] = _LoopClients(self, loop)
+            clients = loop_clients.clients
+            client = clients.get(key)
+            if client is None or client.is_closed:
+                label = _provider_label(provider, base_url)
+                client = httpx.AsyncClient(
+                    event_hooks=self._async_hooks(label),
+                    **self._client_kwargs(base_url, timeout_value),
+                )
+                clients[key] = client
+                self._labels[key] = label
+            return client
+
+    def get_openai_client(
+        self,
+        *,
+        api_key: Optional[str],
+        base_url: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> Any:
+        """Cached ``openai.OpenAI`` client running on a shared ``httpx.Client``."""
+        import openai
+
+        key = (base_url or "", api_key or "", "chat")
+        with self._lock:
+            cached = self._openai_clients.get(key)
+        if cached is not None and not cached[1].is_closed:
+            return cached[0]
+
+        # Separate profile: the SDK's own default client follows redirects
+        http_client = self._sync_client_for(
+            (base_url or "", api_key or "", "openai"),
+            provider or ("openai" if not base_url else None),
+            TIMEOUT_PROFILES["chat"],
+            follow_redirects=True,
+        )
+        client_kwargs: Dict[str, Any] = {"api_key": api_key, "http_client": http_client}
+        if base_url:
+            client_kwargs["base_url"] = base_url
+        client = openai.OpenAI(**client_kwargs)
+        with self._lock:
+            self._openai_clients[key] = (client, http_client)
+        return client
+
+    def _forget_closed_loops(self) -> None:
+        """Drop the clients of loops closed without an asyncgen shutdown (caller holds the lock)."""
+        for loop in [loop for loop in self._async_clients.keys() if loop.is_closed()]:
+            self._async_clients.pop(loop, None)
+
+    def _forget_loop_clients(self, loop_clients: _LoopClients) -> None:
+        with self._lock:
+            if self._async_clients.get(loop_clients.loop) is loop_clients:
+                del self._async_clients[loop_clients.loop]
+
+    # ------------------------------------------------------------------
+    # Stats / lifecycle
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _pool_occupancy(client: Union[httpx.Client, httpx.AsyncClient]) -> Dict[str, int]:
+        """Connection counts of a client's default transport (best effort)."""
+        try:
+            connections = list(client._transport._pool.connections)  # type: ignore[attr-defined]
+        except Exception:
+            return {"connections": 0, "idle": 0, "active": 0}
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return {"connections": len(connections), "idle": idle, "active": len(connections) - idle}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool occupancy per client and TTFB per provider."""
+        with self._lock:
+            clients = [("sync", key, client) for key, client in self._sync_clients.items()]
+            for loop_clients in list(self._async_clients.values()):
+                clients.extend(("async", key, c) for key, c in loop_clients.clients.items())
+            labels = dict(self._labels)
+            providers = {label: metrics.snapshot() for label, metrics in self._metrics.items()}
+
+        pools = []
+        for kind, key, client in clients:
+            if client.is_closed:
+                continue
+            pools.append(
+                {
+                    "kind": kind,
+                    "provider": labels.get(key),
+                    "base_url": key[0] or None,
+                    "timeout_profile": key[2],
+                    **self._pool_occupancy(client),
+                }
+            )
+        return {
+            "http2": self.http2,
+            "limits": {
+                "max_connections": self.limits.max_connections,
+                "max_keepalive_connections": self.limits.max_keepalive_connections,
+                "keepalive_expiry": self.limits.keepalive_expiry,
+            },
+            "pools": pools,
+            "providers": providers,
+        }
+
+    def close(self) -> None:
+        """Close sync clients, schedule closing async ones on their loops, forget all."""
+        with self._lock:
+            sync_clients = list(self._sync_clients.values())
+            loop_clients = list(self._async_clients.values())
+            self._sync_clients.clear()
+            self._openai_clients.clear()
+            self._async_clients = weakref.WeakKeyDictionary()
+        for entry in loop_clients:
+            entry.close_soon()
+        for client in sync_clients:
+            try:
+                client.close()
+            except Exception:
+                logger.debug("Failed to close pooled HTTP client", exc_info=True)
+
+
+_pool = HTTPClientPool()
+atexit.register(_pool.close)
+
+
+def get_http_pool() -> HTTPClientPool:
+    """Process-wide HTTP client pool."""
+    return _pool
+
+
+def get_sync_client(
+    base_url: str = "",
+    *,
+    api_key: Optional[str] = None,
+    timeout: TimeoutSpec = "chat",
+    provider: Optional[str] = None,
+) -> httpx.Client:
+    return _pool.get_sync_client(base_url, api_key=api_key, timeout=timeout, provider=provider)
+
+
+def get_async_client(
+    base_url: str = "",
+    *,
+    api_key: Optional[str] = None,
+    timeout: TimeoutSpec = "probe",
+    provider: Optional[str] = None,
+) -> httpx.AsyncClient:
+    return _pool.get_async_client(base_url, api_key=api_key, timeout=timeout, provider=provider)
+
+
+@contextlib.asynccontextmanager
+async def pooled_async_client(
+    provider: Optional[str] = None,
+    base_url: str = "",
+    *,
+    api_key: Optional[str] = None,
+    timeout: TimeoutSpec = "probe",
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Drop-in replacement for ``async with httpx.AsyncClient(timeout=...) as client``.
+
+    Yields the shared client for the running loop and leaves it open on exit.
+    """
+    yield _pool.get_async_client(base_url, api_key=api_key, timeout=timeout, provider=provider)
+
+
+@contextlib.contextmanager
+def pooled_sync_client(
+    provider: Optional[str] = None,
+    base_url: str = "",
+    *,
+    api_key: Optional[str] = None,
+    timeout: TimeoutSpec = "probe",
+):
+    """Sync counterpart of ``pooled_async_client``."""
+    yield _pool.get_sync_client(base_url, api_key=api_key, timeout=timeout, provider=provider)
+
+
+def get_openai_client(
+    *,
+    api_key: Optional[str],
+    base_url: Optional[str] = None,
+    provider: Optional[str] = None,
+) -> Any:
+    return _pool.get_openai_client(api_key=api_key, base_url=base_url, provider=provider)
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    return _pool.get_stats()
@@ -15,6 +15,7 @@ from octopusos.providers.base import (
     ModelInfo,
 )
 from octopusos.common.reasons import ReasonCode, get_hint
+from octopusos.providers.http_pool import pooled_async_client
 
 
 class LlamaCppProvider(Provider):
@@ -67,7 +68,7 @@ class LlamaCppProvider(Provider):
             return status
 
         try:
-            async with httpx.AsyncClient(timeout=1.5) as client:
+            async with pooled_async_client(self.id, self.endpoint, timeout="probe") as client:
                 # Try OpenAI-compatible endpoint first
                 try:
                     response = await client.get(f"{self.endpoint}/v1/models")
@@ -171,7 +172,7 @@ class LlamaCppProvider(Provider):
     async def list_models(self) -> List[ModelInfo]:
         """List available llama.cpp models"""
         try:
-            async with httpx.AsyncClient(timeout=2.0) as client:
+            async with pooled_async_client(self.id, self.endpoint, timeout=2.0) as client:
                 # Try OpenAI-compatible endpoint
                 try:
                     response = await client.get(f"{self.endpoint}/v1/models")
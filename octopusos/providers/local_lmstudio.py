@@ -15,6 +15,7 @@ from octopusos.providers.base import (
     ModelInfo,
 )
 from octopusos.common.reasons import ReasonCode, get_hint
+from octopusos.providers.http_pool import pooled_async_client
 
 
 class LMStudioProvider(Provider):
@@ -67,7 +68,7 @@ class LMStudioProvider(Provider):
             return status
 
         try:
-            async with httpx.AsyncClient(timeout=1.5) as client:
+            async with pooled_async_client(self.id, self.endpoint, timeout="probe") as client:
                 # LM Studio uses OpenAI-compatible API
                 response = await client.get(f"{self.endpoint}/v1/models")
 
@@ -152,7 +153,7 @@ class LMStudioProvider(Provider):
     async def list_models(self) -> List[ModelInfo]:
         """List available LM Studio models"""
         try:
-            async with httpx.AsyncClient(timeout=2.0) as client:
+            async with pooled_async_client(self.id, self.endpoint, timeout=2.0) as client:
                 response = await client.get(f"{self.endpoint}/v1/models")
 
                 if response.status_code == 200:
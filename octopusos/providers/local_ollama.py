@@ -15,6 +15,7 @@ from octopusos.providers.base import (
     ModelInfo,
 )
 from octopusos.common.reasons import ReasonCode, get_hint
+from octopusos.providers.http_pool import pooled_async_client
 
 
 class OllamaProvider(Provider):
@@ -93,7 +94,7 @@ class OllamaProvider(Provider):
 
         # Fingerprint verified, proceed with normal probe
         try:
-            async with httpx.AsyncClient(timeout=1.5) as client:
+            async with pooled_async_client(self.id, self.endpoint, timeout="probe") as client:
                 response = await client.get(f"{self.endpoint}/api/tags")
 
                 if response.status_code == 200:
@@ -196,7 +197,7 @@ class OllamaProvider(Provider):
     async def list_models(self) -> List[ModelInfo]:
         """List available Ollama models"""
         try:
-            async with httpx.AsyncClient(timeout=2.0) as client:
+            async with pooled_async_client(self.id, self.endpoint, timeout=2.0) as client:
                 response = await client.get(f"{self.endpoint}/api/tags")
 
                 if response.status_code == 200:
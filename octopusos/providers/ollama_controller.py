@@ -24,9 +24,8 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
-import httpx
-
 from octopusos.providers import platform_utils
+from octopusos.providers.http_pool import pooled_sync_client
 from octopusos.providers.process_manager import (
     stop_process_cross_platform,
     is_process_running_cross_platform
@@ -88,7 +87,7 @@ class OllamaController:
         Returns True if endpoint responds to /api/tags
         """
         try:
-            with httpx.Client(timeout=1.5) as client:
+            with pooled_sync_client("ollama", self.endpoint, timeout="probe") as client:
                 response = client.get(f"{self.endpoint}/api/tags")
                 return response.status_code == 200
         except Exception:
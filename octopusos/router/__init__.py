@@ -20,6 +20,12 @@ from octopusos.router.models import (
 from octopusos.router.requirements_extractor import RequirementsExtractor
 from octopusos.router.instance_profiles import InstanceProfileBuilder
 from octopusos.router.scorer import RouteScorer, RouteScore
+from octopusos.router.telemetry import (
+    CircuitState,
+    InstanceTelemetry,
+    TelemetrySnapshot,
+    get_instance_telemetry,
+)
 from octopusos.router.persistence import RouterPersistence
 from octopusos.router import events as router_events
 
@@ -35,6 +41,10 @@ __all__ = [
     "InstanceProfileBuilder",
     "RouteScorer",
     "RouteScore",
+    "CircuitState",
+    "InstanceTelemetry",
+    "TelemetrySnapshot",
+    "get_instance_telemetry",
     "RouterPersistence",
     "router_events",
 ]
@@ -18,6 +18,8 @@ class RerouteReason(str, Enum):
     FINGERPRINT_MISMATCH = "FINGERPRINT_MISMATCH"  # Service fingerprint mismatch
     INSTANCE_NOT_READY = "INSTANCE_NOT_READY"  # Instance not in READY state
     NO_AVAILABLE_INSTANCE = "NO_AVAILABLE_INSTANCE"  # No available instances
+    CIRCUIT_OPEN = "CIRCUIT_OPEN"  # Circuit breaker opened after recent failures
+    OVERLOADED = "OVERLOADED"  # Too many in-flight requests, less loaded fallback available
 
 
 @dataclass
@@ -9,7 +9,8 @@ PR-2: Chat→Task Integration
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import os
+from typing import Dict, Any, List, Optional, Tuple
 from octopusos.router.models import (
     RoutePlan,
     TaskRequirements,
@@ -20,10 +21,14 @@ from octopusos.router.models import (
 from octopusos.router.requirements_extractor import RequirementsExtractor
 from octopusos.router.instance_profiles import InstanceProfileBuilder
 from octopusos.router.scorer import RouteScorer, RouteScore
+from octopusos.router.telemetry import InstanceTelemetry, TelemetrySnapshot, get_instance_telemetry
 from octopusos.providers.registry import ProviderRegistry
 
 logger = logging.getLogger(__name__)
 
+# In-flight requests at which verify_or_reroute moves a task to a less loaded fallback
+DEFAULT_MAX_IN_FLIGHT = 4
+
 
 class Router:
     """
@@ -40,6 +45,11 @@ class Router:
     - Initial routing (route)
     - Route verification (verify_or_reroute)
     - Manual override (override_route)
+
+    Scoring and verification use live instance telemetry (see telemetry.py):
+    open circuits are never selected, load and errors lower the score, and
+    near-equal candidates are picked by power of two choices. Selecting a
+    half-open instance reserves its single trial request for the task.
     """
 
     def __init__(
@@ -48,6 +58,8 @@ class Router:
         extractor: Optional[RequirementsExtractor] = None,
         profile_builder: Optional[InstanceProfileBuilder] = None,
         scorer: Optional[RouteScorer] = None,
+        telemetry: Optional[InstanceTelemetry] = None,
+        max_in_flight: Optional[int] = None,
     ):
         """
         Initialize Router
@@ -57,11 +69,17 @@ class Router:
             extractor: RequirementsExtractor (creates new if None)
             profile_builder: InstanceProfileBuilder (creates new if None)
             scorer: RouteScorer (creates new if None)
+            telemetry: InstanceTelemetry for a new scorer (uses process-wide telemetry if None)
+            max_in_flight: In-flight requests that count as overloaded in verify_or_reroute
+                (default: OCTOPUSOS_ROUTER_MAX_IN_FLIGHT or 4)
         """
         self.registry = registry or ProviderRegistry.get_instance()
         self.extractor = extractor or RequirementsExtractor()
         self.profile_builder = profile_builder or InstanceProfileBuilder(self.registry)
-        self.scorer = scorer or RouteScorer()
+        self.scorer = scorer or RouteScorer(telemetry=telemetry or get_instance_telemetry())
+        self.max_in_flight = max_in_flight or int(
+            os.getenv("OCTOPUSOS_ROUTER_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT)
+        )
 
     async def route(
         self,
@@ -97,18 +115,24 @@ class Router:
         # Step 3: Score all instances
         scores = self.scorer.score_all(profiles, requirements)
 
-        # Step 4: Select top instances
-        top_scores = self.scorer.select_top_n(scores, n=3)
+        # Step 4: Select top instances (least loaded of two near-equal candidates first)
+        top_scores = self.scorer.choose(self.scorer.select_top_n(scores, n=3))
 
-        if not top_scores:
+        # A half-open instance takes one trial request: the first route to
+        # reserve it wins, concurrent routes move on to the next candidate
+        selected = next(
+            (s for s in top_scores if self.scorer.acquire_trial(s.instance_id, task_id)),
+            None,
+        )
+
+        if selected is None:
             # No instances with score > 0
             raise RuntimeError(
                 f"No suitable instances found for task requirements: {requirements.needs}"
             )
 
         # Step 5: Build routing plan
-        selected = top_scores[0]
-        fallback = [s.instance_id for s in top_scores[1:]]
+        fallback = [s.instance_id for s in top_scores if s is not selected]
 
         scores_dict = {s.instance_id: s.total_score for s in scores}
 
@@ -148,30 +172,50 @@ class Router:
         """
         logger.info(f"Verifying route for task {task_id}: {current_plan.selected}")
 
-        # Get profile for current selected instance
-        profile = await self.profile_builder.get_profile(current_plan.selected)
-
-        if profile and profile.state == "READY":
-            # Instance still ready, no reroute needed
-            logger.info(f"Route verified: {current_plan.selected} still READY")
-            return current_plan, None
+        # Live telemetry first: fail over before probing an instance known to be failing
+        live = self.scorer.snapshot(current_plan.selected)
+        failover = self._failover_reason(live, task_id)
+
+        if failover is None:
+            # Get profile for current selected instance
+            profile = await self.profile_builder.get_profile(current_plan.selected)
+
+            if profile and profile.state == "READY":
+                if self.scorer.acquire_trial(current_plan.selected, task_id):
+                    # Instance still ready, no reroute needed
+                    logger.info(f"Route verified: {current_plan.selected} still READY")
+                    return current_plan, None
+                failover = (
+                    RerouteReason.CIRCUIT_OPEN,
+                    "Half-open trial request taken by another task",
+                )
+            else:
+                state = profile.state if profile else "NOT_FOUND"
+                failover = (
+                    RerouteReason.INSTANCE_NOT_READY,
+                    f"Selected instance not ready (state={state})",
+                )
 
-        # Instance not ready, need to reroute
-        logger.warning(
-            f"Instance {current_plan.selected} not ready (state={profile.state if profile else 'NOT_FOUND'})"
-        )
+        reason_code, reason_detail = failover
+        logger.warning(f"Instance {current_plan.selected} needs failover: {reason_detail}")
 
         # Try fallback chain
         for fallback_id in current_plan.fallback:
+            if not self._fallback_viable(fallback_id, reason_code, live, task_id):
+                continue
             fallback_profile = await self.profile_builder.get_profile(fallback_id)
-            if fallback_profile and fallback_profile.state == "READY":
+            if (
+                fallback_profile
+                and fallback_profile.state == "READY"
+                and self.scorer.acquire_trial(fallback_id, task_id)
+            ):
                 # Found a working fallback
                 reroute_event = RerouteEvent(
                     task_id=task_id,
                     from_instance=current_plan.selected,
                     to_instance=fallback_id,
-                    reason_code=RerouteReason.INSTANCE_NOT_READY,
-                    reason_detail=f"Selected instance not ready (state={profile.state if profile else 'NOT_FOUND'})",
+                    reason_code=reason_code,
+                    reason_detail=reason_detail,
                     timestamp="",  # Will be set in __post_init__
                     fallback_chain=current_plan.fallback,
                 )
@@ -189,6 +233,11 @@ class Router:
                 logger.info(f"Rerouted to fallback: {fallback_id}")
                 return new_plan, reroute_event
 
+        if reason_code == RerouteReason.OVERLOADED:
+            # Busy but working: better to queue than to re-route onto something worse
+            logger.info(f"No less loaded fallback for {current_plan.selected}, keeping route")
+            return current_plan, None
+
         # No working fallback, need to re-route from scratch
         logger.error("All fallback instances failed, re-routing from scratch")
 
@@ -217,6 +266,52 @@ class Router:
             logger.error(f"Complete routing failure: {e}")
             raise RuntimeError(f"Cannot route task {task_id}: {e}")
 
+    def _failover_reason(
+        self, live: Optional[TelemetrySnapshot], task_id: str
+    ) -> Optional[Tuple[RerouteReason, str]]:
+        """
+        Reason to leave the selected instance based on live telemetry
+
+        Args:
+            live: TelemetrySnapshot of the selected instance (None without telemetry)
+            task_id: Task being verified (its own half-open trial reservation is fine)
+
+        Returns:
+            (reason_code, detail) or None if telemetry shows no problem
+        """
+        if live is None:
+            return None
+        if not live.routable_for(task_id):
+            return (
+                RerouteReason.CIRCUIT_OPEN,
+                f"Circuit {live.circuit.value} (error_rate={live.error_rate:.0%}, "
+                f"{live.window_requests} recent requests)",
+            )
+        if live.in_flight >= self.max_in_flight:
+            return (
+                RerouteReason.OVERLOADED,
+                f"Selected instance overloaded "
+                f"(in_flight={live.in_flight}, max={self.max_in_flight})",
+            )
+        return None
+
+    def _fallback_viable(
+        self,
+        fallback_id: str,
+        reason_code: RerouteReason,
+        live: Optional[TelemetrySnapshot],
+        task_id: str,
+    ) -> bool:
+        """Whether telemetry allows failing over to fallback_id"""
+        fallback_live = self.scorer.snapshot(fallback_id)
+        if fallback_live is None:
+            return True
+        if not fallback_live.routable_for(task_id):
+            return False
+        if reason_code == RerouteReason.OVERLOADED and live is not None:
+            return fallback_live.in_flight < live.in_flight
+        return True
+
     def override_route(
         self,
         task_id: str,
@@ -7,14 +7,19 @@ Implements the scoring formula from router.md MVP specification:
 - Context window requirements
 - Latency scoring
 - Local preference
+- Live telemetry (optional): circuit breaker, EWMA TTFT / tokens per second,
+  in-flight requests and error rate, plus power-of-two-choices selection
 
 PR-1: Router Core
 """
 
 import logging
-from typing import List, Dict, Tuple
+import random
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from octopusos.router.models import InstanceProfile, TaskRequirements
+from octopusos.router.telemetry import InstanceTelemetry, TelemetrySnapshot
+
 
 logger = logging.getLogger(__name__)
 
@@ -49,8 +54,44 @@ class RouteScorer:
     - Context window: +0.1 if ctx >= min_ctx
     - Latency: +0.0~0.1 (normalized, lower is better)
     - Local preference: +0.05 for local, -0.02 for cloud
+
+    With telemetry:
+    - Circuit open: score=0 (like NOT_READY)
+    - Latency uses the live EWMA time-to-first-token instead of the probe latency
+    - Throughput: +0.0~0.1 from EWMA tokens/sec
+    - Health: total multiplied by 1 / (1 + 0.25 * in_flight) * (1 - 0.5 * error_rate)
     """
 
+    # Candidates within this fraction of the best score are interchangeable for P2C
+    P2C_SCORE_RATIO = 0.85
+
+    def __init__(
+        self,
+        telemetry: Optional[InstanceTelemetry] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize scorer
+
+        Args:
+            telemetry: Live instance statistics (static scoring only if None)
+            rng: Random source for power-of-two-choices (for tests)
+        """
+        self.telemetry = telemetry
+        self._rng = rng or random.Random()
+
+    def snapshot(self, instance_id: str) -> Optional[TelemetrySnapshot]:
+        """Live statistics for an instance, or None without telemetry"""
+        if self.telemetry is None:
+            return None
+        return self.telemetry.snapshot(instance_id)
+
+    def acquire_trial(self, instance_id: str, owner: str) -> bool:
+        """Reserve a half-open instance's trial request (always True without telemetry)"""
+        if self.telemetry is None:
+            return True
+        return self.telemetry.acquire_trial(instance_id, owner)
+
     def score_all(
         self,
         profiles: List[InstanceProfile],
@@ -106,6 +147,15 @@ class RouteScorer:
                 breakdown={"state": 0.0},
             )
 
+        live = self.snapshot(profile.instance_id)
+        if live is not None and not live.routable:
+            return RouteScore(
+                instance_id=profile.instance_id,
+                total_score=0.0,
+                reasons=[f"CIRCUIT_{live.circuit.value}"],
+                breakdown={"state": 1.0, "circuit": 0.0},
+            )
+
         reasons.append("READY")
         breakdown["state"] = 1.0
 
@@ -122,15 +172,26 @@ class RouteScorer:
         if ctx_reason:
             reasons.append(ctx_reason)
 
-        # Latency scoring
+        # Latency scoring (live time-to-first-token when known)
+        live_latency = live is not None and live.ttft_ms is not None
+        latency_ms = live.ttft_ms if live_latency else profile.latency_ms
         latency_score, latency_reason = self._score_latency(
-            profile.latency_ms, requirements.latency_class
+            latency_ms, requirements.latency_class
         )
         total_score += latency_score
         breakdown["latency"] = latency_score
         if latency_reason:
+            if live_latency:
+                latency_reason += f"(ttft={latency_ms:.0f}ms)"
             reasons.append(latency_reason)
 
+        if live is not None:
+            tps_score, tps_reason = self._score_throughput(live.tokens_per_s)
+            total_score += tps_score
+            breakdown["throughput"] = tps_score
+            if tps_reason:
+                reasons.append(tps_reason)
+
         # Preference scoring
         pref_score, pref_reason = self._score_preference(
             profile.cost_category, requirements.prefer
@@ -140,6 +201,12 @@ class RouteScorer:
         if pref_reason:
             reasons.append(pref_reason)
 
+        if live is not None and total_score > 0:
+            health, health_reasons = self._score_health(live)
+            total_score *= health
+            breakdown["health"] = health
+            reasons.extend(health_reasons)
+
         return RouteScore(
             instance_id=profile.instance_id,
             total_score=total_score,
@@ -236,6 +303,48 @@ class RouteScorer:
 
         return score, reason
 
+    def _score_throughput(self, tokens_per_s: float | None) -> Tuple[float, str]:
+        """
+        Score live generation throughput
+
+        Args:
+            tokens_per_s: EWMA tokens/sec (None if no completed request yet)
+
+        Returns:
+            (score, reason)
+        """
+        if tokens_per_s is None:
+            return 0.0, ""
+        if tokens_per_s >= 50:
+            return 0.1, f"tps_best({tokens_per_s:.0f}/s)"
+        if tokens_per_s >= 20:
+            return 0.05, f"tps_good({tokens_per_s:.0f}/s)"
+        if tokens_per_s >= 5:
+            return 0.02, f"tps_ok({tokens_per_s:.0f}/s)"
+        return 0.0, f"tps_slow({tokens_per_s:.0f}/s)"
+
+    def _score_health(self, live: TelemetrySnapshot) -> Tuple[float, List[str]]:
+        """
+        Multiplier for load and recent errors
+
+        Multiplicative so that a busy or flaky READY instance ranks lower but
+        stays eligible as a fallback.
+
+        Args:
+            live: TelemetrySnapshot
+
+        Returns:
+            (factor in (0, 1], reasons)
+        """
+        reasons = []
+        factor = 1.0 / (1.0 + 0.25 * live.in_flight)
+        if live.in_flight:
+            reasons.append(f"in_flight={live.in_flight}")
+        if live.error_rate > 0:
+            factor *= 1.0 - 0.5 * live.error_rate
+            reasons.append(f"error_rate={live.error_rate:.0%}")
+        return factor, reasons
+
     def _score_preference(self, cost_category: str, preferences: List[str]) -> Tuple[float, str]:
         """
         Score preference match
@@ -275,3 +384,39 @@ class RouteScorer:
         # Filter out zero scores
         valid_scores = [s for s in scores if s.total_score > 0.0]
         return valid_scores[:n]
+
+    def choose(self, candidates: List[RouteScore]) -> List[RouteScore]:
+        """
+        Pick the instance to use among ranked candidates (power of two choices)
+
+        Routes decided at the same moment see the same telemetry, so always
+        taking the top score would send a burst of tasks to one instance.
+        Among the candidates scoring within P2C_SCORE_RATIO of the best, two
+        are sampled at random and the one with fewer in-flight requests wins
+        (ties go to the higher score). Without telemetry the order is kept.
+
+        Args:
+            candidates: RouteScore list sorted by score descending
+
+        Returns:
+            Same candidates with the chosen one first
+        """
+        if self.telemetry is None or len(candidates) < 2:
+            return candidates
+
+        best = candidates[0].total_score
+        pool = [c for c in candidates if c.total_score >= best * self.P2C_SCORE_RATIO]
+        if len(pool) < 2:
+            return candidates
+
+        first, second = self._rng.sample(pool, 2)
+        in_flight = {
+            c.instance_id: self.telemetry.snapshot(c.instance_id).in_flight for c in (first, second)
+        }
+        chosen = min(
+            (first, second),
+            key=lambda c: (in_flight[c.instance_id], -c.total_score),
+        )
+        if chosen is not candidates[0]:
+            chosen.reasons.append("p2c_least_loaded")
+        return [chosen] + [c for c in candidates if c is not chosen]
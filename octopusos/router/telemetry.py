@@ -0,0 +1,398 @@
+"""
+Instance Telemetry - Live per-instance request statistics for routing
+
+Profiles only carry static fields (READY state, tags, last probe latency),
+so a saturated instance keeps winning routes while an idle one with the
+same profile gets nothing. InstanceTelemetry records what each instance is
+actually doing, as reported by the chat adapters and the LLM call wrappers:
+
+- EWMA time-to-first-token (streaming calls) and end-to-end latency
+- EWMA tokens/sec
+- In-flight request count
+- Error rate over a sliding window
+- Circuit breaker: OPEN after CIRCUIT_CONSECUTIVE_FAILURES failures in a
+  row, or once the windowed error rate reaches CIRCUIT_ERROR_RATE over at
+  least CIRCUIT_MIN_REQUESTS requests. After CIRCUIT_COOLDOWN_S the circuit
+  is HALF_OPEN: one trial request is routed; success closes it, failure
+  reopens it. The router reserves the trial with acquire_trial() when it
+  selects the instance, so concurrent routes cannot all pick it.
+
+Usage:
+    telemetry = get_instance_telemetry()
+    with telemetry.track("llamacpp:qwen3-coder-30b") as call:
+        for chunk in stream:
+            call.first_token()
+            call.add_tokens(1)
+    telemetry.snapshot("llamacpp:qwen3-coder-30b").in_flight
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EWMA_ALPHA = 0.3
+ERROR_WINDOW_S = 60.0
+CIRCUIT_MIN_REQUESTS = 5
+CIRCUIT_ERROR_RATE = 0.5
+CIRCUIT_CONSECUTIVE_FAILURES = 3
+CIRCUIT_COOLDOWN_S = 30.0
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state of an instance"""
+    CLOSED = "CLOSED"  # Healthy, routable
+    OPEN = "OPEN"  # Failing, not routable until cooldown expires
+    HALF_OPEN = "HALF_OPEN"  # Cooldown expired, one trial request allowed
+
+
+@dataclass
+class TelemetrySnapshot:
+    """
+    Point-in-time view of an instance's live statistics
+    """
+    instance_id: str
+    in_flight: int = 0
+    ttft_ms: Optional[float] = None  # EWMA time to first token (streaming)
+    latency_ms: Optional[float] = None  # EWMA end-to-end request latency
+    tokens_per_s: Optional[float] = None  # EWMA generation throughput
+    error_rate: float = 0.0  # Failures / requests in the error window
+    window_requests: int = 0  # Requests in the error window
+    total_requests: int = 0
+    circuit: CircuitState = CircuitState.CLOSED
+    trial_owner: Optional[str] = None  # Holder of the half-open trial reservation
+
+    @property
+    def routable(self) -> bool:
+        """False while the circuit is open, or half-open with its trial reserved or running"""
+        return self.routable_for(None)
+
+    def routable_for(self, owner: Optional[str]) -> bool:
+        """Like routable, but a trial reserved by owner does not count against it"""
+        if self.circuit == CircuitState.OPEN:
+            return False
+        if self.circuit == CircuitState.HALF_OPEN:
+            return self.in_flight == 0 and self.trial_owner in (None, owner)
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        result = asdict(self)
+        result["circuit"] = self.circuit.value
+        return result
+
+
+@dataclass
+class _InstanceStats:
+    in_flight: int = 0
+    ttft_ms: Optional[float] = None
+    latency_ms: Optional[float] = None
+    tokens_per_s: Optional[float] = None
+    outcomes: Deque[Tuple[float, bool]] = field(default_factory=deque)  # (finished_at, ok)
+    total_requests: int = 0
+    consecutive_failures: int = 0
+    circuit: CircuitState = CircuitState.CLOSED
+    opened_at: float = 0.0
+    trial_owner: Optional[str] = None
+    trial_reserved_at: float = 0.0
+
+
+def _ewma(current: Optional[float], sample: float, alpha: float) -> float:
+    return sample if current is None else alpha * sample + (1 - alpha) * current
+
+
+class RequestTracker:
+    """
+    Tracks one request; use via InstanceTelemetry.track()
+
+    The request counts as failed if the block raises or fail() was called
+    (adapters that turn errors into messages call fail() themselves). A
+    stream closed early by its consumer (GeneratorExit) is not a failure.
+    """
+
+    def __init__(self, telemetry: "InstanceTelemetry", instance_id: str):
+        self._telemetry = telemetry
+        self.instance_id = instance_id
+        self._started = 0.0
+        self._first_token_at: Optional[float] = None
+        self._tokens = 0
+        self._failed = False
+
+    def first_token(self) -> None:
+        """Mark the first streamed token (later calls are ignored)"""
+        if self._first_token_at is None:
+            self._first_token_at = self._telemetry._clock()
+
+    def add_tokens(self, count: int = 1) -> None:
+        self._tokens += max(0, int(count or 0))
+
+    def fail(self, error: Any = None) -> None:
+        self._failed = True
+        if error is not None:
+            logger.debug(f"Request to {self.instance_id} failed: {error}")
+
+    def __enter__(self) -> "RequestTracker":
+        self._started = self._telemetry._begin(self.instance_id)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        finished = self._telemetry._clock()
+        ttft_ms = None
+        generation_s = finished - self._started
+        if self._first_token_at is not None:
+            ttft_ms = (self._first_token_at - self._started) * 1000
+            generation_s = finished - self._first_token_at
+        self._telemetry._finish(
+            self.instance_id,
+            ok=(exc_type is None or issubclass(exc_type, GeneratorExit)) and not self._failed,
+            latency_ms=(finished - self._started) * 1000,
+            ttft_ms=ttft_ms,
+            tokens=self._tokens,
+            generation_s=generation_s,
+        )
+        return False
+
+
+class InstanceTelemetry:
+    """
+    Thread-safe registry of live per-instance statistics
+    """
+
+    def __init__(
+        self,
+        alpha: float = EWMA_ALPHA,
+        error_window_s: float = ERROR_WINDOW_S,
+        circuit_min_requests: int = CIRCUIT_MIN_REQUESTS,
+        circuit_error_rate: float = CIRCUIT_ERROR_RATE,
+        circuit_consecutive_failures: int = CIRCUIT_CONSECUTIVE_FAILURES,
+        circuit_cooldown_s: float = CIRCUIT_COOLDOWN_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize telemetry
+
+        Args:
+            alpha: EWMA weight of the newest sample
+            error_window_s: Sliding window for the error rate
+            circuit_min_requests: Requests in the window before the error rate can open
+                the circuit
+            circuit_error_rate: Windowed error rate that opens the circuit
+            circuit_consecutive_failures: Failures in a row that open the circuit
+            circuit_cooldown_s: Seconds an open circuit waits before a trial request; also how
+                long an unused trial reservation is held
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.alpha = alpha
+        self.error_window_s = error_window_s
+        self.circuit_min_requests = circuit_min_requests
+        self.circuit_error_rate = circuit_error_rate
+        self.circuit_consecutive_failures = circuit_consecutive_failures
+        self.circuit_cooldown_s = circuit_cooldown_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _InstanceStats] = {}
+
+    def track(self, instance_id: str) -> RequestTracker:
+        """Context manager measuring one request to instance_id"""
+        return RequestTracker(self, instance_id)
+
+    def record(
+        self,
+        instance_id: str,
+        *,
+        ok: bool,
+        latency_ms: float,
+        ttft_ms: Optional[float] = None,
+        tokens: int = 0,
+    ) -> None:
+        """Record a request measured by the caller (not counted as in flight)"""
+        with self._lock:
+            self._stats_for(instance_id).in_flight += 1
+        generation_s = (latency_ms - (ttft_ms or 0.0)) / 1000
+        self._finish(
+            instance_id,
+            ok=ok,
+            latency_ms=latency_ms,
+            ttft_ms=ttft_ms,
+            tokens=tokens,
+            generation_s=generation_s,
+        )
+
+    def acquire_trial(self, instance_id: str, owner: str) -> bool:
+        """
+        Reserve an instance for a route about to use it
+
+        Always succeeds for a closed circuit. A half-open circuit allows one
+        trial: the first caller gets it, and everyone else is refused until
+        the trial finishes or the reservation expires after the cooldown.
+
+        Args:
+            instance_id: Instance being selected
+            owner: Identifies the reservation (e.g. the task id)
+
+        Returns:
+            True if owner may send its request to the instance
+        """
+        now = self._clock()
+        with self._lock:
+            stats = self._stats.get(instance_id)
+            if stats is None:
+                return True
+            circuit = self._circuit(stats, now)
+            if circuit == CircuitState.CLOSED:
+                return True
+            if circuit == CircuitState.OPEN or stats.in_flight > 0:
+                return False
+            if self._trial_owner(stats, now) not in (None, owner):
+                return False
+            stats.trial_owner = owner
+            stats.trial_reserved_at = now
+            return True
+
+    def snapshot(self, instance_id: str) -> TelemetrySnapshot:
+        """Current statistics for an instance (defaults if never seen)"""
+        now = self._clock()
+        with self._lock:
+            stats = self._stats.get(instance_id)
+            if stats is None:
+                return TelemetrySnapshot(instance_id=instance_id)
+            self._expire(stats, now)
+            failures = sum(1 for _, ok in stats.outcomes if not ok)
+            window = len(stats.outcomes)
+            return TelemetrySnapshot(
+                instance_id=instance_id,
+                in_flight=stats.in_flight,
+                ttft_ms=stats.ttft_ms,
+                latency_ms=stats.latency_ms,
+                tokens_per_s=stats.tokens_per_s,
+                error_rate=failures / window if window else 0.0,
+                window_requests=window,
+                total_requests=stats.total_requests,
+                circuit=self._circuit(stats, now),
+                trial_owner=self._trial_owner(stats, now),
+            )
+
+    def snapshots(self) -> Dict[str, TelemetrySnapshot]:
+        """Snapshots of every instance seen so far"""
+        with self._lock:
+            instance_ids = list(self._stats)
+        return {instance_id: self.snapshot(instance_id) for instance_id in instance_ids}
+
+    def reset(self, instance_id: Optional[str] = None) -> None:
+        """Forget one instance's statistics, or all"""
+        with self._lock:
+            if instance_id is None:
+                self._stats.clear()
+            else:
+                self._stats.pop(instance_id, None)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _stats_for(self, instance_id: str) -> _InstanceStats:
+        # Caller holds self._lock
+        stats = self._stats.get(instance_id)
+        if stats is None:
+            stats = self._stats[instance_id] = _InstanceStats()
+        return stats
+
+    def _begin(self, instance_id: str) -> float:
+        with self._lock:
+            self._stats_for(instance_id).in_flight += 1
+        return self._clock()
+
+    def _finish(
+        self,
+        instance_id: str,
+        *,
+        ok: bool,
+        latency_ms: float,
+        ttft_ms: Optional[float],
+        tokens: int,
+        generation_s: float,
+    ) -> None:
+        now = self._clock()
+        with self._lock:
+            stats = self._stats_for(instance_id)
+            stats.in_flight = max(0, stats.in_flight - 1)
+            stats.total_requests += 1
+            stats.outcomes.append((now, ok))
+            self._expire(stats, now)
+
+            if ok:
+                stats.latency_ms = _ewma(stats.latency_ms, latency_ms, self.alpha)
+                if ttft_ms is not None:
+                    stats.ttft_ms = _ewma(stats.ttft_ms, ttft_ms, self.alpha)
+                if tokens > 0 and generation_s > 0:
+                    throughput = tokens / generation_s
+                    stats.tokens_per_s = _ewma(stats.tokens_per_s, throughput, self.alpha)
+                stats.consecutive_failures = 0
+                if self._circuit(stats, now) == CircuitState.HALF_OPEN:
+                    # Trial request succeeded; forget the failures that opened the circuit
+                    stats.circuit = CircuitState.CLOSED
+                    stats.trial_owner = None
+                    stats.outcomes.clear()
+                    logger.info(f"Circuit closed for {instance_id}")
+                return
+
+            stats.consecutive_failures += 1
+            circuit = self._circuit(stats, now)
+            if circuit == CircuitState.OPEN:
+                return
+            failures = sum(1 for _, outcome in stats.outcomes if not outcome)
+            window = len(stats.outcomes)
+            error_rate_tripped = (
+                window >= self.circuit_min_requests
+                and failures / window >= self.circuit_error_rate
+            )
+            if (
+                circuit == CircuitState.HALF_OPEN
+                or stats.consecutive_failures >= self.circuit_consecutive_failures
+                or error_rate_tripped
+            ):
+                stats.circuit = CircuitState.OPEN
+                stats.opened_at = now
+                stats.trial_owner = None
+                logger.warning(
+                    f"Circuit opened for {instance_id} ({stats.consecutive_failures} "
+                    f"consecutive failures, {failures}/{window} in window)"
+                )
+
+    def _expire(self, stats: _InstanceStats, now: float) -> None:
+        # Caller holds self._lock
+        cutoff = now - self.error_window_s
+        while stats.outcomes and stats.outcomes[0][0] < cutoff:
+            stats.outcomes.popleft()
+
+    def _circuit(self, stats: _InstanceStats, now: float) -> CircuitState:
+        # Caller holds self._lock
+        if stats.circuit == CircuitState.OPEN and now - stats.opened_at >= self.circuit_cooldown_s:
+            stats.circuit = CircuitState.HALF_OPEN
+        return stats.circuit
+
+    def _trial_owner(self, stats: _InstanceStats, now: float) -> Optional[str]:
+        # Caller holds self._lock; a reservation nobody used expires after the cooldown
+        expired = now - stats.trial_reserved_at >= self.circuit_cooldown_s
+        if stats.trial_owner is not None and expired:
+            stats.trial_owner = None
+        return stats.trial_owner
+
+
+_default_telemetry: Optional[InstanceTelemetry] = None
+_default_lock = threading.Lock()
+
+
+def get_instance_telemetry() -> InstanceTelemetry:
+    """Process-wide InstanceTelemetry"""
+    global _default_telemetry
+    if _default_telemetry is None:
+        with _default_lock:
+            if _default_telemetry is None:
+                _default_telemetry = InstanceTelemetry()
+    return _default_telemetry
@@ -0,0 +1,9 @@
+-- schema_v101_kb_source_stat.sql
+-- ProjectKB stat fast path: remember (size, mtime_ns) per source so refresh
+-- can skip re-hashing files whose stat has not changed.
+
+ALTER TABLE kb_sources ADD COLUMN size_bytes INTEGER;
+ALTER TABLE kb_sources ADD COLUMN mtime_ns INTEGER;
+
+INSERT INTO schema_version (version, applied_at)
+VALUES ('0.101.0-v101', datetime('now'));
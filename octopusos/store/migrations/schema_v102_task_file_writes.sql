@@ -0,0 +1,43 @@
+-- schema_v102_task_file_writes.sql
+-- File-write ledger for dependency detection: one row per (file, writing task).
+-- TaskDependencyService used to find the last writer of a file with
+-- LIKE '%write%' / LIKE '%<path>%' over task_audits (full table scan per file).
+-- The ledger is filled by a trigger on every write audit, whatever code path
+-- inserts it, and backfilled from existing audits below.
+
+CREATE TABLE IF NOT EXISTS task_file_writes (
+    write_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL,                  -- files_changed entry of the audit payload
+    task_id TEXT NOT NULL,
+    audit_id INTEGER,                    -- source task_audits row
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (task_id) REFERENCES tasks(task_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_task_file_writes_path
+    ON task_file_writes(path, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_task_file_writes_task
+    ON task_file_writes(task_id);
+
+CREATE TRIGGER IF NOT EXISTS task_audits_record_file_writes
+AFTER INSERT ON task_audits
+FOR EACH ROW
+WHEN NEW.event_type LIKE '%write%' AND json_valid(NEW.payload)
+BEGIN
+    INSERT INTO task_file_writes (path, task_id, audit_id, created_at)
+    SELECT value, NEW.task_id, NEW.audit_id, COALESCE(NEW.created_at, CURRENT_TIMESTAMP)
+    FROM json_each(NEW.payload, '$.files_changed')
+    WHERE type = 'text';
+END;
+
+-- Backfill from existing write audits
+INSERT INTO task_file_writes (path, task_id, audit_id, created_at)
+SELECT je.value, ta.task_id, ta.audit_id, COALESCE(ta.created_at, CURRENT_TIMESTAMP)
+FROM task_audits ta,
+     json_each(CASE WHEN json_valid(ta.payload) THEN ta.payload ELSE '{}' END, '$.files_changed') je
+WHERE ta.event_type LIKE '%write%'
+  AND je.type = 'text';
+
+INSERT INTO schema_version (version, applied_at)
+VALUES ('0.102.0-v102', datetime('now'));
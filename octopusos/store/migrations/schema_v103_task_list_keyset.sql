@@ -0,0 +1,21 @@
+-- schema_v103_task_list_keyset.sql
+-- Keyset pagination for task listings: TaskManager.list_tasks_page and
+-- GET /api/tasks?cursor= page with (created_at, task_id) < (?, ?) ordered by
+-- created_at DESC, task_id DESC. These indexes serve that order directly for
+-- the unfiltered list and the status / project / session filters.
+
+CREATE INDEX IF NOT EXISTS idx_tasks_created_task
+    ON tasks(created_at DESC, task_id DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_created_task
+    ON tasks(status, created_at DESC, task_id DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_project_created_task
+    ON tasks(project_id, created_at DESC, task_id DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_session_created_task
+    ON tasks(session_id, created_at DESC, task_id DESC);
+
+-- Strict prefixes of the indexes above
+DROP INDEX IF EXISTS idx_tasks_created;
+DROP INDEX IF EXISTS idx_tasks_project_created;
+
+INSERT INTO schema_version (version, applied_at)
+VALUES ('0.103.0-v103', datetime('now'));
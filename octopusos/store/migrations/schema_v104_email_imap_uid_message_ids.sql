@@ -0,0 +1,33 @@
+-- schema_v104_email_imap_uid_message_ids.sql
+-- The IMAP/SMTP provider now returns IMAP UIDs as message ids instead of
+-- sequence numbers. Ids stored before this change can only be mapped to UIDs
+-- against the live mailbox, and an old sequence number may now name a
+-- different message, so IMAP-sourced ids are invalidated once:
+--
+-- - snoozes are cleared (snoozed mail shows up in the next digest again)
+-- - pending reply drafts are cancelled (send_draft would look up the sender
+--   by the stale id)
+-- - digest run locks are cleared so the scheduler re-runs today's digest and
+--   the ids it lists are UIDs
+--
+-- OAuth providers (Gmail / Outlook) keep their ids and are not touched.
+
+DELETE FROM email_snoozes
+WHERE instance_id IN (
+  SELECT instance_id FROM email_instances WHERE provider_type = 'imap_smtp'
+);
+
+UPDATE email_drafts
+SET status = 'cancelled'
+WHERE status = 'draft'
+  AND instance_id IN (
+    SELECT instance_id FROM email_instances WHERE provider_type = 'imap_smtp'
+  );
+
+DELETE FROM email_digest_runs
+WHERE instance_id IN (
+  SELECT instance_id FROM email_instances WHERE provider_type = 'imap_smtp'
+);
+
+INSERT INTO schema_version (version, applied_at)
+VALUES ('0.104.0-v104', datetime('now'));
@@ -250,7 +250,13 @@ def connect_channel(channel_id: str) -> Dict[str, Any]:
 @router.get("/channels/{channel_id}/status")
 def channel_status(channel_id: str) -> Dict[str, Any]:
     rt = get_communication_runtime()
-    return {"ok": True, "channel_id": channel_id, "status": rt.get_adapter_status(channel_id), "source": "real"}
+    return {
+        "ok": True,
+        "channel_id": channel_id,
+        "status": rt.get_adapter_status(channel_id),
+        "queues": rt.get_queue_metrics(channel_id),
+        "source": "real",
+    }
 
 
 @router.get("/channels/{channel_id}/qr")
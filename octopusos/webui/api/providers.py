@@ -472,8 +472,8 @@ async def test_cloud_config(provider_id: str, config_id: str) -> Dict[str, Any]:
     manager.set_active(provider_id, config_id)
 
     import asyncio as _asyncio
-    import httpx
     from datetime import datetime, timezone
+    from octopusos.providers.http_pool import pooled_async_client
 
     ok = False
     error: Optional[str] = None
@@ -486,7 +486,7 @@ async def test_cloud_config(provider_id: str, config_id: str) -> Dict[str, Any]:
         base_url = (cfg.base_url or "").rstrip("/")
         start = _asyncio.get_event_loop().time()
         try:
-            async with httpx.AsyncClient(timeout=4.0) as client:
+            async with pooled_async_client(provider_id, base_url, api_key=cfg.auth.api_key, timeout=4.0) as client:
                 if provider_id == "anthropic":
                     resp = await client.get(
                         f"{base_url}/models" if base_url else "https://api.anthropic.com/v1/models",
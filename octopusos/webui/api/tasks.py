@@ -28,6 +28,7 @@ from pydantic import BaseModel
 
 from octopusos.store import get_db_path
 from octopusos.core.task import TaskManager
+from octopusos.core.task.manager import encode_task_cursor, task_cursor_condition
 from octopusos.core.runner.task_runner import TaskRunner
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
@@ -59,6 +60,7 @@ class TasksListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class TaskLiveResponse(BaseModel):
@@ -393,6 +395,8 @@ def list_tasks(
     page: int = Query(1, ge=1),
     limit: int = Query(25, ge=1, le=500),
     offset: Optional[int] = Query(default=None, ge=0),
+    cursor: Optional[str] = Query(default=None, description="next_cursor of the previous page"),
+    include_metadata: bool = Query(True, description="Set false for a lighter list payload"),
 ) -> Dict[str, Any]:
     conn = _db_connect()
     try:
@@ -401,6 +405,7 @@ def list_tasks(
 
         cols = _table_columns(conn, "tasks")
         id_col = _task_id_col(cols)
+        keyset = "created_at" in cols
 
         where = []
         params: list[Any] = []
@@ -414,14 +419,46 @@ def list_tasks(
             where.append("status = ?")
             params.append(status)
         where_sql = f" WHERE {' AND '.join(where)}" if where else ""
+        total = conn.execute(f"SELECT COUNT(*) FROM tasks{where_sql}", params).fetchone()[0]
 
+        # Keyset pagination: the cursor replaces page/offset and keeps deep pages cheap.
         use_offset = offset if offset is not None else (page - 1) * limit
-        total = conn.execute(f"SELECT COUNT(*) FROM tasks{where_sql}", params).fetchone()[0]
+        if cursor:
+            if not keyset:
+                raise HTTPException(
+                    status_code=400,
+                    detail="cursor pagination is not supported by this tasks table",
+                )
+            try:
+                condition, cursor_params = task_cursor_condition(cursor, id_col)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            where.append(condition)
+            params.extend(cursor_params)
+            where_sql = f" WHERE {' AND '.join(where)}"
+            use_offset = 0
+
+        # Only the columns the list view renders; metadata JSON on request.
+        list_cols = (
+            id_col, "project_id", "session_id", "title", "description", "status",
+            "created_at", "updated_at",
+        )
+        selected = [c for c in list_cols if c in cols]
+        if include_metadata and "metadata" in cols:
+            selected.append("metadata")
+        order_sql = f"created_at DESC, {id_col} DESC" if keyset else "rowid DESC"
         rows = conn.execute(
-            f"SELECT * FROM tasks{where_sql} ORDER BY rowid DESC LIMIT ? OFFSET ?",
-            params + [limit, use_offset],
+            f"SELECT {', '.join(selected)} FROM tasks{where_sql}"
+            f" ORDER BY {order_sql} LIMIT ? OFFSET ?",
+            params + [limit + 1, use_offset],
         ).fetchall()
 
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            if keyset:
+                next_cursor = encode_task_cursor(rows[-1]["created_at"], str(rows[-1][id_col]))
+
         tasks = []
         for r in rows:
             d = _as_task(r, id_col)
@@ -438,6 +475,7 @@ def list_tasks(
             total=int(total),
             limit=int(limit),
             offset=int(use_offset),
+            next_cursor=next_cursor,
         ).model_dump()
     finally:
         conn.close()
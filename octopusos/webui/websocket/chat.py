@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import contextlib
 import hashlib
 import json
 import logging
+import threading
+import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from fastapi import WebSocket
 
@@ -24,6 +28,13 @@ logger = logging.getLogger(__name__)
 
 CANCEL_TIMEOUT_SECONDS = 5.0
 
+# Stream event persistence: frames go to the socket first, then into a per-run
+# ring that a background writer flushes in batches.
+STREAM_FLUSH_MAX_EVENTS = 64
+STREAM_FLUSH_INTERVAL_SECONDS = 0.05
+STREAM_RING_CAPACITY = 4096
+STREAM_FLUSH_NOW_TYPES = frozenset({"message.end", "message.error", "message.cancelled"})
+
 
 @dataclass
 class ChatRuntimeConfig:
@@ -248,24 +259,23 @@ class ConnectionManager:
         run_id = str(message.get("run_id") or "").strip()
         seq_raw = message.get("seq")
         seq = int(seq_raw) if isinstance(seq_raw, int) or (isinstance(seq_raw, str) and seq_raw.isdigit()) else 0
+        websocket = self.active_connections.get(session_id)
+        if websocket:
+            try:
+                await websocket.send_json(message)
+            except Exception:
+                logger.warning("Failed to send websocket json message, disconnect stale session: %s", session_id, exc_info=True)
+                self.disconnect(session_id)
         if run_id and seq > 0:
             try:
-                recovery_store.append_event(
+                recovery_store.buffer_event(
                     session_id=session_id,
                     run_id=run_id,
                     seq=seq,
                     event=message,
                 )
-                recovery_store.update_last_seq(session_id=session_id, run_id=run_id, seq=seq)
             except Exception:
-                logger.debug("Failed to persist stream event %s/%s#%s", session_id, run_id, seq, exc_info=True)
-        websocket = self.active_connections.get(session_id)
-        if websocket:
-            try:
-                await websocket.send_json(message)
-            except Exception:
-                logger.warning("Failed to send websocket json message, disconnect stale session: %s", session_id, exc_info=True)
-                self.disconnect(session_id)
+                logger.debug("Failed to buffer stream event %s/%s#%s", session_id, run_id, seq, exc_info=True)
 
     async def send_text(self, session_id: str, text: str) -> None:
         websocket = self.active_connections.get(session_id)
@@ -432,11 +442,189 @@ class CommandStore:
 command_store = CommandStore()
 
 
+StreamEventRow = Tuple[str, str, int, Dict[str, Any]]
+
+
+class StreamEventBuffer:
+    """Per-run in-memory rings of stream events, persisted by a background writer.
+
+    The writer thread drains every ring in a single batch once a run has
+    ``max_events`` pending events, once the oldest pending event is
+    ``flush_interval`` seconds old, or immediately after a terminal event
+    (``message.end`` and friends). Events remain visible through
+    ``pending_events`` until the batch holding them has been committed, so
+    readers never observe a gap between the buffer and the database.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[List[StreamEventRow]], None],
+        *,
+        max_events: int = STREAM_FLUSH_MAX_EVENTS,
+        flush_interval: float = STREAM_FLUSH_INTERVAL_SECONDS,
+        ring_capacity: int = STREAM_RING_CAPACITY,
+    ) -> None:
+        self._write_batch = write_batch
+        self._max_events = max(1, int(max_events))
+        self._flush_interval = max(0.0, float(flush_interval))
+        self._ring_capacity = max(self._max_events, int(ring_capacity))
+        self._cond = threading.Condition()
+        self._rings: Dict[Tuple[str, str], Deque[Tuple[int, Dict[str, Any]]]] = {}
+        self._inflight: Dict[Tuple[str, str], Deque[Tuple[int, Dict[str, Any]]]] = {}
+        self._first_pending_at: Optional[float] = None
+        self._flush_requested = False
+        self._requested_generation = 0
+        self._flushed_generation = 0
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._batches = 0
+        self._events_written = 0
+        self._events_dropped = 0
+        self._failed_batches = 0
+
+    def append(self, session_id: str, run_id: str, seq: int, event: Dict[str, Any]) -> None:
+        key = (session_id, run_id)
+        with self._cond:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                ring = self._rings.get(key)
+                if ring is None:
+                    ring = deque(maxlen=self._ring_capacity)
+                    self._rings[key] = ring
+                if len(ring) == ring.maxlen:
+                    # Writer is stalled; the oldest event falls out and resume will
+                    # report required_retry for it, exactly as for a failed write.
+                    self._events_dropped += 1
+                ring.append((int(seq), event))
+                if self._first_pending_at is None:
+                    self._first_pending_at = time.monotonic()
+                if len(ring) >= self._max_events or event.get("type") in STREAM_FLUSH_NOW_TYPES:
+                    self._flush_requested = True
+                self._ensure_writer()
+                self._cond.notify_all()
+        if closed:
+            self._write([(session_id, run_id, int(seq), event)])
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Ask the writer to persist everything buffered so far and wait for it."""
+        with self._cond:
+            if not self._rings and not self._inflight:
+                return True
+            self._requested_generation += 1
+            target = self._requested_generation
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: self._flushed_generation >= target or (not self._rings and not self._inflight),
+                timeout,
+            )
+
+    def pending_events(self, session_id: str, run_id: str, after_seq: int = 0) -> List[Tuple[int, Dict[str, Any]]]:
+        """Buffered (not yet committed) events of a run with ``seq > after_seq``."""
+        key = (session_id, run_id)
+        with self._cond:
+            pending = [
+                item
+                for source in (self._inflight, self._rings)
+                for item in source.get(key, ())
+                if item[0] > after_seq
+            ]
+        return pending
+
+    def pending_last_seq(self, session_id: str, run_id: str) -> int:
+        key = (session_id, run_id)
+        with self._cond:
+            return max(
+                (item[0] for source in (self._inflight, self._rings) for item in source.get(key, ())),
+                default=0,
+            )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending events and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            pending = sum(len(ring) for ring in self._rings.values())
+            return {
+                "pending_events": pending,
+                "pending_runs": len(self._rings),
+                "batches": self._batches,
+                "events_written": self._events_written,
+                "events_dropped": self._events_dropped,
+                "failed_batches": self._failed_batches,
+                "avg_batch_size": (self._events_written / self._batches) if self._batches else 0.0,
+            }
+
+    def _ensure_writer(self) -> None:
+        # Caller holds self._cond
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run,
+                name="chat-stream-event-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._rings and not self._closed:
+                    self._cond.wait()
+                if not self._rings:
+                    return
+                deadline = (self._first_pending_at or time.monotonic()) + self._flush_interval
+                while not self._flush_requested and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._rings
+                self._rings = {}
+                self._inflight = batch
+                self._first_pending_at = None
+                self._flush_requested = False
+                generation = self._requested_generation
+
+            self._write(
+                [
+                    (session_id, run_id, seq, event)
+                    for (session_id, run_id), ring in batch.items()
+                    for seq, event in ring
+                ]
+            )
+
+            with self._cond:
+                self._inflight = {}
+                self._flushed_generation = generation
+                self._cond.notify_all()
+
+    def _write(self, rows: List[StreamEventRow]) -> None:
+        try:
+            self._write_batch(rows)
+        except Exception:
+            logger.warning("Failed to persist %d stream events", len(rows), exc_info=True)
+            with self._cond:
+                self._failed_batches += 1
+            return
+        with self._cond:
+            self._batches += 1
+            self._events_written += len(rows)
+
+
 class SessionRecoveryStore:
     """Persistent run/session recovery state for WebSocket chat streaming."""
 
     def __init__(self) -> None:
         self._schema_ready = False
+        self._buffer = StreamEventBuffer(self.append_events)
 
     def _ensure_schema(self) -> None:
         if self._schema_ready:
@@ -561,6 +749,62 @@ class SessionRecoveryStore:
         )
         conn.commit()
 
+    def append_events(self, events: List[StreamEventRow]) -> None:
+        """Persist a batch of (session_id, run_id, seq, event) rows in one transaction."""
+        if not events:
+            return
+        self._ensure_schema()
+        last_seqs: Dict[Tuple[str, str], int] = {}
+        rows = []
+        for session_id, run_id, seq, event in events:
+            rows.append((session_id, run_id, int(seq), json.dumps(event, ensure_ascii=False)))
+            key = (session_id, run_id)
+            last_seqs[key] = max(last_seqs.get(key, 0), int(seq))
+        conn = get_db()
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO session_run_events (session_id, run_id, seq, created_at, event_json)
+                VALUES (?, ?, ?, strftime('%s','now'), ?)
+                """,
+                rows,
+            )
+            cursor.executemany(
+                """
+                UPDATE session_run_state
+                SET last_seq = CASE WHEN ? > last_seq THEN ? ELSE last_seq END,
+                    updated_at = strftime('%s','now')
+                WHERE session_id = ? AND run_id = ?
+                """,
+                [(seq, seq, session_id, run_id) for (session_id, run_id), seq in last_seqs.items()],
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def buffer_event(
+        self,
+        *,
+        session_id: str,
+        run_id: str,
+        seq: int,
+        event: Dict[str, Any],
+    ) -> None:
+        """Queue a stream event for batched persistence (never blocks on SQLite)."""
+        self._buffer.append(session_id, run_id, int(seq), dict(event))
+
+    def flush_buffered(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every buffered stream event has been committed."""
+        return self._buffer.flush(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        self._buffer.close(timeout)
+
+    def get_buffer_stats(self) -> Dict[str, Any]:
+        return self._buffer.get_stats()
+
     def get_state(self, session_id: str) -> Optional[Dict[str, Any]]:
         self._ensure_schema()
         conn = get_db()
@@ -584,12 +828,13 @@ class SessionRecoveryStore:
                     metadata = parsed
             except Exception:
                 metadata = {}
+        last_seq = max(int(row[4] or 0), self._buffer.pending_last_seq(row[0], row[1]))
         return {
             "session_id": row[0],
             "run_id": row[1],
             "message_id": row[2],
             "status": row[3],
-            "last_seq": int(row[4] or 0),
+            "last_seq": last_seq,
             "reason": row[5],
             "metadata": metadata,
             "updated_at": int(row[7] or 0),
@@ -604,27 +849,34 @@ class SessionRecoveryStore:
         limit: int = 2000,
     ) -> List[Dict[str, Any]]:
         self._ensure_schema()
+        safe_after_seq = max(0, int(after_seq))
+        safe_limit = max(1, min(int(limit), 5000))
+        # Snapshot the buffer before reading SQLite: an event committed in between
+        # then shows up in both places instead of in neither.
+        pending = self._buffer.pending_events(session_id, run_id, safe_after_seq)
         conn = get_db()
         cursor = conn.cursor()
         rows = cursor.execute(
             """
-            SELECT event_json
+            SELECT seq, event_json
             FROM session_run_events
             WHERE session_id = ? AND run_id = ? AND seq > ?
             ORDER BY seq ASC
             LIMIT ?
             """,
-            (session_id, run_id, max(0, int(after_seq)), max(1, min(int(limit), 5000))),
+            (session_id, run_id, safe_after_seq, safe_limit),
         ).fetchall()
-        events: List[Dict[str, Any]] = []
+        by_seq: Dict[int, Dict[str, Any]] = {}
         for row in rows:
             try:
-                payload = json.loads(row[0])
+                payload = json.loads(row[1])
                 if isinstance(payload, dict):
-                    events.append(payload)
+                    by_seq[int(row[0])] = payload
             except Exception:
                 continue
-        return events
+        for seq, payload in pending:
+            by_seq[seq] = payload
+        return [by_seq[seq] for seq in sorted(by_seq)[:safe_limit]]
 
     def mark_inflight_as_interrupted(self, *, reason: str) -> List[Dict[str, Any]]:
         """Mark persisted inflight states as interrupted (typically after process restart)."""
@@ -661,6 +913,7 @@ class SessionRecoveryStore:
 
 
 recovery_store = SessionRecoveryStore()
+atexit.register(recovery_store.close)
 
 
 def get_session_store():
@@ -0,0 +1,316 @@
+"""Per-conversation actor executor for inbound channel traffic.
+
+Inbound chat messages must be handled in order within a conversation (a
+reply to message N+1 must not overtake message N), while different
+conversations should run in parallel. ConversationExecutor gives every
+conversation a FIFO mailbox and drains the mailboxes on a bounded pool of
+worker threads; a mailbox is run by at most one worker at a time.
+
+Design Principles:
+- Bounded threads: at most max_workers workers, started on demand and
+  stopped after idling for worker_idle_s
+- Backpressure: submit() never blocks the caller (the message bus calls
+  handlers from its event loop); it sheds the message instead when the
+  conversation's mailbox holds max_mailbox_depth items or max_pending items
+  are queued in total
+- Fairness: a worker runs one item, then puts the mailbox back at the end
+  of the ready queue, so a chatty conversation cannot starve the others
+- Idle eviction: empty mailboxes are dropped after idle_ttl_s
+- Metrics: per channel queue depth, shed counts and queue-wait / run
+  latency percentiles (see metrics())
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_MAILBOX_DEPTH = 20
+DEFAULT_MAX_PENDING = 500
+DEFAULT_IDLE_TTL_S = 300.0
+DEFAULT_WORKER_IDLE_S = 60.0
+
+# Latency samples kept per channel for percentiles
+_LATENCY_SAMPLES = 512
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, "") or default)
+    except ValueError:
+        logger.warning("Invalid %s, using %s", name, default)
+        return default
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))], 2)
+
+
+@dataclass
+class _Mailbox:
+    key: str
+    channel_id: str
+    items: Deque[Tuple[Callable[[], Any], float]] = field(default_factory=deque)
+    scheduled: bool = False  # In the ready queue or being run by a worker
+    last_active: float = field(default_factory=time.monotonic)
+    shed_streak: int = 0  # Consecutive shed submissions
+
+
+@dataclass
+class _ChannelStats:
+    pending: int = 0
+    running: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    shed: int = 0
+    max_depth: int = 0
+    wait_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_SAMPLES))
+    run_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_SAMPLES))
+
+
+class ConversationExecutor:
+    """Bounded worker pool with one FIFO mailbox per conversation.
+
+    Usage:
+        executor = ConversationExecutor(name="commos-inbound")
+        if not executor.submit(conversation_key, lambda: handle(message), channel_id="slack"):
+            ...  # shed: tell the user to retry
+    """
+
+    def __init__(
+        self,
+        name: str = "commos-conversation",
+        max_workers: Optional[int] = None,
+        max_mailbox_depth: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        idle_ttl_s: float = DEFAULT_IDLE_TTL_S,
+        worker_idle_s: float = DEFAULT_WORKER_IDLE_S,
+    ):
+        """Initialize the executor.
+
+        Args:
+            name: Worker thread name prefix
+            max_workers: Max worker threads (default: OCTOPUSOS_COMM_WORKERS or 8)
+            max_mailbox_depth: Max queued items per conversation
+                (default: OCTOPUSOS_COMM_MAILBOX_DEPTH or 20)
+            max_pending: Max queued items across all conversations
+                (default: OCTOPUSOS_COMM_MAX_PENDING or 500)
+            idle_ttl_s: Empty mailboxes idle this long are evicted
+            worker_idle_s: Workers without work this long exit
+        """
+        self.name = name
+        self.max_workers = max(1, max_workers or _env_int("OCTOPUSOS_COMM_WORKERS", DEFAULT_MAX_WORKERS))
+        self.max_mailbox_depth = max(
+            1, max_mailbox_depth or _env_int("OCTOPUSOS_COMM_MAILBOX_DEPTH", DEFAULT_MAX_MAILBOX_DEPTH)
+        )
+        self.max_pending = max(1, max_pending or _env_int("OCTOPUSOS_COMM_MAX_PENDING", DEFAULT_MAX_PENDING))
+        self.idle_ttl_s = idle_ttl_s
+        self.worker_idle_s = worker_idle_s
+
+        self._cond = threading.Condition()
+        self._mailboxes: Dict[str, _Mailbox] = {}
+        self._ready: Deque[_Mailbox] = deque()
+        self._pending = 0
+        self._workers = 0
+        self._idle_workers = 0
+        self._worker_seq = 0
+        self._stats: Dict[str, _ChannelStats] = {}
+        self._last_sweep = time.monotonic()
+        self._evicted = 0
+        self._shutdown = False
+
+    def submit(self, key: str, fn: Callable[[], Any], *, channel_id: str = "") -> bool:
+        """Queue fn on the conversation's mailbox.
+
+        Args:
+            key: Conversation key (items with the same key run in order)
+            fn: Callable run on a worker thread
+            channel_id: Channel the item belongs to (for metrics)
+
+        Returns:
+            True if queued, False if shed (limits exceeded or shut down)
+        """
+        now = time.monotonic()
+        with self._cond:
+            stats = self._stats.get(channel_id)
+            if stats is None:
+                stats = self._stats[channel_id] = _ChannelStats()
+            mailbox = self._mailboxes.get(key)
+
+            if (
+                self._shutdown
+                or self._pending >= self.max_pending
+                or (mailbox is not None and len(mailbox.items) >= self.max_mailbox_depth)
+            ):
+                stats.shed += 1
+                if mailbox is None and not self._shutdown:
+                    # Empty mailbox just to track the streak; evicted once idle
+                    mailbox = self._mailboxes[key] = _Mailbox(key=key, channel_id=channel_id)
+                if mailbox is not None:
+                    mailbox.shed_streak += 1
+                    mailbox.last_active = now
+                return False
+
+            if mailbox is None:
+                mailbox = self._mailboxes[key] = _Mailbox(key=key, channel_id=channel_id)
+            mailbox.items.append((fn, now))
+            mailbox.last_active = now
+            mailbox.shed_streak = 0
+            self._pending += 1
+            stats.pending += 1
+            stats.submitted += 1
+            stats.max_depth = max(stats.max_depth, len(mailbox.items))
+
+            if not mailbox.scheduled:
+                mailbox.scheduled = True
+                self._ready.append(mailbox)
+                # A notified worker stays counted as idle until it runs, so
+                # only mailboxes beyond the idle count can count on a wakeup
+                if len(self._ready) <= self._idle_workers:
+                    self._cond.notify()
+                elif self._workers < self.max_workers:
+                    self._start_worker()
+
+            if now - self._last_sweep >= self.idle_ttl_s / 4:
+                self._evict_idle(now)
+        return True
+
+    def shed_streak(self, key: str) -> int:
+        """Consecutive shed submissions for a conversation since it last accepted one"""
+        with self._cond:
+            mailbox = self._mailboxes.get(key)
+            return mailbox.shed_streak if mailbox is not None else 0
+
+    def metrics(self, channel_id: Optional[str] = None) -> Dict[str, Any]:
+        """Queue depth and latency metrics, per channel (or for one channel)"""
+        with self._cond:
+            channels = {}
+            for cid, stats in self._stats.items():
+                if channel_id is not None and cid != channel_id:
+                    continue
+                wait_ms = list(stats.wait_ms)
+                run_ms = list(stats.run_ms)
+                channels[cid] = {
+                    "pending": stats.pending,
+                    "running": stats.running,
+                    "submitted": stats.submitted,
+                    "completed": stats.completed,
+                    "failed": stats.failed,
+                    "shed": stats.shed,
+                    "max_depth": stats.max_depth,
+                    "mailboxes": sum(1 for mb in self._mailboxes.values() if mb.channel_id == cid),
+                    "queue_wait_ms_p50": _percentile(wait_ms, 0.5),
+                    "queue_wait_ms_p95": _percentile(wait_ms, 0.95),
+                    "run_ms_p50": _percentile(run_ms, 0.5),
+                    "run_ms_p95": _percentile(run_ms, 0.95),
+                }
+            if channel_id is not None:
+                return channels.get(channel_id, {})
+            return {
+                "workers": self._workers,
+                "max_workers": self.max_workers,
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "mailboxes": len(self._mailboxes),
+                "evicted_mailboxes": self._evicted,
+                "channels": channels,
+            }
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = 10.0) -> bool:
+        """Stop accepting work; queued items still run. Returns False on timeout."""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+            if not wait:
+                return True
+            return self._cond.wait_for(lambda: self._workers == 0, timeout)
+
+    # ------------------------------------------------------------------
+    # Internals (callers hold self._cond unless noted)
+    # ------------------------------------------------------------------
+
+    def _start_worker(self) -> None:
+        self._workers += 1
+        self._worker_seq += 1
+        threading.Thread(
+            target=self._worker,
+            name=f"{self.name}-{self._worker_seq}",
+            daemon=True,
+        ).start()
+
+    def _evict_idle(self, now: float) -> None:
+        self._last_sweep = now
+        idle = [
+            key
+            for key, mb in self._mailboxes.items()
+            if not mb.scheduled and not mb.items and now - mb.last_active >= self.idle_ttl_s
+        ]
+        for key in idle:
+            del self._mailboxes[key]
+        if idle:
+            self._evicted += len(idle)
+            logger.debug("%s: evicted %d idle conversation mailboxes", self.name, len(idle))
+
+    def _worker(self) -> None:
+        # Runs without self._cond except where taken
+        while True:
+            with self._cond:
+                idle_since = time.monotonic()
+                while not self._ready:
+                    if self._shutdown:
+                        self._exit_worker()
+                        return
+                    remaining = self.worker_idle_s - (time.monotonic() - idle_since)
+                    if remaining <= 0:
+                        self._exit_worker()
+                        return
+                    self._idle_workers += 1
+                    self._cond.wait(remaining)
+                    self._idle_workers -= 1
+                mailbox = self._ready.popleft()
+                fn, enqueued_at = mailbox.items.popleft()
+                self._pending -= 1
+                stats = self._stats[mailbox.channel_id]
+                stats.pending -= 1
+                stats.running += 1
+
+            started = time.monotonic()
+            ok = True
+            try:
+                fn()
+            except Exception:
+                ok = False
+                logger.exception("%s: conversation task failed (%s)", self.name, mailbox.key)
+            finished = time.monotonic()
+
+            with self._cond:
+                stats.running -= 1
+                stats.completed += 1
+                if not ok:
+                    stats.failed += 1
+                stats.wait_ms.append((started - enqueued_at) * 1000)
+                stats.run_ms.append((finished - started) * 1000)
+                mailbox.last_active = finished
+                if mailbox.items:
+                    self._ready.append(mailbox)
+                else:
+                    mailbox.scheduled = False
+                if self._idle_workers and len(self._ready) > 1:
+                    self._cond.notify()
+
+    def _exit_worker(self) -> None:
+        self._workers -= 1
+        if self._workers == 0:
+            self._cond.notify_all()
@@ -20,6 +20,7 @@ from typing import Any, Dict, Optional
 from octopusos.communicationos.audit import AuditMiddleware, AuditStore
 from octopusos.communicationos.bindings_store import ChannelBindingsStore
 from octopusos.communicationos.commands import CommandProcessor
+from octopusos.communicationos.conversation_executor import ConversationExecutor
 from octopusos.communicationos.dedupe import DedupeMiddleware, DedupeStore
 from octopusos.communicationos.manifest import ChannelManifest
 from octopusos.communicationos.message_bus import MessageBus
@@ -107,8 +108,11 @@ class CommunicationRuntime:
 
         self._adapters: Dict[str, ChannelRuntimeState] = {}
         self._lock = threading.RLock()
-        self._inbound_conversation_locks: Dict[str, threading.Lock] = {}
-        self._inbound_conversation_locks_guard = threading.RLock()
+        # Inbound chat runs per conversation in FIFO order on a bounded pool;
+        # replies sent outside a chat turn (commands, shortcuts) use their own
+        # pool so they are not queued behind LLM calls.
+        self._inbound_executor = ConversationExecutor(name="commos-inbound")
+        self._outbound_executor = ConversationExecutor(name="commos-send", max_workers=4)
 
         self._command_processor = CommandProcessor(self.session_store)
 
@@ -356,22 +360,27 @@ class CommunicationRuntime:
         )
         # Fast-path session reset commands for IM usage:
         # /new, /start, /session new, /resume, /session resume
-        try:
-            text = " ".join(str(message.text or "").strip().lower().split())
-            if text in {"/new", "/start", "/session new"}:
-                _comm_trace("shortcut_detected", command=text, message_id=message.message_id)
-                self._handle_session_new_shortcut(message)
-                return
-            if text in {"/clear", "/session clear"}:
-                _comm_trace("shortcut_detected", command=text, message_id=message.message_id)
-                self._handle_session_clear_shortcut(message)
-                return
-            if text in {"/resume", "/session resume"}:
-                _comm_trace("shortcut_detected", command=text, message_id=message.message_id)
-                self._handle_session_resume_shortcut(message)
-                return
-        except Exception:
-            logger.exception("Session shortcut failed")
+        # They go through the conversation mailbox so they apply after the
+        # chat messages sent before them.
+        text = " ".join(str(message.text or "").strip().lower().split())
+        shortcut = None
+        if text in {"/new", "/start", "/session new"}:
+            shortcut = self._handle_session_new_shortcut
+        elif text in {"/clear", "/session clear"}:
+            shortcut = self._handle_session_clear_shortcut
+        elif text in {"/resume", "/session resume"}:
+            shortcut = self._handle_session_resume_shortcut
+        if shortcut is not None:
+            _comm_trace("shortcut_detected", command=text, message_id=message.message_id)
+
+            def _run_shortcut() -> None:
+                try:
+                    shortcut(message)
+                except Exception:
+                    logger.exception("Session shortcut failed")
+
+            self._enqueue_inbound(message, _run_shortcut)
+            return
 
         # Commands are handled inline (cheap) and responded via same channel.
         try:
@@ -392,12 +401,8 @@ class CommunicationRuntime:
                     text=response.text,
                     metadata={**(response.metadata or {}), "source": "command"},
                 )
-                # fire-and-forget in a background thread to avoid blocking bus handlers
-                threading.Thread(
-                    target=lambda: _run_async_send(self.bus, outbound),
-                    daemon=True,
-                    name="commos-cmd-send",
-                ).start()
+                # fire-and-forget on the send pool to avoid blocking bus handlers
+                self._send_in_background(outbound)
                 _comm_trace(
                     "command_enqueued",
                     command=text,
@@ -409,25 +414,70 @@ class CommunicationRuntime:
             logger.exception("Command processing failed")
             _comm_trace("command_failed", message_id=message.message_id)
 
-        threading.Thread(
-            target=lambda: self._handle_inbound_chat_serialized(message),
-            daemon=True,
-            name="commos-inbound-chat",
-        ).start()
-
-    def _get_inbound_lock(self, message: InboundMessage) -> threading.Lock:
-        key = f"{message.channel_id}:{message.user_key}:{message.conversation_key}"
-        with self._inbound_conversation_locks_guard:
-            lk = self._inbound_conversation_locks.get(key)
-            if lk is None:
-                lk = threading.Lock()
-                self._inbound_conversation_locks[key] = lk
-            return lk
-
-    def _handle_inbound_chat_serialized(self, message: InboundMessage) -> None:
-        lk = self._get_inbound_lock(message)
-        with lk:
-            self._handle_inbound_chat(message)
+        self._enqueue_inbound(message, lambda: self._handle_inbound_chat(message))
+
+    @staticmethod
+    def _conversation_key(channel_id: str, user_key: str, conversation_key: str) -> str:
+        return f"{channel_id}:{user_key}:{conversation_key}"
+
+    def _enqueue_inbound(self, message: InboundMessage, fn: Any) -> None:
+        """Run fn on the conversation's mailbox; shed (with one busy notice) when over limits."""
+        key = self._conversation_key(message.channel_id, message.user_key, message.conversation_key)
+        enqueued_at = time.perf_counter()
+
+        def _run() -> None:
+            _comm_trace(
+                "inbound_dequeued",
+                message_id=message.message_id,
+                channel_id=message.channel_id,
+                queue_wait_ms=int((time.perf_counter() - enqueued_at) * 1000),
+            )
+            fn()
+
+        if self._inbound_executor.submit(key, _run, channel_id=message.channel_id):
+            return
+
+        _comm_trace(
+            "inbound_shed",
+            message_id=message.message_id,
+            channel_id=message.channel_id,
+            conversation_key=message.conversation_key,
+        )
+        # Tell the user once per burst rather than once per dropped message
+        if self._inbound_executor.shed_streak(key) > 1:
+            return
+        cfg = self.config_store.get_config(message.channel_id) or {}
+        busy_text = cfg.get("busy_text")
+        if busy_text is None:
+            busy_text = "⏳ Too many messages in progress, please resend shortly."
+        # An empty busy_text turns the notice off
+        busy_text = str(busy_text).strip()
+        if busy_text:
+            self._send_in_background(
+                OutboundMessage(
+                    channel_id=message.channel_id,
+                    user_key=message.user_key,
+                    conversation_key=message.conversation_key,
+                    type=MessageType.TEXT,
+                    text=busy_text,
+                    metadata={"source": "status", "status": "busy", "inbound_message_id": message.message_id},
+                )
+            )
+
+    def _send_in_background(self, outbound: OutboundMessage) -> None:
+        """Send on the send pool, in order per conversation."""
+        key = self._conversation_key(outbound.channel_id, outbound.user_key, outbound.conversation_key)
+        if not self._outbound_executor.submit(
+            key, lambda: _run_async_send(self.bus, outbound), channel_id=outbound.channel_id
+        ):
+            logger.warning("Outbound send queue full, dropping reply for %s", key)
+
+    def get_queue_metrics(self, channel_id: Optional[str] = None) -> Dict[str, Any]:
+        """Inbound/outbound queue depth and latency metrics (per channel, or one channel)"""
+        return {
+            "inbound": self._inbound_executor.metrics(channel_id),
+            "outbound": self._outbound_executor.metrics(channel_id),
+        }
 
     def _handle_session_new_shortcut(
         self,
@@ -503,11 +553,7 @@ class CommunicationRuntime:
             text=f"{success_text_prefix}: {new_session_id}",
             metadata={"source": "command", "command": command_name},
         )
-        threading.Thread(
-            target=lambda: _run_async_send(self.bus, outbound),
-            daemon=True,
-            name="commos-cmd-send",
-        ).start()
+        self._send_in_background(outbound)
 
     def _handle_session_clear_shortcut(self, message: InboundMessage) -> None:
         """Clear current context by rotating to a fresh session."""
@@ -552,11 +598,7 @@ class CommunicationRuntime:
                 text="ℹ️ No previous session available. Use /new to create one.",
                 metadata={"source": "command", "command": "session_resume"},
             )
-            threading.Thread(
-                target=lambda: _run_async_send(self.bus, outbound),
-                daemon=True,
-                name="commos-cmd-send",
-            ).start()
+            self._send_in_background(outbound)
             return
 
         try:
@@ -576,11 +618,7 @@ class CommunicationRuntime:
                 text=f"❌ Failed to resume previous session: {e}",
                 metadata={"source": "command", "command": "session_resume"},
             )
-            threading.Thread(
-                target=lambda: _run_async_send(self.bus, outbound),
-                daemon=True,
-                name="commos-cmd-send",
-            ).start()
+            self._send_in_background(outbound)
             return
 
         if current_binding:
@@ -612,11 +650,7 @@ class CommunicationRuntime:
             text=f"✅ Resumed previous session: {target_session_id}",
             metadata={"source": "command", "command": "session_resume"},
         )
-        threading.Thread(
-            target=lambda: _run_async_send(self.bus, outbound),
-            daemon=True,
-            name="commos-cmd-send",
-        ).start()
+        self._send_in_background(outbound)
 
     def _handle_inbound_chat(self, message: InboundMessage) -> None:
         t0 = time.perf_counter()
@@ -0,0 +1,95 @@
+"""Shared fixtures for the benchmark suite (run with ``-m slow -s``)."""
+
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+
+def _write_kb_docs(root: Path, n_files: int) -> None:
+    for i in range(n_files):
+        doc_dir = root / "docs" / f"area_{i % 20}"
+        doc_dir.mkdir(parents=True, exist_ok=True)
+        sections = []
+        for s in range(4):
+            body = " ".join(f"token{(i * 7 + s * 13 + w) % 997}" for w in range(120))
+            sections.append(f"## Section {s} of doc {i}\n\n{body}\n")
+        (doc_dir / f"doc_{i}.md").write_text(f"# Document {i}\n\n" + "\n".join(sections))
+
+
+BENCH_BRAIN_EDGES = int(os.getenv("OCTOPUSOS_BENCH_BRAIN_EDGES", "100000"))
+
+
+def _build_brain_graph(db_path: Path, n_edges: int = BENCH_BRAIN_EDGES):
+    import numpy as np
+
+    from octopusos.core.brain.store import SQLiteStore
+
+    n_entities = n_edges // 5
+    rng = np.random.default_rng(11)
+    store = SQLiteStore(str(db_path))
+    conn = store.connect()
+    now = time.time()
+
+    conn.executemany(
+        "INSERT INTO entities (id, type, key, name, created_at) VALUES (?, 'file', ?, ?, ?)",
+        ((i, f"src/mod_{i}.py", f"mod_{i}.py", now) for i in range(1, n_entities + 1)),
+    )
+
+    # Zipf-distributed targets give a few hub files with very high fan-in
+    src = rng.integers(1, n_entities + 1, size=n_edges)
+    dst = np.minimum(rng.zipf(1.3, size=n_edges), n_entities)
+    edge_types = ("depends_on", "references", "modifies")
+    conn.executemany(
+        "INSERT INTO edges (id, src_entity_id, dst_entity_id, type, key, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (i + 1, int(s), int(d), edge_types[i % 3], f"e{i}", now)
+            for i, (s, d) in enumerate(zip(src, dst))
+        ),
+    )
+
+    evidence_per_edge = rng.integers(0, 4, size=n_edges)
+    source_types = ("git", "doc", "code")
+    conn.executemany(
+        "INSERT INTO evidence (edge_id, source_type, source_ref, created_at) VALUES (?, ?, ?, ?)",
+        (
+            (edge_id + 1, source_types[j], f"ref{edge_id}", now)
+            for edge_id, count in enumerate(evidence_per_edge)
+            for j in range(int(count))
+        ),
+    )
+    conn.commit()
+    return store
+
+
+@pytest.fixture
+def write_kb_docs() -> Callable[[Path, int], None]:
+    """Write ``n_files`` synthetic markdown docs (5 chunks each) under ``root/docs``."""
+    return _write_kb_docs
+
+
+@pytest.fixture
+def build_brain_graph():
+    """Build a synthetic BrainOS graph (skewed fan-in, 0-3 evidence rows per edge)."""
+    return _build_brain_graph
+
+
+@pytest.fixture
+def make_kb_service(migrated_db):
+    """Build a ProjectKBService over ``root`` backed by a freshly migrated DB."""
+
+    def _make(root: Path, db_path: Path, refresh_workers: int = 0):
+        from octopusos.core.project_kb.config import ProjectKBConfig
+        from octopusos.core.project_kb.service import ProjectKBService
+
+        migrated_db(db_path)
+        config = ProjectKBConfig()
+        config.scan_paths = ["docs/**/*.md"]
+        config.vector_rerank.enabled = False
+        config.refresh_workers = refresh_workers
+        return ProjectKBService(root_dir=root, db_path=db_path, config=config, fail_safe=False)
+
+    return _make
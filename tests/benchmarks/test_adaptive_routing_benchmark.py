@@ -0,0 +1,142 @@
+"""Adaptive routing benchmark.
+
+``RouteScorer`` used to rank instances only on static profile fields, so
+every task went to the same top-scoring instance however busy it was.
+Scoring now folds in live per-instance telemetry (EWMA time-to-first-token
+and tokens/sec, in-flight requests, error rate, circuit breaker) and the
+router picks between near-equal candidates by power of two choices.
+
+The benchmark routes a burst of requests across three identical
+single-slot llama.cpp stand-ins and compares request latency. Telemetry,
+scoring and failover behaviour is covered in
+``tests/unit/router/test_adaptive_routing.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_adaptive_routing_benchmark.py -m slow -s
+"""
+
+import asyncio
+import random
+import statistics
+import threading
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from octopusos.router import (
+    InstanceProfile,
+    InstanceTelemetry,
+    Router,
+    RouteScorer,
+)
+
+INSTANCES = ["llamacpp:a", "llamacpp:b", "llamacpp:c"]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Profiles:
+    """InstanceProfileBuilder stand-in with fixed READY profiles"""
+
+    def __init__(self, instance_ids, state: str = "READY"):
+        self.states = {instance_id: state for instance_id in instance_ids}
+        self.probed = []
+
+    def _profile(self, instance_id: str) -> InstanceProfile:
+        return InstanceProfile(
+            instance_id=instance_id,
+            provider_type="llamacpp",
+            base_url="http://127.0.0.1",
+            state=self.states[instance_id],
+            latency_ms=20.0,
+            tags=["coding"],
+            ctx=8192,
+        )
+
+    async def build_all_profiles(self):
+        return [self._profile(instance_id) for instance_id in self.states]
+
+    async def get_profile(self, instance_id: str):
+        self.probed.append(instance_id)
+        return self._profile(instance_id)
+
+
+def _router(telemetry=None, seed: int = 7, **kwargs) -> Router:
+    scorer = RouteScorer(telemetry=telemetry, rng=random.Random(seed))
+    return Router(
+        registry=SimpleNamespace(), profile_builder=_Profiles(INSTANCES), scorer=scorer, **kwargs
+    )
+
+
+def _run_burst(
+    router: Router, telemetry: InstanceTelemetry, requests: int, spacing_s: float, service_s: float
+):
+    """Route requests and serve them on single-slot instances
+
+    Returns (latencies_ms, per-instance counts).
+    """
+    slots = {instance_id: threading.Lock() for instance_id in INSTANCES}
+    latencies, counts, threads = [], Counter(), []
+    task = {"title": "Implement parser", "description": "code"}
+
+    def _serve(instance_id: str, call, submitted: float) -> None:
+        with slots[instance_id]:
+            call.first_token()
+            time.sleep(service_s)
+            call.add_tokens(32)
+        call.__exit__(None, None, None)
+        latencies.append((time.perf_counter() - submitted) * 1000)
+
+    for i in range(requests):
+        submitted = time.perf_counter()
+        plan = asyncio.run(router.route(f"task-{i}", task))
+        counts[plan.selected] += 1
+        call = telemetry.track(plan.selected)
+        call.__enter__()  # In flight from the moment it is routed
+        thread = threading.Thread(target=_serve, args=(plan.selected, call, submitted))
+        thread.start()
+        threads.append(thread)
+        time.sleep(spacing_s)
+    for thread in threads:
+        thread.join()
+    return latencies, counts
+
+
+def _p95(samples):
+    return sorted(samples)[int(len(samples) * 0.95)]
+
+
+@pytest.mark.slow
+def test_burst_latency_static_vs_adaptive() -> None:
+    requests, spacing_s, service_s = 150, 0.004, 0.01
+    print()
+
+    telemetry = InstanceTelemetry()
+    static, static_counts = _run_burst(_router(), telemetry, requests, spacing_s, service_s)
+    print(
+        f"[router] static scoring: p50 {statistics.median(static):.0f}ms, "
+        f"p95 {_p95(static):.0f}ms, {dict(static_counts)}"
+    )
+
+    telemetry = InstanceTelemetry()
+    adaptive, adaptive_counts = _run_burst(
+        _router(telemetry), telemetry, requests, spacing_s, service_s
+    )
+    print(
+        f"[router] telemetry + P2C: p50 {statistics.median(adaptive):.0f}ms, "
+        f"p95 {_p95(adaptive):.0f}ms, {dict(adaptive_counts)}"
+    )
+    print(f"[router] {telemetry.snapshot(INSTANCES[0]).to_dict()}")
+
+    assert len(static_counts) == 1
+    assert len(adaptive_counts) == 3 and min(adaptive_counts.values()) > requests // 6
+    assert _p95(adaptive) * 3 < _p95(static)
@@ -0,0 +1,51 @@
+"""BrainOS navigation path benchmark.
+
+Times ``find_paths`` on a synthetic 100k-edge graph: the first call builds
+the in-memory graph snapshot, later calls reuse it until the graph changes.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_brain_path_benchmark.py -m slow -s
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from octopusos.core.brain.navigation.graph_snapshot import get_graph_snapshot
+from octopusos.core.brain.navigation.path_engine import find_paths
+
+
+@pytest.mark.slow
+def test_brain_find_paths_latency(tmp_path: Path, build_brain_graph) -> None:
+    store = build_brain_graph(tmp_path / "brain.db")
+
+    started = time.perf_counter()
+    snapshot = get_graph_snapshot(store)
+    print(f"\n[brain paths] snapshot build: {(time.perf_counter() - started) * 1000:.0f}ms")
+
+    queries = [(f"file:src/mod_{50 + i}.py", f"file:src/mod_{500 + 7 * i}.py") for i in range(50)]
+    for label, use_goal in (("goal", True), ("explore", False)):
+        samples = []
+        for seed, goal in queries:
+            started = time.perf_counter()
+            find_paths(store, seed, goal=goal if use_goal else None, max_hops=3)
+            samples.append(time.perf_counter() - started)
+        samples.sort()
+        print(
+            f"[brain paths] {label}: p50={samples[len(samples) // 2] * 1000:.1f}ms "
+            f"max={samples[-1] * 1000:.1f}ms over {len(samples)} queries"
+        )
+
+    assert get_graph_snapshot(store) is snapshot
+
+    # Any graph write produces a new version token and a fresh snapshot
+    conn = store.connect()
+    conn.execute(
+        "INSERT INTO edges (src_entity_id, dst_entity_id, type, key, created_at) "
+        "VALUES (1, 2, 'references', 'new', 0)"
+    )
+    conn.commit()
+    assert get_graph_snapshot(store) is not snapshot
+    store.close()
@@ -0,0 +1,74 @@
+"""CapabilityRegistry.check_capability benchmark.
+
+``check_capability`` used to run a SELECT on a fresh connection (on a cache
+miss) and then INSERT + COMMIT its audit row on another fresh connection, so
+every permission check paid an fsync. Grants are now answered from an
+in-memory snapshot and audit rows go through a bounded queue that a
+background thread writes in batches. Snapshot consistency and invocation
+logging are covered in ``tests/unit/capability/test_capability_snapshot.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_capability_check_benchmark.py -m slow -s
+"""
+
+import time
+
+import pytest
+
+from octopusos.core.capability.registry import CapabilityRegistry
+
+CAPABILITY = "state.memory.read"
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = CapabilityRegistry(db_path=str(tmp_path / "registry.sqlite"))
+    yield registry
+    registry._invocation_log.close()
+
+
+def _legacy_check(registry: CapabilityRegistry, agent_id: str, operation: str) -> None:
+    """Previous behaviour: SELECT, then INSERT + COMMIT of the audit row, per check."""
+    allowed = registry._query_has_grant(agent_id, CAPABILITY, None)
+    registry._write_invocations(
+        [(agent_id, CAPABILITY, operation, int(allowed), None, None, int(time.time() * 1000))]
+    )
+
+
+@pytest.mark.slow
+def test_check_throughput(registry) -> None:
+    registry.grant_capability("chat_agent", CAPABILITY, granted_by="system")
+    print()
+
+    rounds = 300
+    started = time.perf_counter()
+    for _ in range(rounds):
+        _legacy_check(registry, "chat_agent", "list")
+    legacy_per_s = rounds / (time.perf_counter() - started)
+
+    rounds = 100_000
+    started = time.perf_counter()
+    for _ in range(rounds):
+        registry.check_capability("chat_agent", CAPABILITY, "list")
+    buffered_per_s = rounds / (time.perf_counter() - started)
+    started = time.perf_counter()
+    registry.flush_invocations(timeout=60)
+    flush_s = time.perf_counter() - started
+
+    registry.invocation_sample_rate = 0.01
+    started = time.perf_counter()
+    for _ in range(rounds):
+        registry.check_capability("chat_agent", CAPABILITY, "list")
+    sampled_per_s = rounds / (time.perf_counter() - started)
+    registry.flush_invocations(timeout=60)
+
+    print(f"[capability] per-check SELECT + INSERT/COMMIT: {legacy_per_s:,.0f} checks/s")
+    print(
+        f"[capability] snapshot + buffered log: {buffered_per_s:,.0f} checks/s "
+        f"(final flush {flush_s * 1000:.0f}ms)"
+    )
+    print(f"[capability] snapshot + 1% sampled log: {sampled_per_s:,.0f} checks/s")
+    print(f"[capability] {registry._invocation_log.get_stats()}")
+    assert buffered_per_s > legacy_per_s * 20
+    assert registry._invocation_log.get_stats()["dropped"] == 0
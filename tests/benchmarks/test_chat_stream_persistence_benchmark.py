@@ -0,0 +1,176 @@
+"""WebSocket chat streaming persistence load test.
+
+Streams deltas for 200 concurrent sessions through ``ConnectionManager`` and
+measures inter-token latency as seen by the (fake) sockets. The baseline mode
+persists every event inline on the event loop (two commits per token), the
+buffered mode is the production path: send first, batch-persist off-loop.
+Replay of buffered events is covered in
+``tests/unit/webui/test_chat_stream_buffer.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_chat_stream_persistence_benchmark.py -m slow -s
+"""
+
+import asyncio
+import os
+import sqlite3
+import time
+
+import pytest
+
+N_SESSIONS = int(os.getenv("OCTOPUSOS_BENCH_CHAT_SESSIONS", "200"))
+N_TOKENS = int(os.getenv("OCTOPUSOS_BENCH_CHAT_TOKENS", "100"))
+TOKEN_INTERVAL_SECONDS = 0.01
+
+
+class _RecordingWebSocket:
+    def __init__(self) -> None:
+        self.sent_at: list[float] = []
+
+    async def send_json(self, message) -> None:
+        self.sent_at.append(time.perf_counter())
+
+
+@pytest.fixture(scope="module")
+def chat_module(tmp_path_factory):
+    home = tmp_path_factory.mktemp("home")
+    db_dir = home / ".octopusos" / "store" / "octopusos"
+    db_dir.mkdir(parents=True)
+    db_path = db_dir / "db.sqlite"
+    sqlite3.connect(db_path).close()
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home))
+        mp.setenv("OCTOPUSOS_DB_PATH", str(db_path))
+
+        from octopusos.core.db import registry_db
+        from octopusos.store.migrator import auto_migrate
+
+        auto_migrate(db_path)
+        registry_db._DB_PATH = None  # type: ignore[attr-defined]
+        registry_db._thread_local.connection = None  # type: ignore[attr-defined]
+
+        from octopusos.webui.websocket import chat
+
+        yield chat
+
+
+@pytest.fixture
+def recovery_store(chat_module, monkeypatch):
+    store = chat_module.SessionRecoveryStore()
+    monkeypatch.setattr(chat_module, "recovery_store", store)
+    yield store
+    store.close()
+
+
+def _delta(session_id: str, run_id: str, seq: int) -> dict:
+    return {
+        "type": "message.delta",
+        "session_id": session_id,
+        "run_id": run_id,
+        "message_id": f"msg-{session_id}",
+        "seq": seq,
+        "delta": f"token{seq} ",
+        "content": f"token{seq} ",
+        "metadata": {"source": "real"},
+    }
+
+
+def _end(session_id: str, run_id: str, seq: int) -> dict:
+    return {
+        "type": "message.end",
+        "session_id": session_id,
+        "run_id": run_id,
+        "message_id": f"msg-{session_id}",
+        "seq": seq,
+        "content": "done",
+        "metadata": {"total_seq": seq, "source": "real"},
+    }
+
+
+class _InlinePersistManager:
+    """Previous behaviour: two commits on the loop before every frame."""
+
+    def __init__(self, manager, store) -> None:
+        self._manager = manager
+        self._store = store
+
+    async def send_message(self, session_id: str, message: dict) -> None:
+        self._store.append_event(
+            session_id=session_id, run_id=message["run_id"], seq=message["seq"], event=message
+        )
+        self._store.update_last_seq(
+            session_id=session_id, run_id=message["run_id"], seq=message["seq"]
+        )
+        websocket = self._manager.active_connections.get(session_id)
+        await websocket.send_json(message)
+
+
+async def _stream_sessions(sender, manager, store, prefix: str) -> dict[str, _RecordingWebSocket]:
+    sockets: dict[str, _RecordingWebSocket] = {}
+    for i in range(N_SESSIONS):
+        session_id = f"{prefix}-{i}"
+        sockets[session_id] = _RecordingWebSocket()
+        manager.active_connections[session_id] = sockets[session_id]
+        store.upsert_state(
+            session_id=session_id, run_id=f"run-{session_id}", status="streaming", last_seq=0
+        )
+
+    async def _one(session_id: str) -> None:
+        run_id = f"run-{session_id}"
+        for seq in range(1, N_TOKENS + 1):
+            await sender.send_message(session_id, _delta(session_id, run_id, seq))
+            await asyncio.sleep(TOKEN_INTERVAL_SECONDS)
+        await sender.send_message(session_id, _end(session_id, run_id, N_TOKENS + 1))
+
+    await asyncio.gather(*(_one(session_id) for session_id in sockets))
+    for session_id in sockets:
+        manager.disconnect(session_id)
+    return sockets
+
+
+def _report(label: str, sockets: dict[str, _RecordingWebSocket], elapsed: float) -> float:
+    gaps = sorted(
+        later - earlier
+        for socket in sockets.values()
+        for earlier, later in zip(socket.sent_at, socket.sent_at[1:])
+    )
+    p50 = gaps[len(gaps) // 2] * 1000
+    p99 = gaps[int(len(gaps) * 0.99)] * 1000
+    print(
+        f"[chat stream] {label}: {N_SESSIONS} sessions x {N_TOKENS} tokens in {elapsed:.2f}s, "
+        f"inter-token p50={p50:.1f}ms p99={p99:.1f}ms max={gaps[-1] * 1000:.1f}ms "
+        f"(producer interval {TOKEN_INTERVAL_SECONDS * 1000:.0f}ms)"
+    )
+    return p99
+
+
+@pytest.mark.slow
+def test_chat_stream_inter_token_latency(chat_module, recovery_store) -> None:
+    manager = chat_module.ConnectionManager()
+    print()
+
+    for label, sender in (
+        ("inline persistence", _InlinePersistManager(manager, recovery_store)),
+        ("buffered persistence", manager),
+    ):
+        started = time.perf_counter()
+        sockets = asyncio.run(_stream_sessions(sender, manager, recovery_store, label.split()[0]))
+        elapsed = time.perf_counter() - started
+        _report(label, sockets, elapsed)
+
+    assert recovery_store.flush_buffered(timeout=30)
+    stats = recovery_store.get_buffer_stats()
+    print(
+        f"[chat stream] writer: {stats['batches']} batches, "
+        f"avg {stats['avg_batch_size']:.0f} events/batch, dropped={stats['events_dropped']}"
+    )
+    assert stats["events_written"] == N_SESSIONS * (N_TOKENS + 1)
+    assert stats["events_dropped"] == 0
+
+    for i in (0, N_SESSIONS // 2, N_SESSIONS - 1):
+        session_id = f"buffered-{i}"
+        events = recovery_store.list_events_after(session_id=session_id, run_id=f"run-{session_id}")
+        assert [event["seq"] for event in events] == list(range(1, N_TOKENS + 2))
+        assert recovery_store.get_state(session_id)["last_seq"] == N_TOKENS + 1
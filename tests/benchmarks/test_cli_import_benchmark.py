@@ -0,0 +1,66 @@
+"""CLI startup benchmark.
+
+``octopusos.cli.main`` registers its subcommands by name only
+(``octopusos.cli.lazy_group``), so ``octopusos --help`` must not import
+numpy, openai or FastAPI. The slow test reports ``-X importtime`` top
+offenders and wall-clock startup against a budget. Lazy registration is
+covered in ``tests/unit/cli/test_cli_lazy_subcommands.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_cli_import_benchmark.py -m slow -s
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+IMPORT_BUDGET_MS = float(os.getenv("OCTOPUSOS_BENCH_CLI_IMPORT_BUDGET_MS", "300"))
+N_RUNS = int(os.getenv("OCTOPUSOS_BENCH_CLI_RUNS", "5"))
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+
+
+def _importtime_top(n: int = 10) -> tuple[float, list[tuple[float, str]]]:
+    stderr = _run_python("-X", "importtime", "-c", "import octopusos.cli.main").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        rows.append((int(cumulative) / 1000, name.strip()))
+    total = next(ms for ms, name in rows if name == "octopusos.cli.main")
+    return total, sorted(rows, reverse=True)[:n]
+
+
+@pytest.mark.slow
+def test_cli_startup_within_budget() -> None:
+    total_ms, top = _importtime_top()
+    print(
+        f"\n[cli import] octopusos.cli.main: {total_ms:.1f}ms cumulative "
+        f"(budget {IMPORT_BUDGET_MS:.0f}ms)"
+    )
+    for ms, name in top:
+        print(f"[cli import]   {ms:8.1f}ms  {name}")
+
+    for argv in (["--help"], ["task", "--help"]):
+        samples = []
+        for _ in range(N_RUNS):
+            started = time.perf_counter()
+            _run_python("-m", "octopusos.cli.main", *argv)
+            samples.append(time.perf_counter() - started)
+        best_ms = min(samples) * 1000
+        print(f"[cli import] octopusos {' '.join(argv)}: best of {N_RUNS} {best_ms:.0f}ms")
+
+    assert total_ms < IMPORT_BUDGET_MS
@@ -0,0 +1,134 @@
+"""ContextBuilder source loading and token budgeting benchmark.
+
+Fake services answer the session window, summary, memory and RAG loads
+after a fixed latency (standing in for their DB / index round-trips).
+``build`` used to await them one after another; the loads now run
+concurrently on the bounded context-loader pool. The token counter memoizes
+window messages by ``(message_id, content hash)``, so a growing
+conversation only tokenizes its new messages each turn. Memoization, window
+trimming and the heuristic are covered in
+``tests/unit/chat/test_context_builder_budget.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_context_builder_benchmark.py -m slow -s
+"""
+
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from octopusos.core.chat.context_builder import ContextBudget, ContextBuilder
+from octopusos.core.chat.models import ChatMessage
+from octopusos.core.chat.token_counter import TokenCounter
+
+LOAD_LATENCY_S = {"window": 0.03, "summaries": 0.02, "memory": 0.03, "rag": 0.04}
+FILLER = "the quick brown fox jumps over the lazy dog " * 8
+
+
+def _message(index: int, content: str = "") -> ChatMessage:
+    return ChatMessage(
+        message_id=f"msg-{index:04d}",
+        session_id="s1",
+        role="user" if index % 2 == 0 else "assistant",
+        content=content or f"Message {index}: " + FILLER,
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        metadata={},
+    )
+
+
+class _FakeChatService:
+    def __init__(self, messages: List[ChatMessage]):
+        self.messages = messages
+
+    def get_session(self, session_id):
+        return SimpleNamespace(metadata={"conversation_mode": "chat"})
+
+    def get_recent_messages(self, session_id, count=60):
+        time.sleep(LOAD_LATENCY_S["window"])
+        return self.messages[-count:]
+
+
+def _builder(monkeypatch, messages: List[ChatMessage], counter: TokenCounter) -> ContextBuilder:
+    builder = ContextBuilder(
+        chat_service=_FakeChatService(messages),
+        memory_service=object(),
+        kb_service=object(),
+        budget=ContextBudget(),
+        db_path=":memory:",
+        enable_auto_summary=False,
+        enable_snapshots=False,
+        token_counter=counter,
+    )
+
+    def _summaries(session_id):
+        time.sleep(LOAD_LATENCY_S["summaries"])
+        return []
+
+    def _memory(session_id):
+        time.sleep(LOAD_LATENCY_S["memory"])
+        return [{"id": "mem-1", "type": "fact", "content": {"summary": "likes tea"}}]
+
+    def _rag(session_id, query):
+        time.sleep(LOAD_LATENCY_S["rag"])
+        return [{"chunk_id": "c1", "content": "Acme ships rockets", "path": "README.md"}], {}
+
+    monkeypatch.setattr(builder, "_load_summary_artifacts", _summaries)
+    monkeypatch.setattr(builder, "_load_memory_facts", _memory)
+    monkeypatch.setattr(builder, "_load_rag_context", _rag)
+    monkeypatch.setattr(builder, "_log_memory_injection_audit", lambda **kwargs: None)
+    return builder
+
+
+def _serial_loads(builder: ContextBuilder) -> None:
+    """Previous behaviour: the four sources loaded one after another."""
+    builder._load_session_window("s1")
+    builder._load_summary_artifacts("s1")
+    builder._load_memory_facts("s1")
+    builder._load_rag_context(session_id="s1", query="hello")
+
+
+@pytest.mark.slow
+def test_parallel_source_loading(monkeypatch) -> None:
+    builder = _builder(monkeypatch, [_message(i) for i in range(40)], TokenCounter())
+    print()
+
+    samples = {"serial loads": [], "build (parallel loads)": []}
+    for _ in range(5):
+        started = time.perf_counter()
+        _serial_loads(builder)
+        samples["serial loads"].append(time.perf_counter() - started)
+        started = time.perf_counter()
+        builder.build("s1", "hello")
+        samples["build (parallel loads)"].append(time.perf_counter() - started)
+    for label, values in samples.items():
+        print(f"[context builder] {label}: best {min(values) * 1000:.1f}ms")
+
+    assert min(samples["build (parallel loads)"]) < min(samples["serial loads"]) * 0.7
+
+
+@pytest.mark.slow
+def test_token_memo_growing_window(monkeypatch) -> None:
+    messages: List[ChatMessage] = []
+    counter = TokenCounter()
+    builder = _builder(monkeypatch, messages, counter)
+    print(f"\n[context builder] tokenizer: {counter.backend}")
+
+    started = time.perf_counter()
+    for turn in range(100):
+        messages.append(_message(turn))
+        builder._apply_budget({"window": messages[-60:], "memory": [], "rag": [], "summaries": []})
+    memo_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for turn in range(100):
+        sum(counter.count(msg.content) for msg in messages[-60:][: turn + 1])
+    uncached_s = time.perf_counter() - started
+    print(
+        f"[context builder] 100 turns: memoized {memo_s * 1000:.1f}ms, "
+        f"uncached {uncached_s * 1000:.1f}ms, {counter.stats()}"
+    )
+    assert counter.misses == 100
@@ -0,0 +1,118 @@
+"""CommunicationOS inbound executor benchmark.
+
+``CommunicationRuntime._handle_inbound`` used to start a thread per inbound
+message and serialize conversations on per-conversation locks kept in a
+dict that was never pruned. A burst therefore parked one thread per message
+on those locks. ``ConversationExecutor`` queues messages in per-conversation
+FIFO mailboxes drained by a bounded worker pool, sheds messages beyond its
+queue limits and evicts idle mailboxes. Ordering, shedding and the runtime
+wiring are covered in ``tests/unit/communicationos/test_conversation_executor.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_conversation_executor_benchmark.py -m slow -s
+"""
+
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+
+from octopusos.communicationos.conversation_executor import ConversationExecutor
+
+HANDLER_S = 0.005
+
+
+class _Probe:
+    """Handler stand-in recording per-conversation order and concurrency."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.order = defaultdict(list)
+        self.active = defaultdict(int)
+        self.overlap = False
+        self.running = 0
+        self.peak_running = 0
+        self.peak_threads = threading.active_count()
+
+    def handle(self, conversation: str, seq: int, seconds: float = HANDLER_S) -> None:
+        with self.lock:
+            self.active[conversation] += 1
+            self.overlap |= self.active[conversation] > 1
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+        time.sleep(seconds)
+        with self.lock:
+            self.active[conversation] -= 1
+            self.running -= 1
+            self.order[conversation].append(seq)
+
+
+def _legacy_dispatch(
+    probe: _Probe,
+    locks: dict,
+    guard: threading.Lock,
+    conversation: str,
+    seq: int,
+    seconds: float,
+):
+    """Previous behaviour: one thread per message, serialized on a per-conversation lock."""
+
+    def _run():
+        with guard:
+            lock = locks.setdefault(conversation, threading.Lock())
+        with lock:
+            probe.handle(conversation, seq, seconds)
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.mark.slow
+def test_burst_threads_and_latency() -> None:
+    conversations, per_conversation = 100, 10
+    handler_s = 0.02  # Stand-in for a chat turn
+    messages = [
+        (f"conv-{c}", seq) for seq in range(per_conversation) for c in range(conversations)
+    ]
+    print()
+
+    probe, locks, guard = _Probe(), {}, threading.Lock()
+    started = time.perf_counter()
+    threads = [
+        _legacy_dispatch(probe, locks, guard, conv, seq, handler_s) for conv, seq in messages
+    ]
+    for thread in threads:
+        thread.join()
+    legacy_s = time.perf_counter() - started
+    legacy_peak = probe.peak_threads
+    print(
+        f"[commos] thread per message: {legacy_s * 1000:.0f}ms, peak threads {legacy_peak}, "
+        f"locks retained {len(locks)}"
+    )
+
+    probe = _Probe()
+    baseline_threads = threading.active_count()
+    executor = ConversationExecutor(
+        name="bench", max_workers=32, max_mailbox_depth=50, max_pending=5000
+    )
+    started = time.perf_counter()
+    for conv, seq in messages:
+        handle = lambda c=conv, s=seq: probe.handle(c, s, handler_s)  # noqa: E731
+        assert executor.submit(conv, handle, channel_id="slack")
+    executor.shutdown(timeout=60)
+    pooled_s = time.perf_counter() - started
+    metrics = executor.metrics()["channels"]["slack"]
+    print(
+        f"[commos] actor executor (32 workers): {pooled_s * 1000:.0f}ms, "
+        f"peak threads {probe.peak_threads}, {metrics}"
+    )
+
+    assert metrics["completed"] == len(messages)
+    assert sum(len(order) for order in probe.order.values()) == len(messages)
+    assert all(order == list(range(per_conversation)) for order in probe.order.values())
+    assert not probe.overlap
+    assert probe.peak_threads <= baseline_threads + executor.max_workers
@@ -0,0 +1,166 @@
+"""Shared HTTP client pool benchmark.
+
+Runs chat turns and provider probes against a local OpenAI/Ollama-compatible
+stub server and compares building a fresh client per call (previous
+behaviour) with the process-wide pool in ``octopusos.providers.http_pool``.
+Client reuse and loop cleanup are covered in
+``tests/unit/providers/test_http_client_pool.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_http_client_pool_benchmark.py -m slow -s
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from octopusos.providers.http_pool import HTTPClientPool
+
+N_TURNS = int(os.getenv("OCTOPUSOS_BENCH_HTTP_TURNS", "200"))
+
+_COMPLETION = {
+    "id": "chatcmpl-stub",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "stub",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "pong"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY a kept-alive
+    # connection stalls on delayed ACKs (real model servers set it too)
+    disable_nagle_algorithm = True
+
+    def _send_json(self, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path.endswith("/api/tags"):
+            self._send_json({"models": [{"name": "stub"}]})
+        else:
+            self._send_json({"object": "list", "data": [{"id": "stub", "object": "model"}]})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        self._send_json(_COMPLETION)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _chat_turn(client) -> str:
+    response = client.chat.completions.create(
+        model="stub",
+        messages=[{"role": "user", "content": "ping"}],
+        max_tokens=8,
+    )
+    return response.choices[0].message.content
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    samples = sorted(samples)
+    return samples[len(samples) // 2] * 1000, samples[int(len(samples) * 0.99)] * 1000
+
+
+@pytest.mark.slow
+def test_chat_turn_latency_fresh_vs_pooled(stub_server) -> None:
+    openai = pytest.importorskip("openai")
+    base_url = f"{stub_server}/v1"
+    pool = HTTPClientPool()
+    print()
+
+    def fresh_turn() -> str:
+        client = openai.OpenAI(api_key="sk-stub", base_url=base_url)
+        try:
+            return _chat_turn(client)
+        finally:
+            client.close()
+
+    def pooled_turn() -> str:
+        client = pool.get_openai_client(api_key="sk-stub", base_url=base_url, provider="stub")
+        return _chat_turn(client)
+
+    results = {}
+    for label, turn in (("fresh client per turn", fresh_turn), ("pooled client", pooled_turn)):
+        turn()  # warm-up (imports, first connection)
+        samples = []
+        for _ in range(N_TURNS):
+            started = time.perf_counter()
+            assert turn() == "pong"
+            samples.append(time.perf_counter() - started)
+        results[label] = _percentiles(samples)
+        p50, p99 = results[label]
+        print(f"[http pool] chat {label}: {N_TURNS} turns, p50={p50:.2f}ms p99={p99:.2f}ms")
+
+    saved = results["fresh client per turn"][0] - results["pooled client"][0]
+    print(f"[http pool] saved per turn (p50): {saved:.2f}ms")
+
+    stats = pool.get_stats()
+    print(f"[http pool] http2={stats['http2']} providers={stats['providers']}")
+    print(f"[http pool] pools={stats['pools']}")
+    assert stats["providers"]["stub"]["requests"] == N_TURNS + 1
+    assert results["pooled client"][0] < results["fresh client per turn"][0]
+    pool.close()
+
+
+@pytest.mark.slow
+def test_provider_probe_latency_fresh_vs_pooled(stub_server) -> None:
+    pool = HTTPClientPool()
+    print()
+
+    async def fresh_probe() -> int:
+        async with httpx.AsyncClient(timeout=1.5) as client:
+            return (await client.get(f"{stub_server}/api/tags")).status_code
+
+    async def pooled_probe() -> int:
+        client = pool.get_async_client(stub_server, timeout="probe", provider="ollama")
+        return (await client.get(f"{stub_server}/api/tags")).status_code
+
+    async def run(probe) -> list[float]:
+        await probe()
+        samples = []
+        for _ in range(N_TURNS):
+            started = time.perf_counter()
+            assert await probe() == 200
+            samples.append(time.perf_counter() - started)
+        return samples
+
+    for label, probe in (("fresh client per probe", fresh_probe), ("pooled client", pooled_probe)):
+        p50, p99 = _percentiles(asyncio.run(run(probe)))
+        print(f"[http pool] probe {label}: {N_TURNS} probes, p50={p50:.2f}ms p99={p99:.2f}ms")
+
+    print(f"[http pool] ollama TTFB: {pool.get_stats()['providers']['ollama']}")
+    pool.close()
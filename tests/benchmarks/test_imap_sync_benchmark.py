@@ -0,0 +1,133 @@
+"""IMAP unread polling benchmark.
+
+``ImapSmtpEmailProvider.list_unread`` used to connect, log in and SELECT
+INBOX on every poll, then SEARCH UNSEEN and FETCH the headers of up to 200
+messages one round trip at a time. It now keeps one session per email
+instance (``imap_session.ImapSessionCache``) and syncs by UID: every poll
+runs one ``UID SEARCH UNSEEN`` and fetches ENVELOPE and FLAGS in one ranged
+``UID FETCH`` only for the unread UIDs that are not cached yet.
+
+Runs against ``tests/imap_stub_server.py`` with a 50k-message mailbox.
+Sync correctness is covered in ``tests/unit/email/test_imap_session_sync.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_imap_sync_benchmark.py -m slow -s
+"""
+
+import email
+import statistics
+import time
+from email.utils import parseaddr
+
+import pytest
+from imap_stub_server import ImapStubServer
+
+from octopusos.core.email.providers import imap_smtp
+from octopusos.core.email.providers.imap_session import ImapSessionCache
+from octopusos.core.email.providers.imap_smtp import ImapSmtpEmailProvider
+
+MAILBOX_SIZE = 50_000
+POLLS = 20
+
+
+@pytest.fixture(autouse=True)
+def _password(monkeypatch):
+    monkeypatch.setattr(ImapSmtpEmailProvider, "_password", lambda self: "secret")
+
+
+def _provider(server: ImapStubServer, cache: ImapSessionCache, instance_id: str = "inst-1"):
+    config = {
+        "imap_host": server.host,
+        "imap_port": server.port,
+        "imap_tls": False,
+        "username": "me@example.com",
+    }
+    return ImapSmtpEmailProvider(
+        config=config, secret_ref="secret://x", instance_id=instance_id, session_cache=cache
+    )
+
+
+def _legacy_list_unread(provider: ImapSmtpEmailProvider, limit: int = 200) -> list:
+    """Previous behaviour: fresh login, SEARCH UNSEEN, one FETCH per message."""
+    im = provider._imap()
+    try:
+        im.login("me@example.com", "secret")
+        im.select("INBOX")
+        _, data = im.search(None, "UNSEEN")
+        ids = [x for x in (data[0] or b"").split() if x][-limit:]
+        out = []
+        for mid in reversed(ids):
+            _, msg_data = im.fetch(mid, "(BODY.PEEK[HEADER])")
+            msg = email.message_from_bytes(msg_data[0][1])
+            from_name, from_addr = parseaddr(imap_smtp._decode_mime(str(msg.get("From") or "")))
+            out.append(
+                (
+                    imap_smtp._decode_mime(str(msg.get("Subject") or "")),
+                    from_addr,
+                    from_name,
+                    imap_smtp._msg_date_ms(msg),
+                )
+            )
+        return out
+    finally:
+        im.logout()
+
+
+def _summary(headers: list) -> list:
+    return [(h.subject, h.from_email, h.from_name, h.date_ms) for h in headers]
+
+
+def _timed(fn, rounds: int) -> list:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+@pytest.mark.slow
+def test_poll_time_on_large_mailbox() -> None:
+    cache = ImapSessionCache()
+    server = ImapStubServer(
+        MAILBOX_SIZE, unseen_every=100, latency_s=0.001, login_latency_s=0.02
+    )
+    with server:
+        provider = _provider(server, cache)
+        print()
+
+        legacy = _timed(lambda: _legacy_list_unread(provider), 3)
+        legacy_headers = _legacy_list_unread(provider)
+        print(f"[imap] per-poll login + FETCH per message: p50 {statistics.median(legacy):.1f}ms")
+
+        server.reset_counters()
+        started = time.perf_counter()
+        first = provider.list_unread(since_ms=None, limit=200)
+        first_ms = (time.perf_counter() - started) * 1000
+        # Raw UTF-8 subjects came out garbled before; compare the rest
+        assert [h[1:] for h in _summary(first)] == [h[1:] for h in legacy_headers]
+        assert all(
+            new == old
+            for new, old in zip(_summary(first), legacy_headers)
+            if "\ufffd" not in old[0]
+        )
+        commands = dict(server.commands)
+        print(f"[imap] first incremental poll (full sync): {first_ms:.1f}ms, {commands}")
+
+        server.reset_counters()
+        steady = []
+        for i in range(POLLS):
+            server.deliver(1)
+            started = time.perf_counter()
+            headers = provider.list_unread(since_ms=None, limit=200)
+            steady.append((time.perf_counter() - started) * 1000)
+            assert int(headers[0].message_id) == server.uids[-1]
+        print(
+            f"[imap] incremental poll with 1 new message: p50 {statistics.median(steady):.1f}ms, "
+            f"{server.commands['UID FETCH'] / POLLS:.0f} UID FETCH per poll, {server.logins} logins"
+        )
+        cache.close()
+
+    assert server.logins == 0
+    assert statistics.median(steady) * 10 < statistics.median(legacy)
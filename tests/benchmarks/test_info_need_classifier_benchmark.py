@@ -0,0 +1,172 @@
+"""InfoNeedClassifier rule filter and result cache benchmark.
+
+The rule filter used to run one Python loop of substring checks per keyword
+list (plus one uncompiled ``re.search`` per code pattern) on every chat
+message. It now matches all keyword categories in one pass of a single
+trie-shaped regex and keeps the code patterns precompiled. Repeated prompts
+are answered from the classifier's result cache without the LLM confidence
+call. Legacy parity and the cache are covered in
+``tests/unit/chat/test_info_need_classifier.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_info_need_classifier_benchmark.py -m slow -s
+"""
+
+import asyncio
+import json
+import re
+import time
+
+import pytest
+
+from octopusos.core.chat.info_need_classifier import InfoNeedClassifier, RuleBasedFilter
+
+# Chat messages as users type them (mixed English / Chinese, code, status)
+CORPUS = [
+    "What's the weather like in Shanghai today?",
+    "今天上海天气怎么样",
+    "What is the latest Python version?",
+    "最新的 Python 版本是多少？",
+    "Explain the difference between a list and a tuple in Python",
+    "How do I reverse a linked list?",
+    "Where is the UserService class defined?",
+    "Does the function parse_config exist in this repo?",
+    "find the file that handles login",
+    "what phase are we in right now",
+    "当前是什么阶段？",
+    "Is the task runner still running?",
+    "show me the current config",
+    "What's the USD to CNY exchange rate?",
+    "美元兑人民币汇率是多少",
+    "AAPL stock price",
+    "比特币现在多少钱",
+    "Flight status for MU5101",
+    "航班 MU5101 的航班状态",
+    "Who won the match last night? what was the game score",
+    "What are the new EU AI Act compliance guidelines?",
+    "最新的数据安全法规有哪些规定",
+    "Is there an official announcement about the policy change?",
+    "Which database would you recommend for a small project?",
+    "你觉得 React 和 Vue 哪个更好？",
+    "I think we should refactor the router, what do you suggest?",
+    "Write a haiku about autumn",
+    "Summarize this paragraph for me: The quick brown fox jumps over the lazy dog.",
+    "Translate 'good morning' into Japanese",
+    "帮我写一个快速排序",
+    "What does HTTP 418 mean?",
+    "How does the API for the memory service work?",
+    "Can you check if utils.py exists and open it",
+    "Why does my main.js throw undefined is not a function?",
+    "class Foo extends Bar — how do I call the parent API constructor?",
+    "What time is it?",
+    "几点了",
+    "Any traffic on the road to the airport now?",
+    "Is it going to rain tomorrow? forecast please",
+    "What's the temperature and humidity outside",
+    "Tell me a joke",
+    "Thanks!",
+    "ok",
+    "Can you explain how transformers work, in simple terms?",
+    "What's the recommended way to handle errors in Go?",
+    "最近有什么科技新闻",
+    "What happened recently in the 2026 elections?",
+    "What is the current government standard for food labeling?",
+    "List the steps to set up a Python virtualenv",
+    "Generate unit tests for the function add(a, b)",
+    "为什么我的程序一直报错",
+    "Could you review this SQL: SELECT * FROM users WHERE id = 1",
+    "What's the capital of Australia?",
+    "Compare gold price this year with last year",
+    "How many sessions are active?",
+    "Please draft an email to the team about the release",
+    "What's your opinion on tabs vs spaces?",
+    "Show the status of the session mode",
+    "有没有官方的 API 文档",
+    "Is the wind strong enough for sailing today?",
+]
+
+
+def _legacy_filter(rule_filter: RuleBasedFilter, message: str) -> list:
+    """Previous implementation: one loop per keyword list."""
+    message_lower = message.lower()
+    matched = []
+    for prefix, keywords in (
+        ("time", rule_filter.TIME_SENSITIVE_KEYWORDS),
+        ("auth", rule_filter.AUTHORITATIVE_KEYWORDS),
+        ("state", rule_filter.AMBIENT_STATE_KEYWORDS),
+        ("implicit_time", rule_filter.IMPLICIT_TIME_KEYWORDS),
+    ):
+        matched.extend(f"{prefix}:{k}" for k in keywords if k.lower() in message_lower)
+    matched.extend(
+        f"code:{p}"
+        for p in rule_filter.CODE_STRUCTURE_PATTERNS
+        if re.search(p, message, re.IGNORECASE)
+    )
+    matched.extend(
+        f"opinion:{k}" for k in rule_filter.OPINION_INDICATORS if k.lower() in message_lower
+    )
+    return matched
+
+
+class _CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, prompt: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return json.dumps({"confidence": "high", "reason": "stable"})
+
+
+def _classifier(monkeypatch, llm, **config) -> InfoNeedClassifier:
+    classifier = InfoNeedClassifier(config=config, llm_callable=llm)
+
+    async def _no_audit(**kwargs):
+        return None
+
+    monkeypatch.setattr(classifier, "_log_classification_audit", _no_audit)
+    return classifier
+
+
+@pytest.mark.slow
+def test_rule_filter_throughput() -> None:
+    rule_filter = RuleBasedFilter()
+    rounds = 200
+    print()
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for message in CORPUS:
+            _legacy_filter(rule_filter, message)
+    legacy_us = (time.perf_counter() - started) / (rounds * len(CORPUS)) * 1e6
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for message in CORPUS:
+            rule_filter.filter(message)
+    compiled_us = (time.perf_counter() - started) / (rounds * len(CORPUS)) * 1e6
+
+    print(f"[info need] rule filter, per-list loops: {legacy_us:.1f}us/message")
+    print(f"[info need] rule filter, compiled (incl. signal model): {compiled_us:.1f}us/message")
+    assert compiled_us < legacy_us
+
+
+@pytest.mark.slow
+def test_repeated_prompts_skip_llm(monkeypatch) -> None:
+    llm = _CountingLLM()
+    classifier = _classifier(monkeypatch, llm)
+    prompts = CORPUS * 5
+
+    async def _run():
+        for prompt in prompts:
+            await classifier.classify(prompt)
+
+    started = time.perf_counter()
+    asyncio.run(_run())
+    elapsed = time.perf_counter() - started
+    print(
+        f"\n[info need] {len(prompts)} classifications in {elapsed * 1000:.0f}ms, "
+        f"LLM calls {llm.calls}, cache hits {classifier.cache_hits}"
+    )
+    assert classifier.cache_hits == len(prompts) - len(set(CORPUS))
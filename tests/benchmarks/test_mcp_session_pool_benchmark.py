@@ -0,0 +1,90 @@
+"""MCP session pool benchmark.
+
+A local stub MCP server (``tests/unit/mcp/mcp_stub_server.py``, with a startup delay
+standing in for node module loading) answers tool listings and calls.
+The chat engine used to spawn the server, run the MCP handshake and stop it
+again for every listing and every call; ``MCPSessionPool`` keeps one warm
+session per server and caches the tool schemas. Caching, multiplexing and
+restarts are covered in ``tests/unit/mcp/test_mcp_session_pool.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_mcp_session_pool_benchmark.py -m slow -s
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from octopusos.core.mcp.client import MCPClient
+from octopusos.core.mcp.config import MCPServerConfig
+from octopusos.core.mcp.session_pool import MCPSessionPool
+from octopusos.core.utils.background_loop import BackgroundLoop
+
+STUB_SERVER = Path(__file__).parents[1] / "unit" / "mcp" / "mcp_stub_server.py"
+STARTUP_S = os.getenv("OCTOPUSOS_BENCH_MCP_STARTUP_S", "0.2")
+
+
+def _server(server_id: str = "stub", startup_s: str = STARTUP_S) -> MCPServerConfig:
+    return MCPServerConfig(
+        id=server_id,
+        command=[sys.executable, str(STUB_SERVER)],
+        env={"MCP_STUB_STARTUP_S": startup_s},
+        timeout_ms=5000,
+    )
+
+
+@pytest.fixture
+def pool():
+    loop = BackgroundLoop(name="mcp-pool-test")
+    pool = MCPSessionPool(loop=loop, health_interval_s=3600)
+    yield pool
+    pool.close_sync()
+    loop.stop()
+
+
+async def _spawn_per_call(server: MCPServerConfig, tool: str, arguments: dict):
+    """Previous engine behaviour: connect -> request -> disconnect."""
+    client = MCPClient(server)
+    try:
+        await client.connect()
+        if tool == "tools/list":
+            return await client.list_tools()
+        return await client.call_tool(tool, arguments)
+    finally:
+        await client.disconnect()
+
+
+@pytest.mark.slow
+def test_per_call_latency(pool) -> None:
+    server = _server()
+    print()
+
+    cases = (("tools/list", "tools/list", {}), ("tools/call echo", "echo", {"message": "hi"}))
+    for label, tool, arguments in cases:
+        started = time.perf_counter()
+        for _ in range(5):
+            asyncio.run(_spawn_per_call(server, tool, arguments))
+        spawn_ms = (time.perf_counter() - started) / 5 * 1000
+
+        if tool == "tools/list":
+            call = lambda: pool.list_tools_sync(server)  # noqa: E731
+        else:
+            call = lambda: pool.call_tool_sync(server, tool, arguments)  # noqa: E731
+        started = time.perf_counter()
+        call()
+        first_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        for _ in range(50):
+            call()
+        warm_ms = (time.perf_counter() - started) / 50 * 1000
+
+        print(
+            f"[mcp] {label}: spawn per call {spawn_ms:.1f}ms, "
+            f"pooled first {first_ms:.1f}ms, pooled warm {warm_ms:.2f}ms"
+        )
+        assert warm_ms < spawn_ms / 10
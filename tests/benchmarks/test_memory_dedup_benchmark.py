@@ -0,0 +1,110 @@
+"""Memory dedup / compaction scaling benchmark.
+
+Generates synthetic memory summaries with planted near-duplicates and times
+``MemoryDeduplicator.get_duplicate_groups`` (prefix-filtered token index for
+the overlap coefficient) and ``MemoryCompactor._cluster_memories`` (MinHash/LSH
+candidate index for Jaccard) from 1k to 100k memories. At sizes where the
+pairwise scan is still feasible, groups are compared with it; exactness is
+covered in ``tests/unit/memory/test_memory_dedup_index.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_memory_dedup_benchmark.py -m slow -s
+"""
+
+import os
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from octopusos.core.memory.compactor import MemoryCompactor
+from octopusos.core.memory.deduplicator import MemoryDeduplicator
+from octopusos.core.memory.lsh import MemoryLSHIndex
+
+SIZES = [int(n) for n in os.getenv("OCTOPUSOS_BENCH_MEMORY_SIZES", "1000,10000,100000").split(",")]
+EXACT_MAX_SIZE = 5000
+
+
+def _synthetic_memories(n: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(20000)]
+    memories = []
+    for i in range(n):
+        roll = rng.random()
+        if memories and roll < 0.15:
+            # Near-duplicate of an earlier memory: replace one or two words
+            words = memories[rng.randrange(len(memories))]["content"]["summary"].split()
+            for _ in range(rng.randint(1, 2)):
+                words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        elif memories and roll < 0.2:
+            # Prefix of an earlier memory: overlap 1.0, Jaccard often below 0.5
+            words = memories[rng.randrange(len(memories))]["content"]["summary"].split()
+            words = words[:rng.randint(3, max(3, len(words) // 2))]
+        else:
+            words = rng.sample(vocabulary, rng.randint(10, 24))
+        memories.append(
+            {
+                "id": f"mem-{i:06d}",
+                "scope": "global",
+                "type": rng.choice(("convention", "decision")),
+                "content": {"summary": " ".join(words)},
+            }
+        )
+    return memories
+
+
+def _group_keys(groups: list[list[dict]]) -> set[tuple[str, ...]]:
+    return {tuple(m["id"] for m in group) for group in groups}
+
+
+def _pairwise_groups(deduplicator: MemoryDeduplicator, memories: list[dict]) -> list[list[dict]]:
+    processed = set()
+    groups = []
+    for i, mem in enumerate(memories):
+        if mem["id"] in processed:
+            continue
+        duplicates = deduplicator.find_duplicates(mem, memories[i + 1:])
+        if duplicates:
+            group = [mem] + duplicates
+            groups.append(group)
+            processed.update(m["id"] for m in group)
+    return groups
+
+
+@pytest.mark.slow
+def test_memory_dedup_and_compaction_scaling() -> None:
+    deduplicator = MemoryDeduplicator(similarity_threshold=0.85)
+    print()
+
+    for n in SIZES:
+        memories = _synthetic_memories(n)
+
+        started = time.perf_counter()
+        index = MemoryLSHIndex.from_memories(memories)
+        build_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        groups = deduplicator.get_duplicate_groups(memories)
+        dedup_s = time.perf_counter() - started
+
+        compactor = MemoryCompactor(SimpleNamespace(get_similarity_index=lambda: index))
+        started = time.perf_counter()
+        clusters = compactor._cluster_memories(memories)
+        compact_s = time.perf_counter() - started
+
+        line = (
+            f"[memory dedup] n={n}: index build {build_s:.2f}s, "
+            f"dedup {dedup_s:.2f}s ({len(groups)} groups), "
+            f"compaction clustering {compact_s:.2f}s "
+            f"({sum(1 for c in clusters if len(c.memories) > 1)} clusters)"
+        )
+
+        if n <= EXACT_MAX_SIZE:
+            started = time.perf_counter()
+            exact = _pairwise_groups(deduplicator, memories)
+            exact_s = time.perf_counter() - started
+            line += f"; pairwise scan {exact_s:.2f}s"
+            assert _group_keys(groups) == _group_keys(exact)
+        print(line)
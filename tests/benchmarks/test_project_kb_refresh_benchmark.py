@@ -0,0 +1,88 @@
+"""ProjectKB refresh throughput benchmark.
+
+Builds a synthetic markdown tree and reports files/sec and chunks/sec for a
+cold ``ProjectKBService.refresh`` (serial and process pool), a no-op
+incremental refresh (stat fast path) and a refresh after ``touch``.
+
+Run explicitly (excluded from the default ``not slow`` selection)::
+
+    pytest tests/benchmarks/test_project_kb_refresh_benchmark.py -m slow -s
+
+Set ``OCTOPUSOS_BENCH_KB_FILES`` to change the number of generated files.
+Bulk indexing correctness is covered in
+``tests/unit/project_kb/test_kb_bulk_session.py``.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+BENCH_FILES = int(os.getenv("OCTOPUSOS_BENCH_KB_FILES", "1000"))
+
+
+@pytest.mark.slow
+def test_project_kb_refresh_throughput(tmp_path: Path, write_kb_docs, make_kb_service) -> None:
+    root = tmp_path / "repo"
+    write_kb_docs(root, BENCH_FILES)
+    kb = make_kb_service(root, tmp_path / "kb.sqlite")
+
+    started = time.perf_counter()
+    report = kb.refresh(changed_only=True)
+    cold = time.perf_counter() - started
+
+    started = time.perf_counter()
+    noop = kb.refresh(changed_only=True)
+    warm = time.perf_counter() - started
+
+    print(
+        f"\n[kb refresh] cold: {report.changed_files} files, {report.new_chunks} chunks in "
+        f"{cold:.2f}s -> {report.changed_files / cold:.0f} files/s, "
+        f"{report.new_chunks / cold:.0f} chunks/s"
+    )
+    print(f"[kb refresh] no-op incremental: {noop.total_files} files in {warm:.2f}s")
+
+    assert not report.errors
+    assert report.changed_files == BENCH_FILES
+    assert report.total_chunks == report.new_chunks
+    assert noop.changed_files == 0
+    assert kb.search("token42", top_k=3)
+
+
+@pytest.mark.slow
+def test_project_kb_refresh_parallel_and_stat_fast_path(
+    tmp_path: Path, write_kb_docs, make_kb_service
+) -> None:
+    root = tmp_path / "repo"
+    write_kb_docs(root, BENCH_FILES)
+
+    timings = {}
+    reports = {}
+    for label, workers in (("serial", 1), ("parallel", 0)):
+        kb = make_kb_service(root, tmp_path / f"kb_{label}.sqlite", refresh_workers=workers)
+        started = time.perf_counter()
+        reports[label] = kb.refresh(changed_only=True)
+        timings[label] = time.perf_counter() - started
+        print(
+            f"\n[kb refresh] cold {label} (workers={kb._refresh_workers(BENCH_FILES)}): "
+            f"{timings[label]:.2f}s -> {BENCH_FILES / timings[label]:.0f} files/s"
+        )
+
+    assert reports["serial"].new_chunks == reports["parallel"].new_chunks
+
+    # No-op refresh: every file hits the (size, mtime_ns) fast path
+    started = time.perf_counter()
+    noop = kb.refresh(changed_only=True)
+    noop_seconds = time.perf_counter() - started
+    print(f"[kb refresh] no-op: {noop.total_files} files in {noop_seconds:.3f}s")
+    assert noop.changed_files == 0
+
+    # mtime bumped, content unchanged: hashed again but nothing re-indexed
+    for path in (root / "docs").rglob("*.md"):
+        os.utime(path)
+    touched = kb.refresh(changed_only=True)
+    assert touched.changed_files == 0
+    started = time.perf_counter()
+    kb.refresh(changed_only=True)
+    print(f"[kb refresh] after touch, second no-op: {time.perf_counter() - started:.3f}s")
@@ -0,0 +1,114 @@
+"""ProjectKB query latency benchmark.
+
+Reports p50/p99 latency of ``ProjectKBService.search`` over a synthetic
+corpus, with and without vector rerank. Vector rerank uses a deterministic
+hashing embedding provider so the benchmark measures the retrieval path,
+not model inference.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_project_kb_search_benchmark.py -m slow -s
+"""
+
+import hashlib
+import os
+import statistics
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from octopusos.core.project_kb.embedding.provider import IEmbeddingProvider
+
+BENCH_FILES = int(os.getenv("OCTOPUSOS_BENCH_KB_FILES", "1000"))
+BENCH_QUERIES = int(os.getenv("OCTOPUSOS_BENCH_KB_QUERIES", "300"))
+
+
+class HashingEmbeddingProvider(IEmbeddingProvider):
+    """Bag-of-words hashing embeddings (deterministic, no model download)."""
+
+    def __init__(self, dims: int = 384):
+        self._dims = dims
+
+    def _embed(self, text: str) -> np.ndarray:
+        vec = np.zeros(self._dims, dtype=np.float32)
+        for word in text.lower().split():
+            digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+            vec[int.from_bytes(digest, "little") % self._dims] += 1.0
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def embed_texts(self, texts: list[str]) -> np.ndarray:
+        return np.stack([self._embed(t) for t in texts])
+
+    def embed_query(self, query: str) -> np.ndarray:
+        return self._embed(query)
+
+    @property
+    def dims(self) -> int:
+        return self._dims
+
+    @property
+    def model_name(self) -> str:
+        return "bench-hashing"
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    ordered = sorted(samples)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return p50 * 1000, p99 * 1000
+
+
+def _run_queries(kb, queries: list[str], use_rerank: bool) -> list[float]:
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        kb.search(query, top_k=10, use_rerank=use_rerank)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+@pytest.mark.slow
+def test_project_kb_search_latency(
+    tmp_path: Path, write_kb_docs, make_kb_service, monkeypatch
+) -> None:
+    from octopusos.core.project_kb.embedding.manager import EmbeddingManager
+    from octopusos.core.project_kb.reranker import VectorReranker
+
+    # Keep the retrieval audit tape out of the user's home directory
+    monkeypatch.setenv("OCTOPUSOS_KB_RUN_TAPE_PATH", str(tmp_path / "kb_run_tape.jsonl"))
+
+    root = tmp_path / "repo"
+    write_kb_docs(root, BENCH_FILES)
+    kb = make_kb_service(root, tmp_path / "kb.sqlite")
+    kb.refresh(changed_only=True)
+
+    provider = HashingEmbeddingProvider()
+    kb.embedding_manager = EmbeddingManager(kb.db_path, provider)
+    kb.reranker = VectorReranker(kb.embedding_manager, provider, kb.searcher)
+    started = time.perf_counter()
+    embed_stats = kb.embedding_manager.build_embeddings(
+        kb._get_chunks_for_embedding(False), show_progress=False
+    )
+    print(
+        f"\n[kb search] built {embed_stats['processed']} embeddings in "
+        f"{time.perf_counter() - started:.2f}s (provider {embed_stats['embed_seconds']:.2f}s, "
+        f"cache hit rate {embed_stats['cache_hit_rate']:.0%})"
+    )
+
+    queries = [f"token{(i * 31) % 997} token{(i * 17) % 997}" for i in range(BENCH_QUERIES)]
+    _run_queries(kb, queries[:20], use_rerank=False)  # warm-up
+
+    kb.embedding_manager.get_index()  # load the vector index outside the timed loop
+    for label, use_rerank in (("bm25", False), ("bm25+vector retrieval/rerank", True)):
+        p50, p99 = _percentiles(_run_queries(kb, queries, use_rerank))
+        print(f"\n[kb search] {label}: p50={p50:.2f}ms p99={p99:.2f}ms over {len(queries)} queries")
+
+    results = kb.search(queries[0], top_k=5)
+    assert results
+    explanation = results[0].explanation
+    assert explanation.matched_terms
+    start, end = explanation.match_offsets[0]
+    assert results[0].content[start:end].lower() in explanation.matched_terms
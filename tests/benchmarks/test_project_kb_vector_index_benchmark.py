@@ -0,0 +1,107 @@
+"""ProjectKB in-memory vector index benchmark.
+
+Measures top-k latency of ``VectorIndex.search`` (exhaustive and IVF),
+IVF recall against exhaustive search, and cold-start load time from the
+SQLite BLOBs versus the memory-mapped sidecar. Index and sidecar behaviour
+is covered in ``tests/unit/project_kb/test_kb_vector_index.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_project_kb_vector_index_benchmark.py -m slow -s
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from octopusos.core.project_kb.embedding.vector_index import VectorIndex
+
+BENCH_VECTORS = int(os.getenv("OCTOPUSOS_BENCH_KB_VECTORS", "100000"))
+BENCH_DIMS = 384
+BENCH_QUERIES = 200
+
+
+def _clustered_vectors(n: int, dims: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.standard_normal((256, dims)).astype(np.float32)
+    labels = rng.integers(0, len(centers), size=n)
+    return centers[labels] + 0.5 * rng.standard_normal((n, dims)).astype(np.float32)
+
+
+def _populate_db(db_path: Path, vectors: np.ndarray) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE kb_embeddings (
+            chunk_id TEXT PRIMARY KEY, model TEXT NOT NULL, dims INTEGER NOT NULL,
+            vector BLOB NOT NULL, content_hash TEXT NOT NULL, built_at INTEGER NOT NULL
+        )
+        """
+    )
+    conn.executemany(
+        "INSERT INTO kb_embeddings VALUES (?, 'bench', ?, ?, 'h', 0)",
+        ((f"chunk_{i}", vectors.shape[1], vec.tobytes()) for i, vec in enumerate(vectors)),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _timed_search(index: VectorIndex, queries: np.ndarray, k: int):
+    samples, results = [], []
+    for query in queries:
+        started = time.perf_counter()
+        results.append(index.search(query, k))
+        samples.append(time.perf_counter() - started)
+    ordered = sorted(samples)
+    return ordered[len(ordered) // 2] * 1000, ordered[int(len(ordered) * 0.99)] * 1000, results
+
+
+@pytest.mark.slow
+def test_vector_index_latency_and_recall(tmp_path: Path) -> None:
+    rng = np.random.default_rng(7)
+    vectors = _clustered_vectors(BENCH_VECTORS, BENCH_DIMS, rng)
+    queries = vectors[rng.choice(len(vectors), BENCH_QUERIES, replace=False)]
+    queries = queries + 0.1 * rng.standard_normal(queries.shape).astype(np.float32)
+    db_path = tmp_path / "kb.sqlite"
+    _populate_db(db_path, vectors)
+
+    conn = sqlite3.connect(db_path)
+    exact = VectorIndex(db_path, "bench", BENCH_DIMS, ivf_min_vectors=0)
+    started = time.perf_counter()
+    exact.load(conn)
+    elapsed = time.perf_counter() - started
+    print(f"\n[kb vector index] load from sqlite: {elapsed:.2f}s ({len(exact)} vectors)")
+
+    cold = VectorIndex(db_path, "bench", BENCH_DIMS, ivf_min_vectors=0)
+    started = time.perf_counter()
+    cold.load(conn)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"[kb vector index] load from mmap sidecar: {elapsed_ms:.1f}ms")
+    assert cold.get_stats()["memory_mapped"]
+
+    p50, p99, exact_results = _timed_search(exact, queries, 10)
+    print(f"[kb vector index] exhaustive top-10: p50={p50:.2f}ms p99={p99:.2f}ms")
+
+    ivf = VectorIndex(
+        tmp_path / "ivf.sqlite", "bench", BENCH_DIMS, ivf_min_vectors=1, ivf_nprobe=16
+    )
+    started = time.perf_counter()
+    ivf.upsert([f"chunk_{i}" for i in range(len(vectors))], vectors)
+    elapsed = time.perf_counter() - started
+    print(f"[kb vector index] IVF build: {elapsed:.2f}s ({ivf.get_stats()['ivf_lists']} lists)")
+
+    p50, p99, ivf_results = _timed_search(ivf, queries, 10)
+    recall = np.mean([
+        len({cid for cid, _ in a} & {cid for cid, _ in b}) / 10
+        for a, b in zip(exact_results, ivf_results)
+    ])
+    print(
+        f"[kb vector index] IVF nprobe=16 top-10: p50={p50:.2f}ms p99={p99:.2f}ms "
+        f"recall@10={recall:.3f}"
+    )
+    conn.close()
+
+    assert recall >= 0.9
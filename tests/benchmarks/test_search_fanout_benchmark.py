@@ -0,0 +1,137 @@
+"""Company research search fan-out benchmark.
+
+Simulated engines (``asyncio.sleep`` latencies, a slow duckduckgo tail)
+answer the six company research queries. The previous loop awaited every
+query / engine one after another on a fresh thread + event loop per call;
+``SearchFanout`` runs them concurrently with hedging on the shared
+background loop. Hedging, deadlines and loop reuse are covered in
+``tests/unit/chat/test_search_fanout.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_search_fanout_benchmark.py -m slow -s
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from octopusos.core.chat.search_fanout import SearchFanout, SearchJob
+from octopusos.core.utils.background_loop import BackgroundLoop, run_coroutine_sync
+
+LATENCY_S = {"duckduckgo": 0.4, "bing": 0.5, "google": 0.6}
+SLOW_TAIL_S = float(os.getenv("OCTOPUSOS_BENCH_SEARCH_SLOW_TAIL_S", "3.0"))
+
+CORE_QUERIES = [
+    "Acme company profile",
+    "Acme 公司 简介",
+    "Acme site:wikipedia.org",
+    "Acme site:baike.baidu.com",
+]
+NEWS_QUERIES = ["Acme latest news", "Acme site:news.baidu.com"]
+JOBS = [SearchJob("core", q, ("duckduckgo", "bing"), 6) for q in CORE_QUERIES] + [
+    SearchJob("news", q, ("google",), 5) for q in NEWS_QUERIES
+]
+
+
+class FakeEngines:
+    """Engines answering after a fixed latency; some queries are slow or empty."""
+
+    def __init__(self, slow: Dict[str, float] | None = None, empty: set | None = None):
+        self.slow = slow or {}
+        self.empty = empty or set()
+        self.calls: List[tuple] = []
+        self.in_flight: Dict[str, int] = {}
+        self.max_in_flight: Dict[str, int] = {}
+
+    async def search(self, engine: str, query: str, max_results: int) -> Dict[str, Any]:
+        self.calls.append((engine, query))
+        self.in_flight[engine] = self.in_flight.get(engine, 0) + 1
+        self.max_in_flight[engine] = max(self.max_in_flight.get(engine, 0), self.in_flight[engine])
+        try:
+            await asyncio.sleep(self.slow.get(f"{engine}:{query}", LATENCY_S[engine]))
+            if (engine, query) in self.empty:
+                return {"results": []}
+            return {
+                "results": [
+                    {
+                        "url": f"https://{engine}.example/{abs(hash(query)) % 1000}/{i}",
+                        "title": f"{query} {i}",
+                    }
+                    for i in range(max_results)
+                ]
+                + [{"url": "https://shared.example/acme", "title": "shared"}]
+            }
+        finally:
+            self.in_flight[engine] -= 1
+
+
+async def _sequential(engines: FakeEngines) -> Dict[str, List[Dict[str, Any]]]:
+    """Previous behaviour: queries and fallback engines awaited one by one."""
+    bucket: Dict[str, List[Dict[str, Any]]] = {"core": [], "news": []}
+    seen: set = set()
+    for job in JOBS:
+        for engine in job.engines:
+            response = await engines.search(engine, job.query, job.max_results)
+            added = 0
+            for row in response.get("results") or []:
+                if row["url"] in seen:
+                    continue
+                seen.add(row["url"])
+                bucket[job.bucket].append(row)
+                added += 1
+            if added:
+                break
+    return bucket
+
+
+def _thread_per_call(coro):
+    """Previous _run_async_in_sync from inside a running loop."""
+    holder = {}
+
+    def _runner():
+        loop = asyncio.new_event_loop()
+        try:
+            holder["result"] = loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    thread = threading.Thread(target=_runner, daemon=True)
+    thread.start()
+    thread.join()
+    return holder["result"]
+
+
+@pytest.mark.slow
+def test_research_fanout_latency() -> None:
+    slow = {"duckduckgo:Acme site:wikipedia.org": SLOW_TAIL_S}
+    print()
+
+    started = time.perf_counter()
+    sequential = _thread_per_call(_sequential(FakeEngines(slow=slow)))
+    sequential_s = time.perf_counter() - started
+    rows = sum(map(len, sequential.values()))
+    print(f"[search fanout] sequential: {sequential_s:.2f}s, {rows} rows")
+
+    engines = FakeEngines(slow=slow)
+    started = time.perf_counter()
+    outcome = run_coroutine_sync(SearchFanout(engines.search, hedge_delay=1.0).run(JOBS))
+    fanout_s = time.perf_counter() - started
+    rows = sum(map(len, outcome.buckets.values()))
+    print(f"[search fanout] fan-out: {fanout_s:.2f}s, {rows} rows {outcome.stats()}")
+
+    assert fanout_s < sequential_s / 3
+    assert outcome.winners["Acme site:wikipedia.org"] == "bing"
+
+    loop = BackgroundLoop()
+    for label, run in (("thread + loop per call", _thread_per_call), ("background loop", loop.run)):
+        started = time.perf_counter()
+        for _ in range(200):
+            run(asyncio.sleep(0))
+        per_call_us = (time.perf_counter() - started) / 200 * 1e6
+        print(f"[search fanout] sync bridge, {label}: {per_call_us:.0f}us/call")
+    loop.stop()
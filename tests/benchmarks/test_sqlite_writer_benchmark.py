@@ -0,0 +1,84 @@
+"""SQLiteWriter group-commit benchmark.
+
+With ``batch_max_jobs > 1`` the writer drains queued jobs and runs them in one
+``BEGIN IMMEDIATE`` transaction, one SAVEPOINT per job, with a single COMMIT
+instead of one per job. The benchmark compares per-job and group commit
+throughput with concurrent submitters; batching behaviour is covered in
+``tests/unit/db/test_sqlite_writer_batch.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_sqlite_writer_benchmark.py -m slow -s
+"""
+
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from octopusos.core.db.writer import SQLiteWriter
+
+N_WRITES = 2000
+SUBMITTERS = 16
+
+
+@pytest.fixture
+def make_writer(tmp_path):
+    writers = []
+
+    def _make(name: str = "writer.db", **kwargs) -> SQLiteWriter:
+        db_path = tmp_path / name
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)")
+        conn.commit()
+        conn.close()
+        writer = SQLiteWriter(str(db_path), **kwargs)
+        writers.append(writer)
+        return writer
+
+    yield _make
+    for writer in writers:
+        writer.stop()
+        with SQLiteWriter._lock:
+            SQLiteWriter._instances.pop(writer.db_path, None)
+
+
+def _insert(value: str):
+    def _write(conn):
+        conn.execute("INSERT INTO items (value) VALUES (?)", (value,))
+        return value
+
+    return _write
+
+
+def _values(writer: SQLiteWriter) -> list:
+    conn = sqlite3.connect(writer.db_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT value FROM items ORDER BY id")]
+    finally:
+        conn.close()
+
+
+@pytest.mark.slow
+def test_group_commit_throughput(make_writer) -> None:
+    print()
+    results = {}
+    for label, kwargs in (
+        ("per-job commit", {"batch_max_jobs": 1}),
+        ("group commit", {"batch_max_jobs": 64}),
+    ):
+        writer = make_writer(f"{label.replace(' ', '_')}.db", **kwargs)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(SUBMITTERS) as pool:
+            list(pool.map(lambda i: writer.submit(_insert(f"v{i}")), range(N_WRITES)))
+        elapsed = time.perf_counter() - started
+        results[label] = elapsed
+        stats = writer.get_stats()
+        print(
+            f"[writer] {label}: {N_WRITES / elapsed:.0f} writes/s, "
+            f"{stats['total_batches']} commits, avg batch {stats['avg_batch_size']:.1f}"
+        )
+        assert len(_values(writer)) == N_WRITES
+
+    assert results["group commit"] < results["per-job commit"]
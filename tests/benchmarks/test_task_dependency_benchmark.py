@@ -0,0 +1,119 @@
+"""Task dependency insert benchmark.
+
+Inserts 10k dependency edges (a random DAG over planned work items) through
+``TaskDependencyService``. The previous ``create_dependency_safe`` reloaded
+every row and ran a full DFS per insert, so it is timed on a prefix only;
+the incremental graph is timed per edge and as one ``create_dependencies``
+batch. Cycle rejection is covered in
+``tests/unit/task/test_task_dependency_graph.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_task_dependency_benchmark.py -m slow -s
+"""
+
+import os
+import random
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from octopusos.core.task.dependency_service import (
+    CircularDependencyError,
+    DependencyGraph,
+    TaskDependencyService,
+)
+
+N_EDGES = int(os.getenv("OCTOPUSOS_BENCH_DEPENDENCY_EDGES", "10000"))
+N_LEGACY_EDGES = int(os.getenv("OCTOPUSOS_BENCH_DEPENDENCY_LEGACY_EDGES", "1000"))
+
+
+def _connect(db_path: Path, n_tasks: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executemany(
+        "INSERT INTO tasks (task_id, title, status) VALUES (?, ?, 'created')",
+        ((f"task-{i:05d}", f"Work item {i}") for i in range(n_tasks)),
+    )
+    conn.commit()
+    return conn
+
+
+def _dag_edges(n_edges: int, n_tasks: int, seed: int = 5) -> list[tuple[str, str]]:
+    """Random DAG: a work item only depends on lower-numbered items."""
+    rng = random.Random(seed)
+    edges: set[tuple[str, str]] = set()
+    while len(edges) < n_edges:
+        a = rng.randrange(1, n_tasks)
+        b = rng.randrange(max(0, a - 200), a)
+        edges.add((f"task-{a:05d}", f"task-{b:05d}"))
+    return sorted(edges, key=lambda _: rng.random())
+
+
+def _legacy_create_safe(service: TaskDependencyService, task_id: str, depends_on: str) -> None:
+    """Previous behaviour: reload all rows and run find_cycles() per insert."""
+    temp_deps = service.get_all_dependencies()
+    from octopusos.core.task.models import DependencyType, TaskDependency
+
+    temp_deps.append(
+        TaskDependency(
+            task_id=task_id, depends_on_task_id=depends_on, dependency_type=DependencyType.BLOCKS
+        )
+    )
+    if DependencyGraph(temp_deps).find_cycles():
+        raise CircularDependencyError(task_id)
+    service.create_dependency(task_id, depends_on, "blocks", "planned order")
+
+
+@pytest.mark.slow
+def test_dependency_insert_scaling(tmp_path: Path, migrated_db) -> None:
+    n_tasks = max(100, N_EDGES // 3)
+    edges = _dag_edges(N_EDGES, n_tasks)
+    print()
+
+    conn = _connect(migrated_db(tmp_path / "legacy.db"), n_tasks)
+    service = TaskDependencyService(conn)
+    started = time.perf_counter()
+    for task_id, depends_on in edges[:N_LEGACY_EDGES]:
+        _legacy_create_safe(service, task_id, depends_on)
+    legacy_s = time.perf_counter() - started
+    print(f"[task deps] full-DFS per insert: {N_LEGACY_EDGES} edges in {legacy_s:.2f}s")
+    conn.close()
+
+    conn = _connect(migrated_db(tmp_path / "incremental.db"), n_tasks)
+    service = TaskDependencyService(conn)
+    started = time.perf_counter()
+    for task_id, depends_on in edges:
+        service.create_dependency_safe(task_id, depends_on, "blocks", "planned order")
+    incremental_s = time.perf_counter() - started
+    print(
+        f"[task deps] incremental per insert: {N_EDGES} edges in {incremental_s:.2f}s "
+        f"({incremental_s / N_EDGES * 1e6:.0f}us/edge)"
+    )
+
+    # Closing edges are rejected without touching the rest of the graph
+    rejected = 0
+    started = time.perf_counter()
+    for task_id, depends_on in edges[:500]:
+        try:
+            service.create_dependency_safe(depends_on, task_id, "blocks", "reverse")
+        except CircularDependencyError:
+            rejected += 1
+    print(f"[task deps] 500 cycle checks: {(time.perf_counter() - started) * 1000:.0f}ms")
+    assert rejected == 500
+    assert not service.detect_cycles()
+    conn.close()
+
+    conn = _connect(migrated_db(tmp_path / "batch.db"), n_tasks)
+    service = TaskDependencyService(conn)
+    started = time.perf_counter()
+    created = service.create_dependencies(
+        (task_id, depends_on, "blocks", "planned order") for task_id, depends_on in edges
+    )
+    batch_s = time.perf_counter() - started
+    print(f"[task deps] create_dependencies batch: {len(created)} edges in {batch_s:.2f}s")
+    assert len(service.get_all_dependencies()) == N_EDGES
+    conn.close()
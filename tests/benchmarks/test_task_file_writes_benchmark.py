@@ -0,0 +1,101 @@
+"""File-dependency detection benchmark.
+
+Fills ``task_audits`` with write audits (the trigger from schema v102 keeps
+the ``task_file_writes`` ledger in sync) and times resolving the last writer
+of a task's read files: the previous per-file ``LIKE`` scan over audit
+payloads versus the single indexed ledger query. The ledger trigger is
+covered in ``tests/unit/task/test_task_file_writes.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_task_file_writes_benchmark.py -m slow -s
+"""
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from octopusos.core.task.dependency_service import TaskDependencyService
+
+N_AUDITS = int(os.getenv("OCTOPUSOS_BENCH_WRITE_AUDITS", "200000"))
+N_FILES_READ = 50
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _write_payload(*files: str) -> str:
+    return json.dumps({"operation": "write", "status": "success", "files_changed": list(files)})
+
+
+def _fill_audits(conn: sqlite3.Connection, n_audits: int, n_tasks: int = 500) -> None:
+    conn.executemany(
+        "INSERT INTO tasks (task_id, title) VALUES (?, ?)",
+        ((f"task-{i:04d}", f"Task {i}") for i in range(n_tasks)),
+    )
+    conn.executemany(
+        "INSERT INTO task_audits (task_id, level, event_type, payload, created_at) "
+        "VALUES (?, 'info', ?, ?, ?)",
+        (
+            (
+                f"task-{i % n_tasks:04d}",
+                "repo_write" if i % 3 == 0 else "repo_read",
+                _write_payload(
+                    f"src/pkg_{i % 97}/module_{i % 5003}.py", f"docs/page_{i % 211}.md"
+                ),
+                f"2026-01-01T00:00:{i // 1000 % 60:02d}.{i % 1000:03d}000+00:00",
+            )
+            for i in range(n_audits)
+        ),
+    )
+    conn.commit()
+
+
+def _legacy_last_modifier(conn: sqlite3.Connection, file_path: str, task_id: str):
+    row = conn.execute(
+        """
+        SELECT DISTINCT ta.task_id
+        FROM task_audits ta
+        WHERE ta.event_type LIKE '%write%'
+          AND ta.payload LIKE ?
+          AND ta.task_id != ?
+        ORDER BY ta.created_at DESC
+        LIMIT 1
+        """,
+        (f"%{file_path}%", task_id),
+    ).fetchone()
+    return row[0] if row else None
+
+
+@pytest.mark.slow
+def test_last_modifier_lookup(tmp_path: Path, migrated_db) -> None:
+    conn = _connect(migrated_db(tmp_path / "audits.db"))
+    started = time.perf_counter()
+    _fill_audits(conn, N_AUDITS)
+    print(f"\n[file writes] {N_AUDITS} audits inserted in {time.perf_counter() - started:.1f}s")
+    ledger_rows = conn.execute("SELECT COUNT(*) FROM task_file_writes").fetchone()[0]
+
+    files = [f"src/pkg_{i % 97}/module_{i * 37 % 5003}.py" for i in range(N_FILES_READ)]
+    service = TaskDependencyService(conn)
+
+    started = time.perf_counter()
+    legacy = {path: _legacy_last_modifier(conn, path, "task-0001") for path in files}
+    legacy_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indexed = service._find_last_modifiers(files, "task-0001")
+    indexed_s = time.perf_counter() - started
+
+    print(
+        f"[file writes] {N_FILES_READ} files: LIKE scan {legacy_s * 1000:.0f}ms, "
+        f"ledger query {indexed_s * 1000:.1f}ms ({ledger_rows} ledger rows)"
+    )
+    assert {path for path, task in legacy.items() if task} == set(indexed)
+    conn.close()
@@ -0,0 +1,109 @@
+"""Task listing benchmark.
+
+Fills ``tasks`` with rows carrying realistic metadata / routing JSON and
+times deep pages of ``TaskManager.list_tasks``: the previous
+``SELECT * ... LIMIT/OFFSET`` listing versus keyset pages on
+``(created_at, task_id)`` (schema v103 indexes) with the summary projection.
+Paging correctness is covered in ``tests/unit/task/test_task_list_keyset.py``.
+
+Run explicitly::
+
+    pytest tests/benchmarks/test_task_list_benchmark.py -m slow -s
+"""
+
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from octopusos.core.task import TaskManager
+from octopusos.core.task.manager import encode_task_cursor
+
+N_TASKS = int(os.getenv("OCTOPUSOS_BENCH_TASKS", "100000"))
+PAGE_SIZE = 50
+
+
+def _fill_tasks(db_path: Path, n_tasks: int, same_second: int = 1) -> None:
+    """Insert tasks; ``same_second`` consecutive tasks share a created_at."""
+    metadata = json.dumps({"execution_context": {"notes": "x" * 1500}, "run_mode": "assisted"})
+    route_plan = json.dumps({"steps": [{"provider": "local", "reason": "y" * 200}] * 4})
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO tasks (task_id, title, status, created_at, updated_at, metadata, "
+        "route_plan_json) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            (
+                f"task-{i:07d}",
+                f"Task {i}",
+                ("created", "executing", "succeeded")[i % 3],
+                f"2026-01-{1 + (i // same_second) // 86400 % 28:02d}T"
+                f"{(i // same_second) // 3600 % 24:02d}:{(i // same_second) // 60 % 60:02d}:"
+                f"{(i // same_second) % 60:02d}+00:00",
+                "2026-02-01T00:00:00+00:00",
+                metadata,
+                route_plan,
+            )
+            for i in range(n_tasks)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _legacy_list(conn: sqlite3.Connection, limit: int, offset: int) -> list:
+    """Previous query: every column, LIMIT/OFFSET, metadata parsed per row."""
+    rows = conn.execute(
+        "SELECT * FROM tasks WHERE 1=1 ORDER BY created_at DESC LIMIT ? OFFSET ?",
+        (limit, offset),
+    ).fetchall()
+    return [
+        (row["task_id"], json.loads(row["metadata"]) if row["metadata"] else {}) for row in rows
+    ]
+
+
+def _timed(label: str, fn, repeat: int = 5):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - started)
+    print(f"[task list] {label}: best {min(samples) * 1000:.2f}ms")
+    return result
+
+
+@pytest.mark.slow
+def test_deep_page_latency(tmp_path: Path, migrated_db) -> None:
+    db_path = migrated_db(tmp_path / "tasks.db")
+    started = time.perf_counter()
+    _fill_tasks(db_path, N_TASKS)
+    print(f"\n[task list] {N_TASKS} tasks inserted in {time.perf_counter() - started:.1f}s")
+    manager = TaskManager(db_path=db_path)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+
+    deep_offset = N_TASKS - 10 * PAGE_SIZE
+    deep_task = manager.list_tasks(limit=1, offset=deep_offset - 1, summary=True)[0]
+    deep_cursor = encode_task_cursor(deep_task.created_at, deep_task.task_id)
+
+    # Query cost on an open connection (the WebUI and shared registry_db case)
+    _timed("first page, SELECT * + OFFSET", lambda: _legacy_list(conn, PAGE_SIZE, 0))
+    legacy = _timed(
+        f"offset {deep_offset}, SELECT * + OFFSET",
+        lambda: _legacy_list(conn, PAGE_SIZE, deep_offset),
+    )
+    keyset = _timed(
+        "same page, keyset summary",
+        lambda: manager._select_tasks(conn, limit=PAGE_SIZE, cursor=deep_cursor, summary=True),
+    )
+    assert [task.task_id for task in keyset] == [task_id for task_id, _ in legacy]
+
+    # End to end through TaskManager(db_path=...), which opens a connection per call
+    page = _timed(
+        "list_tasks_page end to end",
+        lambda: manager.list_tasks_page(limit=PAGE_SIZE, cursor=deep_cursor),
+    )
+    assert page.tasks == keyset
+    conn.close()
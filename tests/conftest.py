@@ -0,0 +1,21 @@
+"""Fixtures shared by the unit and benchmark suites."""
+
+import sqlite3
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+
+def _migrated_db(db_path: Path) -> Path:
+    from octopusos.store.migrator import auto_migrate
+
+    sqlite3.connect(db_path).close()
+    auto_migrate(db_path)
+    return db_path
+
+
+@pytest.fixture
+def migrated_db() -> Callable[[Path], Path]:
+    """Create and migrate an OctopusOS database at the given path."""
+    return _migrated_db
@@ -0,0 +1,303 @@
+"""Minimal IMAP4rev1 server over TCP for the IMAP sync tests and benchmark.
+
+Serves a single INBOX of generated messages (``message_count``, built
+lazily so a 50k-message mailbox costs nothing until it is fetched).
+Supports the commands the IMAP/SMTP email provider uses: CAPABILITY, LOGIN,
+SELECT, NOOP, LOGOUT, SEARCH, FETCH (UID, FLAGS, ENVELOPE,
+BODY.PEEK[HEADER], RFC822) and STORE, plain or prefixed with UID.
+Envelope strings that cannot be quoted are sent as literals.
+
+``latency_s`` delays every response and ``login_latency_s`` the LOGIN
+response, standing in for the network round trip and TLS + authentication.
+``commands`` counts the commands received; ``deliver``, ``set_seen``,
+``expunge``, ``set_uidvalidity`` and ``drop_connections`` change the mailbox
+or the sessions from the test.
+"""
+
+import base64
+import bisect
+import re
+import socket
+import socketserver
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Iterable, List, Optional, Set
+
+_ARG = re.compile(rb'"((?:[^"\\]|\\.)*)"|(\S+)')
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _subject(uid: int) -> str:
+    if uid % 10 == 0:
+        return f'Re: "Quarterly" report – {uid}'  # Needs a literal
+    if uid % 10 == 5:
+        return f"=?utf-8?b?{_b64(f'Überweisung {uid}')}?="
+    return f"Message {uid}"
+
+
+def _b64(text: str) -> str:
+    return base64.b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def _date(uid: int) -> str:
+    return format_datetime(_EPOCH + timedelta(minutes=uid))
+
+
+def _sender(uid: int) -> tuple:
+    return f"Sender {uid % 97}", f"user{uid % 97}", "example.com"
+
+
+def _string(value: Optional[str]) -> bytes:
+    if value is None:
+        return b"NIL"
+    raw = value.encode("utf-8")
+    if any(c in raw for c in b'"\\\r\n') or any(c > 0x7F for c in raw):
+        return b"{%d}\r\n" % len(raw) + raw
+    return b'"' + raw + b'"'
+
+
+def _envelope(uid: int) -> bytes:
+    name, mailbox, host = _sender(uid)
+    address = b"((" + b" ".join([_string(name), b"NIL", _string(mailbox), _string(host)]) + b"))"
+    return b"(" + b" ".join(
+        [
+            _string(_date(uid)),
+            _string(_subject(uid)),
+            address,
+            address,
+            address,
+            b'((NIL NIL "me" "example.com"))',
+            b"NIL",
+            b"NIL",
+            b"NIL",
+            _string(f"<msg-{uid}@example.com>"),
+        ]
+    ) + b")"
+
+
+def _message(uid: int) -> bytes:
+    name, mailbox, host = _sender(uid)
+    header = (
+        f"From: {name} <{mailbox}@{host}>\r\n"
+        f"To: me@example.com\r\n"
+        f"Subject: {_subject(uid)}\r\n"
+        f"Date: {_date(uid)}\r\n"
+        f"Message-ID: <msg-{uid}@example.com>\r\n"
+        f"Content-Type: text/plain; charset=utf-8\r\n\r\n"
+    )
+    return header.encode("utf-8") + f"Body of message {uid}.\r\n".encode("utf-8")
+
+
+class ImapStubServer:
+    """Threaded IMAP stand-in; use as a context manager"""
+
+    def __init__(
+        self,
+        message_count: int = 0,
+        unseen_every: int = 100,
+        latency_s: float = 0.0,
+        login_latency_s: float = 0.0,
+    ):
+        self.latency_s = latency_s
+        self.login_latency_s = login_latency_s
+        self.uidvalidity = 1
+        self.commands: Counter = Counter()
+        self.logins = 0
+        self.lock = threading.Lock()
+        # UIDs ascending; sequence number = index + 1
+        self.uids: List[int] = list(range(1, message_count + 1))
+        self.seen: Set[int] = {uid for uid in self.uids if uid % unseen_every}
+        self._sockets: Set[socket.socket] = set()
+
+        stub = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                stub._serve(self.connection, self.rfile)
+
+        self._server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self.host, self.port = self._server.server_address
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self) -> "ImapStubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.drop_connections()
+        self._server.shutdown()
+        self._server.server_close()
+
+    # ------------------------------------------------------------------
+    # Test helpers
+    # ------------------------------------------------------------------
+
+    def deliver(self, count: int = 1, seen: bool = False) -> List[int]:
+        with self.lock:
+            start = (self.uids[-1] if self.uids else 0) + 1
+            new = list(range(start, start + count))
+            self.uids.extend(new)
+            if seen:
+                self.seen.update(new)
+        return new
+
+    def set_seen(self, uid: int, seen: bool = True) -> None:
+        with self.lock:
+            (self.seen.add if seen else self.seen.discard)(uid)
+
+    def expunge(self, uid: int) -> None:
+        with self.lock:
+            self.uids.remove(uid)
+
+    def set_uidvalidity(self, value: int) -> None:
+        with self.lock:
+            self.uidvalidity = value
+
+    def drop_connections(self) -> None:
+        with self.lock:
+            sockets = list(self._sockets)
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def reset_counters(self) -> None:
+        with self.lock:
+            self.commands.clear()
+            self.logins = 0
+
+    # ------------------------------------------------------------------
+    # Protocol
+    # ------------------------------------------------------------------
+
+    def _serve(self, sock: socket.socket, rfile) -> None:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.lock:
+            self._sockets.add(sock)
+        try:
+            sock.sendall(b"* OK IMAP4rev1 stub ready\r\n")
+            while True:
+                line = rfile.readline()
+                if not line:
+                    return
+                tag, _, rest = line.rstrip(b"\r\n").partition(b" ")
+                out = self._command(tag, rest)
+                if self.latency_s:
+                    time.sleep(self.latency_s)
+                sock.sendall(out)
+                if out.endswith(b"OK LOGOUT completed\r\n"):
+                    return
+        except OSError:
+            return
+        finally:
+            with self.lock:
+                self._sockets.discard(sock)
+
+    def _command(self, tag: bytes, rest: bytes) -> bytes:
+        name, _, args = rest.partition(b" ")
+        name = name.upper()
+        by_uid = name == b"UID"
+        if by_uid:
+            name, _, args = args.partition(b" ")
+            name = name.upper()
+        label = ("UID " if by_uid else "") + name.decode("ascii", "replace")
+        with self.lock:
+            self.commands[label] += 1
+            try:
+                lines = self._dispatch(name, args, by_uid)
+            except Exception as exc:  # Malformed command
+                return tag + b" BAD " + str(exc).encode("utf-8") + b"\r\n"
+        if lines is None:
+            return tag + b" BAD unknown command\r\n"
+        if name == b"LOGIN":
+            if self.login_latency_s:
+                time.sleep(self.login_latency_s)
+        return b"".join(lines) + tag + b" OK " + name + b" completed\r\n"
+
+    def _dispatch(self, name: bytes, args: bytes, by_uid: bool) -> Optional[List[bytes]]:
+        # Caller holds self.lock
+        if name == b"CAPABILITY":
+            return [b"* CAPABILITY IMAP4rev1 AUTH=PLAIN\r\n"]
+        if name == b"LOGIN":
+            self.logins += 1
+            return []
+        if name in (b"SELECT", b"EXAMINE"):
+            uidnext = (self.uids[-1] if self.uids else 0) + 1
+            return [
+                b"* FLAGS (\\Seen)\r\n",
+                b"* %d EXISTS\r\n" % len(self.uids),
+                b"* 0 RECENT\r\n",
+                b"* OK [UIDVALIDITY %d] UIDs valid\r\n" % self.uidvalidity,
+                b"* OK [UIDNEXT %d] Predicted next UID\r\n" % uidnext,
+            ]
+        if name == b"NOOP":
+            return [b"* %d EXISTS\r\n" % len(self.uids)]
+        if name == b"LOGOUT":
+            return [b"* BYE logging out\r\n"]
+        if name == b"SEARCH":
+            if args.strip().upper() != b"UNSEEN":
+                raise ValueError("only SEARCH UNSEEN is supported")
+            hits = [
+                uid if by_uid else seq
+                for seq, uid in enumerate(self.uids, start=1)
+                if uid not in self.seen
+            ]
+            return [b"* SEARCH" + b"".join(b" %d" % n for n in hits) + b"\r\n"]
+        if name == b"FETCH":
+            sequence, _, items = args.partition(b" ")
+            items = items.strip().strip(b"()").upper().split()
+            return [
+                self._fetch(seq, uid, items, by_uid)
+                for seq, uid in self._resolve(sequence, by_uid)
+            ]
+        if name == b"STORE":
+            sequence, op, flags = (m.group(0) for m in _ARG.finditer(args))
+            out = []
+            for seq, uid in self._resolve(sequence, by_uid):
+                if b"\\SEEN" in flags.upper():
+                    (self.seen.discard if op.startswith(b"-") else self.seen.add)(uid)
+                out.append(self._fetch(seq, uid, [b"FLAGS"], by_uid))
+            return out
+        return None
+
+    def _resolve(self, sequence: bytes, by_uid: bool) -> Iterable[tuple]:
+        """(seq, uid) pairs for a sequence / UID set; "*" is the largest number"""
+        if not self.uids:
+            return []
+        largest = self.uids[-1] if by_uid else len(self.uids)
+        selected = set()
+        for part in sequence.split(b","):
+            low, _, high = part.partition(b":")
+            a = largest if low == b"*" else int(low)
+            b = a if not high else (largest if high == b"*" else int(high))
+            a, b = min(a, b), max(a, b)
+            if by_uid:
+                lo = bisect.bisect_left(self.uids, a)
+                hi = bisect.bisect_right(self.uids, b)
+                selected.update(range(lo + 1, hi + 1))
+            else:
+                selected.update(range(max(a, 1), min(b, largest) + 1))
+        return [(seq, self.uids[seq - 1]) for seq in sorted(selected)]
+
+    def _fetch(self, seq: int, uid: int, items: List[bytes], by_uid: bool) -> bytes:
+        parts = []
+        if by_uid or b"UID" in items:
+            parts.append(b"UID %d" % uid)
+        for item in items:
+            if item == b"FLAGS":
+                parts.append(b"FLAGS (\\Seen)" if uid in self.seen else b"FLAGS ()")
+            elif item == b"ENVELOPE":
+                parts.append(b"ENVELOPE " + _envelope(uid))
+            elif item in (b"BODY.PEEK[HEADER]", b"BODY[HEADER]"):
+                header = _message(uid).split(b"\r\n\r\n", 1)[0] + b"\r\n\r\n"
+                parts.append(b"BODY[HEADER] {%d}\r\n" % len(header) + header)
+            elif item == b"RFC822":
+                body = _message(uid)
+                self.seen.add(uid)
+                parts.append(b"RFC822 {%d}\r\n" % len(body) + body)
+        return b"* %d FETCH (" % seq + b" ".join(parts) + b")\r\n"
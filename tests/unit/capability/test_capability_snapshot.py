@@ -0,0 +1,141 @@
+import json
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from octopusos.core.capability.invocation_log import InvocationLogBuffer
+from octopusos.core.capability.registry import CapabilityRegistry, PermissionDenied
+
+CAPABILITY = "state.memory.read"
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = CapabilityRegistry(db_path=str(tmp_path / "registry.sqlite"))
+    yield registry
+    registry._invocation_log.close()
+
+
+def _invocations(registry: CapabilityRegistry, where: str = "1 = 1") -> list:
+    registry.flush_invocations()
+    conn = sqlite3.connect(registry.db_path)
+    try:
+        return conn.execute(
+            "SELECT agent_id, operation, allowed, context_json "
+            f"FROM capability_invocations WHERE {where}"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def test_scope_and_expiry_match_database(registry) -> None:
+    now_ms = int(time.time() * 1000)
+    registry.grant_capability("scoped", CAPABILITY, granted_by="system", scope="project:a")
+    registry.grant_capability("global", CAPABILITY, granted_by="system")
+    registry.grant_capability(
+        "expired", CAPABILITY, granted_by="system", expires_at_ms=now_ms - 1000
+    )
+    registry.grant_capability(
+        "expiring", CAPABILITY, granted_by="system", expires_at_ms=now_ms + 300
+    )
+
+    cases = [
+        (agent, scope)
+        for agent in ("scoped", "global", "expired", "expiring", "unknown")
+        for scope in (None, "project:a", "project:b")
+    ]
+    for agent, scope in cases:
+        assert registry.has_capability(agent, CAPABILITY, scope, log_invocation=False) == (
+            registry._query_has_grant(agent, CAPABILITY, scope)
+        ), (agent, scope)
+    assert registry.has_capability("scoped", CAPABILITY, "project:a", log_invocation=False)
+    assert not registry.has_capability("scoped", CAPABILITY, "project:b", log_invocation=False)
+    assert registry.has_capability("expiring", CAPABILITY, log_invocation=False)
+
+    # Expiry is evaluated per check, not at snapshot load
+    time.sleep(0.4)
+    assert not registry.has_capability("expiring", CAPABILITY, log_invocation=False)
+
+
+def test_grant_and_revoke_update_snapshot(registry) -> None:
+    assert not registry.has_capability("agent", CAPABILITY, log_invocation=False)
+    registry.grant_capability("agent", CAPABILITY, granted_by="system", scope="project:a")
+    registry.grant_capability("agent", CAPABILITY, granted_by="system", scope="project:b")
+    assert registry.has_capability("agent", CAPABILITY, "project:b", log_invocation=False)
+
+    # Revoke removes one grant; the remaining one still counts
+    assert registry.revoke_capability("agent", CAPABILITY, revoked_by="admin")
+    assert registry.has_capability("agent", CAPABILITY, log_invocation=False)
+    assert registry.revoke_capability("agent", CAPABILITY, revoked_by="admin")
+    assert not registry.has_capability("agent", CAPABILITY, log_invocation=False)
+    with pytest.raises(PermissionDenied):
+        registry.check_capability("agent", CAPABILITY, "list")
+
+    # Grants written by another process show up after the snapshot TTL
+    other = sqlite3.connect(registry.db_path)
+    other.execute(
+        "INSERT INTO capability_grants "
+        "(grant_id, agent_id, capability_id, granted_by, granted_at_ms) "
+        "VALUES ('grant-x', 'agent', ?, 'other', 0)",
+        (CAPABILITY,),
+    )
+    other.commit()
+    other.close()
+    assert not registry.has_capability("agent", CAPABILITY, log_invocation=False)
+    registry._cache_ttl_seconds = 0
+    assert registry.has_capability("agent", CAPABILITY, log_invocation=False)
+
+
+def test_invocations_are_batched_and_sampled(registry) -> None:
+    registry.grant_capability("agent", CAPABILITY, granted_by="system")
+    registry.check_capability("agent", CAPABILITY, "list", context={"task": "t1"})
+    with pytest.raises(PermissionDenied):
+        registry.check_capability("intruder", CAPABILITY, "list")
+
+    rows = _invocations(registry)
+    assert [(row[0], row[2]) for row in rows] == [("agent", 1), ("intruder", 0)]
+    assert json.loads(rows[0][3]) == {"task": "t1"}
+
+    # Allowed checks are sampled; denials are always written
+    registry.invocation_sample_rate = 0.0
+    for _ in range(50):
+        registry.check_capability("agent", CAPABILITY, "sampled")
+        with pytest.raises(PermissionDenied):
+            registry.check_capability("intruder", CAPABILITY, "sampled")
+    assert len(_invocations(registry, "operation = 'sampled' AND allowed = 1")) == 0
+    assert len(_invocations(registry, "operation = 'sampled' AND allowed = 0")) == 50
+
+    registry.invocation_sample_rate = 0.5
+    for _ in range(400):
+        registry.check_capability("agent", CAPABILITY, "half")
+    rows = _invocations(registry, "operation = 'half'")
+    assert 100 < len(rows) < 300
+    assert json.loads(rows[0][3]) == {"sample_rate": 0.5}
+
+    stats = registry.get_stats()
+    assert stats["total_invocations"] == 2 + 50 + len(rows)
+    assert stats["invocation_log"]["pending"] == 0
+
+
+def test_full_queue_waits_then_drops_when_writer_stalls() -> None:
+    release = threading.Event()
+    written = []
+
+    def _stalled_write(rows):
+        release.wait(5)
+        written.extend(rows)
+
+    buffer = InvocationLogBuffer(
+        _stalled_write, max_pending=2, batch_size=2, full_wait_timeout=0.05
+    )
+    rows = [("agent", CAPABILITY, f"op{i}", 1, None, None, i) for i in range(6)]
+    for row in rows:
+        buffer.append(row)
+    # Two rows in flight, two queued, the two oldest queued ones dropped
+    assert buffer.get_stats()["dropped"] == 2
+    release.set()
+    assert buffer.flush(timeout=5)
+    buffer.close()
+    assert [row[2] for row in written] == ["op0", "op1", "op4", "op5"]
@@ -0,0 +1,103 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import List
+
+from octopusos.core.chat.context_builder import ContextBudget, ContextBuilder
+from octopusos.core.chat.models import ChatMessage
+from octopusos.core.chat.token_counter import TokenCounter, estimate_tokens_heuristic
+
+FILLER = "the quick brown fox jumps over the lazy dog " * 8
+
+
+def _message(index: int, content: str = "") -> ChatMessage:
+    return ChatMessage(
+        message_id=f"msg-{index:04d}",
+        session_id="s1",
+        role="user" if index % 2 == 0 else "assistant",
+        content=content or f"Message {index}: " + FILLER,
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        metadata={},
+    )
+
+
+class _FakeChatService:
+    def __init__(self, messages: List[ChatMessage]):
+        self.messages = messages
+
+    def get_session(self, session_id):
+        return SimpleNamespace(metadata={"conversation_mode": "chat"})
+
+    def get_recent_messages(self, session_id, count=60):
+        return self.messages[-count:]
+
+
+def _builder(monkeypatch, messages: List[ChatMessage], counter: TokenCounter) -> ContextBuilder:
+    builder = ContextBuilder(
+        chat_service=_FakeChatService(messages),
+        memory_service=object(),
+        kb_service=object(),
+        budget=ContextBudget(),
+        db_path=":memory:",
+        enable_auto_summary=False,
+        enable_snapshots=False,
+        token_counter=counter,
+    )
+
+    memory = [{"id": "mem-1", "type": "fact", "content": {"summary": "likes tea"}}]
+    rag = [{"chunk_id": "c1", "content": "Acme ships rockets", "path": "README.md"}]
+    monkeypatch.setattr(builder, "_load_summary_artifacts", lambda session_id: [])
+    monkeypatch.setattr(builder, "_load_memory_facts", lambda session_id: memory)
+    monkeypatch.setattr(builder, "_load_rag_context", lambda session_id, query: (rag, {}))
+    monkeypatch.setattr(builder, "_log_memory_injection_audit", lambda **kwargs: None)
+    return builder
+
+
+def test_window_only_tokenizes_new_or_edited_messages(monkeypatch) -> None:
+    messages = [_message(i) for i in range(10)]
+    counter = TokenCounter()
+    builder = _builder(monkeypatch, messages, counter)
+
+    pack = builder.build("s1", "hello")
+    assert pack.metadata["window_count"] == 10
+    assert pack.metadata["rag_count"] == 1 and pack.metadata["memory_count"] == 1
+    assert pack.metadata["tokenizer"] == counter.backend
+
+    messages.append(_message(10))
+    counter.hits = counter.misses = 0
+    builder._apply_budget({"window": list(messages), "memory": [], "rag": [], "summaries": []})
+    assert (counter.hits, counter.misses) == (10, 1)
+
+    # An edited message is counted again; same content under another id too
+    messages[0] = _message(0, content="edited")
+    builder._apply_budget({"window": list(messages), "memory": [], "rag": [], "summaries": []})
+    assert counter.misses == 2
+    assert counter.count_message(_message(99, content="edited")) == counter.count("edited")
+    assert counter.misses == 3
+
+
+def test_window_budget_keeps_most_recent(monkeypatch) -> None:
+    counter = TokenCounter()
+    messages = [_message(i) for i in range(60)]
+    builder = _builder(monkeypatch, messages, counter)
+    builder.budget = ContextBudget(max_tokens=3000, window_tokens=1000)
+
+    trimmed, debug = builder._apply_budget(
+        {"window": list(messages), "memory": [], "rag": [], "summaries": []}
+    )
+    kept = trimmed["window"]
+    assert debug["trimmed_window"] == 60 - len(kept) > 0
+    assert kept == messages[-len(kept):]
+    assert sum(counter.count_message(msg) for msg in kept) <= 1000
+
+
+def test_heuristic_is_script_aware() -> None:
+    english = "The quick brown fox jumps over the lazy dog. " * 10
+    chinese = "敏捷的棕色狐狸跳过了懒狗。" * 10
+    # ~4 chars/token for English, ~1 token/char for CJK (len * 1.3 was off both ways)
+    assert estimate_tokens_heuristic(english) == (len(english) + 3) // 4
+    assert estimate_tokens_heuristic(chinese) == len(chinese)
+    assert estimate_tokens_heuristic("") == 0
+
+    counter = TokenCounter(encoding_name="no-such-encoding")
+    assert counter.backend == "heuristic"
+    assert counter.count(english) == estimate_tokens_heuristic(english)
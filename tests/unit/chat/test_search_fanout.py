@@ -0,0 +1,114 @@
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from octopusos.core.chat.search_fanout import SearchFanout, SearchJob
+from octopusos.core.utils.background_loop import run_coroutine_sync
+
+LATENCY_S = {"duckduckgo": 0.4, "bing": 0.5, "google": 0.6}
+
+CORE_QUERIES = [
+    "Acme company profile",
+    "Acme 公司 简介",
+    "Acme site:wikipedia.org",
+    "Acme site:baike.baidu.com",
+]
+NEWS_QUERIES = ["Acme latest news", "Acme site:news.baidu.com"]
+JOBS = [SearchJob("core", q, ("duckduckgo", "bing"), 6) for q in CORE_QUERIES] + [
+    SearchJob("news", q, ("google",), 5) for q in NEWS_QUERIES
+]
+
+
+class FakeEngines:
+    """Engines answering after a fixed latency; some queries are slow or empty."""
+
+    def __init__(self, slow: Dict[str, float] | None = None, empty: set | None = None):
+        self.slow = slow or {}
+        self.empty = empty or set()
+        self.calls: List[tuple] = []
+        self.in_flight: Dict[str, int] = {}
+        self.max_in_flight: Dict[str, int] = {}
+
+    async def search(self, engine: str, query: str, max_results: int) -> Dict[str, Any]:
+        self.calls.append((engine, query))
+        self.in_flight[engine] = self.in_flight.get(engine, 0) + 1
+        self.max_in_flight[engine] = max(self.max_in_flight.get(engine, 0), self.in_flight[engine])
+        try:
+            await asyncio.sleep(self.slow.get(f"{engine}:{query}", LATENCY_S[engine]))
+            if (engine, query) in self.empty:
+                return {"results": []}
+            return {
+                "results": [
+                    {
+                        "url": f"https://{engine}.example/{abs(hash(query)) % 1000}/{i}",
+                        "title": f"{query} {i}",
+                    }
+                    for i in range(max_results)
+                ]
+                + [{"url": "https://shared.example/acme", "title": "shared"}]
+            }
+        finally:
+            self.in_flight[engine] -= 1
+
+
+def test_fanout_hedges_caps_and_dedups() -> None:
+    engines = FakeEngines(
+        slow={"duckduckgo:Acme site:wikipedia.org": 5.0},
+        empty={("duckduckgo", "Acme 公司 简介")},
+    )
+    fanout = SearchFanout(engines.search, per_engine_concurrency=2, hedge_delay=0.2, deadline=5.0)
+    outcome = run_coroutine_sync(fanout.run(JOBS))
+
+    assert outcome.winners == {
+        "Acme company profile": "duckduckgo",
+        "Acme 公司 简介": "bing",  # empty primary answer falls through
+        "Acme site:wikipedia.org": "bing",  # slow primary is hedged
+        "Acme site:baike.baidu.com": "duckduckgo",
+        "Acme latest news": "google",
+        "Acme site:news.baidu.com": "google",
+    }
+    assert outcome.hedges >= 1 and not outcome.deadline_hit
+    assert max(engines.max_in_flight.values()) <= 2
+
+    urls = [row["url"] for rows in outcome.buckets.values() for row in rows]
+    assert len(urls) == len(set(urls))
+    assert urls.count("https://shared.example/acme") == 1
+    assert len(outcome.buckets["news"]) >= 5
+
+
+def test_fanout_deadline_returns_partial_results() -> None:
+    engines = FakeEngines(
+        slow={"google:Acme latest news": 10.0, "google:Acme site:news.baidu.com": 10.0}
+    )
+    fanout = SearchFanout(engines.search, hedge_delay=5.0, deadline=1.0)
+    started = time.perf_counter()
+    outcome = run_coroutine_sync(fanout.run(JOBS))
+
+    assert time.perf_counter() - started < 2.0
+    assert outcome.deadline_hit
+    assert outcome.buckets["news"] == []
+    assert len(outcome.buckets["core"]) >= 4 * 6
+
+
+def test_background_loop_is_reused_and_nestable() -> None:
+    async def loop_id() -> int:
+        return id(asyncio.get_running_loop())
+
+    first, second = run_coroutine_sync(loop_id()), run_coroutine_sync(loop_id())
+    assert first == second
+
+    async def nested() -> int:
+        # A sync helper called from a coroutine that already runs on the loop
+        return run_coroutine_sync(loop_id())
+
+    assert run_coroutine_sync(nested()) != first
+
+    async def caller_loop() -> int:
+        return run_coroutine_sync(loop_id())
+
+    assert asyncio.run(caller_loop()) == first
+
+    with pytest.raises(TimeoutError):
+        run_coroutine_sync(asyncio.sleep(5), timeout=0.05)
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+import click
+
+HEAVY_MODULES = ("numpy", "openai", "fastapi", "octopusos.core.task", "octopusos.core.chat")
+
+
+def _loaded_heavy_modules(argv: list[str]) -> list[str]:
+    script = (
+        "import sys\n"
+        "from octopusos.cli.main import cli\n"
+        f"try:\n    cli.main({argv!r}, standalone_mode=False)\n"
+        "except SystemExit:\n    pass\n"
+        f"print('loaded:' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=120, check=True
+    )
+    last_line = result.stdout.splitlines()[-1]
+    return [name for name in last_line[len("loaded:"):].split(",") if name]
+
+
+def test_help_does_not_import_subcommands() -> None:
+    assert _loaded_heavy_modules(["--help"]) == []
+    assert "octopusos.core.task" in _loaded_heavy_modules(["task", "--help"])
+
+
+def test_lazy_subcommands_match_commands() -> None:
+    from octopusos.cli.main import SUBCOMMANDS, cli
+
+    ctx = click.Context(cli)
+    # Same width as the "Commands" listing of an 80-column --help
+    limit = 80 - 6 - max(len(name) for name in cli.list_commands(ctx))
+    for name, spec in SUBCOMMANDS.items():
+        command = cli.get_command(ctx, name)
+        assert isinstance(command, click.Command), name
+        assert not command.hidden, name
+        expected = click.utils.make_default_short_help(spec.short_help, limit)
+        assert expected == command.get_short_help_str(limit), name
+        for extra_name, _ in spec.extras:
+            assert extra_name in command.commands, (name, extra_name)
@@ -0,0 +1,180 @@
+import threading
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+
+from octopusos.communicationos.conversation_executor import ConversationExecutor
+from octopusos.communicationos.runtime import CommunicationRuntime
+
+HANDLER_S = 0.005
+
+
+class _Probe:
+    """Handler stand-in recording per-conversation order and concurrency."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.order = defaultdict(list)
+        self.active = defaultdict(int)
+        self.overlap = False
+        self.running = 0
+        self.peak_running = 0
+        self.peak_threads = threading.active_count()
+
+    def handle(self, conversation: str, seq: int, seconds: float = HANDLER_S) -> None:
+        with self.lock:
+            self.active[conversation] += 1
+            self.overlap |= self.active[conversation] > 1
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+        time.sleep(seconds)
+        with self.lock:
+            self.active[conversation] -= 1
+            self.running -= 1
+            self.order[conversation].append(seq)
+
+
+def test_order_within_and_parallelism_across_conversations() -> None:
+    probe = _Probe()
+    executor = ConversationExecutor(name="test", max_workers=4, worker_idle_s=0.2)
+    for seq in range(5):
+        for conv in ("a", "b", "c", "d"):
+            executor.submit(conv, lambda c=conv, s=seq: probe.handle(c, s), channel_id="teams")
+    assert executor.shutdown(timeout=5)
+    assert 1 < probe.peak_running <= 4
+    assert all(order == list(range(5)) for order in probe.order.values())
+    assert not probe.overlap
+
+    metrics = executor.metrics("teams")
+    assert metrics["completed"] == 20 and metrics["pending"] == 0 and metrics["failed"] == 0
+    assert metrics["run_ms_p50"] >= HANDLER_S * 1000 * 0.8
+
+
+def test_burst_after_idle_starts_workers() -> None:
+    probe = _Probe()
+    executor = ConversationExecutor(name="test", max_workers=8, worker_idle_s=5)
+    executor.submit("warmup", lambda: None, channel_id="slack")
+    time.sleep(0.05)  # One warm worker, now idle
+    assert executor.metrics()["workers"] == 1
+
+    started = time.perf_counter()
+    for conv in (f"conv-{i}" for i in range(8)):
+        executor.submit(conv, lambda c=conv: probe.handle(c, 0, 0.2), channel_id="slack")
+    assert executor.shutdown(timeout=5)
+    elapsed = time.perf_counter() - started
+
+    # Parallel, not serialized behind the one idle worker (8 x 0.2s)
+    assert probe.peak_running == 8
+    assert elapsed < 0.8
+
+
+def test_shedding_and_idle_eviction() -> None:
+    release = threading.Event()
+    executor = ConversationExecutor(
+        name="test", max_workers=1, max_mailbox_depth=2, max_pending=3, idle_ttl_s=0.2
+    )
+
+    assert executor.submit("a", release.wait, channel_id="slack")  # Running
+    time.sleep(0.05)
+    assert executor.submit("a", lambda: None, channel_id="slack")
+    assert executor.submit("a", lambda: None, channel_id="slack")
+    # Mailbox depth exceeded
+    assert not executor.submit("a", lambda: None, channel_id="slack")
+    assert not executor.submit("a", lambda: None, channel_id="slack")
+    assert executor.shed_streak("a") == 2
+    # Global limit exceeded
+    assert executor.submit("b", lambda: None, channel_id="slack")
+    assert not executor.submit("c", lambda: None, channel_id="slack")
+    assert not executor.submit("c", lambda: None, channel_id="slack")
+    assert executor.shed_streak("c") == 2  # Tracked without queued items
+    assert executor.metrics("slack")["shed"] == 4
+
+    release.set()
+    time.sleep(0.05)
+    assert executor.submit("a", lambda: None, channel_id="slack")
+    assert executor.shed_streak("a") == 0
+    time.sleep(0.3)
+    # Next submission sweeps the idle mailboxes
+    assert executor.submit("d", lambda: None, channel_id="slack")
+    stats = executor.metrics()
+    assert stats["evicted_mailboxes"] >= 2 and stats["mailboxes"] <= 2
+    executor.shutdown(timeout=5)
+    assert not executor.submit("e", lambda: None, channel_id="slack")
+
+
+def test_runtime_routes_inbound_through_mailboxes() -> None:
+    runtime = CommunicationRuntime.__new__(CommunicationRuntime)
+    runtime._inbound_executor = ConversationExecutor(
+        name="rt-in", max_workers=2, max_mailbox_depth=1
+    )
+    runtime._outbound_executor = ConversationExecutor(name="rt-out", max_workers=1)
+    runtime._command_processor = SimpleNamespace(is_command=lambda text: False)
+    runtime.config_store = SimpleNamespace(get_config=lambda channel_id: {})
+    release = threading.Event()
+    handled, sent = [], []
+    runtime._handle_inbound_chat = lambda message: (
+        release.wait(5),
+        handled.append(message.message_id),
+    )
+    runtime._handle_session_new_shortcut = lambda message: handled.append(message.message_id)
+    runtime._send_in_background = sent.append
+
+    def _message(message_id: str, text: str = "hi") -> SimpleNamespace:
+        return SimpleNamespace(
+            channel_id="slack",
+            user_key="u1",
+            conversation_key="c1",
+            message_id=message_id,
+            text=text,
+        )
+
+    runtime._handle_inbound(_message("m1"))
+    time.sleep(0.05)
+    runtime._handle_inbound(_message("m2", "/new"))  # Queued behind m1
+    runtime._handle_inbound(_message("m3"))  # Shed, busy notice
+    runtime._handle_inbound(_message("m4"))  # Shed, no second notice
+    release.set()
+    assert runtime._inbound_executor.shutdown(timeout=5)
+
+    assert handled == ["m1", "m2"]
+    assert [msg.metadata["status"] for msg in sent] == ["busy"]
+    assert runtime.get_queue_metrics("slack")["inbound"]["shed"] == 2
+
+
+def test_runtime_busy_notice_once_per_conversation_under_global_limit() -> None:
+    runtime = CommunicationRuntime.__new__(CommunicationRuntime)
+    runtime._inbound_executor = ConversationExecutor(name="rt-in", max_workers=1, max_pending=1)
+    runtime._command_processor = SimpleNamespace(is_command=lambda text: False)
+    configs = {"slack": {}, "teams": {"busy_text": ""}}
+    runtime.config_store = SimpleNamespace(get_config=lambda channel_id: configs[channel_id])
+    release = threading.Event()
+    runtime._handle_inbound_chat = lambda message: release.wait(5)
+    sent = []
+    runtime._send_in_background = sent.append
+
+    def _message(channel_id: str, conversation: str, message_id: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            channel_id=channel_id,
+            user_key="u1",
+            conversation_key=conversation,
+            message_id=message_id,
+            text="hi",
+        )
+
+    runtime._handle_inbound(_message("slack", "c1", "m1"))  # Running
+    time.sleep(0.05)
+    runtime._handle_inbound(_message("slack", "c1", "m2"))  # Fills max_pending
+    # New conversations are shed by the global limit: one notice each
+    for message_id in ("m3", "m4", "m5"):
+        runtime._handle_inbound(_message("slack", "c2", message_id))
+    runtime._handle_inbound(_message("slack", "c3", "m6"))
+    # An empty busy_text disables the notice
+    runtime._handle_inbound(_message("teams", "c4", "m7"))
+    release.set()
+    assert runtime._inbound_executor.shutdown(timeout=5)
+
+    assert [(msg.conversation_key, msg.metadata["inbound_message_id"]) for msg in sent] == [
+        ("c2", "m3"),
+        ("c3", "m6"),
+    ]
@@ -0,0 +1,189 @@
+import queue
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from octopusos.core.db.writer import SQLiteWriter, WriteJob
+
+
+@pytest.fixture
+def make_writer(tmp_path):
+    writers = []
+
+    def _make(name: str = "writer.db", **kwargs) -> SQLiteWriter:
+        db_path = tmp_path / name
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)")
+        conn.commit()
+        conn.close()
+        writer = SQLiteWriter(str(db_path), **kwargs)
+        writers.append(writer)
+        return writer
+
+    yield _make
+    for writer in writers:
+        writer.stop()
+        with SQLiteWriter._lock:
+            SQLiteWriter._instances.pop(writer.db_path, None)
+
+
+def _insert(value: str):
+    def _write(conn):
+        conn.execute("INSERT INTO items (value) VALUES (?)", (value,))
+        return value
+
+    return _write
+
+
+def _values(writer: SQLiteWriter) -> list:
+    conn = sqlite3.connect(writer.db_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT value FROM items ORDER BY id")]
+    finally:
+        conn.close()
+
+
+def _run_batch(writer: SQLiteWriter, fns: list) -> list:
+    """Queue fns behind a blocked job so they run as one batch; returns (success, result) per fn"""
+    gate = threading.Event()
+    blocker = WriteJob(fn=lambda conn: gate.wait(5), result_q=queue.Queue())
+    jobs = [WriteJob(fn=fn, result_q=queue.Queue()) for fn in fns]
+    writer._queue.put(blocker)
+    blocker_started = time.monotonic()
+    while writer._queue.qsize() and time.monotonic() - blocker_started < 5:
+        time.sleep(0.001)  # Wait until the writer thread holds the blocker
+    for job in jobs:
+        writer._queue.put(job)
+    gate.set()
+    assert blocker.result_q.get(timeout=5)[0]
+    return [job.result_q.get(timeout=5) for job in jobs]
+
+
+def _fail_begin_on_calls(writer: SQLiteWriter, monkeypatch, *calls: int) -> None:
+    """Make the given (1-based) calls of _begin_immediate raise a non-transient error"""
+    begin = writer._begin_immediate
+    seen = []
+
+    def _begin(conn):
+        seen.append(1)
+        if len(seen) in calls:
+            raise sqlite3.OperationalError("disk I/O error")
+        begin(conn)
+
+    monkeypatch.setattr(writer, "_begin_immediate", _begin)
+
+
+def test_batched_jobs_commit_together(make_writer) -> None:
+    writer = make_writer(batch_max_jobs=16)
+    outcomes = _run_batch(writer, [_insert(f"v{i}") for i in range(10)])
+
+    assert outcomes == [(True, f"v{i}") for i in range(10)]
+    assert _values(writer) == [f"v{i}" for i in range(10)]
+    assert writer.total_batches == 2 and writer.batch_size_histogram["<=16"] == 1
+    assert writer.total_writes == 11 and writer.failed_writes == 0
+
+
+def test_failing_job_only_rolls_back_itself(make_writer) -> None:
+    writer = make_writer(batch_max_jobs=16)
+
+    def _fail(conn):
+        conn.execute("INSERT INTO items (value) VALUES ('bad')")
+        raise ValueError("invalid payload")
+
+    outcomes = _run_batch(writer, [_insert("a"), _fail, _insert("c")])
+
+    assert outcomes[0] == (True, "a") and outcomes[2] == (True, "c")
+    assert not outcomes[1][0] and isinstance(outcomes[1][1], ValueError)
+    assert _values(writer) == ["a", "c"]
+    assert writer.failed_writes == 1
+
+    # Exceptions reach submit() callers
+    with pytest.raises(ValueError):
+        writer.submit(_fail)
+
+
+@pytest.mark.parametrize("raises", [True, False])
+def test_job_rolling_back_shared_transaction_replays_earlier_jobs(make_writer, raises) -> None:
+    writer = make_writer(batch_max_jobs=16)
+
+    def _rollback(conn):
+        conn.execute("INSERT INTO items (value) VALUES ('b')")
+        conn.rollback()
+        if raises:
+            raise RuntimeError("boom")
+        return "b"
+
+    outcomes = _run_batch(writer, [_insert("a"), _rollback, _insert("c")])
+
+    assert outcomes[0] == (True, "a") and outcomes[2] == (True, "c")
+    assert outcomes[1][0] is not raises
+    # "a" was lost with the rollback and written again on its own
+    assert _values(writer) == ["a", "c"]
+
+
+def test_job_committing_shared_transaction_keeps_earlier_jobs(make_writer) -> None:
+    writer = make_writer(batch_max_jobs=16)
+
+    def _commit(conn):
+        conn.execute("INSERT INTO items (value) VALUES ('b')")
+        conn.commit()
+        return "b"
+
+    outcomes = _run_batch(writer, [_insert("a"), _commit, _insert("c")])
+
+    assert outcomes == [(True, "a"), (True, "b"), (True, "c")]
+    # No replay: "a" is written exactly once
+    assert _values(writer) == ["a", "b", "c"]
+
+
+def test_results_follow_submission_order(make_writer) -> None:
+    writer = make_writer(batch_max_jobs=8)
+    executed = []
+
+    def _job(i):
+        def _write(conn):
+            executed.append(i)
+            cursor = conn.execute("INSERT INTO items (value) VALUES (?)", (f"v{i}",))
+            return i, cursor.lastrowid
+
+        return _write
+
+    outcomes = _run_batch(writer, [_job(i) for i in range(20)])
+
+    # Three batches (8 + 8 + 4); each caller gets its own job's result
+    assert executed == list(range(20))
+    assert [result for _, result in outcomes] == [(i, i + 1) for i in range(20)]
+    assert _values(writer) == [f"v{i}" for i in range(20)]
+
+
+def test_failing_begin_runs_every_job_alone(make_writer, monkeypatch) -> None:
+    writer = make_writer(batch_max_jobs=16)
+    _fail_begin_on_calls(writer, monkeypatch, 1)
+
+    outcomes = _run_batch(writer, [_insert(f"v{i}") for i in range(5)])
+
+    assert outcomes == [(True, f"v{i}") for i in range(5)]
+    assert _values(writer) == [f"v{i}" for i in range(5)]
+
+
+def test_error_partway_through_batch_resolves_remaining_jobs(make_writer, monkeypatch) -> None:
+    writer = make_writer(batch_max_jobs=16)
+
+    def _commit(conn):
+        conn.execute("INSERT INTO items (value) VALUES ('b')")
+        conn.commit()
+        return "b"
+
+    def _fail(conn):
+        raise ValueError("invalid payload")
+
+    # "b" commits the shared transaction; starting the next one fails
+    _fail_begin_on_calls(writer, monkeypatch, 2)
+    outcomes = _run_batch(writer, [_insert("a"), _fail, _commit, _insert("c"), _insert("d")])
+
+    assert outcomes[0] == (True, "a") and outcomes[2:] == [(True, "b"), (True, "c"), (True, "d")]
+    assert not outcomes[1][0] and isinstance(outcomes[1][1], ValueError)
+    # Committed jobs are not run twice
+    assert _values(writer) == ["a", "b", "c", "d"]
@@ -0,0 +1,166 @@
+import imaplib
+import time
+
+import pytest
+from imap_stub_server import ImapStubServer
+
+from octopusos.core.email.providers import imap_smtp
+from octopusos.core.email.providers.imap_session import (
+    ImapSessionCache,
+    parse_fetch_response,
+    uid_set,
+)
+from octopusos.core.email.providers.imap_smtp import ImapSmtpEmailProvider
+
+
+@pytest.fixture(autouse=True)
+def _password(monkeypatch):
+    monkeypatch.setattr(ImapSmtpEmailProvider, "_password", lambda self: "secret")
+
+
+def _provider(server: ImapStubServer, cache: ImapSessionCache, instance_id: str = "inst-1"):
+    config = {
+        "imap_host": server.host,
+        "imap_port": server.port,
+        "imap_tls": False,
+        "username": "me@example.com",
+    }
+    return ImapSmtpEmailProvider(
+        config=config, secret_ref="secret://x", instance_id=instance_id, session_cache=cache
+    )
+
+
+def _unread_uids(provider: ImapSmtpEmailProvider, since_ms=None, limit: int = 50) -> list:
+    return [int(h.message_id) for h in provider.list_unread(since_ms=since_ms, limit=limit)]
+
+
+def test_parse_fetch_response_with_literals() -> None:
+    data = [
+        (b'1 (UID 7 FLAGS (\\Seen) ENVELOPE ("Mon, 1 Jan 2026 00:00:00 +0000" {5}', b'a "b"'),
+        b' (("N" NIL "u" "h")) NIL NIL NIL NIL NIL NIL "<id>"))',
+        b"2 (UID 9 FLAGS ())",
+        b"3 (FLAGS (\\Seen))",
+    ]
+    parsed = parse_fetch_response(data)
+    assert [item.get(b"UID") for item in parsed] == [b"7", b"9", None]
+    assert parsed[0][b"FLAGS"] == [b"\\Seen"]
+    envelope = parsed[0][b"ENVELOPE"]
+    assert envelope[1] == b'a "b"' and envelope[2] == [[b"N", None, b"u", b"h"]]
+    assert parsed[1][b"FLAGS"] == []
+    assert uid_set([9, 1, 2, 3, 7, 8]) == "1:3,7:9" and uid_set([]) == ""
+
+
+def test_incremental_sync_tracks_new_and_read_messages() -> None:
+    cache = ImapSessionCache()
+    with ImapStubServer(40, unseen_every=10) as server:
+        provider = _provider(server, cache)
+        headers = provider.list_unread(since_ms=None, limit=50)
+        assert [h.message_id for h in headers] == ["40", "30", "20", "10"]
+        assert headers[0].subject == 'Re: "Quarterly" report – 40'
+        assert headers[0].from_email == "user40@example.com"
+        assert headers[0].from_name == "Sender 40"
+        assert cache.stats()[0]["last_uid"] == 40
+
+        # Nothing changed: the SEARCH alone answers the poll
+        server.reset_counters()
+        assert len(provider.list_unread(since_ms=None, limit=50)) == 4
+        assert server.commands == {"UID SEARCH": 1}
+
+        server.reset_counters()
+        new = server.deliver(3)
+        server.deliver(1, seen=True)
+        server.set_seen(30)  # Read in another client
+        headers = provider.list_unread(since_ms=None, limit=50)
+        assert [int(h.message_id) for h in headers] == [*reversed(new), 40, 20, 10]
+        assert [h.subject for h in headers[:1]] == ["Message 43"]
+        assert server.commands == {"UID SEARCH": 1, "UID FETCH": 1}
+
+        # Marked unread again in another client, below the highest known UID
+        server.reset_counters()
+        server.set_seen(30, seen=False)
+        headers = provider.list_unread(since_ms=None, limit=50)
+        assert [int(h.message_id) for h in headers] == [*reversed(new), 40, 30, 20, 10]
+        assert server.commands == {"UID SEARCH": 1, "UID FETCH": 1}
+        server.set_seen(30)
+
+        server.expunge(20)
+        provider.mark_read(message_id="10")
+        assert _unread_uids(provider, limit=2) == [43, 42]
+        assert _unread_uids(provider) == [43, 42, 41, 40]
+        assert 10 in server.seen
+
+        since = headers[1].date_ms
+        assert _unread_uids(provider, since_ms=since) == [43, 42]
+
+        message = provider.get_message(message_id="15")
+        assert message.subject == "Überweisung 15" and "Body of message 15." in message.body_text
+        assert server.logins == 0
+        cache.close()
+
+
+def test_uidvalidity_change_and_reconnect() -> None:
+    cache = ImapSessionCache()
+    with ImapStubServer(20, unseen_every=5) as server:
+        provider = _provider(server, cache)
+        assert len(provider.list_unread(since_ms=None, limit=50)) == 4
+
+        # Dropped connection: reconnect and retry once, sync state kept
+        server.drop_connections()
+        server.reset_counters()
+        server.deliver(1)
+        assert len(provider.list_unread(since_ms=None, limit=50)) == 5
+        # Only the new message is fetched
+        assert server.logins == 1 and server.commands["UID FETCH"] == 1
+
+        # New UIDVALIDITY: cached UIDs are meaningless, full resync
+        server.set_uidvalidity(2)
+        server.set_seen(5)
+        server.drop_connections()
+        server.reset_counters()
+        assert _unread_uids(provider) == [21, 20, 15, 10]
+        assert server.commands["UID SEARCH"] == 1
+        assert cache.stats()[0]["uidvalidity"] == 2
+
+        # Changed credentials open a new session
+        provider._config["username"] = "other@example.com"
+        server.reset_counters()
+        provider.list_unread(since_ms=None, limit=50)
+        assert server.logins == 1 and cache.connects == 4
+        cache.close()
+
+
+def test_full_resync_when_more_unread_than_cached(monkeypatch) -> None:
+    monkeypatch.setattr(imap_smtp, "MAX_UNREAD", 3)
+    cache = ImapSessionCache()
+    with ImapStubServer(10, unseen_every=2) as server:
+        provider = _provider(server, cache)
+        assert _unread_uids(provider, limit=10) == [10, 8, 6]
+        server.set_seen(8)
+        assert _unread_uids(provider, limit=10) == [10, 6, 4]
+        cache.close()
+
+
+def test_idle_eviction_and_single_retry() -> None:
+    cache = ImapSessionCache(idle_timeout_s=0)
+    with ImapStubServer(5, unseen_every=1) as server:
+        first = _provider(server, cache, instance_id="a")
+        second = _provider(server, cache, instance_id="b")
+        first.list_unread(since_ms=None, limit=10)
+        time.sleep(0.01)
+        # Opening "b" evicts the idle session "a"
+        second.list_unread(since_ms=None, limit=10)
+        assert [s["key"] for s in cache.stats()] == ["b"]
+        assert server.commands["LOGOUT"] == 1
+
+        # A dropped connection is reopened once; a second failure surfaces
+        calls = []
+
+        def _fail(session):
+            calls.append(session.conn)
+            raise imaplib.IMAP4.abort("socket error: EOF")
+
+        with pytest.raises(imaplib.IMAP4.abort):
+            second._with_session("me@example.com", "secret", _fail)
+        assert len(calls) == 2 and calls[0] is not calls[1]
+        assert server.commands["LOGIN"] == 3
+        cache.close()
@@ -0,0 +1,67 @@
+import sqlite3
+from pathlib import Path
+
+from octopusos.store import migrator
+from octopusos.store.migrator import Migrator
+
+MIGRATIONS_DIR = Path(migrator.__file__).parent / "migrations"
+UID_MIGRATION = "schema_v104_email_imap_uid_message_ids.sql"
+
+
+def _migrate(db_path: Path, migrations_dir: Path) -> None:
+    Migrator(db_path, migrations_dir).migrate()
+
+
+def _seed(conn: sqlite3.Connection) -> None:
+    for instance_id, provider_type in (("imap-1", "imap_smtp"), ("gmail-1", "gmail_oauth")):
+        conn.execute(
+            "INSERT INTO email_instances "
+            "(instance_id, name, provider_type, created_at_ms, updated_at_ms) "
+            "VALUES (?, ?, ?, 0, 0)",
+            (instance_id, instance_id, provider_type),
+        )
+        conn.execute(
+            "INSERT INTO email_snoozes (instance_id, message_id, until_ms) VALUES (?, '7', 1)",
+            (instance_id,),
+        )
+        conn.execute(
+            "INSERT INTO email_digest_runs (instance_id, run_key, last_run_ms) "
+            "VALUES (?, '2026-10-17', 1)",
+            (instance_id,),
+        )
+        for status in ("draft", "sent"):
+            conn.execute(
+                "INSERT INTO email_drafts (draft_id, instance_id, message_id, subject, body_md, "
+                "confirm_token, status, created_at_ms, expires_at_ms) "
+                "VALUES (?, ?, '7', 's', 'b', ?, ?, 0, 1)",
+                (f"{instance_id}-{status}", instance_id, f"tok-{instance_id}-{status}", status),
+            )
+    conn.commit()
+
+
+def test_uid_migration_invalidates_imap_message_ids(tmp_path: Path) -> None:
+    # Migrate to v103 from a copy of the migrations without v104, seed, then apply v104
+    staged = tmp_path / "migrations"
+    staged.mkdir()
+    for sql_file in MIGRATIONS_DIR.glob("schema_v*.sql"):
+        if sql_file.name != UID_MIGRATION:
+            (staged / sql_file.name).symlink_to(sql_file)
+    db_path = tmp_path / "db.sqlite"
+    sqlite3.connect(db_path).close()
+    _migrate(db_path, staged)
+
+    conn = sqlite3.connect(db_path)
+    _seed(conn)
+    (staged / UID_MIGRATION).symlink_to(MIGRATIONS_DIR / UID_MIGRATION)
+    _migrate(db_path, staged)
+
+    assert conn.execute("SELECT instance_id FROM email_snoozes").fetchall() == [("gmail-1",)]
+    assert conn.execute("SELECT instance_id FROM email_digest_runs").fetchall() == [("gmail-1",)]
+    drafts = dict(conn.execute("SELECT draft_id, status FROM email_drafts").fetchall())
+    assert drafts == {
+        "imap-1-draft": "cancelled",
+        "imap-1-sent": "sent",
+        "gmail-1-draft": "draft",
+        "gmail-1-sent": "sent",
+    }
+    conn.close()
@@ -0,0 +1,131 @@
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from octopusos.core.idempotency import IdempotencyStore, LLMOutputCache
+
+
+@pytest.fixture
+def store() -> IdempotencyStore:
+    from octopusos.store.migrator import auto_migrate
+
+    fd, p = tempfile.mkstemp(suffix=".sqlite")
+    os.close(fd)
+    db_path = Path(p)
+    auto_migrate(db_path)
+    return IdempotencyStore(db_path=db_path)
+
+
+def _generate(tokens: int = 100, calls: list | None = None):
+    def _fn():
+        if calls is not None:
+            calls.append(1)
+        return {"content": "plan", "tokens": tokens}
+
+    return _fn
+
+
+def test_memory_tier_serves_repeats_without_store(
+    store: IdempotencyStore, monkeypatch: pytest.MonkeyPatch
+):
+    cache = LLMOutputCache(store=store)
+    calls: list = []
+
+    first = cache.get_or_generate("plan", "do X", "gpt-4", _generate(calls=calls))
+
+    def _no_store(*args, **kwargs):
+        raise AssertionError("store should not be consulted on a memory hit")
+
+    monkeypatch.setattr(store, "check_or_create", _no_store)
+    second = cache.get_or_generate("plan", "do X", "gpt-4", _generate(calls=calls))
+
+    assert first == second == {"content": "plan", "tokens": 100}
+    assert second is not first
+    assert len(calls) == 1
+
+    stats = cache.get_stats()
+    assert stats["memory_hits"] == 1
+    assert stats["cache_misses"] == 1
+    assert stats["tokens_saved"] == 100
+    assert stats["memory"]["entries"] == 1
+
+
+def test_store_hit_after_memory_cleared(store: IdempotencyStore):
+    cache = LLMOutputCache(store=store)
+    cache.get_or_generate("plan", "do X", "gpt-4", _generate())
+    cache.clear_memory()
+
+    calls: list = []
+    result = cache.get_or_generate("plan", "do X", "gpt-4", _generate(calls=calls))
+    assert result["content"] == "plan"
+    assert not calls
+    assert cache.get_stats()["store_hits"] == 1
+
+
+def test_concurrent_identical_requests_are_coalesced(store: IdempotencyStore):
+    cache = LLMOutputCache(store=store)
+    release = threading.Event()
+    calls: list = []
+
+    def slow_generate():
+        calls.append(1)
+        release.wait(5)
+        return {"content": "plan", "tokens": 50}
+
+    results: list = []
+
+    def worker():
+        results.append(cache.get_or_generate("plan", "same prompt", "gpt-4", slow_generate))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        flights = list(cache._inflight.values())
+        if flights and flights[0].waiters == 7:
+            break
+        time.sleep(0.005)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(result == {"content": "plan", "tokens": 50} for result in results)
+
+    stats = cache.get_stats()
+    assert stats["coalesced_calls"] == 7
+    assert stats["cache_hits"] == 7
+    assert stats["tokens_saved"] == 350
+
+
+def test_failure_is_shared_and_not_cached(store: IdempotencyStore):
+    cache = LLMOutputCache(store=store)
+
+    def failing():
+        raise RuntimeError("model down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_generate("plan", "do Y", "gpt-4", failing)
+
+    calls: list = []
+    result = cache.get_or_generate("plan", "do Y", "gpt-4", _generate(calls=calls))
+    assert result["content"] == "plan"
+    assert len(calls) == 1
+
+
+def test_memory_tier_evicts_by_bytes(store: IdempotencyStore):
+    cache = LLMOutputCache(store=store, memory_max_bytes=300)
+    for i in range(5):
+        cache.get_or_generate("plan", f"prompt {i}", "gpt-4", lambda: {"content": "x" * 100})
+
+    memory = cache.get_stats()["memory"]
+    assert memory["bytes"] <= 300
+    assert memory["entries"] == 2
+    assert memory["evictions"] == 3
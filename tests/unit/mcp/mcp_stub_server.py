@@ -0,0 +1,88 @@
+"""Minimal MCP server over stdio for the MCP session pool tests and benchmark.
+
+Tools: ``echo`` (returns its message), ``sleep`` (answers after ``seconds``,
+other requests are served meanwhile), ``add_tool`` (adds a tool and sends
+``notifications/tools/list_changed``) and ``crash`` (exits the process).
+``MCP_STUB_STARTUP_S`` delays the start, standing in for interpreter / node
+module loading.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+_write_lock = threading.Lock()
+_EMPTY_SCHEMA = {"type": "object", "properties": {}}
+_tools = [
+    {"name": "echo", "description": "Echo a message", "inputSchema": {
+        "type": "object",
+        "properties": {"message": {"type": "string"}},
+        "required": ["message"],
+    }},
+    {"name": "sleep", "description": "Sleep", "inputSchema": {
+        "type": "object", "properties": {"seconds": {"type": "number"}}}},
+    {"name": "add_tool", "description": "Add a tool", "inputSchema": _EMPTY_SCHEMA},
+    {"name": "crash", "description": "Exit the server", "inputSchema": _EMPTY_SCHEMA},
+]
+
+
+def _send(message: dict) -> None:
+    with _write_lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def _error(request_id, code: int, message: str) -> None:
+    _send({"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}})
+
+
+def _text(request_id, text: str) -> None:
+    content = [{"type": "text", "text": text}]
+    _send({"jsonrpc": "2.0", "id": request_id, "result": {"content": content}})
+
+
+def _call(request_id, name: str, arguments: dict) -> None:
+    if name == "echo":
+        _text(request_id, str(arguments.get("message", "")))
+    elif name == "sleep":
+        time.sleep(float(arguments.get("seconds", 0)))
+        _text(request_id, "slept")
+    elif name == "add_tool":
+        _tools.append({"name": f"extra_{len(_tools)}", "inputSchema": _EMPTY_SCHEMA})
+        _send({"jsonrpc": "2.0", "method": "notifications/tools/list_changed"})
+        _text(request_id, "added")
+    elif name == "crash":
+        os._exit(1)
+    else:
+        _error(request_id, -32602, f"Unknown tool: {name}")
+
+
+def main() -> None:
+    time.sleep(float(os.getenv("MCP_STUB_STARTUP_S", "0")))
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        method, request_id = request.get("method"), request.get("id")
+        if request_id is None:
+            continue  # notification
+        if method == "initialize":
+            _send({"jsonrpc": "2.0", "id": request_id, "result": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {"tools": {"listChanged": True}},
+                "serverInfo": {"name": "stub", "version": "1.0"},
+            }})
+        elif method == "tools/list":
+            _send({"jsonrpc": "2.0", "id": request_id, "result": {"tools": list(_tools)}})
+        elif method == "tools/call":
+            params = request.get("params") or {}
+            args = (request_id, params.get("name"), params.get("arguments") or {})
+            threading.Thread(target=_call, args=args, daemon=True).start()
+        else:
+            _error(request_id, -32601, "Method not found")
+
+
+if __name__ == "__main__":
+    main()
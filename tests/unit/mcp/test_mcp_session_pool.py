@@ -0,0 +1,113 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from octopusos.core.mcp.client import MCPConnectionError
+from octopusos.core.mcp.config import MCPServerConfig
+from octopusos.core.mcp.session_pool import MCPSessionPool
+from octopusos.core.utils.background_loop import BackgroundLoop
+
+STUB_SERVER = Path(__file__).with_name("mcp_stub_server.py")
+
+
+def _server(server_id: str = "stub", startup_s: str = "0") -> MCPServerConfig:
+    return MCPServerConfig(
+        id=server_id,
+        command=[sys.executable, str(STUB_SERVER)],
+        env={"MCP_STUB_STARTUP_S": startup_s},
+        timeout_ms=5000,
+    )
+
+
+@pytest.fixture
+def pool():
+    loop = BackgroundLoop(name="mcp-pool-test")
+    pool = MCPSessionPool(loop=loop, health_interval_s=3600)
+    yield pool
+    pool.close_sync()
+    loop.stop()
+
+
+def test_schema_cache_and_list_changed(pool) -> None:
+    server = _server(startup_s="0")
+    tools = pool.list_tools_sync(server)
+    assert [tool["name"] for tool in tools] == ["echo", "sleep", "add_tool", "crash"]
+    generation = pool.stats()[0]["generation"]
+
+    # Cached: no request reaches the server
+    session = pool._sessions["stub"]
+    session.client.list_tools = None
+    assert pool.list_tools_sync(server) == tools
+    del session.client.list_tools
+
+    # tools/list_changed drops the cache; the next listing sees the new tool
+    pool.call_tool_sync(server, "add_tool", {})
+    assert pool.stats()[0]["tools_cached"] is False
+    assert [tool["name"] for tool in pool.list_tools_sync(server)][-1] == "extra_4"
+    assert pool.stats()[0]["generation"] == generation
+
+
+def test_requests_are_multiplexed(pool) -> None:
+    server = _server(startup_s="0")
+    pool.list_tools_sync(server)
+
+    async def _concurrent():
+        calls = (pool.call_tool(server, "sleep", {"seconds": 0.3}) for _ in range(5))
+        return await asyncio.gather(*calls)
+
+    started = time.perf_counter()
+    results = asyncio.run(_concurrent())
+    assert time.perf_counter() - started < 1.0
+    assert len(results) == 5 and pool.stats()[0]["generation"] == 1
+
+
+def test_crash_restart_and_config_change(pool) -> None:
+    server = _server(startup_s="0")
+    assert pool.call_tool_sync(server, "echo", {"message": "a"})["content"][0]["text"] == "a"
+
+    # The in-flight call fails fast instead of waiting for its timeout
+    started = time.perf_counter()
+    with pytest.raises(Exception):
+        pool.call_tool_sync(server, "crash", {})
+    assert time.perf_counter() - started < 2.0
+
+    # Next request restarts the server
+    assert pool.call_tool_sync(server, "echo", {"message": "b"})["content"][0]["text"] == "b"
+    stats = pool.stats()[0]
+    assert stats["generation"] == 2 and stats["restarts"] == 1
+
+    # A changed config restarts the session too
+    changed = server.model_copy(update={"env": {"MCP_STUB_STARTUP_S": "0", "EXTRA": "1"}})
+    pool.list_tools_sync(changed)
+    assert pool.stats()[0]["generation"] == 1
+
+    # Idle sessions are closed by the health check
+    pool.idle_timeout_s = 0
+    pool._loop.run(pool._check_health())
+    assert pool.stats() == []
+
+
+def test_start_failure_backs_off(pool) -> None:
+    broken = MCPServerConfig(
+        id="broken", command=[sys.executable, "-c", "import sys; sys.exit(3)"], timeout_ms=2000
+    )
+    with pytest.raises(MCPConnectionError):
+        pool.list_tools_sync(broken)
+    # Within the backoff window the pool fails fast without spawning
+    started = time.perf_counter()
+    with pytest.raises(MCPConnectionError, match="restarting after failures"):
+        pool.list_tools_sync(broken)
+    assert time.perf_counter() - started < 0.1
+
+
+def test_timed_out_probe_keeps_starting(pool) -> None:
+    server = _server(startup_s="0.5")
+    with pytest.raises(TimeoutError):
+        pool.list_tools_sync(server, timeout=0.05)
+    time.sleep(0.8)
+    started = time.perf_counter()
+    assert pool.list_tools_sync(server, timeout=2)
+    assert time.perf_counter() - started < 0.3
@@ -0,0 +1,142 @@
+import random
+
+from octopusos.core.memory import overlap
+from octopusos.core.memory.deduplicator import MemoryDeduplicator
+from octopusos.core.memory.lsh import MemoryLSHIndex
+from octopusos.core.memory.overlap import overlap_matches, prefix_length
+
+
+def _memory(memory_id: str, summary: str, memory_type: str = "convention") -> dict:
+    return {"id": memory_id, "type": memory_type, "content": {"summary": summary}}
+
+
+def _synthetic_memories(n: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(2000)]
+    memories = []
+    for i in range(n):
+        roll = rng.random()
+        if memories and roll < 0.15:
+            # Near-duplicate of an earlier memory: replace one or two words
+            words = memories[rng.randrange(len(memories))]["content"]["summary"].split()
+            for _ in range(rng.randint(1, 2)):
+                words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        elif memories and roll < 0.2:
+            # Prefix of an earlier memory: overlap 1.0, Jaccard often below 0.5
+            words = memories[rng.randrange(len(memories))]["content"]["summary"].split()
+            words = words[: rng.randint(3, max(3, len(words) // 2))]
+        else:
+            words = rng.sample(vocabulary, rng.randint(10, 24))
+        memory_type = rng.choice(("convention", "decision"))
+        memories.append(_memory(f"mem-{i:06d}", " ".join(words), memory_type))
+    return memories
+
+
+def _group_keys(groups: list[list[dict]]) -> set[tuple[str, ...]]:
+    return {tuple(m["id"] for m in group) for group in groups}
+
+
+def _pairwise_groups(deduplicator: MemoryDeduplicator, memories: list[dict]) -> list[list[dict]]:
+    processed = set()
+    groups = []
+    for i, mem in enumerate(memories):
+        if mem["id"] in processed:
+            continue
+        duplicates = deduplicator.find_duplicates(mem, memories[i + 1:])
+        if duplicates:
+            group = [mem] + duplicates
+            groups.append(group)
+            processed.update(m["id"] for m in group)
+    return groups
+
+
+def test_indexed_grouping_matches_pairwise_scan() -> None:
+    memories = _synthetic_memories(600, seed=3)
+    deduplicator = MemoryDeduplicator(similarity_threshold=0.85)
+
+    exact_groups = _group_keys(_pairwise_groups(deduplicator, memories))
+    assert _group_keys(deduplicator.get_duplicate_groups(memories)) == exact_groups
+
+    # Summary / prefix pairs: low Jaccard, overlap 1.0
+    rng = random.Random(11)
+    pairs = []
+    for i in range(150):
+        words = [f"t{i}x{k}" for k in range(rng.randint(12, 30))] + ["the", "a", "of"]
+        rng.shuffle(words)
+        pairs.append(_memory(f"long-{i}", " ".join(words)))
+        pairs.append(_memory(f"short-{i}", " ".join(words[:4])))
+    groups = deduplicator.get_duplicate_groups(pairs)
+    assert len(groups) == 150
+    assert _group_keys(groups) == _group_keys(_pairwise_groups(deduplicator, pairs))
+
+
+def test_overlap_matches_equal_pairwise_check(monkeypatch) -> None:
+    rng = random.Random(5)
+    vocabulary = [f"w{i}" for i in range(60)]
+    token_sets = [frozenset(rng.sample(vocabulary, rng.randint(1, 12))) for _ in range(300)]
+    assert prefix_length(20, 0.85) == 4 and prefix_length(1, 0.85) == 1
+
+    for threshold in (0.5, 0.85, 1.0):
+        expected = [
+            [
+                j
+                for j, b in enumerate(token_sets)
+                if i != j and MemoryDeduplicator._overlap(a, b) >= threshold
+            ]
+            for i, a in enumerate(token_sets)
+        ]
+        assert overlap_matches(token_sets, threshold) == expected
+        # Batches split between sets, never inside one
+        monkeypatch.setattr(overlap, "_PROBE_CHUNK", 16)
+        assert overlap_matches(token_sets, threshold) == expected
+        monkeypatch.undo()
+    assert overlap_matches([frozenset(), frozenset()], 0.85) == [[], []]
+
+
+def test_find_duplicates_compares_only_index_candidates(monkeypatch) -> None:
+    memories = _synthetic_memories(500, seed=9)
+    index = MemoryLSHIndex.from_memories(memories)
+    deduplicator = MemoryDeduplicator(similarity_threshold=0.85)
+    unindexed = _memory("late", "w1 w2 w3")
+    existing = memories + [unindexed]
+
+    for probe in memories[::25] + [_memory("new", "w1 w2 w3 w4")]:
+        expected = deduplicator.find_duplicates(probe, existing)
+
+        compared = []
+        similarity = deduplicator.calculate_similarity
+        monkeypatch.setattr(
+            deduplicator,
+            "calculate_similarity",
+            lambda a, b: compared.append(b) or similarity(a, b),
+        )
+        assert deduplicator.find_duplicates(probe, existing, index=index) == expected
+        monkeypatch.undo()
+        # Candidates plus the memory the index does not hold, not the whole list
+        assert len(compared) <= len(expected) + 2
+
+    # Prefix of an indexed summary: overlap 1.0 although Jaccard is low
+    long_summary = memories[0]["content"]["summary"]
+    prefix = _memory("prefix", " ".join(long_summary.split()[:3]), memories[0]["type"])
+    assert memories[0] in deduplicator.find_duplicates(prefix, memories, index=index)
+
+
+def test_index_tracks_updates_and_removals() -> None:
+    index = MemoryLSHIndex()
+    index.add("a", "prefer pytest fixtures over setup methods in unit tests")
+    index.add("b", "prefer pytest fixtures over setup methods in all unit tests")
+    index.add("c", "deploy the webui behind nginx with tls termination")
+
+    assert index.query_id("a") == {"b"}
+    assert index.query_overlap("pytest fixtures in unit tests", 0.85) == {"a", "b"}
+
+    index.add("b", "deploy the webui behind nginx with tls termination enabled")
+    assert index.query_id("a") == set()
+    assert index.query_id("c") == {"b"}
+    assert index.query_overlap("pytest fixtures in unit tests", 0.85) == {"a"}
+
+    assert index.remove("c")
+    assert not index.remove("c")
+    assert index.query_id("b") == set()
+    assert index.query_overlap("webui behind nginx", 1.0) == {"b"}
+    assert len(index) == 2
@@ -0,0 +1,59 @@
+import sqlite3
+from pathlib import Path
+
+from octopusos.core.project_kb.indexer import ProjectKBIndexer
+from octopusos.core.project_kb.types import Chunk, Source
+
+
+class _FailingFirstCommit:
+    """Connection proxy whose first COMMIT fails (e.g. SQLITE_BUSY)"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.failed = False
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def commit(self):
+        if not self.failed:
+            self.failed = True
+            raise sqlite3.OperationalError("database is locked")
+        self._conn.commit()
+
+
+def test_bulk_session_counts_only_committed_files(tmp_path: Path, migrated_db) -> None:
+    indexer = ProjectKBIndexer(migrated_db(tmp_path / "kb.sqlite"))
+
+    def _file(name: str, chunk_ids: list[str]) -> tuple[Source, list[Chunk]]:
+        source = Source(
+            source_id=name, repo_id="repo", path=f"docs/{name}.md", file_hash=name, mtime=0
+        )
+        chunks = [
+            Chunk(
+                chunk_id=chunk_id,
+                source_id=name,
+                heading=None,
+                start_line=1,
+                end_line=2,
+                content=f"{name} {chunk_id}",
+                content_hash=chunk_id,
+            )
+            for chunk_id in chunk_ids
+        ]
+        return source, chunks
+
+    # Batch COMMIT fails: the batch is rolled back and every file written again on its own
+    with indexer.bulk_session(batch_size=10) as session:
+        session._conn = _FailingFirstCommit(session._conn)
+        for name, chunk_ids in (("a", ["a1", "a2"]), ("b", ["b1"]), ("c", ["c1"])):
+            session.add_file(*_file(name, chunk_ids))
+    assert session._conn is None and not session.errors
+    assert session.stats["files"] == 3 and session.stats["chunks"] == 4
+
+    # "e" reuses a chunk_id of "d": only "d" and "f" are committed and counted
+    with indexer.bulk_session(batch_size=10) as session:
+        for name, chunk_ids in (("d", ["d1", "d2"]), ("e", ["e1", "d1"]), ("f", ["f1"])):
+            session.add_file(*_file(name, chunk_ids))
+    assert len(session.errors) == 1 and session.errors[0].startswith("docs/e.md")
+    assert session.stats["files"] == 2 and session.stats["chunks"] == 3
@@ -0,0 +1,84 @@
+import gc
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from octopusos.core.project_kb import connections
+from octopusos.core.project_kb.connections import (
+    close_all_read_connections,
+    get_read_connection,
+    reset_read_connection,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "kb.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE chunks (id INTEGER PRIMARY KEY)")
+    conn.commit()
+    conn.close()
+    yield path
+    close_all_read_connections()
+
+
+def _is_closed(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("SELECT 1")
+    except sqlite3.ProgrammingError:
+        return True
+    return False
+
+
+def _open_in_thread(db_path: Path) -> sqlite3.Connection:
+    opened = []
+    thread = threading.Thread(target=lambda: opened.append(get_read_connection(db_path)))
+    thread.start()
+    thread.join()
+    return opened[0]
+
+
+def test_connection_is_reused_per_thread(db_path: Path) -> None:
+    conn = get_read_connection(db_path)
+    assert get_read_connection(db_path) is conn
+    assert _open_in_thread(db_path) is not conn
+
+    reset_read_connection(db_path)
+    assert _is_closed(conn)
+    assert get_read_connection(db_path) is not conn
+
+
+def test_finished_threads_release_their_connections(db_path: Path) -> None:
+    before = len(connections._ALL_THREADS)
+    opened = [_open_in_thread(db_path) for _ in range(20)]
+    gc.collect()
+
+    assert len(connections._ALL_THREADS) == before
+    assert all(_is_closed(conn) for conn in opened)
+
+
+def test_close_all_closes_live_thread_connections(db_path: Path) -> None:
+    ready, release = threading.Event(), threading.Event()
+    opened = []
+
+    def _worker() -> None:
+        opened.append(get_read_connection(db_path))
+        ready.set()
+        release.wait()
+        # The thread gets a fresh connection after close_all
+        opened.append(get_read_connection(db_path))
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    ready.wait()
+    main_conn = get_read_connection(db_path)
+
+    close_all_read_connections()
+    release.set()
+    thread.join()
+
+    assert _is_closed(opened[0]) and _is_closed(main_conn)
+    assert opened[1] is not opened[0]
+    assert get_read_connection(db_path).execute("SELECT 1").fetchone()[0] == 1
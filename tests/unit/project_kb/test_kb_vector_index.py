@@ -0,0 +1,158 @@
+import os
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from octopusos.core.project_kb.embedding.vector_index import VectorIndex
+
+DIMS = 16
+
+
+@pytest.fixture
+def conn(tmp_path: Path):
+    conn = sqlite3.connect(tmp_path / "kb.sqlite")
+    conn.execute(
+        """
+        CREATE TABLE kb_embeddings (
+            chunk_id TEXT PRIMARY KEY, model TEXT NOT NULL, dims INTEGER NOT NULL,
+            vector BLOB NOT NULL, content_hash TEXT NOT NULL, built_at INTEGER NOT NULL
+        )
+        """
+    )
+    yield conn
+    conn.close()
+
+
+def _vectors(n: int, seed: int = 1) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((n, DIMS)).astype(np.float32)
+
+
+def _insert(conn: sqlite3.Connection, chunk_ids: list, vectors: np.ndarray) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO kb_embeddings VALUES (?, 'test', ?, ?, 'h', 0)",
+        ((chunk_id, DIMS, vec.tobytes()) for chunk_id, vec in zip(chunk_ids, vectors)),
+    )
+    conn.commit()
+
+
+def _write(conn: sqlite3.Connection, index: VectorIndex, chunk_ids: list, vectors) -> None:
+    """Write like EmbeddingManager: database first, then the index, then mark_synced."""
+    _insert(conn, chunk_ids, vectors)
+    index.upsert(chunk_ids, vectors)
+    index.mark_synced(conn)
+
+
+def _delete(conn: sqlite3.Connection, index: VectorIndex, chunk_ids: list) -> None:
+    conn.executemany("DELETE FROM kb_embeddings WHERE chunk_id = ?", ((c,) for c in chunk_ids))
+    conn.commit()
+    index.delete(chunk_ids)
+    index.mark_synced(conn)
+
+
+def _make_index(conn: sqlite3.Connection, **kwargs) -> VectorIndex:
+    db_path = Path(conn.execute("PRAGMA database_list").fetchone()[2])
+    index = VectorIndex(db_path, "test", DIMS, **kwargs)
+    index.load(conn)
+    return index
+
+
+def _inode(index: VectorIndex) -> int:
+    return os.stat(index.sidecar_dir / "vectors.npy").st_ino
+
+
+def _reload(conn: sqlite3.Connection, **kwargs) -> VectorIndex:
+    index = _make_index(conn, **kwargs)
+    assert index.get_stats()["memory_mapped"], "sidecar should be valid"
+    return index
+
+
+def test_vector_index_incremental_updates(conn: sqlite3.Connection) -> None:
+    vectors = _vectors(50)
+    _insert(conn, [f"chunk_{i}" for i in range(50)], vectors)
+
+    index = _make_index(conn)
+    assert index.search(vectors[3], 1)[0][0] == "chunk_3"
+
+    index.delete(["chunk_3"])
+    assert "chunk_3" not in {cid for cid, _ in index.search(vectors[3], 5)}
+
+    index.upsert(["chunk_new"], vectors[3:4])
+    top_id, top_score = index.search(vectors[3], 1)[0]
+    assert top_id == "chunk_new"
+    assert top_score == pytest.approx(1.0, abs=1e-5)
+
+    # An out-of-band DB write invalidates the sidecar fingerprint
+    conn.execute("DELETE FROM kb_embeddings WHERE chunk_id = 'chunk_0'")
+    conn.commit()
+    assert index.is_stale(conn)
+    reloaded = VectorIndex(index.db_path, "test", DIMS)
+    reloaded.load(conn)
+    assert len(reloaded) == 49
+
+
+def test_mark_synced_writes_changed_rows_in_place(conn: sqlite3.Connection) -> None:
+    vectors = _vectors(40)
+    _insert(conn, [f"chunk_{i}" for i in range(40)], vectors)
+    index = _make_index(conn)
+    inode = _inode(index)
+
+    replacement, added = _vectors(2, seed=2)
+    _write(conn, index, ["chunk_5"], replacement[None, :])
+    _write(conn, index, ["chunk_new"], added[None, :])
+    assert _inode(index) == inode
+
+    reloaded = _reload(conn)
+    assert len(reloaded) == 41
+    assert reloaded.search(replacement, 1)[0][0] == "chunk_5"
+    assert reloaded.search(added, 1)[0][0] == "chunk_new"
+    assert reloaded.search(vectors[6], 1)[0][0] == "chunk_6"
+
+
+def test_deletes_are_tombstoned_until_compaction(conn: sqlite3.Connection) -> None:
+    vectors = _vectors(40)
+    chunk_ids = [f"chunk_{i}" for i in range(40)]
+    _insert(conn, chunk_ids, vectors)
+    index = _make_index(conn)
+    inode = _inode(index)
+
+    _delete(conn, index, ["chunk_1"])
+    assert _inode(index) == inode
+    reloaded = _reload(conn)
+    assert len(reloaded) == 39
+    assert "chunk_1" not in {cid for cid, _ in reloaded.search(vectors[1], 40)}
+
+    # Past the tombstone ratio the save compacts and rewrites the sidecar
+    _delete(conn, index, chunk_ids[2:20])
+    assert _inode(index) != inode
+    reloaded = _reload(conn)
+    assert len(reloaded) == 21
+    assert reloaded.search(vectors[30], 1)[0][0] == "chunk_30"
+
+
+def test_sidecar_grows_when_capacity_is_exceeded(conn: sqlite3.Connection) -> None:
+    index = _make_index(conn)
+    vectors = _vectors(200)
+    for start in range(0, 200, 25):
+        chunk_ids = [f"chunk_{i}" for i in range(start, start + 25)]
+        _write(conn, index, chunk_ids, vectors[start : start + 25])
+
+    reloaded = _reload(conn)
+    assert len(reloaded) == 200
+    assert all(reloaded.search(vectors[i], 1)[0][0] == f"chunk_{i}" for i in (0, 63, 64, 199))
+
+
+def test_ivf_assignments_are_persisted_incrementally(conn: sqlite3.Connection) -> None:
+    vectors = _vectors(120)
+    _insert(conn, [f"chunk_{i}" for i in range(100)], vectors[:100])
+    index = _make_index(conn, ivf_min_vectors=50, ivf_nprobe=2)
+    assert index.get_stats()["ivf_lists"]
+    inode = _inode(index)
+
+    _write(conn, index, [f"chunk_{i}" for i in range(100, 120)], vectors[100:])
+    assert _inode(index) == inode
+
+    reloaded = _reload(conn, ivf_min_vectors=50, ivf_nprobe=2)
+    assert np.array_equal(reloaded._assign[:120], index._assign[:120])
+    assert reloaded.search(vectors[110], 1)[0][0] == "chunk_110"
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from octopusos.providers.http_pool import HTTPClientPool
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        if self.path.endswith("/api/tags"):
+            payload = {"models": [{"name": "stub"}]}
+        else:
+            payload = {"object": "list", "data": [{"id": "stub", "object": "model"}]}
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_reuses_clients_and_records_metrics(stub_server) -> None:
+    pool = HTTPClientPool()
+
+    client = pool.get_sync_client(stub_server, timeout="probe", provider="stub")
+    assert pool.get_sync_client(stub_server, timeout="probe") is client
+    assert pool.get_sync_client(stub_server, timeout="catalog") is not client
+    assert pool.get_sync_client(stub_server, api_key="other", timeout="probe") is not client
+
+    for _ in range(3):
+        assert client.get(f"{stub_server}/api/tags").status_code == 200
+
+    stats = pool.get_stats()
+    assert stats["providers"]["stub"]["requests"] == 3
+    assert stats["providers"]["stub"]["ttfb_p50_ms"] is not None
+    occupancy = next(p for p in stats["pools"] if p["provider"] == "stub")
+    assert occupancy["connections"] == 1
+    assert occupancy["idle"] == 1
+
+    async def async_client():
+        first = pool.get_async_client(stub_server, provider="stub")
+        assert pool.get_async_client(stub_server) is first
+        assert (await first.get(f"{stub_server}/v1/models")).status_code == 200
+        return first
+
+    # One async client per event loop
+    assert asyncio.run(async_client()) is not asyncio.run(async_client())
+
+    pool.close()
+    assert client.is_closed
+    assert pool.get_sync_client(stub_server, timeout="probe") is not client
+    pool.close()
+
+
+def test_async_clients_closed_when_their_loop_shuts_down(stub_server) -> None:
+    pool = HTTPClientPool()
+    clients = []
+
+    async def probe():
+        client = pool.get_async_client(stub_server, timeout="probe", provider="stub")
+        assert (await client.get(f"{stub_server}/api/tags")).status_code == 200
+        clients.append(client)
+
+    # Each asyncio.run() closes its loop's clients and drops the loop
+    for _ in range(5):
+        asyncio.run(probe())
+    assert all(client.is_closed for client in clients)
+    assert len(pool._async_clients) == 0
+
+    async def close_then_probe():
+        await probe()
+        pool.close()
+        await probe()
+
+    # A closed pool's guard does not close clients the loop created afterwards
+    asyncio.run(close_then_probe())
+    assert all(client.is_closed for client in clients)
+    assert len(pool._async_clients) == 0
+    pool.close()
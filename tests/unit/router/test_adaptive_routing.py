@@ -0,0 +1,284 @@
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from octopusos.core.chat.adapters import OpenAIChatAdapter
+from octopusos.core.llm.token_tracking_wrapper import LLMCallWrapper
+from octopusos.router import (
+    CircuitState,
+    InstanceProfile,
+    InstanceTelemetry,
+    RerouteReason,
+    RoutePlan,
+    Router,
+    RouteScore,
+    RouteScorer,
+    TaskRequirements,
+)
+from octopusos.router import telemetry as telemetry_module
+
+INSTANCES = ["llamacpp:a", "llamacpp:b", "llamacpp:c"]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Profiles:
+    """InstanceProfileBuilder stand-in with fixed READY profiles"""
+
+    def __init__(self, instance_ids, state: str = "READY"):
+        self.states = {instance_id: state for instance_id in instance_ids}
+        self.probed = []
+
+    def _profile(self, instance_id: str) -> InstanceProfile:
+        return InstanceProfile(
+            instance_id=instance_id,
+            provider_type="llamacpp",
+            base_url="http://127.0.0.1",
+            state=self.states[instance_id],
+            latency_ms=20.0,
+            tags=["coding"],
+            ctx=8192,
+        )
+
+    async def build_all_profiles(self):
+        return [self._profile(instance_id) for instance_id in self.states]
+
+    async def get_profile(self, instance_id: str):
+        self.probed.append(instance_id)
+        return self._profile(instance_id)
+
+
+def _router(telemetry=None, seed: int = 7, instances=INSTANCES, **kwargs) -> Router:
+    scorer = RouteScorer(telemetry=telemetry, rng=random.Random(seed))
+    return Router(
+        registry=SimpleNamespace(), profile_builder=_Profiles(instances), scorer=scorer, **kwargs
+    )
+
+
+def _open_circuit(telemetry: InstanceTelemetry, instance_id: str) -> None:
+    for _ in range(3):
+        telemetry.record(instance_id, ok=False, latency_ms=5)
+
+
+def test_ewma_and_circuit_breaker() -> None:
+    clock = _Clock()
+    telemetry = InstanceTelemetry(alpha=0.5, circuit_cooldown_s=30, clock=clock)
+    with telemetry.track("x") as call:
+        clock.now += 0.1
+        call.first_token()
+        clock.now += 0.5
+        call.add_tokens(50)
+    live = telemetry.snapshot("x")
+    assert live.ttft_ms == pytest.approx(100) and live.tokens_per_s == pytest.approx(100)
+    assert live.latency_ms == pytest.approx(600) and live.in_flight == 0
+
+    with telemetry.track("x") as call:
+        assert telemetry.snapshot("x").in_flight == 1
+        clock.now += 0.3
+        call.first_token()
+    assert telemetry.snapshot("x").ttft_ms == pytest.approx(200)
+
+    # Three failures in a row open the circuit; errors do not move the EWMAs
+    for _ in range(3):
+        with telemetry.track("x") as call:
+            call.fail("HTTP 503")
+    live = telemetry.snapshot("x")
+    assert live.circuit == CircuitState.OPEN and not live.routable
+    assert live.error_rate == pytest.approx(0.6) and live.ttft_ms == pytest.approx(200)
+
+    clock.now += 30
+    assert telemetry.snapshot("x").circuit == CircuitState.HALF_OPEN
+    with pytest.raises(ConnectionError):
+        with telemetry.track("x"):
+            assert not telemetry.snapshot("x").routable  # Trial in flight
+            raise ConnectionError("refused")
+    assert telemetry.snapshot("x").circuit == CircuitState.OPEN
+
+    clock.now += 30
+    with telemetry.track("x"):
+        pass
+    live = telemetry.snapshot("x")
+    assert live.circuit == CircuitState.CLOSED and live.error_rate == 0.0
+
+    # Error rate over the window also opens it; old outcomes expire
+    telemetry = InstanceTelemetry(circuit_consecutive_failures=100, clock=clock)
+    for ok in (True, False, True, False, False):
+        telemetry.record("y", ok=ok, latency_ms=10)
+    assert telemetry.snapshot("y").circuit == CircuitState.OPEN
+    clock.now += 120
+    assert telemetry.snapshot("y").window_requests == 0
+
+
+def test_abandoned_stream_is_not_a_failure() -> None:
+    telemetry = InstanceTelemetry()
+
+    def _stream():
+        with telemetry.track("s") as call:
+            for _ in range(10):
+                call.first_token()
+                call.add_tokens(1)
+                yield "tok"
+
+    stream = _stream()
+    next(stream)
+    assert telemetry.snapshot("s").in_flight == 1
+    stream.close()
+    live = telemetry.snapshot("s")
+    assert live.in_flight == 0 and live.error_rate == 0.0 and live.total_requests == 1
+
+
+def test_scoring_uses_live_signals() -> None:
+    clock = _Clock()
+    telemetry = InstanceTelemetry(clock=clock)
+    profiles = _Profiles(INSTANCES)
+    requirements = TaskRequirements(needs=["coding"])
+    scorer = RouteScorer(telemetry=telemetry, rng=random.Random(1))
+
+    static = RouteScorer().score_all(asyncio.run(profiles.build_all_profiles()), requirements)
+    assert len({s.total_score for s in static}) == 1
+
+    busy = [telemetry.track("llamacpp:a").__enter__() for _ in range(2)]
+    for _ in range(3):
+        with telemetry.track("llamacpp:b") as call:
+            call.fail()
+    telemetry.record("llamacpp:c", ok=True, latency_ms=1000, ttft_ms=900, tokens=90)
+
+    all_profiles = asyncio.run(profiles.build_all_profiles())
+    scores = {s.instance_id: s for s in scorer.score_all(all_profiles, requirements)}
+    assert scores["llamacpp:b"].total_score == 0.0
+    assert scores["llamacpp:b"].reasons == ["CIRCUIT_OPEN"]
+    assert "in_flight=2" in scores["llamacpp:a"].reasons
+    assert scores["llamacpp:a"].breakdown["health"] == pytest.approx(1 / 1.5)
+    assert "latency_slow(ttft=900ms)" in scores["llamacpp:c"].reasons
+    assert "tps_best(900/s)" in scores["llamacpp:c"].reasons
+    assert scores["llamacpp:c"].breakdown["throughput"] == 0.1
+
+    # Power of two choices: the least loaded of two near-equal candidates wins
+    candidates = [
+        RouteScore("llamacpp:a", 0.40),
+        RouteScore("llamacpp:c", 0.38),
+        RouteScore("llamacpp:b", 0.1),
+    ]
+    chosen = scorer.choose(candidates)
+    assert [c.instance_id for c in chosen] == ["llamacpp:c", "llamacpp:a", "llamacpp:b"]
+    assert chosen[0].reasons == ["p2c_least_loaded"]
+    assert RouteScorer().choose(candidates) == candidates
+    for call in busy:
+        call.__exit__(None, None, None)
+
+
+def test_verify_or_reroute_fails_over_on_live_signals() -> None:
+    telemetry = InstanceTelemetry()
+    router = _router(telemetry, max_in_flight=2)
+    plan = RoutePlan(task_id="t1", selected="llamacpp:a", fallback=["llamacpp:b", "llamacpp:c"])
+
+    # Healthy: probe confirms READY
+    assert asyncio.run(router.verify_or_reroute("t1", plan)) == (plan, None)
+
+    # Open circuit: fail over without probing the failing instance; skip open fallbacks
+    for instance_id in ("llamacpp:a", "llamacpp:b"):
+        _open_circuit(telemetry, instance_id)
+    router.profile_builder.probed.clear()
+    new_plan, event = asyncio.run(router.verify_or_reroute("t1", plan))
+    assert new_plan.selected == "llamacpp:c" and event.reason_code == RerouteReason.CIRCUIT_OPEN
+    assert router.profile_builder.probed == ["llamacpp:c"]
+
+    # Overloaded: move only to a less loaded fallback, otherwise keep the route
+    telemetry.reset()
+    busy = [telemetry.track("llamacpp:a").__enter__() for _ in range(2)]
+    busy += [telemetry.track("llamacpp:b").__enter__() for _ in range(2)]
+    new_plan, event = asyncio.run(router.verify_or_reroute("t1", plan))
+    assert new_plan.selected == "llamacpp:c" and event.reason_code == RerouteReason.OVERLOADED
+    busy += [telemetry.track("llamacpp:c").__enter__() for _ in range(2)]
+    assert asyncio.run(router.verify_or_reroute("t1", plan)) == (plan, None)
+    for call in busy:
+        call.__exit__(None, None, None)
+
+
+def test_adapters_and_call_wrapper_report_telemetry(monkeypatch) -> None:
+    telemetry = InstanceTelemetry()
+    monkeypatch.setattr(telemetry_module, "_default_telemetry", telemetry)
+
+    # Error paths return an empty metadata dict and count as failures
+    adapter = OpenAIChatAdapter(model="m", api_key=None, instance_id="openai:test")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    adapter.api_key = None
+    content, metadata = adapter.generate([{"role": "user", "content": "hi"}])
+    assert metadata == {} and telemetry.snapshot("openai:test").error_rate == 1.0
+    assert list(adapter.generate_stream([{"role": "user", "content": "hi"}]))
+    assert telemetry.snapshot("openai:test").total_requests == 2
+
+    wrapper = LLMCallWrapper("local", "m", instance_id="llamacpp:w")
+    response = {"usage": {"completion_tokens": 40}}
+    assert wrapper.wrap_call(lambda: response) is response
+    with pytest.raises(TimeoutError):
+        wrapper.wrap_call(lambda: (_ for _ in ()).throw(TimeoutError()))
+    live = telemetry.snapshot("llamacpp:w")
+    assert live.total_requests == 2 and live.error_rate == 0.5 and live.tokens_per_s > 0
+
+
+def test_half_open_trial_is_reserved_at_selection() -> None:
+    clock = _Clock()
+    telemetry = InstanceTelemetry(circuit_cooldown_s=30, clock=clock)
+    router = _router(telemetry, instances=["llamacpp:a", "llamacpp:b"])
+    task = {"title": "Implement parser", "description": "code"}
+
+    _open_circuit(telemetry, "llamacpp:a")
+    clock.now += 20
+    _open_circuit(telemetry, "llamacpp:b")
+    clock.now += 15
+    assert telemetry.snapshot("llamacpp:a").circuit == CircuitState.HALF_OPEN
+    assert telemetry.snapshot("llamacpp:b").circuit == CircuitState.OPEN
+
+    # A burst of routes: only the first gets the half-open instance's trial
+    plan = asyncio.run(router.route("t1", task))
+    assert plan.selected == "llamacpp:a"
+    for task_id in ("t2", "t3"):
+        with pytest.raises(RuntimeError):
+            asyncio.run(router.route(task_id, task))
+
+    live = telemetry.snapshot("llamacpp:a")
+    assert live.trial_owner == "t1" and not live.routable and live.routable_for("t1")
+    # The owner's own reservation does not trigger a failover
+    assert asyncio.run(router.verify_or_reroute("t1", plan)) == (plan, None)
+
+    with telemetry.track("llamacpp:a"):
+        pass
+    live = telemetry.snapshot("llamacpp:a")
+    assert live.circuit == CircuitState.CLOSED and live.trial_owner is None
+    assert asyncio.run(router.route("t2", task)).selected == "llamacpp:a"
+
+
+def test_trial_reservation_expires_and_is_released() -> None:
+    clock = _Clock()
+    telemetry = InstanceTelemetry(circuit_cooldown_s=30, clock=clock)
+    assert telemetry.acquire_trial("unknown", "t1")
+
+    _open_circuit(telemetry, "x")
+    assert not telemetry.acquire_trial("x", "t1")
+    clock.now += 30
+    assert telemetry.acquire_trial("x", "t1")
+    assert telemetry.acquire_trial("x", "t1")
+    assert not telemetry.acquire_trial("x", "t2")
+
+    # An unused reservation expires after the cooldown
+    clock.now += 30
+    assert telemetry.snapshot("x").trial_owner is None
+    assert telemetry.acquire_trial("x", "t2")
+
+    # A failed trial reopens the circuit and drops the reservation
+    with telemetry.track("x") as call:
+        assert not telemetry.acquire_trial("x", "t3")
+        call.fail()
+    live = telemetry.snapshot("x")
+    assert live.circuit == CircuitState.OPEN and live.trial_owner is None
+    clock.now += 30
+    assert telemetry.acquire_trial("x", "t3")
@@ -0,0 +1,78 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from octopusos.core.task.dependency_service import (
+    CircularDependencyError,
+    TaskDependencyService,
+    invalidate_dependency_graph,
+)
+
+
+def _connect(db_path: Path, n_tasks: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executemany(
+        "INSERT INTO tasks (task_id, title, status) VALUES (?, ?, 'created')",
+        ((f"task-{i:05d}", f"Work item {i}") for i in range(n_tasks)),
+    )
+    conn.commit()
+    return conn
+
+
+def test_incremental_graph_tracks_writes(tmp_path: Path, migrated_db) -> None:
+    conn = _connect(migrated_db(tmp_path / "deps.db"), 10)
+    service = TaskDependencyService(conn)
+
+    service.create_dependency_safe("task-00002", "task-00001", "blocks", "b")
+    service.create_dependency_safe("task-00003", "task-00002", "requires", "r")
+    graph = service.get_incremental_graph()
+
+    with pytest.raises(CircularDependencyError, match="task-00001"):
+        service.create_dependency_safe("task-00001", "task-00003", "blocks", "cycle")
+    with pytest.raises(CircularDependencyError):
+        service.create_dependency_safe("task-00004", "task-00004", "blocks", "self")
+
+    # Same pair with a second type: deleting one type keeps the edge
+    service.create_dependency("task-00003", "task-00002", "blocks", "b")
+    assert service.delete_dependency("task-00003", "task-00002", "blocks")
+    with pytest.raises(CircularDependencyError):
+        service.create_dependency_safe("task-00002", "task-00003", "blocks", "cycle")
+
+    assert service.delete_dependency("task-00003", "task-00002")
+    service.create_dependency_safe("task-00002", "task-00003", "blocks", "now allowed")
+    assert service.get_incremental_graph() is graph
+
+    # A write made behind the service's back is picked up by a rebuild
+    conn.execute(
+        "INSERT INTO task_dependency (task_id, depends_on_task_id, dependency_type) "
+        "VALUES (?, ?, 'blocks')",
+        ("task-00001", "task-00005"),
+    )
+    conn.commit()
+    assert service.get_incremental_graph() is not graph
+    with pytest.raises(CircularDependencyError):
+        service.create_dependency_safe("task-00005", "task-00002", "blocks", "cycle")
+
+    # A batch is all-or-nothing, and edges are checked against each other
+    before = len(service.get_all_dependencies())
+    with pytest.raises(CircularDependencyError):
+        service.create_dependencies([
+            ("task-00006", "task-00007", "blocks", "ok"),
+            ("task-00007", "task-00008", "blocks", "ok"),
+            ("task-00008", "task-00006", "blocks", "closes the cycle"),
+        ])
+    assert len(service.get_all_dependencies()) == before
+    created = service.create_dependencies([
+        ("task-00006", "task-00007", "blocks", "ok"),
+        ("task-00007", "task-00008", "blocks", "ok"),
+    ])
+    assert all(dep.dependency_id for dep in created)
+    assert service.get_incremental_graph().cycle_if_added("task-00008", "task-00006") == [
+        "task-00008", "task-00006", "task-00007", "task-00008",
+    ]
+
+    invalidate_dependency_graph(conn)
+    conn.close()
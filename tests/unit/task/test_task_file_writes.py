@@ -0,0 +1,56 @@
+import json
+import sqlite3
+from pathlib import Path
+
+from octopusos.core.task.dependency_service import TaskDependencyService
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _write_payload(*files: str) -> str:
+    return json.dumps({"operation": "write", "status": "success", "files_changed": list(files)})
+
+
+def test_ledger_tracks_write_audits(tmp_path: Path, migrated_db) -> None:
+    conn = _connect(migrated_db(tmp_path / "ledger.db"))
+    conn.executemany(
+        "INSERT INTO tasks (task_id, title) VALUES (?, ?)",
+        [("writer-a", "A"), ("writer-b", "B"), ("reader", "R")],
+    )
+    audits = [
+        ("writer-a", "repo_write", _write_payload("src/app.py", "src/util.py")),
+        ("writer-b", "repo_write", _write_payload("src/app.py")),
+        ("writer-b", "repo_read", _write_payload("src/util.py")),
+        ("writer-a", "repo_write", "not json"),
+        ("reader", "repo_write", _write_payload("src/util.py")),
+    ]
+    audits = [
+        (*audit, f"2026-01-01T00:00:{second:02d}+00:00")
+        for second, audit in enumerate(audits, start=1)
+    ]
+    conn.executemany(
+        "INSERT INTO task_audits (task_id, level, event_type, payload, created_at) "
+        "VALUES (?, 'info', ?, ?, ?)",
+        audits,
+    )
+    conn.commit()
+
+    rows = conn.execute("SELECT path, task_id FROM task_file_writes ORDER BY write_id").fetchall()
+    assert [tuple(row) for row in rows] == [
+        ("src/app.py", "writer-a"),
+        ("src/util.py", "writer-a"),
+        ("src/app.py", "writer-b"),
+        ("src/util.py", "reader"),
+    ]
+
+    service = TaskDependencyService(conn)
+    assert service._find_last_modifiers(["src/app.py", "src/util.py", "missing.py"], "reader") == {
+        "src/app.py": "writer-b",
+        "src/util.py": "writer-a",
+    }
+    assert service._find_last_modifier("src/util.py", "writer-a") == "reader"
+    conn.close()
@@ -0,0 +1,145 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from octopusos.core.task import TaskManager
+from octopusos.core.task.manager import (
+    decode_task_cursor,
+    encode_task_cursor,
+    task_cursor_condition,
+)
+
+
+def _fill_tasks(db_path: Path, n_tasks: int, same_second: int = 1) -> None:
+    """Insert tasks; ``same_second`` consecutive tasks share a created_at."""
+    metadata = json.dumps({"run_mode": "assisted"})
+    route_plan = json.dumps({"steps": [{"provider": "local"}]})
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO tasks (task_id, title, status, created_at, metadata, route_plan_json) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (
+                f"task-{i:07d}",
+                f"Task {i}",
+                ("created", "executing", "succeeded")[i % 3],
+                f"2026-01-01T00:{(i // same_second) // 60 % 60:02d}:"
+                f"{(i // same_second) % 60:02d}+00:00",
+                metadata,
+                route_plan,
+            )
+            for i in range(n_tasks)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _add_undated_tasks(db_path: Path, task_ids: list) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO tasks (task_id, title, status, created_at) VALUES (?, ?, 'created', NULL)",
+        ((task_id, task_id) for task_id in task_ids),
+    )
+    conn.commit()
+    conn.close()
+
+
+def _all_pages(manager: TaskManager, limit: int) -> list:
+    seen: list = []
+    cursor: Optional[str] = None
+    while True:
+        page = manager.list_tasks_page(limit=limit, cursor=cursor)
+        seen.extend(task.task_id for task in page.tasks)
+        if page.next_cursor is None:
+            return seen
+        cursor = page.next_cursor
+
+
+def test_keyset_pages_cover_every_task_once(tmp_path: Path, migrated_db) -> None:
+    db_path = migrated_db(tmp_path / "pages.db")
+    # Groups of 7 tasks share a created_at, so pages must break ties on task_id
+    _fill_tasks(db_path, 103, same_second=7)
+    manager = TaskManager(db_path=db_path)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = manager.list_tasks_page(limit=10, cursor=cursor)
+        seen.extend(task.task_id for task in page.tasks)
+        pages += 1
+        assert all(task.metadata == {} and task.route_plan_json is None for task in page.tasks)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert pages == 11
+    assert seen == [task.task_id for task in manager.list_tasks(limit=200)]
+    assert len(set(seen)) == 103
+
+    full = manager.list_tasks_page(limit=3, status_filter="executing", summary=False)
+    assert all(task.status == "executing" for task in full.tasks)
+    assert full.tasks[0].metadata["run_mode"] == "assisted"
+    assert full.tasks[0].route_plan_json
+
+    with pytest.raises(ValueError):
+        manager.list_tasks_page(cursor="not-a-cursor")
+
+
+def test_keyset_pages_include_tasks_without_created_at(tmp_path: Path, migrated_db) -> None:
+    db_path = migrated_db(tmp_path / "undated.db")
+    _fill_tasks(db_path, 12)
+    _add_undated_tasks(db_path, [f"legacy-{i}" for i in range(7)])
+    manager = TaskManager(db_path=db_path)
+
+    # Page boundaries fall both between dated and undated rows and inside the NULL tail
+    for limit in (1, 3, 5, 12, 13):
+        seen = _all_pages(manager, limit)
+        assert seen == [task.task_id for task in manager.list_tasks(limit=100)]
+        assert len(set(seen)) == 19
+
+
+def test_task_cursor_round_trip() -> None:
+    assert decode_task_cursor(encode_task_cursor("2026-01-01T00:00:00+00:00", "task-1")) == (
+        "2026-01-01T00:00:00+00:00",
+        "task-1",
+    )
+    assert decode_task_cursor(encode_task_cursor(None, "task-1")) == (None, "task-1")
+
+
+def test_cursor_condition_keeps_custom_id_column() -> None:
+    # GET /api/tasks pages tables whose id column is not called task_id
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE tasks (id TEXT, created_at TEXT)")
+    conn.executemany(
+        "INSERT INTO tasks VALUES (?, ?)",
+        [("a", "2026-01-02"), ("b", "2026-01-01"), ("c", None), ("d", None)],
+    )
+    condition, params = task_cursor_condition(encode_task_cursor("2026-01-02", "a"), "id")
+    rows = conn.execute(
+        f"SELECT id FROM tasks WHERE {condition} ORDER BY created_at DESC, id DESC", params
+    ).fetchall()
+    assert [row[0] for row in rows] == ["b", "d", "c"]
+
+    condition, params = task_cursor_condition(encode_task_cursor(None, "d"), "id")
+    rows = conn.execute(f"SELECT id FROM tasks WHERE {condition}", params).fetchall()
+    assert [row[0] for row in rows] == ["c"]
+
+
+def test_keyset_uses_composite_index(tmp_path: Path, migrated_db) -> None:
+    conn = sqlite3.connect(migrated_db(tmp_path / "plan.db"))
+    condition, cursor_params = task_cursor_condition(encode_task_cursor("2026-01-01", "task-1"))
+    for where in ("", "status = ? AND "):
+        params = ["executing"] if where else []
+        plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT task_id FROM tasks WHERE {where}{condition} "
+                "ORDER BY created_at DESC, task_id DESC LIMIT 50",
+                params + cursor_params,
+            )
+        )
+        assert "USE TEMP B-TREE" not in plan, plan
+    conn.close()
@@ -0,0 +1,100 @@
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def chat_module(tmp_path_factory):
+    home = tmp_path_factory.mktemp("home")
+    db_dir = home / ".octopusos" / "store" / "octopusos"
+    db_dir.mkdir(parents=True)
+    db_path = db_dir / "db.sqlite"
+    sqlite3.connect(db_path).close()
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home))
+        mp.setenv("OCTOPUSOS_DB_PATH", str(db_path))
+
+        from octopusos.core.db import registry_db
+        from octopusos.store.migrator import auto_migrate
+
+        auto_migrate(db_path)
+        registry_db._DB_PATH = None  # type: ignore[attr-defined]
+        registry_db._thread_local.connection = None  # type: ignore[attr-defined]
+
+        from octopusos.webui.websocket import chat
+
+        yield chat
+
+
+@pytest.fixture
+def recovery_store(chat_module, monkeypatch):
+    store = chat_module.SessionRecoveryStore()
+    monkeypatch.setattr(chat_module, "recovery_store", store)
+    yield store
+    store.close()
+
+
+def _delta(session_id: str, run_id: str, seq: int) -> dict:
+    return {
+        "type": "message.delta",
+        "session_id": session_id,
+        "run_id": run_id,
+        "message_id": f"msg-{session_id}",
+        "seq": seq,
+        "delta": f"token{seq} ",
+        "content": f"token{seq} ",
+        "metadata": {"source": "real"},
+    }
+
+
+def _end(session_id: str, run_id: str, seq: int) -> dict:
+    return {
+        "type": "message.end",
+        "session_id": session_id,
+        "run_id": run_id,
+        "message_id": f"msg-{session_id}",
+        "seq": seq,
+        "content": "done",
+        "metadata": {"total_seq": seq, "source": "real"},
+    }
+
+
+def test_buffered_events_are_replayable_before_flush(chat_module, recovery_store) -> None:
+    session_id, run_id = "resume-session", "resume-run"
+    recovery_store.upsert_state(
+        session_id=session_id, run_id=run_id, status="streaming", last_seq=0
+    )
+    buffer = chat_module.StreamEventBuffer(recovery_store.append_events, flush_interval=60)
+    recovery_store._buffer = buffer
+
+    manager = chat_module.ConnectionManager()
+
+    async def _send() -> None:
+        for seq in range(1, 6):
+            await manager.send_message(session_id, _delta(session_id, run_id, seq))
+
+    asyncio.run(_send())
+
+    # Nothing committed yet (long interval, below the size threshold) but resume sees it all
+    events = recovery_store.list_events_after(session_id=session_id, run_id=run_id, after_seq=2)
+    assert [event["seq"] for event in events] == [3, 4, 5]
+    assert recovery_store.get_state(session_id)["last_seq"] == 5
+
+    result = asyncio.run(
+        chat_module.resume_stream(session_id=session_id, run_id=run_id, last_seq=3)
+    )
+    assert result["status"] == "replayed"
+    assert result["to_seq"] == 5
+
+    # A terminal event triggers an immediate flush
+    asyncio.run(manager.send_message(session_id, _end(session_id, run_id, 6)))
+    deadline = time.monotonic() + 10
+    while buffer.pending_last_seq(session_id, run_id) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert buffer.pending_last_seq(session_id, run_id) == 0
+    events = recovery_store.list_events_after(session_id=session_id, run_id=run_id)
+    assert [event["seq"] for event in events] == [1, 2, 3, 4, 5, 6]
+    buffer.close()